@@ -3,21 +3,24 @@
 Microsoft Planner Task Creator CLI
 A command-line tool for creating and managing Microsoft Planner tasks.
 
-This is the main entry point that registers all commands from the modular planner_lib.
+This is the main entry point. Commands are listed in planner_lib.cli_registry
+and imported on first use, so each call loads only the modules it needs.
 """
 
 import typer
-from planner_lib.cli_commands import register_all_commands
-from planner_lib.cli_task_commands import register_task_commands
-from planner_lib.cli_bucket_commands import register_bucket_commands
+from planner_lib.auth import set_device_code_handler
+from planner_lib.cli_output import print_device_code
+from planner_lib.cli_registry import LazyCommandGroup
 
 # Initialize CLI app
-app = typer.Typer(help="Microsoft Planner Task Creator CLI")
+app = typer.Typer(help="Microsoft Planner Task Creator CLI", cls=LazyCommandGroup)
+
+
+@app.callback()
+def main():
+    # The library logs sign-in prompts; the CLI renders them on the console
+    set_device_code_handler(print_device_code)
 
-# Register all commands
-register_all_commands(app)
-register_task_commands(app)
-register_bucket_commands(app)
 
 if __name__ == "__main__":
     app()
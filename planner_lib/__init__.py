@@ -1,63 +1,81 @@
 """
 Microsoft Planner CLI Library
 Modular components for Microsoft Planner task management.
+
+Public names are imported on first access (PEP 562), so importing one
+submodule, or the package itself, does not load msal, requests or every
+operation module.
 """
 
-from .config import get_config_path, load_conf, save_conf
-from .auth import get_cache_path, get_tokens
-from .graph_client import auth_headers, get_json, post_json, patch_json
-from .resolution import (
-    case_insensitive_match,
-    list_user_plans,
-    list_plan_buckets,
-    resolve_plan,
-    resolve_bucket
-)
-from .task_creation import parse_labels, create_task
-from .task_management import (
-    list_tasks,
-    resolve_task,
-    get_task_details,
-    find_task_by_title,
-    complete_task_op,
-    move_task_op,
-    add_subtask,
-    list_subtasks,
-    complete_subtask,
-    delete_task_op
-)
-
-__all__ = [
+from importlib import import_module
+
+# Public name -> submodule that defines it
+_EXPORTS = {
     # Config
-    "get_config_path",
-    "load_conf",
-    "save_conf",
+    "get_config_path": "config",
+    "load_conf": "config",
+    "save_conf": "config",
     # Auth
-    "get_cache_path",
-    "get_tokens",
+    "get_cache_path": "auth",
+    "get_tokens": "auth",
+    "get_token_provider": "auth",
+    "reset_token_providers": "auth",
     # Graph Client
-    "auth_headers",
-    "get_json",
-    "post_json",
-    "patch_json",
+    "auth_headers": "graph_client",
+    "get_json": "graph_client",
+    "post_json": "graph_client",
+    "patch_json": "graph_client",
+    "delete_json": "graph_client",
+    "get_session": "graph_client",
+    "configure_session": "graph_client",
+    "close_session": "graph_client",
+    "iter_pages": "graph_client",
+    "iter_values": "graph_client",
     # Resolution
-    "case_insensitive_match",
-    "list_user_plans",
-    "list_plan_buckets",
-    "resolve_plan",
-    "resolve_bucket",
+    "case_insensitive_match": "resolution",
+    "list_user_plans": "resolution",
+    "list_plan_buckets": "resolution",
+    "resolve_plan": "resolution",
+    "resolve_bucket": "resolution",
     # Task Creation
-    "parse_labels",
-    "create_task",
+    "parse_labels": "task_creation",
+    "create_task": "task_creation",
+    "read_bulk_rows": "task_bulk",
+    "create_tasks_bulk": "task_bulk",
     # Task Management
-    "list_tasks",
-    "resolve_task",
-    "get_task_details",
-    "find_task_by_title",
-    "complete_task_op",
-    "move_task_op",
-    "add_subtask",
-    "list_subtasks",
-    "complete_subtask",
-    "delete_task_op",
-]
+    "list_tasks": "task_management",
+    "iter_tasks": "task_management",
+    "resolve_task": "task_management",
+    "get_task_details": "task_management",
+    "find_task_by_title": "task_management",
+    "complete_task_op": "task_management",
+    "move_task_op": "task_management",
+    "add_subtask": "task_management",
+    "add_subtasks": "task_management",
+    "list_subtasks": "task_management",
+    "complete_subtask": "task_management",
+    "delete_task_op": "task_management",
+    "TaskFilter": "task_aggregate",
+    "iter_my_tasks": "task_aggregate",
+    "iter_plans_tasks": "task_aggregate",
+    # Local Store
+    "LocalStore": "local_store",
+    "get_local_store": "local_store",
+    "sync_plan": "store_sync",
+    "search_tasks": "task_search",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
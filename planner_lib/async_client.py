@@ -0,0 +1,294 @@
+"""
+Async Graph API Client Module
+asyncio counterpart of graph_client, built on one shared httpx.AsyncClient.
+
+httpx is an optional dependency (pip install httpx); it is imported when
+the first client is created, so importing planner_lib never requires it.
+Throttling, ETag caching and stale-ID handling are shared with the
+synchronous client: both use the same rate governors, etag_cache and
+stale handlers.
+"""
+
+import asyncio
+import time
+import weakref
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Iterable, List, Optional, TypeVar
+
+from .constants import DEFAULT_ASYNC_POOL_SIZE, DEFAULT_HTTP_RETRIES, RETRY_MAX_ATTEMPTS
+from .etag_cache import remember_etag, forget_etag
+from .graph_client import auth_headers, _env_int, notify_stale
+from .rate_governor import get_rate_governor, get_retry_budget, backoff_delay
+
+if TYPE_CHECKING:
+    import httpx
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# httpx connections belong to the event loop that opened them: one client per loop
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError("The planner_lib async API requires httpx (pip install httpx)") from None
+    return httpx
+
+
+def get_async_pool_size() -> int:
+    """Get the async connection limit from PLANNER_ASYNC_POOL_SIZE or the default."""
+    return _env_int("PLANNER_ASYNC_POOL_SIZE", DEFAULT_ASYNC_POOL_SIZE) or DEFAULT_ASYNC_POOL_SIZE
+
+
+def create_async_client(pool_size: Optional[int] = None, max_retries: Optional[int] = None):
+    """
+    Create a pooled keep-alive httpx.AsyncClient for Graph API requests.
+
+    Requests beyond the connection limit wait for a free connection instead
+    of failing, so callers can start thousands of requests at once.
+
+    Args:
+        pool_size: Max open connections (default: PLANNER_ASYNC_POOL_SIZE or 64)
+        max_retries: Connection-level retries (default: PLANNER_HTTP_RETRIES or 3)
+
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    httpx = _import_httpx()
+    pool_size = pool_size or get_async_pool_size()
+    if max_retries is None:
+        max_retries = _env_int("PLANNER_HTTP_RETRIES", DEFAULT_HTTP_RETRIES)
+
+    transport = httpx.AsyncHTTPTransport(
+        retries=max_retries,
+        limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(None),
+        headers={"Connection": "keep-alive"}
+    )
+
+
+def get_async_client():
+    """Return the shared client of the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = create_async_client()
+        _clients[loop] = client
+    return client
+
+
+async def aclose_async_client() -> None:
+    """Close the running loop's shared client and release its connections."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def amap_concurrent(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    max_concurrency: Optional[int] = None
+) -> List[R]:
+    """
+    Await func(item) for every item with at most max_concurrency in flight.
+
+    Args:
+        func: Coroutine function called once per item
+        items: Inputs
+        max_concurrency: In-flight limit (default: PLANNER_ASYNC_POOL_SIZE or 64)
+
+    Returns:
+        Results in input order; the first exception is raised
+    """
+    semaphore = asyncio.Semaphore(max_concurrency or get_async_pool_size())
+
+    async def run(item: T) -> R:
+        async with semaphore:
+            return await func(item)
+
+    return list(await asyncio.gather(*(run(item) for item in items)))
+
+
+def _raise_for_status(response, url: str) -> None:
+    """Notify stale handlers on 404/412, then raise for any HTTP error."""
+    notify_stale(url, response.status_code)
+    response.raise_for_status()
+
+
+async def _send(method: str, url: str, token: str, headers: dict, payload: Optional[dict] = None):
+    """
+    Send one request through the shared rate governor, retrying throttled responses.
+
+    Same policy as graph_client._send: 429 is retried for every method, 503
+    for all but POST; waits honour Retry-After, otherwise exponential backoff
+    with jitter, bounded by RETRY_MAX_ATTEMPTS and the retry budget.
+    """
+    governor = get_rate_governor(url, token)
+    retry_statuses = (429,) if method == "POST" else (429, 503)
+    deadline = time.monotonic() + get_retry_budget()
+    client = get_async_client()
+
+    attempt = 0
+    while True:
+        wait = governor.reserve()
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = governor.reserve()
+
+        response = await client.request(method, url, headers=headers, json=payload)
+        if response.status_code not in retry_statuses:
+            governor.on_success()
+            return response
+
+        delay = backoff_delay(attempt, response.headers.get("Retry-After"))
+        if attempt >= RETRY_MAX_ATTEMPTS or time.monotonic() + delay > deadline:
+            return response
+        governor.on_throttle(delay)
+        attempt += 1
+
+
+async def get_json(url: str, token: str) -> dict:
+    """
+    Make GET request to Graph API with retry on rate limit (429/503).
+
+    Args:
+        url: Full URL to request
+        token: Access token
+
+    Returns:
+        Parsed JSON response
+
+    Raises:
+        httpx.HTTPError: On network or HTTP errors
+    """
+    response = await _send("GET", url, token, auth_headers(token))
+    _raise_for_status(response, url)
+    data = response.json()
+    if isinstance(data, dict):
+        remember_etag(url, data.get("@odata.etag"))
+    return data
+
+
+async def post_json(url: str, token: str, payload: dict) -> dict:
+    """
+    Make POST request to Graph API with retry on rate limit (429).
+
+    Args:
+        url: Full URL to request
+        token: Access token
+        payload: JSON payload
+
+    Returns:
+        Parsed JSON response
+
+    Raises:
+        httpx.HTTPError: On network or HTTP errors
+    """
+    response = await _send("POST", url, token, auth_headers(token), payload)
+    _raise_for_status(response, url)
+    return response.json()
+
+
+async def patch_json(
+    url: str,
+    token: str,
+    payload: dict,
+    etag: str,
+    return_representation: bool = False
+) -> dict:
+    """
+    Make PATCH request to Graph API with ETag, with retry on rate limit (429/503).
+
+    Args:
+        url: Full URL to request
+        token: Access token
+        payload: JSON payload
+        etag: ETag for optimistic concurrency
+        return_representation: Ask for the updated resource (and its new ETag)
+
+    Returns:
+        Parsed JSON response or empty dict
+
+    Raises:
+        httpx.HTTPError: On network or HTTP errors
+    """
+    headers = auth_headers(token)
+    headers["If-Match"] = etag
+    if return_representation:
+        headers["Prefer"] = "return=representation"
+
+    response = await _send("PATCH", url, token, headers, payload)
+    _raise_for_status(response, url)
+
+    if response.content:
+        data = response.json()
+        if isinstance(data, dict) and data.get("@odata.etag"):
+            remember_etag(url, data["@odata.etag"])
+        else:
+            forget_etag(url)
+        return data
+    forget_etag(url)
+    return {}
+
+
+async def delete_json(url: str, token: str, etag: str) -> dict:
+    """
+    Make DELETE request to Graph API with ETag, with retry on rate limit (429/503).
+
+    Args:
+        url: Full URL to request
+        token: Access token
+        etag: ETag for optimistic concurrency
+
+    Returns:
+        Empty dict on success (204 No Content)
+
+    Raises:
+        httpx.HTTPError: On network or HTTP errors
+    """
+    headers = auth_headers(token)
+    headers["If-Match"] = etag
+
+    response = await _send("DELETE", url, token, headers)
+    _raise_for_status(response, url)
+    forget_etag(url)
+    return {}
+
+
+async def iter_pages(url: str, token: str) -> AsyncIterator[dict]:
+    """
+    Yield response pages of a Graph collection, following @odata.nextLink.
+
+    Args:
+        url: Full URL of the first page
+        token: Access token
+
+    Yields:
+        Parsed JSON page
+    """
+    next_url: Optional[str] = url
+    while next_url:
+        page = await get_json(next_url, token)
+        yield page
+        next_url = page.get("@odata.nextLink")
+
+
+async def iter_values(url: str, token: str) -> AsyncIterator[dict]:
+    """
+    Yield items of a Graph collection lazily across all pages.
+
+    Args:
+        url: Full URL of the first page
+        token: Access token
+
+    Yields:
+        Items from each page's "value" array
+    """
+    async for page in iter_pages(url, token):
+        for item in page.get("value", []):
+            yield item
@@ -0,0 +1,362 @@
+"""
+Async Operations Module
+asyncio counterparts of the task, bucket, subtask and comment operations.
+
+Each coroutine mirrors the synchronous function of the same name (same
+arguments, results and JSON errors) but sends its requests through
+async_client, so many operations can share one event loop and one
+connection pool:
+
+    results = await amap_concurrent(lambda t: complete_task_op(t, token), task_ids)
+"""
+
+import asyncio
+import json
+import uuid
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from .async_client import get_json, post_json, patch_json, delete_json, iter_pages, iter_values, amap_concurrent
+from .constants import BASE_GRAPH_URL, GUID_PATTERN
+from .etag_cache import get_known_etag, remember_etags
+from .resolution_cache import get_cached_plan_group, cache_plan_groups, get_cached_thread, cache_thread
+from .resolution_users import resolve_user
+from .task_comments import format_comment
+from .task_creation import parse_labels, build_assignments
+from .task_subtask_add import CHECKLIST_ITEM_TYPE, checklist_additions
+
+
+def _status_of(exc: Exception) -> Optional[int]:
+    """HTTP status of an httpx.HTTPStatusError, or None for other errors."""
+    response = getattr(exc, "response", None)
+    return getattr(response, "status_code", None)
+
+
+async def _with_etag(url: str, token: str, etag: Optional[str], write) -> Any:
+    """Run write(etag) with a known or fetched ETag, refetching once on 412."""
+    etag = etag or get_known_etag(url) or (await get_json(url, token))["@odata.etag"]
+    try:
+        return await write(etag)
+    except Exception as e:
+        if _status_of(e) != 412:
+            raise
+        return await write((await get_json(url, token))["@odata.etag"])
+
+
+async def list_plan_buckets(plan_id: str, token: str) -> List[dict]:
+    """List all buckets in a plan (see resolution_buckets.list_plan_buckets)."""
+    buckets = [b async for b in iter_values(f"{BASE_GRAPH_URL}/planner/plans/{plan_id}/buckets", token)]
+    remember_etags(f"{BASE_GRAPH_URL}/planner/buckets", buckets)
+    return buckets
+
+
+async def iter_tasks(
+    token: str,
+    plan_id: Optional[str] = None,
+    bucket_id: Optional[str] = None,
+    incomplete_only: bool = False,
+    include_details: bool = True,
+    fields: Optional[List[str]] = None,
+    max_concurrency: Optional[int] = None
+) -> AsyncIterator[dict]:
+    """
+    Stream tasks from a plan or bucket page by page (see task_operations.iter_tasks).
+
+    Descriptions of a page are fetched with concurrent /details GETs.
+
+    Args:
+        token: Access token
+        plan_id: Plan ID (required if bucket_id not provided)
+        bucket_id: Bucket ID (takes precedence over plan_id)
+        incomplete_only: Filter to show only incomplete tasks
+        include_details: Fetch /details to attach description
+        fields: Only keep these task properties
+        max_concurrency: Concurrent /details requests (default: PLANNER_ASYNC_POOL_SIZE or 64)
+
+    Yields:
+        Task objects
+
+    Raises:
+        ValueError: If neither plan_id nor bucket_id provided
+    """
+    if bucket_id:
+        url = f"{BASE_GRAPH_URL}/planner/buckets/{bucket_id}/tasks"
+    elif plan_id:
+        url = f"{BASE_GRAPH_URL}/planner/plans/{plan_id}/tasks"
+    else:
+        raise ValueError("plan_id or bucket_id required")
+
+    fetch_details = include_details and (fields is None or "description" in fields)
+
+    async def description_of(task: dict) -> str:
+        try:
+            details = await get_json(f"{BASE_GRAPH_URL}/planner/tasks/{task['id']}/details", token)
+            return details.get("description", "")
+        except Exception:
+            return ""
+
+    async for page in iter_pages(url, token):
+        tasks = page.get("value", [])
+        remember_etags(f"{BASE_GRAPH_URL}/planner/tasks", tasks)
+
+        if incomplete_only:
+            tasks = [t for t in tasks if t.get("percentComplete", 0) < 100]
+
+        if fetch_details:
+            with_ids = [t for t in tasks if t.get("id")]
+            descriptions = await amap_concurrent(description_of, with_ids, max_concurrency)
+            for task, description in zip(with_ids, descriptions):
+                task["description"] = description
+
+        if fields is not None:
+            tasks = [{f: t[f] for f in fields if f in t} for t in tasks]
+
+        for task in tasks:
+            yield task
+
+
+async def list_tasks(
+    token: str,
+    plan_id: Optional[str] = None,
+    bucket_id: Optional[str] = None,
+    incomplete_only: bool = False,
+    include_details: bool = True,
+    fields: Optional[List[str]] = None,
+    max_concurrency: Optional[int] = None
+) -> List[dict]:
+    """List tasks from a plan or bucket (see iter_tasks)."""
+    return [
+        task async for task in iter_tasks(
+            token,
+            plan_id=plan_id,
+            bucket_id=bucket_id,
+            incomplete_only=incomplete_only,
+            include_details=include_details,
+            fields=fields,
+            max_concurrency=max_concurrency
+        )
+    ]
+
+
+async def _resolve_user_id(token: str, identifier: str) -> str:
+    """Resolve an email/UPN or User ID; name searches fall back to the sync resolver."""
+    identifier = identifier.strip()
+    if GUID_PATTERN.match(identifier):
+        return identifier
+    try:
+        return (await get_json(f"{BASE_GRAPH_URL}/users/{identifier}", token))["id"]
+    except Exception:
+        # Partial-name search and its error reporting live in resolution_users
+        return await asyncio.to_thread(resolve_user, token, identifier)
+
+
+async def create_task(
+    token: str,
+    plan_id: str,
+    bucket_id: str,
+    title: str,
+    description: Optional[str] = None,
+    due_date: Optional[str] = None,
+    labels: Optional[str] = None,
+    assignee: Optional[str] = None
+) -> dict:
+    """
+    Create a task in Microsoft Planner (see task_creation.create_task).
+
+    Returns:
+        Dictionary with taskId, webUrl, and bucketId
+    """
+    payload: Dict[str, Any] = {
+        "planId": plan_id,
+        "bucketId": bucket_id,
+        "title": title
+    }
+    if due_date:
+        payload["dueDateTime"] = f"{due_date}T17:00:00Z"
+    if labels:
+        payload["appliedCategories"] = parse_labels(labels)
+    if assignee:
+        identifiers = [a for a in assignee.split(",") if a.strip()]
+        user_ids = await asyncio.gather(*(_resolve_user_id(token, a) for a in identifiers))
+        payload["assignments"] = build_assignments(list(user_ids))
+
+    task = await post_json(f"{BASE_GRAPH_URL}/planner/tasks", token, payload)
+    task_id = task["id"]
+
+    if description:
+        details_url = f"{BASE_GRAPH_URL}/planner/tasks/{task_id}/details"
+        details = await get_json(details_url, token)
+        await patch_json(details_url, token, {"description": description}, details["@odata.etag"])
+
+    return {
+        "taskId": task_id,
+        "webUrl": task.get("detailsUrl", ""),
+        "bucketId": bucket_id
+    }
+
+
+async def complete_task_op(task_id: str, token: str, etag: Optional[str] = None) -> dict:
+    """Mark a task as complete (see task_complete.complete_task_op)."""
+    url = f"{BASE_GRAPH_URL}/planner/tasks/{task_id}"
+
+    async def write(current: str) -> dict:
+        result = await patch_json(url, token, {"percentComplete": 100}, current, return_representation=True)
+        return result if result else {"ok": True, "taskId": task_id}
+
+    return await _with_etag(url, token, etag, write)
+
+
+async def move_task_op(task_id: str, bucket_id: str, token: str, etag: Optional[str] = None) -> dict:
+    """Move a task to a different bucket (see task_move.move_task_op)."""
+    url = f"{BASE_GRAPH_URL}/planner/tasks/{task_id}"
+
+    async def write(current: str) -> dict:
+        result = await patch_json(url, token, {"bucketId": bucket_id}, current, return_representation=True)
+        return result if result else {"ok": True, "taskId": task_id}
+
+    return await _with_etag(url, token, etag, write)
+
+
+async def delete_task_op(task_id: str, token: str, etag: Optional[str] = None) -> dict:
+    """Delete a task (see task_delete.delete_task_op)."""
+    url = f"{BASE_GRAPH_URL}/planner/tasks/{task_id}"
+
+    async def write(current: str) -> dict:
+        return await delete_json(url, token, current)
+
+    await _with_etag(url, token, etag, write)
+    return {"ok": True, "taskId": task_id}
+
+
+async def add_subtask(task_id: str, subtask_title: str, token: str) -> dict:
+    """Add a subtask (checklist item) to a task (see task_subtask_add.add_subtask)."""
+    url = f"{BASE_GRAPH_URL}/planner/tasks/{task_id}/details"
+    item_id = str(uuid.uuid4())
+
+    for attempt in range(2):
+        details = await get_json(url, token)
+        additions = checklist_additions(details.get("checklist", {}), {item_id: subtask_title})
+        if not additions:
+            return {"ok": True, "subtaskId": item_id}
+        try:
+            await patch_json(url, token, {"checklist": additions}, details["@odata.etag"])
+            return {"ok": True, "subtaskId": item_id}
+        except Exception as e:
+            # Retry once on ETag conflict
+            if _status_of(e) != 412 or attempt:
+                raise
+
+
+async def list_subtasks(task_id: str, token: str) -> List[dict]:
+    """List all subtasks (checklist items) for a task (see task_subtask_list.list_subtasks)."""
+    details = await get_json(f"{BASE_GRAPH_URL}/planner/tasks/{task_id}/details", token)
+    return [
+        {"id": item_id, "title": item.get("title"), "isChecked": item.get("isChecked", False)}
+        for item_id, item in details.get("checklist", {}).items()
+    ]
+
+
+async def complete_subtask(task_id: str, subtask_title: str, token: str) -> dict:
+    """
+    Mark a subtask (checklist item) as complete (see task_subtask_complete.complete_subtask).
+
+    Raises:
+        ValueError: If subtask not found
+    """
+    url = f"{BASE_GRAPH_URL}/planner/tasks/{task_id}/details"
+
+    for attempt in range(2):
+        details = await get_json(url, token)
+        checklist = details.get("checklist", {})
+        item_id = next(
+            (cid for cid, item in checklist.items() if item.get("title", "").lower() == subtask_title.lower()),
+            None
+        )
+        if not item_id:
+            raise ValueError(json.dumps({
+                "code": "SubtaskNotFound",
+                "message": f"Subtask '{subtask_title}' not found"
+            }))
+        delta = {item_id: {"@odata.type": CHECKLIST_ITEM_TYPE, "isChecked": True}}
+        try:
+            await patch_json(url, token, {"checklist": delta}, details["@odata.etag"])
+            return {"ok": True, "subtaskId": item_id}
+        except Exception as e:
+            if _status_of(e) != 412 or attempt:
+                raise
+
+
+async def _thread_location(task_id: str, plan_id: str, token: str) -> tuple:
+    """Return (group_id, conversation_thread_id) of a task from the cache, else fetching task and plan concurrently."""
+    group_id = get_cached_plan_group(token, plan_id)
+    thread_id = get_cached_thread(token, task_id)
+    if group_id and thread_id:
+        return group_id, thread_id
+
+    try:
+        task, plan = await asyncio.gather(
+            get_json(f"{BASE_GRAPH_URL}/planner/tasks/{task_id}", token),
+            get_json(f"{BASE_GRAPH_URL}/planner/plans/{plan_id}", token)
+        )
+    except Exception as e:
+        status = _status_of(e)
+        raise ValueError(json.dumps({
+            "code": "TaskNotFound" if status == 404 else "TaskAccessError",
+            "message": f"Could not access task {task_id} or plan {plan_id}: {e}"
+        }))
+
+    group_id = plan.get("owner")
+    if not group_id:
+        raise ValueError(json.dumps({
+            "code": "NoGroupOwner",
+            "message": f"Plan {plan_id} has no owner group"
+        }))
+    cache_plan_groups(token, {plan_id: group_id})
+    thread_id = task.get("conversationThreadId")
+    if thread_id:
+        cache_thread(token, task_id, thread_id)
+    return group_id, thread_id
+
+
+async def get_task_comments(task_id: str, plan_id: str, token: str) -> List[dict]:
+    """Fetch comments from a task's conversation thread (see task_comments.get_task_comments)."""
+    group_id, thread_id = await _thread_location(task_id, plan_id, token)
+    if not thread_id:
+        return []
+
+    try:
+        posts_url = f"{BASE_GRAPH_URL}/groups/{group_id}/threads/{thread_id}/posts"
+        return [format_comment(post) async for post in iter_values(posts_url, token)]
+    except Exception as e:
+        if _status_of(e) == 404:
+            return []
+        raise ValueError(json.dumps({
+            "code": "CommentsAccessError",
+            "message": f"Could not access comments: {e}"
+        }))
+
+
+async def add_task_comment(task_id: str, plan_id: str, comment: str, token: str) -> dict:
+    """Add a comment to a task's conversation thread (see task_comments.add_task_comment)."""
+    if not comment or not comment.strip():
+        raise ValueError(json.dumps({
+            "code": "InvalidComment",
+            "message": "Comment cannot be empty"
+        }))
+
+    group_id, thread_id = await _thread_location(task_id, plan_id, token)
+    if not thread_id:
+        raise ValueError(json.dumps({
+            "code": "NoThread",
+            "message": "Task has no conversation thread. Comments can only be added to tasks that already have a thread (created via Planner UI)."
+        }))
+
+    try:
+        reply_url = f"{BASE_GRAPH_URL}/groups/{group_id}/threads/{thread_id}/reply"
+        payload = {"post": {"body": {"contentType": "text", "content": comment}}}
+        result = await post_json(reply_url, token, payload)
+        return {"ok": True, "taskId": task_id, "commentId": result.get("id", "")}
+    except Exception as e:
+        raise ValueError(json.dumps({
+            "code": "CommentAddError",
+            "message": f"Could not add comment: {e}"
+        }))
@@ -3,14 +3,43 @@ Authentication Module
 Handles Microsoft authentication with device code flow and token caching.
 """
 
+import logging
 import os
+import tempfile
+import threading
+import time
 from pathlib import Path
-import msal
-from rich.console import Console
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
 
-from .constants import REQUIRED_SCOPES
+from .constants import REQUIRED_SCOPES, TOKEN_EXPIRY_SKEW, TOKEN_REFRESH_WINDOW
 
-console = Console()
+if TYPE_CHECKING:
+    import msal
+
+logger = logging.getLogger(__name__)
+
+
+def _log_device_code(flow: dict) -> None:
+    """Default device-flow prompt: log the sign-in instructions."""
+    logger.warning(
+        "Authentication required. Please visit %s and enter code %s",
+        flow["verification_uri"], flow["user_code"]
+    )
+
+
+_device_code_handler: Callable[[dict], None] = _log_device_code
+
+
+def set_device_code_handler(handler: Optional[Callable[[dict], None]]) -> None:
+    """
+    Choose how device code sign-in instructions are shown.
+
+    Args:
+        handler: Called with the MSAL device flow (verification_uri,
+            user_code, message, ...) before polling; None restores logging
+    """
+    global _device_code_handler
+    _device_code_handler = handler or _log_device_code
 
 
 def get_cache_path() -> Path:
@@ -18,10 +47,203 @@ def get_cache_path() -> Path:
     return Path.home() / ".planner-cli" / "msal_cache.bin"
 
 
+class TokenProvider:
+    """
+    Process-wide access token source for one tenant/client pair.
+
+    Keeps the MSAL app, its token cache and the last access token in memory
+    so repeated calls skip cache deserialization and silent acquisition
+    until the token nears expiry. Within TOKEN_REFRESH_WINDOW seconds of
+    expiry the current token is still returned while a background thread
+    refreshes it; the cache file is rewritten only when MSAL reports that
+    its state changed. If another process (e.g. a spawned init-auth)
+    rewrites the cache file, the provider reloads it on the next call.
+    """
+
+    def __init__(self, tenant_id: str, client_id: str):
+        self.tenant_id = tenant_id
+        self.client_id = client_id
+        self._lock = threading.RLock()
+        self._app: Optional["msal.PublicClientApplication"] = None
+        self._cache: Optional["msal.SerializableTokenCache"] = None
+        self._token: Optional[str] = None
+        self._expires_on = 0.0
+        self._refreshing = False
+        self._cache_mtime: Optional[float] = None
+
+    @staticmethod
+    def _file_mtime() -> Optional[float]:
+        try:
+            return get_cache_path().stat().st_mtime
+        except OSError:
+            return None
+
+    def _reload_if_changed(self) -> None:
+        """Drop the in-memory cache and token if the cache file was rewritten elsewhere."""
+        if self._app is not None and self._file_mtime() != self._cache_mtime:
+            self._app = None
+            self._cache = None
+            self._token = None
+            self._expires_on = 0.0
+
+    def _ensure_app(self) -> "msal.PublicClientApplication":
+        if self._app is None:
+            # msal (and requests through it) loads only once a token is needed
+            import msal
+
+            cache_path = get_cache_path()
+
+            # Initialize token cache
+            self._cache = msal.SerializableTokenCache()
+            self._cache_mtime = self._file_mtime()
+            if cache_path.exists():
+                with open(cache_path, 'r') as f:
+                    self._cache.deserialize(f.read())
+
+            # Create MSAL app
+            self._app = msal.PublicClientApplication(
+                client_id=self.client_id,
+                authority=f"https://login.microsoftonline.com/{self.tenant_id}",
+                token_cache=self._cache
+            )
+        return self._app
+
+    def _save_cache(self) -> None:
+        """Write the token cache atomically if MSAL changed it."""
+        if self._cache is None or not self._cache.has_state_changed:
+            return
+
+        cache_path = get_cache_path()
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=".msal-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(self._cache.serialize())
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self._cache.has_state_changed = False
+        self._cache_mtime = self._file_mtime()
+
+    def _remember(self, result: dict) -> str:
+        self._token = result["access_token"]
+        try:
+            self._expires_on = time.time() + float(result.get("expires_in", 0))
+        except (TypeError, ValueError):
+            self._expires_on = 0.0
+        self._save_cache()
+        return self._token
+
+    @staticmethod
+    def _silent_result(app_client: "msal.PublicClientApplication", force_refresh: bool = False) -> Optional[dict]:
+        """Run MSAL silent acquisition; returns the result only if it holds a token."""
+        accounts = app_client.get_accounts()
+        if not accounts:
+            return None
+        result = app_client.acquire_token_silent(
+            REQUIRED_SCOPES,
+            account=accounts[0],
+            force_refresh=force_refresh
+        )
+        return result if result and "access_token" in result else None
+
+    def _acquire_silent(self, force_refresh: bool = False) -> Optional[str]:
+        result = self._silent_result(self._ensure_app(), force_refresh)
+        return self._remember(result) if result else None
+
+    def _acquire_interactive(self) -> str:
+        app_client = self._ensure_app()
+
+        # No cached token, initiate device code flow
+        flow = app_client.initiate_device_flow(scopes=REQUIRED_SCOPES)
+        if "user_code" not in flow:
+            raise RuntimeError("Failed to initiate device code flow")
+
+        # Show device code instructions (rendered by the CLI, logged otherwise)
+        _device_code_handler(flow)
+
+        # Poll for token
+        result = app_client.acquire_token_by_device_flow(flow)
+
+        if "access_token" not in result:
+            error_desc = result.get("error_description", "Unknown error")
+            raise RuntimeError(f"Authentication failed: {error_desc}")
+
+        return self._remember(result)
+
+    def _background_refresh(self) -> None:
+        try:
+            with self._lock:
+                app_client = self._ensure_app()
+            # The network round trip runs unlocked so get_token() keeps serving
+            # the current token; only the swap happens under the lock
+            result = self._silent_result(app_client, force_refresh=True)
+            if result:
+                with self._lock:
+                    if app_client is self._app:
+                        self._remember(result)
+        except Exception:
+            # The next foreground call retries synchronously once the token expires
+            pass
+        finally:
+            self._refreshing = False
+
+    def get_token(self) -> str:
+        """
+        Return a valid access token, acquiring or refreshing it as needed.
+
+        Returns:
+            Valid access token string
+
+        Raises:
+            RuntimeError: If authentication fails
+        """
+        with self._lock:
+            self._reload_if_changed()
+            remaining = self._expires_on - time.time()
+            if self._token and remaining > TOKEN_EXPIRY_SKEW:
+                if remaining <= TOKEN_REFRESH_WINDOW and not self._refreshing:
+                    self._refreshing = True
+                    threading.Thread(target=self._background_refresh, daemon=True).start()
+                return self._token
+
+            token = self._acquire_silent()
+            if token:
+                return token
+            return self._acquire_interactive()
+
+
+_providers: Dict[Tuple[str, str], TokenProvider] = {}
+_providers_lock = threading.Lock()
+
+
+def get_token_provider(tenant_id: str, client_id: str) -> TokenProvider:
+    """Return the process-wide token provider for a tenant/client pair."""
+    key = (tenant_id, client_id)
+    with _providers_lock:
+        provider = _providers.get(key)
+        if provider is None:
+            provider = TokenProvider(tenant_id, client_id)
+            _providers[key] = provider
+        return provider
+
+
+def reset_token_providers() -> None:
+    """Forget all in-memory tokens (the cache file is left untouched)."""
+    with _providers_lock:
+        _providers.clear()
+
+
 def get_tokens(tenant_id: str, client_id: str) -> str:
     """
     Acquire access token using device code flow with caching.
 
+    Tokens are memoized in-process per tenant/client until shortly before
+    they expire, so repeated calls in one process are free.
+
     Args:
         tenant_id: Azure AD tenant ID
         client_id: Azure AD app registration client ID
@@ -35,51 +257,4 @@ def get_tokens(tenant_id: str, client_id: str) -> str:
     if not tenant_id or not client_id:
         raise RuntimeError("TENANT_ID and CLIENT_ID are required")
 
-    authority = f"https://login.microsoftonline.com/{tenant_id}"
-    cache_path = get_cache_path()
-
-    # Initialize token cache
-    cache = msal.SerializableTokenCache()
-    if cache_path.exists():
-        with open(cache_path, 'r') as f:
-            cache.deserialize(f.read())
-
-    # Create MSAL app
-    app_client = msal.PublicClientApplication(
-        client_id=client_id,
-        authority=authority,
-        token_cache=cache
-    )
-
-    # Try to acquire token silently from cache
-    accounts = app_client.get_accounts()
-    if accounts:
-        result = app_client.acquire_token_silent(REQUIRED_SCOPES, account=accounts[0])
-        if result and "access_token" in result:
-            return result["access_token"]
-
-    # No cached token, initiate device code flow
-    flow = app_client.initiate_device_flow(scopes=REQUIRED_SCOPES)
-    if "user_code" not in flow:
-        raise RuntimeError("Failed to initiate device code flow")
-
-    # Display device code instructions
-    console.print(f"\n[bold cyan]Authentication Required[/bold cyan]")
-    console.print(f"Please visit: [bold]{flow['verification_uri']}[/bold]")
-    console.print(f"Enter code: [bold yellow]{flow['user_code']}[/bold yellow]\n")
-
-    # Poll for token
-    result = app_client.acquire_token_by_device_flow(flow)
-
-    if "access_token" not in result:
-        error_desc = result.get("error_description", "Unknown error")
-        raise RuntimeError(f"Authentication failed: {error_desc}")
-
-    # Save cache
-    cache_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(cache_path, 'w') as f:
-        f.write(cache.serialize())
-    os.chmod(cache_path, 0o600)
-
-    return result["access_token"]
-
+    return get_token_provider(tenant_id, client_id).get_token()
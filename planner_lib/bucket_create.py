@@ -3,18 +3,28 @@ Bucket Create Module
 Create new buckets in Microsoft Planner.
 """
 
+from typing import List, Optional
+
+from .concurrency import map_concurrent
 from .constants import BASE_GRAPH_URL
-from .graph_client import post_json
+from .graph_client import patch_json, post_json
+from .order_hint import append_hints
 
 
-def create_bucket_op(plan_id: str, name: str, token: str) -> dict:
+def create_bucket_op(plan_id: str, name: str, token: str, buckets: Optional[List[dict]] = None) -> dict:
     """
     Create a new bucket in a plan.
 
+    When the plan's current buckets are given, the new bucket gets an
+    orderHint after the last of them; only if that hint would be too long
+    are the existing buckets re-hinted first. Otherwise the service places
+    the bucket.
+
     Args:
         plan_id: Plan ID
         name: Bucket name
         token: Access token
+        buckets: Current buckets of the plan (with orderHint and @odata.etag)
 
     Returns:
         Dictionary with ok, bucketId, name, planId
@@ -22,11 +32,25 @@ def create_bucket_op(plan_id: str, name: str, token: str) -> dict:
     Raises:
         requests.RequestException: On API errors
     """
+    # Default order hint, computed by the service
+    order_hint = " !"
+    if buckets is not None:
+        hints, rehinted = append_hints({b["id"]: b.get("orderHint") for b in buckets}, 1)
+        order_hint = hints[0]
+        if rehinted:
+            etags = {b["id"]: b.get("@odata.etag") for b in buckets}
+            map_concurrent(
+                lambda item: patch_json(
+                    f"{BASE_GRAPH_URL}/planner/buckets/{item[0]}", token, {"orderHint": item[1]}, etags[item[0]]
+                ),
+                list(rehinted.items())
+            )
+
     # Build payload
     payload = {
         "name": name,
         "planId": plan_id,
-        "orderHint": " !"  # Default order hint (at the end)
+        "orderHint": order_hint
     }
 
     # Create bucket
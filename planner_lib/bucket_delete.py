@@ -3,17 +3,23 @@ Bucket Delete Module
 Delete buckets from Microsoft Planner.
 """
 
+import requests
+from typing import Optional
+
 from .constants import BASE_GRAPH_URL
+from .etag_cache import get_known_etag
 from .graph_client import get_json, delete_json
+from .resolution_cache import forget_bucket
 
 
-def delete_bucket_op(bucket_id: str, token: str) -> dict:
+def delete_bucket_op(bucket_id: str, token: str, etag: Optional[str] = None) -> dict:
     """
-    Delete a bucket.
+    Delete a bucket and drop its names from the resolution cache.
 
     Args:
         bucket_id: Bucket ID
         token: Access token
+        etag: Known bucket ETag (skips the pre-read GET; refetched on 412)
 
     Returns:
         Success dict with ok and bucketId
@@ -21,14 +27,20 @@ def delete_bucket_op(bucket_id: str, token: str) -> dict:
     Raises:
         requests.RequestException: On API errors
     """
-    # Fetch current bucket for ETag
+    # Use the known ETag, fetching the bucket only when none is at hand
     url = f"{BASE_GRAPH_URL}/planner/buckets/{bucket_id}"
-    bucket = get_json(url, token)
-    etag = bucket["@odata.etag"]
-
-    # Delete with ETag
-    delete_json(url, token, etag)
-
+    etag = etag or get_known_etag(url) or get_json(url, token)["@odata.etag"]
+
+    # Delete with retry on ETag conflict
+    try:
+        delete_json(url, token, etag)
+    except requests.HTTPError as e:
+        if e.response.status_code != 412:
+            raise
+        bucket = get_json(url, token)
+        delete_json(url, token, bucket["@odata.etag"])
+
+    forget_bucket(token, bucket_id)
     return {
         "ok": True,
         "bucketId": bucket_id
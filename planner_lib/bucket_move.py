@@ -3,52 +3,192 @@ Bucket Move Module
 Move all tasks from one bucket to another.
 """
 
-from typing import List, Dict, Any
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, List, Dict, Optional
 
-from .constants import BASE_GRAPH_URL
-from .graph_client import get_json
+from .concurrency import get_max_concurrency
+from .constants import BASE_GRAPH_URL, GRAPH_BATCH_MAX_SIZE, BUCKET_MOVE_MAX_PASSES
+from .etag_cache import forget_etag
+from .graph_batch import batch_requests
+from .graph_client import iter_values
 from .task_move import move_task_op
 
 
-def move_bucket_tasks_op(source_bucket_id: str, target_bucket_id: str, token: str) -> dict:
+def get_checkpoint_path(source_bucket_id: str, target_bucket_id: str) -> Path:
+    """Default checkpoint file for a source → target move."""
+    return Path.home() / ".planner-cli" / "checkpoints" / f"move-{source_bucket_id}-{target_bucket_id}.json"
+
+
+def _load_checkpoint(path: Optional[Path], source_bucket_id: str, target_bucket_id: str) -> List[str]:
+    """Return task IDs already moved by an earlier run of the same move."""
+    if path is None:
+        return []
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return []
+    if data.get("source") != source_bucket_id or data.get("target") != target_bucket_id:
+        return []
+    return list(data.get("movedIds", []))
+
+
+def _save_checkpoint(path: Path, source_bucket_id: str, target_bucket_id: str, moved_ids: List[str]) -> None:
+    """Write the checkpoint atomically so an interrupted run never leaves a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".move-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump({"source": source_bucket_id, "target": target_bucket_id, "movedIds": moved_ids}, f)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _batch_move(
+    tasks: List[dict],
+    target_bucket_id: str,
+    token: str,
+    max_workers: Optional[int] = None
+) -> Dict[str, dict]:
+    """PATCH bucketId for tasks whose ETag came with the listing, 20 per $batch."""
+    if not tasks:
+        return {}
+    return batch_requests(
+        [
+            {
+                "id": task["id"],
+                "method": "PATCH",
+                "url": f"/planner/tasks/{task['id']}",
+                "headers": {"If-Match": task["@odata.etag"]},
+                "body": {"bucketId": target_bucket_id}
+            }
+            for task in tasks
+        ],
+        token,
+        max_workers=max_workers
+    )
+
+
+def _move_chunk(
+    tasks: List[dict],
+    target_bucket_id: str,
+    token: str,
+    max_workers: Optional[int]
+) -> Dict[str, Optional[str]]:
+    """Move one chunk of tasks; return task ID → error message (None when moved)."""
+    try:
+        batched = _batch_move([t for t in tasks if t.get("@odata.etag")], target_bucket_id, token, max_workers)
+    except Exception:
+        # The $batch POST itself failed; move the chunk one task at a time
+        batched = {}
+
+    outcome: Dict[str, Optional[str]] = {}
+    for task in tasks:
+        task_id = task["id"]
+        result = batched.get(task_id)
+        if result and (result["status"] == 412 or 200 <= result["status"] < 300):
+            # A batched PATCH changed the ETag (or found it stale); a cached one is no longer valid
+            forget_etag(f"{BASE_GRAPH_URL}/planner/tasks/{task_id}")
+        if result and 200 <= result["status"] < 300:
+            outcome[task_id] = None
+            continue
+        if result and result["status"] != 412:
+            message = ((result.get("body") or {}).get("error") or {}).get("message", "")
+            outcome[task_id] = f"{result['status']} {message}".strip()
+            continue
+        # No ETag or ETag conflict (rare): move individually with a fresh ETag
+        try:
+            move_task_op(task_id, target_bucket_id, token)
+            outcome[task_id] = None
+        except Exception as e:
+            outcome[task_id] = str(e)
+    return outcome
+
+
+def move_bucket_tasks_op(
+    source_bucket_id: str,
+    target_bucket_id: str,
+    token: str,
+    max_workers: Optional[int] = None,
+    checkpoint_path: Optional[Path] = None,
+    progress: Optional[Callable[[dict], None]] = None
+) -> dict:
     """
     Move all tasks from source bucket to target bucket.
 
+    The source bucket is listed in full (all pages) and moved in chunks of
+    20 x max_workers: tasks listed with an ETag go through concurrent $batch
+    PATCHes; tasks without one, or whose batched PATCH hit an ETag conflict
+    (412), fall back to move_task_op. The source is then listed again, and
+    tasks that appeared or were missed are moved in another pass (up to
+    BUCKET_MOVE_MAX_PASSES).
+
+    With a checkpoint_path, moved task IDs are saved after every chunk, so a
+    rerun of an interrupted move skips them and reports cumulative totals.
+    The checkpoint is removed once a move finishes without failures.
+
     Args:
         source_bucket_id: Source bucket ID
         target_bucket_id: Target bucket ID
         token: Access token
+        max_workers: Concurrent requests (default: PLANNER_MAX_CONCURRENCY or 8)
+        checkpoint_path: File recording moved task IDs (optional)
+        progress: Called with start/progress/done event dicts (optional)
 
     Returns:
-        Dictionary with ok, moved, failed, taskIds, errors
+        Dictionary with ok, moved, failed, taskIds, errors, resumed
 
     Raises:
         requests.RequestException: On API errors
     """
-    # Get all tasks in source bucket
+    def emit(event: dict) -> None:
+        if progress:
+            progress(event)
+
+    moved_ids = _load_checkpoint(checkpoint_path, source_bucket_id, target_bucket_id)
+    resumed = bool(moved_ids)
+    done = set(moved_ids)
+    errors: Dict[str, str] = {}
+    chunk_size = GRAPH_BATCH_MAX_SIZE * (max_workers or get_max_concurrency())
     url = f"{BASE_GRAPH_URL}/planner/buckets/{source_bucket_id}/tasks"
-    data = get_json(url, token)
-    tasks = data.get("value", [])
 
-    # Move each task
-    moved_ids: List[str] = []
-    errors: List[Dict[str, Any]] = []
+    emit({"event": "start", "source": source_bucket_id, "target": target_bucket_id, "alreadyMoved": len(moved_ids)})
 
-    for task in tasks:
-        task_id = task["id"]
-        try:
-            move_task_op(task_id, target_bucket_id, token)
-            moved_ids.append(task_id)
-        except Exception as e:
-            errors.append({
-                "taskId": task_id,
-                "error": str(e)
-            })
+    for _ in range(BUCKET_MOVE_MAX_PASSES):
+        # Get all tasks in source bucket (all pages); skip ones handled earlier
+        tasks = [t for t in iter_values(url, token) if t["id"] not in done and t["id"] not in errors]
+        if not tasks:
+            break
+        emit({"event": "listed", "pending": len(tasks)})
+
+        for start in range(0, len(tasks), chunk_size):
+            outcome = _move_chunk(tasks[start:start + chunk_size], target_bucket_id, token, max_workers)
+            for task_id, error in outcome.items():
+                if error is None:
+                    moved_ids.append(task_id)
+                    done.add(task_id)
+                else:
+                    errors[task_id] = error
+            if checkpoint_path is not None:
+                _save_checkpoint(checkpoint_path, source_bucket_id, target_bucket_id, moved_ids)
+            emit({"event": "progress", "moved": len(moved_ids), "failed": len(errors)})
+
+    if checkpoint_path is not None and not errors and checkpoint_path.exists():
+        checkpoint_path.unlink()
+
+    emit({"event": "done", "moved": len(moved_ids), "failed": len(errors)})
 
     return {
         "ok": True,
         "moved": len(moved_ids),
         "failed": len(errors),
         "taskIds": moved_ids,
-        "errors": errors
+        "errors": [{"taskId": task_id, "error": error} for task_id, error in errors.items()],
+        "resumed": resumed
     }
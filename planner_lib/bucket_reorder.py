@@ -0,0 +1,271 @@
+"""
+Bucket Reorder Module
+Reorder the tasks of a bucket by rewriting as few orderHints as possible.
+"""
+
+import json
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+import requests
+
+from .concurrency import map_concurrent
+from .constants import BASE_GRAPH_URL
+from .etag_cache import get_known_etag, remember_etags, forget_etag
+from .graph_batch import batch_requests
+from .graph_client import get_json, iter_values, patch_json
+from .order_hint import hints_between, needs_rebalance, sort_by_hint, spread_hints
+
+# --by sort key → task property (tasks without the property go last)
+REORDER_KEYS = {
+    "due": "dueDateTime",
+    "title": "title",
+    "priority": "priority",
+    "created": "createdDateTime",
+}
+
+
+def longest_increasing_run(hints: List[str]) -> List[int]:
+    """
+    Return indices of a longest strictly increasing subsequence of hints.
+
+    Patience sorting, O(n log n).
+    """
+    tails: List[str] = []          # smallest tail hint of an increasing run of each length
+    tail_indices: List[int] = []   # index of that tail
+    previous = [-1] * len(hints)
+    for index, hint in enumerate(hints):
+        length = bisect_left(tails, hint)
+        if length == len(tails):
+            tails.append(hint)
+            tail_indices.append(index)
+        else:
+            tails[length] = hint
+            tail_indices[length] = index
+        previous[index] = tail_indices[length - 1] if length else -1
+
+    run = []
+    index = tail_indices[-1] if tail_indices else -1
+    while index != -1:
+        run.append(index)
+        index = previous[index]
+    return run[::-1]
+
+
+def plan_reorder(current: Dict[str, Optional[str]], desired: List[str]) -> Dict[str, str]:
+    """
+    Return the new orderHints that put tasks in the desired order.
+
+    Tasks on a longest run whose current hints already increase in the
+    desired order keep their hints; every other task gets a hint between its
+    nearest kept neighbors. Only if no hint fits, or one would be too long,
+    is the whole bucket re-spread.
+
+    Args:
+        current: Task ID → current orderHint
+        desired: Every task ID of the bucket, in the wanted order
+
+    Returns:
+        Task ID → new orderHint, for the tasks that have to change only
+    """
+    hinted = [task_id for task_id in desired if current.get(task_id)]
+    keep = {hinted[i] for i in longest_increasing_run([current[task_id] for task_id in hinted])}
+
+    new_hints: Dict[str, str] = {}
+    try:
+        before = None
+        moving: List[str] = []
+        for task_id in desired + [None]:
+            if task_id is not None and task_id not in keep:
+                moving.append(task_id)
+                continue
+            after = current[task_id] if task_id is not None else None
+            new_hints.update(zip(moving, hints_between(before, after, len(moving))))
+            moving = []
+            before = after
+        if not needs_rebalance(list(new_hints.values())):
+            return new_hints
+    except ValueError:
+        pass
+
+    return {
+        task_id: hint for task_id, hint in zip(desired, spread_hints(len(desired)))
+        if current.get(task_id) != hint
+    }
+
+
+def desired_order(
+    tasks: List[dict],
+    order: Optional[List[str]] = None,
+    by: Optional[str] = None,
+    descending: bool = False
+) -> List[str]:
+    """
+    Return the task IDs of a bucket in the wanted order.
+
+    Tasks named in order (by ID or exact title, case-insensitive) come first,
+    in that order; with by, tasks are sorted on that property (tasks without
+    it last). Remaining ties keep the current order.
+
+    Args:
+        tasks: Tasks of the bucket
+        order: Task IDs or titles, in the wanted order
+        by: Sort key: due, title, priority or created
+        descending: Reverse the --by sort
+
+    Returns:
+        Every task ID, in the wanted order
+
+    Raises:
+        ValueError: If neither or both of order and by are given, by is
+            unknown, or an entry of order matches no task or several tasks
+    """
+    if bool(order) == bool(by):
+        raise ValueError(json.dumps({
+            "code": "InvalidInput",
+            "message": "Give either a task order or a sort key"
+        }))
+
+    current = sort_by_hint({t["id"]: t.get("orderHint") for t in tasks})
+    by_id = {t["id"]: t for t in tasks}
+
+    if by:
+        if by not in REORDER_KEYS:
+            raise ValueError(json.dumps({
+                "code": "InvalidInput",
+                "message": f"Unknown sort key '{by}'; use one of: {', '.join(REORDER_KEYS)}"
+            }))
+        field = REORDER_KEYS[by]
+
+        def key(task_id):
+            value = by_id[task_id].get(field)
+            if isinstance(value, str):
+                value = value.lower()
+            return value
+
+        present = sorted((t for t in current if key(t) is not None), key=key, reverse=descending)
+        return present + [t for t in current if key(t) is None]
+
+    named: List[str] = []
+    for entry in order:
+        if entry in by_id:
+            matches = [entry]
+        else:
+            matches = [t for t in current if (by_id[t].get("title") or "").lower() == entry.lower()]
+        if len(matches) != 1:
+            raise ValueError(json.dumps({
+                "code": "TaskNotFound" if not matches else "Ambiguous",
+                "message": f"'{entry}' matches {len(matches)} tasks in the bucket",
+                "candidates": [{"id": t, "title": by_id[t].get("title")} for t in matches]
+            }))
+        if matches[0] not in named:
+            named.append(matches[0])
+    return named + [t for t in current if t not in named]
+
+
+def _set_order_hint(task_id: str, hint: str, token: str) -> Optional[str]:
+    """PATCH one task's orderHint, refetching the ETag once on 412; return an error or None."""
+    url = f"{BASE_GRAPH_URL}/planner/tasks/{task_id}"
+    try:
+        etag = get_known_etag(url) or get_json(url, token)["@odata.etag"]
+        try:
+            patch_json(url, token, {"orderHint": hint}, etag)
+        except requests.HTTPError as e:
+            if e.response.status_code != 412:
+                raise
+            patch_json(url, token, {"orderHint": hint}, get_json(url, token)["@odata.etag"])
+        return None
+    except Exception as e:
+        return str(e)
+
+
+def reorder_bucket_op(
+    bucket_id: str,
+    token: str,
+    order: Optional[List[str]] = None,
+    by: Optional[str] = None,
+    descending: bool = False,
+    max_workers: Optional[int] = None,
+    dry_run: bool = False
+) -> dict:
+    """
+    Reorder the tasks of a bucket, updating only the tasks that must move.
+
+    The bucket is listed once; plan_reorder picks the tasks to move and
+    their new hints. Those PATCHes go out concurrently through $batch (with
+    the ETags from the listing); a task whose batched PATCH hit a 412 is
+    retried on its own with a fresh ETag.
+
+    Args:
+        bucket_id: Bucket ID
+        token: Access token
+        order: Task IDs or titles, in the wanted order (others follow)
+        by: Sort key: due, title, priority or created
+        descending: Reverse the --by sort
+        max_workers: Concurrent requests (default: PLANNER_MAX_CONCURRENCY or 8)
+        dry_run: Compute the moves without writing them
+
+    Returns:
+        Dictionary with ok, bucketId, tasks, moved, failed, taskIds, errors, dryRun
+
+    Raises:
+        ValueError: If the order or sort key is invalid
+        requests.RequestException: On API errors
+    """
+    tasks = list(iter_values(f"{BASE_GRAPH_URL}/planner/buckets/{bucket_id}/tasks", token))
+    remember_etags(f"{BASE_GRAPH_URL}/planner/tasks", tasks)
+
+    desired = desired_order(tasks, order=order, by=by, descending=descending)
+    new_hints = plan_reorder({t["id"]: t.get("orderHint") for t in tasks}, desired)
+    moving = [task_id for task_id in desired if task_id in new_hints]
+
+    errors: Dict[str, str] = {}
+    if moving and not dry_run:
+        etags = {t["id"]: t.get("@odata.etag") for t in tasks}
+        try:
+            batched = batch_requests(
+                [
+                    {
+                        "id": task_id,
+                        "method": "PATCH",
+                        "url": f"/planner/tasks/{task_id}",
+                        "headers": {"If-Match": etags[task_id]},
+                        "body": {"orderHint": new_hints[task_id]}
+                    }
+                    for task_id in moving if etags.get(task_id)
+                ],
+                token,
+                max_workers=max_workers
+            )
+        except Exception:
+            # The $batch POST itself failed; update the tasks one at a time
+            batched = {}
+
+        retry = []
+        for task_id in moving:
+            result = batched.get(task_id)
+            if result and (result["status"] == 412 or 200 <= result["status"] < 300):
+                # The ETag remembered from the listing changed or was already stale
+                forget_etag(f"{BASE_GRAPH_URL}/planner/tasks/{task_id}")
+            if result and 200 <= result["status"] < 300:
+                continue
+            if result and result["status"] != 412:
+                message = ((result.get("body") or {}).get("error") or {}).get("message", "")
+                errors[task_id] = f"{result['status']} {message}".strip()
+                continue
+            # No ETag or ETag conflict: update individually with a fresh ETag
+            retry.append(task_id)
+
+        outcomes = map_concurrent(lambda task_id: _set_order_hint(task_id, new_hints[task_id], token), retry, max_workers)
+        errors.update({task_id: error for task_id, error in zip(retry, outcomes) if error})
+
+    return {
+        "ok": True,
+        "bucketId": bucket_id,
+        "tasks": len(tasks),
+        "moved": len(moving) - len(errors),
+        "failed": len(errors),
+        "taskIds": [task_id for task_id in moving if task_id not in errors],
+        "errors": [{"taskId": task_id, "error": error} for task_id, error in errors.items()],
+        "dryRun": dry_run
+    }
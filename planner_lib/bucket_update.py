@@ -4,19 +4,34 @@ Update bucket properties in Microsoft Planner.
 """
 
 import requests
+from typing import Optional
 
 from .constants import BASE_GRAPH_URL
+from .etag_cache import get_known_etag
 from .graph_client import get_json, patch_json
+from .resolution_cache import rename_cached_bucket
 
 
-def update_bucket_op(bucket_id: str, new_name: str, token: str) -> dict:
+def update_bucket_op(
+    bucket_id: str,
+    new_name: str,
+    token: str,
+    etag: Optional[str] = None,
+    old_name: Optional[str] = None
+) -> dict:
     """
     Update a bucket's name.
 
+    The bucket is only fetched when its ETag or current name is not known.
+    On success the old name is dropped from the resolution cache and the new
+    name is cached for the bucket.
+
     Args:
         bucket_id: Bucket ID
         new_name: New bucket name
         token: Access token
+        etag: Known bucket ETag (refetched on 412)
+        old_name: Current bucket name, if already resolved
 
     Returns:
         Dictionary with ok, bucketId, oldName, newName
@@ -24,24 +39,29 @@ def update_bucket_op(bucket_id: str, new_name: str, token: str) -> dict:
     Raises:
         requests.RequestException: On API errors
     """
-    # Fetch current bucket for ETag and old name
+    # Fetch current bucket for ETag and old name unless both are known
     url = f"{BASE_GRAPH_URL}/planner/buckets/{bucket_id}"
-    bucket = get_json(url, token)
-    etag = bucket["@odata.etag"]
-    old_name = bucket["name"]
+    etag = etag or get_known_etag(url)
+    bucket = {}
+    if etag is None or old_name is None:
+        bucket = get_json(url, token)
+        etag = bucket["@odata.etag"]
+        old_name = bucket["name"]
 
     # Update with retry on ETag conflict
     try:
-        patch_json(url, token, {"name": new_name}, etag)
+        updated = patch_json(url, token, {"name": new_name}, etag, return_representation=True)
     except requests.HTTPError as e:
         if e.response.status_code == 412:
             # Retry once on ETag conflict
             bucket = get_json(url, token)
             etag = bucket["@odata.etag"]
-            patch_json(url, token, {"name": new_name}, etag)
+            updated = patch_json(url, token, {"name": new_name}, etag, return_representation=True)
         else:
             raise
 
+    rename_cached_bucket(token, bucket_id, new_name, plan_id=updated.get("planId") or bucket.get("planId"))
+
     return {
         "ok": True,
         "bucketId": bucket_id,
@@ -0,0 +1,257 @@
+"""
+Cache Store Module
+Persistent, TTL'd, size-bounded key/value cache under ~/.planner-cli/.
+"""
+
+import atexit
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from .constants import DEFAULT_CACHE_TTL, DEFAULT_CACHE_MAX_ENTRIES
+
+
+def get_cache_store_path() -> Path:
+    """Get cache file path from environment or default."""
+    cache_path = os.environ.get("PLANNER_CACHE_PATH")
+    if cache_path:
+        return Path(cache_path).expanduser()
+    return Path.home() / ".planner-cli" / "cache.json"
+
+
+def cache_enabled() -> bool:
+    """Return False when caching is disabled via PLANNER_NO_CACHE."""
+    return os.environ.get("PLANNER_NO_CACHE", "").lower() not in ("1", "true", "yes")
+
+
+def token_scope(token: str) -> str:
+    """
+    Derive a cache scope (tenant/user) from an access token.
+
+    Reads the unverified tid/oid claims of the JWT payload; tokens that are
+    not JWTs are scoped by a hash of the token itself.
+
+    Args:
+        token: Access token
+
+    Returns:
+        Scope string like "tid:oid"
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        tid = claims.get("tid", "")
+        oid = claims.get("oid") or claims.get("sub", "")
+        if tid or oid:
+            return f"{tid}:{oid}"
+    except Exception:
+        pass
+    return hashlib.sha256(token.encode()).hexdigest()[:16]
+
+
+class CacheStore:
+    """
+    JSON-file backed cache with per-entry TTL and least-recently-used eviction.
+
+    Writes (set/invalidate) are persisted immediately with an atomic rename;
+    access bookkeeping (LRU timestamps, hit counters) is flushed at exit.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl: float = DEFAULT_CACHE_TTL,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.RLock()
+        self._entries: Dict[str, dict] = {}
+        self._hits = 0
+        self._misses = 0
+        self._dirty = False
+        self._load()
+
+    @staticmethod
+    def _key(namespace: str, key: str) -> str:
+        return f"{namespace}|{key}"
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            self._entries = data.get("entries", {})
+            self._hits = data.get("hits", 0)
+            self._misses = data.get("misses", 0)
+        except (OSError, ValueError):
+            self._entries = {}
+        now = time.time()
+        self._entries = {k: e for k, e in self._entries.items() if e.get("expires", 0) > now}
+
+    def flush(self) -> None:
+        """Write the cache file atomically (0600 permissions)."""
+        with self._lock:
+            data = {"entries": self._entries, "hits": self._hits, "misses": self._misses}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".cache-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f)
+                os.chmod(tmp_path, 0o600)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+            self._dirty = False
+
+    def flush_if_dirty(self) -> None:
+        """Persist access bookkeeping if anything changed since the last write."""
+        if self._dirty:
+            try:
+                self.flush()
+            except OSError:
+                pass
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            full_key = self._key(namespace, key)
+            entry = self._entries.get(full_key)
+            now = time.time()
+            if entry is None or entry.get("expires", 0) <= now:
+                if entry is not None:
+                    del self._entries[full_key]
+                self._misses += 1
+                self._dirty = True
+                return None
+            entry["accessed"] = now
+            self._hits += 1
+            self._dirty = True
+            return entry["value"]
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting least-recently-used entries over max_entries."""
+        self.set_many(namespace, {key: value}, ttl=ttl)
+
+    def set_many(self, namespace: str, items: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Store several values with a single write."""
+        if not items:
+            return
+        with self._lock:
+            now = time.time()
+            expires = now + (self.ttl if ttl is None else ttl)
+            for key, value in items.items():
+                self._entries[self._key(namespace, key)] = {
+                    "value": value,
+                    "expires": expires,
+                    "accessed": now
+                }
+            overflow = len(self._entries) - self.max_entries
+            if overflow > 0:
+                oldest = sorted(self._entries, key=lambda k: self._entries[k].get("accessed", 0))
+                for full_key in oldest[:overflow]:
+                    del self._entries[full_key]
+            self.flush()
+
+    def invalidate(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
+        """
+        Remove one entry, one namespace, or everything.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if namespace is not None and key is not None:
+                removed = 1 if self._entries.pop(self._key(namespace, key), None) is not None else 0
+            else:
+                prefix = f"{namespace}|" if namespace is not None else ""
+                doomed = [k for k in self._entries if k.startswith(prefix)]
+                for full_key in doomed:
+                    del self._entries[full_key]
+                removed = len(doomed)
+            if removed:
+                self.flush()
+            return removed
+
+    def invalidate_where(self, predicate: Callable[[str, Any], bool]) -> int:
+        """Remove entries for which predicate(full_key, value) is true."""
+        with self._lock:
+            doomed = [k for k, e in self._entries.items() if predicate(k, e.get("value"))]
+            for full_key in doomed:
+                del self._entries[full_key]
+            if doomed:
+                self.flush()
+            return len(doomed)
+
+    def clear(self) -> int:
+        """Remove all entries and reset counters."""
+        with self._lock:
+            removed = len(self._entries)
+            self._entries = {}
+            self._hits = 0
+            self._misses = 0
+            self.flush()
+            return removed
+
+    def stats(self) -> dict:
+        """Summarize cache contents and hit rate."""
+        with self._lock:
+            namespaces: Dict[str, int] = {}
+            for full_key in self._entries:
+                namespace = full_key.split("|", 1)[0]
+                namespaces[namespace] = namespaces.get(namespace, 0) + 1
+            lookups = self._hits + self._misses
+            return {
+                "path": str(self.path),
+                "entries": len(self._entries),
+                "maxEntries": self.max_entries,
+                "ttlSeconds": self.ttl,
+                "namespaces": namespaces,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hitRate": round(self._hits / lookups, 3) if lookups else 0.0
+            }
+
+
+_store: Optional[CacheStore] = None
+_store_lock = threading.Lock()
+
+
+def get_cache_store() -> CacheStore:
+    """Return the process-wide cache store for the current PLANNER_CACHE_PATH."""
+    global _store
+    path = get_cache_store_path()
+    with _store_lock:
+        if _store is None or _store.path != path:
+            if _store is not None:
+                _store.flush_if_dirty()
+            try:
+                ttl = float(os.environ.get("PLANNER_CACHE_TTL", DEFAULT_CACHE_TTL))
+            except ValueError:
+                ttl = DEFAULT_CACHE_TTL
+            _store = CacheStore(path, ttl=ttl)
+        return _store
+
+
+def reset_cache_store() -> None:
+    """Drop the process-wide store (the file is left untouched)."""
+    global _store
+    with _store_lock:
+        if _store is not None:
+            _store.flush_if_dirty()
+        _store = None
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    if _store is not None:
+        _store.flush_if_dirty()
@@ -0,0 +1,71 @@
+"""
+Checklist Cache Module
+In-process snapshots of task checklists (items and details ETag), so repeated
+subtask operations in one process skip the GET of /details before each write.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from .constants import CHECKLIST_CACHE_MAX_ENTRIES
+from .etag_cache import _resource_key, get_known_etag
+from .graph_client import register_stale_handler
+
+_checklists: "OrderedDict[str, Tuple[str, dict]]" = OrderedDict()
+_checklists_lock = threading.Lock()
+
+
+def remember_checklist(url: str, details: dict) -> None:
+    """
+    Record the checklist of the task details at url.
+
+    Details without an ETag (e.g. a 204 PATCH response) drop the snapshot,
+    since the next write could not use it.
+    """
+    etag = details.get("@odata.etag") if isinstance(details, dict) else None
+    if not etag:
+        forget_checklist(url)
+        return
+    key = _resource_key(url)
+    checklist = {item_id: dict(item) for item_id, item in (details.get("checklist") or {}).items()}
+    with _checklists_lock:
+        _checklists[key] = (etag, checklist)
+        _checklists.move_to_end(key)
+        while len(_checklists) > CHECKLIST_CACHE_MAX_ENTRIES:
+            _checklists.popitem(last=False)
+
+
+def get_checklist(url: str) -> Optional[Tuple[str, dict]]:
+    """
+    Return (etag, checklist) last seen for the task details at url, or None.
+
+    A snapshot is dropped once the ETag cache knows a different ETag for the
+    same resource (another operation changed the details).
+    """
+    key = _resource_key(url)
+    with _checklists_lock:
+        snapshot = _checklists.get(key)
+    if snapshot is None:
+        return None
+    known = get_known_etag(url)
+    if known and known != snapshot[0]:
+        forget_checklist(url)
+        return None
+    etag, checklist = snapshot
+    return etag, {item_id: dict(item) for item_id, item in checklist.items()}
+
+
+def forget_checklist(url: str) -> None:
+    """Drop the checklist snapshot of the task details at url (after a 404 or 412)."""
+    with _checklists_lock:
+        _checklists.pop(_resource_key(url), None)
+
+
+def clear_checklists() -> None:
+    """Forget every checklist snapshot."""
+    with _checklists_lock:
+        _checklists.clear()
+
+
+register_stale_handler(forget_checklist)
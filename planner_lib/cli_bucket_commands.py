@@ -4,20 +4,20 @@ Implements Typer CLI commands for bucket management.
 """
 
 import os
+import sys
 import json
-from typing import Optional
+from pathlib import Path
+from typing import List, Optional
 import typer
-from rich.console import Console
 
 from .config import load_conf
 from .auth import get_tokens
-from .resolution import resolve_plan, resolve_bucket
+from .resolution import resolve_plan, resolve_bucket, list_plan_buckets
 from .bucket_create import create_bucket_op
 from .bucket_delete import delete_bucket_op
 from .bucket_update import update_bucket_op
-from .bucket_move import move_bucket_tasks_op
-
-console = Console()
+from .bucket_move import move_bucket_tasks_op, get_checkpoint_path
+from .bucket_reorder import reorder_bucket_op
 
 
 def create_bucket_cmd(app: typer.Typer):
@@ -43,7 +43,9 @@ def create_bucket_cmd(app: typer.Typer):
 
             token = get_tokens(tenant_id, client_id)
             plan_obj = resolve_plan(token, plan)
-            result = create_bucket_op(plan_obj["id"], name, token)
+            # Current buckets, so the new one is ordered after the last
+            buckets = list_plan_buckets(plan_obj["id"], token)
+            result = create_bucket_op(plan_obj["id"], name, token, buckets=buckets)
             print(json.dumps(result, indent=2))
 
         except ValueError as e:
@@ -83,7 +85,7 @@ def delete_bucket_cmd(app: typer.Typer):
             token = get_tokens(tenant_id, client_id)
             plan_obj = resolve_plan(token, plan)
             bucket_obj = resolve_bucket(token, plan_obj["id"], bucket)
-            result = delete_bucket_op(bucket_obj["id"], token)
+            result = delete_bucket_op(bucket_obj["id"], token, etag=bucket_obj.get("@odata.etag"))
             print(json.dumps(result, indent=2))
 
         except ValueError as e:
@@ -124,7 +126,13 @@ def rename_bucket_cmd(app: typer.Typer):
             token = get_tokens(tenant_id, client_id)
             plan_obj = resolve_plan(token, plan)
             bucket_obj = resolve_bucket(token, plan_obj["id"], bucket)
-            result = update_bucket_op(bucket_obj["id"], new_name, token)
+            result = update_bucket_op(
+                bucket_obj["id"],
+                new_name,
+                token,
+                etag=bucket_obj.get("@odata.etag"),
+                old_name=bucket_obj.get("name")
+            )
             print(json.dumps(result, indent=2))
 
         except ValueError as e:
@@ -146,9 +154,13 @@ def move_bucket_tasks_cmd(app: typer.Typer):
     def move_bucket_tasks(
         source: str = typer.Option(..., "--source", help="Source bucket name or ID"),
         target: str = typer.Option(..., "--target", help="Target bucket name or ID"),
-        plan: str = typer.Option(..., "--plan", help="Plan name or ID")
+        plan: str = typer.Option(..., "--plan", help="Plan name or ID"),
+        workers: Optional[int] = typer.Option(None, "--workers", help="Concurrent requests (default: PLANNER_MAX_CONCURRENCY or 8)"),
+        checkpoint: Optional[str] = typer.Option(None, "--checkpoint", help="Checkpoint file (default: ~/.planner-cli/checkpoints/move-<source>-<target>.json)"),
+        no_checkpoint: bool = typer.Option(False, "--no-checkpoint", help="Do not record or resume progress"),
+        progress: bool = typer.Option(True, "--progress/--no-progress", help="Write NDJSON progress events to stderr")
     ):
-        """Move all tasks from source bucket to target bucket."""
+        """Move all tasks from source bucket to target bucket (resumable)."""
         try:
             cfg = load_conf()
             tenant_id = cfg.get("tenant_id") or os.environ.get("TENANT_ID")
@@ -166,7 +178,26 @@ def move_bucket_tasks_cmd(app: typer.Typer):
             plan_obj = resolve_plan(token, plan)
             source_obj = resolve_bucket(token, plan_obj["id"], source)
             target_obj = resolve_bucket(token, plan_obj["id"], target)
-            result = move_bucket_tasks_op(source_obj["id"], target_obj["id"], token)
+
+            checkpoint_path = None
+            if not no_checkpoint:
+                checkpoint_path = (
+                    Path(checkpoint).expanduser() if checkpoint
+                    else get_checkpoint_path(source_obj["id"], target_obj["id"])
+                )
+
+            def report(event: dict):
+                sys.stderr.write(json.dumps(event) + "\n")
+                sys.stderr.flush()
+
+            result = move_bucket_tasks_op(
+                source_obj["id"],
+                target_obj["id"],
+                token,
+                max_workers=workers,
+                checkpoint_path=checkpoint_path,
+                progress=report if progress else None
+            )
             print(json.dumps(result, indent=2))
 
         except ValueError as e:
@@ -182,9 +213,78 @@ def move_bucket_tasks_cmd(app: typer.Typer):
             raise typer.Exit(2)
 
 
+def reorder_bucket_cmd(app: typer.Typer):
+    """Reorder the tasks in a bucket with as few task updates as possible."""
+    @app.command("reorder-bucket")
+    def reorder_bucket(
+        bucket: str = typer.Option(..., "--bucket", help="Bucket name or ID"),
+        plan: str = typer.Option(..., "--plan", help="Plan name or ID"),
+        order: Optional[List[str]] = typer.Option(None, "--order", help="Task ID or title, in the wanted order (repeatable; newline-separated values add several); unlisted tasks follow"),
+        file: Optional[str] = typer.Option(None, "--file", help="File with one task ID or title per line ('-' for stdin)"),
+        by: Optional[str] = typer.Option(None, "--by", help="Sort by due, title, priority or created instead of an explicit order"),
+        descending: bool = typer.Option(False, "--descending", help="Reverse the --by sort"),
+        workers: Optional[int] = typer.Option(None, "--workers", help="Concurrent requests (default: PLANNER_MAX_CONCURRENCY or 8)"),
+        dry_run: bool = typer.Option(False, "--dry-run", help="Report the tasks that would move without updating them")
+    ):
+        """
+        Reorder the tasks in a bucket with as few task updates as possible.
+
+        Tasks whose current order already agrees with the wanted one keep
+        their orderHint; only the others are updated, concurrently.
+        """
+        try:
+            entries = [line for value in order or [] for line in value.splitlines()]
+            if file == "-":
+                entries.extend(sys.stdin.read().splitlines())
+            elif file:
+                with open(file, "r", encoding="utf-8") as f:
+                    entries.extend(f.read().splitlines())
+            entries = [entry.strip() for entry in entries if entry.strip()]
+
+            cfg = load_conf()
+            tenant_id = cfg.get("tenant_id") or os.environ.get("TENANT_ID")
+            client_id = cfg.get("client_id") or os.environ.get("CLIENT_ID")
+
+            if not tenant_id or not client_id:
+                error = {
+                    "code": "ConfigError",
+                    "message": "TENANT_ID and CLIENT_ID required"
+                }
+                print(json.dumps(error))
+                raise typer.Exit(2)
+
+            token = get_tokens(tenant_id, client_id)
+            plan_obj = resolve_plan(token, plan)
+            bucket_obj = resolve_bucket(token, plan_obj["id"], bucket)
+
+            result = reorder_bucket_op(
+                bucket_obj["id"],
+                token,
+                order=entries or None,
+                by=by,
+                descending=descending,
+                max_workers=workers,
+                dry_run=dry_run
+            )
+            print(json.dumps(result, indent=2))
+
+        except ValueError as e:
+            # Resolution or ordering error with JSON
+            print(str(e))
+            raise typer.Exit(2)
+        except Exception as e:
+            error = {
+                "code": "Error",
+                "message": str(e)
+            }
+            print(json.dumps(error))
+            raise typer.Exit(2)
+
+
 def register_bucket_commands(app: typer.Typer):
     """Register all bucket CLI commands with the Typer app."""
     create_bucket_cmd(app)
     delete_bucket_cmd(app)
     rename_bucket_cmd(app)
     move_bucket_tasks_cmd(app)
+    reorder_bucket_cmd(app)
@@ -0,0 +1,56 @@
+"""
+CLI Cache Commands Module
+Implements Typer CLI commands for inspecting and clearing the local cache.
+"""
+
+import json
+from typing import Optional
+import typer
+
+from .cache_store import get_cache_store
+
+
+def cache_clear_cmd(cache_app: typer.Typer):
+    """Clear cached entries."""
+    @cache_app.command("clear")
+    def cache_clear(
+        namespace: Optional[str] = typer.Option(None, "--namespace", help="Only clear one namespace (e.g. plan, bucket, group, user, plan-group, thread)")
+    ):
+        """Clear cached name → ID resolutions."""
+        try:
+            store = get_cache_store()
+            removed = store.invalidate(namespace) if namespace else store.clear()
+            print(json.dumps({"ok": True, "removed": removed}, indent=2))
+
+        except Exception as e:
+            error = {
+                "code": "CacheError",
+                "message": str(e)
+            }
+            print(json.dumps(error))
+            raise typer.Exit(2)
+
+
+def cache_stats_cmd(cache_app: typer.Typer):
+    """Show cache statistics."""
+    @cache_app.command("stats")
+    def cache_stats():
+        """Show cache size, namespaces and hit rate."""
+        try:
+            print(json.dumps(get_cache_store().stats(), indent=2))
+
+        except Exception as e:
+            error = {
+                "code": "CacheError",
+                "message": str(e)
+            }
+            print(json.dumps(error))
+            raise typer.Exit(2)
+
+
+def register_cache_commands(app: typer.Typer):
+    """Register the `cache` command group with the Typer app."""
+    cache_app = typer.Typer(help="Inspect or clear the local resolution cache")
+    cache_clear_cmd(cache_app)
+    cache_stats_cmd(cache_app)
+    app.add_typer(cache_app, name="cache")
@@ -7,14 +7,13 @@ import os
 import json
 from typing import Optional
 import typer
-from rich.console import Console
 
 from .config import load_conf, save_conf
 from .auth import get_tokens
-from .resolution import resolve_plan, resolve_bucket, list_user_plans, list_plan_buckets
+from .resolution import resolve_plan, resolve_bucket, list_user_plans, list_plan_buckets, iter_user_plans, iter_plan_buckets
 from .task_creation import create_task
-
-console = Console()
+from .local_store import get_local_store
+from .cli_output import console, check_output_format, print_items
 
 
 def init_auth_cmd(app: typer.Typer):
@@ -74,9 +73,12 @@ def set_defaults_cmd(app: typer.Typer):
 def list_plans_cmd(app: typer.Typer):
     """List all available plans."""
     @app.command()
-    def list_plans():
+    def list_plans(
+        output: str = typer.Option("json", "--output", help="Output format: json (array, written once paging completes) or ndjson (one plan per line, streamed as pages arrive)")
+    ):
         """List all available plans."""
         try:
+            check_output_format(output)
             cfg = load_conf()
             tenant_id = cfg.get("tenant_id") or os.environ.get("TENANT_ID")
             client_id = cfg.get("client_id") or os.environ.get("CLIENT_ID")
@@ -90,9 +92,13 @@ def list_plans_cmd(app: typer.Typer):
                 raise typer.Exit(2)
 
             token = get_tokens(tenant_id, client_id)
-            plans = list_user_plans(token)
-            print(json.dumps(plans, indent=2))
+            # NDJSON streams page by page; the array form resolves all group names at once
+            plans = iter_user_plans(token) if output == "ndjson" else list_user_plans(token)
+            print_items(plans, output)
 
+        except ValueError as e:
+            print(str(e))
+            raise typer.Exit(2)
         except Exception as e:
             error = {
                 "code": "Error",
@@ -106,10 +112,19 @@ def list_buckets_cmd(app: typer.Typer):
     """List all buckets in a plan."""
     @app.command()
     def list_buckets(
-        plan: str = typer.Option(..., "--plan", help="Plan name or ID")
+        plan: str = typer.Option(..., "--plan", help="Plan name or ID"),
+        cached: bool = typer.Option(False, "--cached", "--offline", help="Answer from the local store (see 'sync')"),
+        output: str = typer.Option("json", "--output", help="Output format: json (array, written once paging completes) or ndjson (one bucket per line, streamed as pages arrive)")
     ):
         """List all buckets in a plan."""
         try:
+            check_output_format(output)
+            if cached:
+                store = get_local_store()
+                plan_obj = store.resolve_plan(plan)
+                print_items(store.list_buckets(plan_obj["id"]), output)
+                return
+
             cfg = load_conf()
             tenant_id = cfg.get("tenant_id") or os.environ.get("TENANT_ID")
             client_id = cfg.get("client_id") or os.environ.get("CLIENT_ID")
@@ -124,8 +139,11 @@ def list_buckets_cmd(app: typer.Typer):
 
             token = get_tokens(tenant_id, client_id)
             plan_obj = resolve_plan(token, plan)
-            buckets = list_plan_buckets(plan_obj["id"], token)
-            print(json.dumps(buckets, indent=2))
+            if output == "ndjson":
+                buckets = iter_plan_buckets(plan_obj["id"], token)
+            else:
+                buckets = list_plan_buckets(plan_obj["id"], token)
+            print_items(buckets, output)
 
         except ValueError as e:
             # Resolution error with JSON
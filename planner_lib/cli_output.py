@@ -0,0 +1,99 @@
+"""
+CLI Output Module
+Helpers for writing command results to stdout.
+"""
+
+import json
+import sys
+from typing import Iterable
+
+OUTPUT_FORMATS = ("json", "ndjson")
+
+
+class _LazyConsole:
+    """rich Console stand-in that imports rich on first use."""
+
+    _console = None
+
+    def __getattr__(self, name: str):
+        if _LazyConsole._console is None:
+            from rich.console import Console
+            _LazyConsole._console = Console()
+        return getattr(_LazyConsole._console, name)
+
+
+# Shared console for human-readable output
+console = _LazyConsole()
+
+
+def print_device_code(flow: dict) -> None:
+    """Render MSAL device code sign-in instructions (see auth.set_device_code_handler)."""
+    console.print(f"\n[bold cyan]Authentication Required[/bold cyan]")
+    console.print(f"Please visit: [bold]{flow['verification_uri']}[/bold]")
+    console.print(f"Enter code: [bold yellow]{flow['user_code']}[/bold yellow]\n")
+
+
+def print_json_array(items: Iterable[dict]) -> None:
+    """
+    Print items as an indented JSON array once the iterable is exhausted.
+
+    Output is identical to print(json.dumps(list(items), indent=2)). Items
+    are serialized as they arrive but written only at the end, so an error
+    while paging leaves stdout empty for the command's JSON error instead of
+    a truncated array; use print_ndjson to stream.
+
+    Args:
+        items: Iterable (typically a generator) of JSON-serializable objects
+    """
+    bodies = [json.dumps(item, indent=2).replace("\n", "\n  ") for item in items]
+    out = sys.stdout
+    out.write("[\n  " + ",\n  ".join(bodies) + "\n]\n" if bodies else "[]\n")
+    out.flush()
+
+
+def print_ndjson(items: Iterable[dict]) -> None:
+    """
+    Print items as newline-delimited JSON, one compact object per line.
+
+    Each line is flushed as soon as its item arrives, so consumers can start
+    processing before the command finishes.
+
+    Args:
+        items: Iterable (typically a generator) of JSON-serializable objects
+    """
+    out = sys.stdout
+    for item in items:
+        out.write(json.dumps(item) + "\n")
+        out.flush()
+
+
+def check_output_format(output: str) -> None:
+    """
+    Validate an --output value before any work is done.
+
+    Raises:
+        ValueError: With JSON error object for an unknown format
+    """
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(json.dumps({
+            "code": "InvalidInput",
+            "message": f"Unsupported output format '{output}' (use json or ndjson)"
+        }))
+
+
+def print_items(items: Iterable[dict], output: str = "json") -> None:
+    """
+    Print items as an indented JSON array or as NDJSON.
+
+    Only NDJSON streams; the JSON array is written once the iterable is
+    exhausted (see print_json_array).
+
+    Args:
+        items: Iterable (typically a generator) of JSON-serializable objects
+        output: "json" or "ndjson"
+    """
+    check_output_format(output)
+    if output == "ndjson":
+        print_ndjson(items)
+    else:
+        print_json_array(items)
@@ -0,0 +1,111 @@
+"""
+CLI Command Registry
+Maps command names to the modules that register them, so planner.py imports
+a command's module (and msal, requests, ...) only when that command runs.
+"""
+
+from importlib import import_module
+from typing import Dict, List, Optional, Tuple
+
+import click
+import typer
+import typer.main
+from typer.core import TyperCommand, TyperGroup
+
+# Command name -> (planner_lib submodule, function registering it on a Typer app,
+# short help shown by the root --help without importing the module)
+COMMANDS: Dict[str, Tuple[str, str, str]] = {
+    "init-auth": ("cli_commands", "init_auth_cmd",
+        "Initialize authentication with Microsoft."),
+    "set-defaults": ("cli_commands", "set_defaults_cmd",
+        "Set default plan and bucket for task creation."),
+    "list-plans": ("cli_commands", "list_plans_cmd",
+        "List all available plans."),
+    "list-buckets": ("cli_commands", "list_buckets_cmd",
+        "List all buckets in a plan."),
+    "add": ("cli_commands", "add_task_cmd",
+        "Create a new task in Microsoft Planner."),
+    "list-tasks-cmd": ("cli_task_list", "list_tasks_cmd",
+        "List tasks in a plan or bucket."),
+    "find-task-cmd": ("cli_task_list", "find_task_cmd",
+        "Find a task by ID or title."),
+    "search-tasks": ("cli_task_list", "search_tasks_cmd",
+        "Search tasks by partial title, description or checklist text."),
+    "my-tasks": ("cli_task_list", "my_tasks_cmd",
+        "List tasks across plans as NDJSON (one task per line)."),
+    "complete-task-cmd": ("cli_task_update", "complete_task_cmd",
+        "Mark a task as complete."),
+    "move-task-cmd": ("cli_task_update", "move_task_cmd",
+        "Move a task to a different bucket."),
+    "update-task-labels-cmd": ("cli_task_update", "update_task_labels_cmd",
+        "Update labels on an existing task."),
+    "update-task": ("cli_task_update_enhanced", "update_task_cmd",
+        "Update properties on an existing task (title, description, labels)."),
+    "add-subtask-cmd": ("cli_task_subtask", "add_subtask_cmd",
+        "Add a subtask (checklist item) to a task."),
+    "list-subtasks-cmd": ("cli_task_subtask", "list_subtasks_cmd",
+        "List subtasks (checklist items) for a task."),
+    "complete-subtask-cmd": ("cli_task_subtask", "complete_subtask_cmd",
+        "Mark a subtask (checklist item) as complete."),
+    "delete-task-cmd": ("cli_task_update", "delete_task_cmd",
+        "Delete a task (requires --confirm flag)."),
+    "list-comments-cmd": ("cli_task_comments", "list_comments_cmd",
+        "List all comments on a task."),
+    "add-comment-cmd": ("cli_task_comments", "add_comment_cmd",
+        "Add a comment to a task."),
+    "add-bulk": ("cli_task_bulk", "add_bulk_cmd",
+        "Create many tasks from a CSV or JSON Lines file."),
+    "create-bucket": ("cli_bucket_commands", "create_bucket_cmd",
+        "Create a new bucket in a plan."),
+    "delete-bucket": ("cli_bucket_commands", "delete_bucket_cmd",
+        "Delete a bucket from a plan."),
+    "rename-bucket": ("cli_bucket_commands", "rename_bucket_cmd",
+        "Rename a bucket."),
+    "move-bucket-tasks": ("cli_bucket_commands", "move_bucket_tasks_cmd",
+        "Move all tasks from source bucket to target bucket (resumable)."),
+    "reorder-bucket": ("cli_bucket_commands", "reorder_bucket_cmd",
+        "Reorder the tasks in a bucket with as few task updates as possible."),
+    "sync": ("cli_sync_commands", "sync_cmd",
+        "Mirror plans, buckets and tasks into the local store."),
+    "worker": ("cli_worker", "worker_cmd",
+        "Serve JSON-lines command requests on stdin/stdout (used by the MCP server)."),
+    "user": ("cli_user_commands", "register_user_commands",
+        "User search and lookup commands"),
+    "cache": ("cli_cache_commands", "register_cache_commands",
+        "Inspect or clear the local resolution cache"),
+}
+
+# Commands registered with hidden=True; their listing placeholders stay hidden too
+HIDDEN = {"worker"}
+
+
+class LazyCommandGroup(TyperGroup):
+    """
+    Typer group that loads each command from COMMANDS on first lookup.
+
+    Running one command imports only its module. The root --help lists
+    commands from the registry's short help, so it imports none of them.
+    """
+
+    _listing = False
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return list(dict.fromkeys([*COMMANDS, *self.commands]))
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        self._listing = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.commands and cmd_name in COMMANDS:
+            module, registrar, short_help = COMMANDS[cmd_name]
+            if self._listing:
+                return TyperCommand(cmd_name, help=short_help, hidden=cmd_name in HIDDEN)
+            scratch = typer.Typer()
+            getattr(import_module(f"planner_lib.{module}"), registrar)(scratch)
+            loaded = typer.main.get_group(scratch).commands
+            self.add_command(loaded[cmd_name], cmd_name)
+        return self.commands.get(cmd_name)
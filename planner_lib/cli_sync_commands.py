@@ -0,0 +1,97 @@
+"""
+CLI Sync Commands Module
+Implements the Typer command that mirrors plans into the local store.
+"""
+
+import os
+import json
+from typing import Optional
+import typer
+
+from .config import load_conf
+from .auth import get_tokens
+from .local_store import get_local_store
+from .resolution import resolve_plan, list_user_plans
+from .store_sync import sync_plan
+
+
+def sync_cmd(app: typer.Typer):
+    """Mirror plans, buckets and tasks into the local store."""
+    @app.command()
+    def sync(
+        plan: Optional[str] = typer.Option(None, "--plan", help="Plan name or ID (default: all plans)"),
+        no_details: bool = typer.Option(False, "--no-details", help="Skip descriptions and checklists"),
+        full: bool = typer.Option(False, "--full", help="Refetch details of unchanged tasks too"),
+        max_workers: Optional[int] = typer.Option(None, "--max-workers", help="Concurrent $batch requests")
+    ):
+        """
+        Mirror plans, buckets and tasks into the local store.
+
+        Only tasks whose ETag changed since the last sync have their details
+        refetched. Read commands answer from the store with --cached.
+        """
+        try:
+            cfg = load_conf()
+            tenant_id = cfg.get("tenant_id") or os.environ.get("TENANT_ID")
+            client_id = cfg.get("client_id") or os.environ.get("CLIENT_ID")
+
+            if not tenant_id or not client_id:
+                error = {
+                    "code": "ConfigError",
+                    "message": "TENANT_ID and CLIENT_ID required"
+                }
+                print(json.dumps(error))
+                raise typer.Exit(2)
+
+            token = get_tokens(tenant_id, client_id)
+            store = get_local_store()
+
+            removed_plans = 0
+            if plan:
+                plan_ids = [resolve_plan(token, plan)["id"]]
+            else:
+                plan_ids = [p["id"] for p in list_user_plans(token, include_group_names=False)]
+                # Plans the user can no longer see are dropped from the mirror
+                for stored in store.list_plans():
+                    if stored["id"] not in plan_ids:
+                        store.remove_plan(stored["id"])
+                        removed_plans += 1
+
+            summaries = [
+                sync_plan(
+                    token,
+                    plan_id,
+                    store=store,
+                    include_details=not no_details,
+                    full=full,
+                    max_workers=max_workers
+                )
+                for plan_id in plan_ids
+            ]
+
+            result = {
+                "ok": True,
+                "path": str(store.path),
+                "plans": summaries,
+                "removedPlans": removed_plans
+            }
+            print(json.dumps(result, indent=2))
+
+        except typer.Exit:
+            raise
+        except ValueError as e:
+            # Resolution error with JSON
+            print(str(e))
+            raise typer.Exit(2)
+        except Exception as e:
+            error = {
+                "code": "Error",
+                "message": str(e)
+            }
+            print(json.dumps(error))
+            raise typer.Exit(2)
+
+
+def register_sync_commands(app: typer.Typer):
+    """Register the `sync` command with the Typer app."""
+    sync_cmd(app)
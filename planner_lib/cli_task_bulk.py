@@ -0,0 +1,95 @@
+"""
+CLI Task Bulk Commands
+Command for creating many tasks from a CSV or JSON Lines file.
+"""
+
+import os
+import sys
+import json
+from typing import Optional
+import typer
+
+from .config import load_conf
+from .auth import get_tokens
+from .task_bulk import read_bulk_rows, create_tasks_bulk
+
+
+def _detect_format(file: str, fmt: Optional[str]) -> str:
+    """Pick csv/jsonl from --format or the file extension (stdin defaults to jsonl)."""
+    if fmt:
+        return fmt.lower()
+    if file.lower().endswith(".csv"):
+        return "csv"
+    return "jsonl"
+
+
+def add_bulk_cmd(app: typer.Typer):
+    """Create many tasks from a CSV or JSON Lines file."""
+    @app.command("add-bulk")
+    def add_bulk(
+        file: str = typer.Option(..., "--file", help="CSV or JSON Lines file of tasks ('-' for stdin)"),
+        fmt: Optional[str] = typer.Option(None, "--format", help="Input format: csv or jsonl (default: from file extension)"),
+        plan: Optional[str] = typer.Option(None, "--plan", help="Plan name or ID for rows without one"),
+        bucket: Optional[str] = typer.Option(None, "--bucket", help="Bucket name or ID for rows without one"),
+        max_workers: Optional[int] = typer.Option(None, "--max-workers", help="Concurrent $batch requests")
+    ):
+        """
+        Create many tasks from a CSV or JSON Lines file.
+
+        Columns/keys: title (required), plan, bucket, desc, due, assignee, labels.
+        Prints one JSON result per row as each batch completes; exits with 2 if
+        any row failed.
+        """
+        try:
+            cfg = load_conf()
+            tenant_id = cfg.get("tenant_id") or os.environ.get("TENANT_ID")
+            client_id = cfg.get("client_id") or os.environ.get("CLIENT_ID")
+            plan_input = plan or os.environ.get("PLANNER_DEFAULT_PLAN") or cfg.get("default_plan")
+            bucket_input = bucket or os.environ.get("PLANNER_DEFAULT_BUCKET") or cfg.get("default_bucket")
+
+            if not tenant_id or not client_id:
+                error = {
+                    "code": "ConfigError",
+                    "message": "TENANT_ID and CLIENT_ID required"
+                }
+                print(json.dumps(error))
+                raise typer.Exit(2)
+
+            input_format = _detect_format(file, fmt)
+            if file == "-":
+                rows = read_bulk_rows(sys.stdin, input_format)
+            else:
+                with open(file, "r", encoding="utf-8", newline="") as f:
+                    rows = read_bulk_rows(f, input_format)
+
+            token = get_tokens(tenant_id, client_id)
+
+            failed = 0
+            for result in create_tasks_bulk(
+                token,
+                rows,
+                default_plan=plan_input,
+                default_bucket=bucket_input,
+                max_workers=max_workers
+            ):
+                if not result["ok"]:
+                    failed += 1
+                sys.stdout.write(json.dumps(result) + "\n")
+                sys.stdout.flush()
+
+            if failed:
+                raise typer.Exit(2)
+
+        except typer.Exit:
+            raise
+        except ValueError as e:
+            # Input or resolution error with JSON
+            print(str(e))
+            raise typer.Exit(2)
+        except Exception as e:
+            error = {
+                "code": "Error",
+                "message": str(e)
+            }
+            print(json.dumps(error))
+            raise typer.Exit(2)
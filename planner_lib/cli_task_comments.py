@@ -5,7 +5,7 @@ Commands for reading and adding task comments.
 
 import os
 import json
-from typing import Optional
+from typing import Optional, Tuple
 import typer
 
 from .constants import GUID_PATTERN
@@ -13,7 +13,21 @@ from .config import load_conf
 from .auth import get_tokens
 from .resolution import resolve_plan
 from .task_operations import resolve_task
-from .task_comments import get_task_comments, add_task_comment
+from .task_comments import get_task_comments, iter_task_comments, add_task_comment
+from .cli_output import check_output_format, print_items
+
+
+def _resolve_task_thread(token: str, task: str, plan_id: str) -> Tuple[str, Optional[str]]:
+    """
+    Return (task_id, conversationThreadId if known) for a task ID or title.
+
+    Task IDs are not looked up: the comment operations take the thread ID
+    from the cache, so a warm call costs a single request.
+    """
+    if GUID_PATTERN.match(task):
+        return task, None
+    task_obj = resolve_task(token, task, plan_id)
+    return task_obj["id"], task_obj.get("conversationThreadId")
 
 
 def list_comments_cmd(app: typer.Typer):
@@ -21,10 +35,12 @@ def list_comments_cmd(app: typer.Typer):
     @app.command()
     def list_comments_cmd(
         task: str = typer.Option(..., "--task", help="Task ID or title"),
-        plan: str = typer.Option(..., "--plan", help="Plan name or ID")
+        plan: str = typer.Option(..., "--plan", help="Plan name or ID"),
+        output: str = typer.Option("json", "--output", help="Output format: json (array, written once paging completes) or ndjson (one comment per line, streamed as pages arrive)")
     ):
         """List all comments on a task."""
         try:
+            check_output_format(output)
             cfg = load_conf()
             tenant_id = cfg.get("tenant_id") or os.environ.get("TENANT_ID")
             client_id = cfg.get("client_id") or os.environ.get("CLIENT_ID")
@@ -44,12 +60,18 @@ def list_comments_cmd(app: typer.Typer):
             plan_id = plan_obj["id"]
 
             # Resolve task
-            task_obj = resolve_task(token, task, plan_id)
-            task_id = task_obj["id"]
+            task_id, thread_id = _resolve_task_thread(token, task, plan_id)
 
             # Get comments
-            comments = get_task_comments(task_id, plan_id, token)
-            print(json.dumps(comments, indent=2))
+            if output == "ndjson":
+                comments = iter_task_comments(
+                    task_id, plan_id, token, group_id=plan_obj.get("owner"), thread_id=thread_id
+                )
+            else:
+                comments = get_task_comments(
+                    task_id, plan_id, token, group_id=plan_obj.get("owner"), thread_id=thread_id
+                )
+            print_items(comments, output)
 
         except ValueError as e:
             print(str(e))
@@ -92,11 +114,12 @@ def add_comment_cmd(app: typer.Typer):
             plan_id = plan_obj["id"]
 
             # Resolve task
-            task_obj = resolve_task(token, task, plan_id)
-            task_id = task_obj["id"]
+            task_id, thread_id = _resolve_task_thread(token, task, plan_id)
 
             # Add comment
-            result = add_task_comment(task_id, plan_id, comment, token)
+            result = add_task_comment(
+                task_id, plan_id, comment, token, group_id=plan_obj.get("owner"), thread_id=thread_id
+            )
             print(json.dumps(result, indent=2))
 
         except ValueError as e:
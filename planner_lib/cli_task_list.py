@@ -5,14 +5,19 @@ Commands for listing and finding tasks.
 
 import os
 import json
-from typing import Optional
+from typing import List, Optional
 import typer
 
-from .constants import GUID_PATTERN
+from .constants import GUID_PATTERN, SEARCH_DEFAULT_LIMIT
 from .config import load_conf
 from .auth import get_tokens
 from .resolution import resolve_plan, resolve_bucket
-from .task_operations import list_tasks, resolve_task
+from .task_operations import iter_tasks, resolve_task
+from .local_store import get_local_store
+from .task_search import search_tasks
+from .task_aggregate import TaskFilter, iter_my_tasks, iter_plans_tasks
+from .resolution_users import resolve_user
+from .cli_output import check_output_format, print_items
 
 
 def list_tasks_cmd(app: typer.Typer):
@@ -21,10 +26,32 @@ def list_tasks_cmd(app: typer.Typer):
     def list_tasks_cmd(
         plan: str = typer.Option(..., "--plan", help="Plan name or ID"),
         bucket: Optional[str] = typer.Option(None, "--bucket", help="Bucket name or ID"),
-        incomplete: bool = typer.Option(False, "--incomplete", help="Show only incomplete tasks")
+        incomplete: bool = typer.Option(False, "--incomplete", help="Show only incomplete tasks"),
+        fields: Optional[str] = typer.Option(None, "--fields", help="Comma-separated task fields to output (e.g., id,title,bucketId)"),
+        no_details: bool = typer.Option(False, "--no-details", help="Skip fetching task descriptions"),
+        cached: bool = typer.Option(False, "--cached", "--offline", help="Answer from the local store (see 'sync')"),
+        output: str = typer.Option("json", "--output", help="Output format: json (array, written once paging completes) or ndjson (one task per line, streamed as pages arrive)")
     ):
         """List tasks in a plan or bucket."""
         try:
+            check_output_format(output)
+            field_list = None
+            if fields:
+                field_list = [f.strip() for f in fields.split(",") if f.strip()]
+
+            if cached:
+                store = get_local_store()
+                plan_obj = store.resolve_plan(plan)
+                bucket_id = store.resolve_bucket(plan_obj["id"], bucket)["id"] if bucket else None
+                print_items(store.iter_tasks(
+                    plan_id=plan_obj["id"],
+                    bucket_id=bucket_id,
+                    incomplete_only=incomplete,
+                    include_details=not no_details,
+                    fields=field_list
+                ), output)
+                return
+
             cfg = load_conf()
             tenant_id = cfg.get("tenant_id") or os.environ.get("TENANT_ID")
             client_id = cfg.get("client_id") or os.environ.get("CLIENT_ID")
@@ -45,8 +72,17 @@ def list_tasks_cmd(app: typer.Typer):
                 bucket_obj = resolve_bucket(token, plan_obj["id"], bucket)
                 bucket_id = bucket_obj["id"]
 
-            tasks = list_tasks(token, plan_id=plan_obj["id"], bucket_id=bucket_id, incomplete_only=incomplete)
-            print(json.dumps(tasks, indent=2))
+            # Stream tasks page by page; the next page is fetched while this one is written
+            tasks = iter_tasks(
+                token,
+                plan_id=plan_obj["id"],
+                bucket_id=bucket_id,
+                incomplete_only=incomplete,
+                prefetch=True,
+                include_details=not no_details,
+                fields=field_list
+            )
+            print_items(tasks, output)
 
         except ValueError as e:
             print(str(e))
@@ -65,11 +101,23 @@ def find_task_cmd(app: typer.Typer):
     @app.command()
     def find_task_cmd(
         task: str = typer.Option(..., "--task", help="Task ID or title"),
-        plan: Optional[str] = typer.Option(None, "--plan", help="Plan name or ID")
+        plan: Optional[str] = typer.Option(None, "--plan", help="Plan name or ID"),
+        cached: bool = typer.Option(False, "--cached", "--offline", help="Answer from the local store (see 'sync')")
     ):
         """Find a task by ID or title."""
         try:
             cfg = load_conf()
+
+            if cached:
+                store = get_local_store()
+                plan_id = None
+                plan_input = plan or cfg.get("default_plan")
+                if not GUID_PATTERN.match(task) and plan_input:
+                    plan_id = store.resolve_plan(plan_input)["id"]
+                task_obj = store.resolve_task(task, plan_id, include_details=True)
+                print(json.dumps(task_obj, indent=2))
+                return
+
             tenant_id = cfg.get("tenant_id") or os.environ.get("TENANT_ID")
             client_id = cfg.get("client_id") or os.environ.get("CLIENT_ID")
 
@@ -96,7 +144,7 @@ def find_task_cmd(app: typer.Typer):
                 plan_obj = resolve_plan(token, plan_input)
                 plan_id = plan_obj["id"]
 
-            task_obj = resolve_task(token, task, plan_id)
+            task_obj = resolve_task(token, task, plan_id, include_details=True)
             print(json.dumps(task_obj, indent=2))
 
         except ValueError as e:
@@ -109,3 +157,151 @@ def find_task_cmd(app: typer.Typer):
             }
             print(json.dumps(error))
             raise typer.Exit(2)
+
+
+def search_tasks_cmd(app: typer.Typer):
+    """Search tasks by partial title, description or checklist text."""
+    @app.command("search-tasks")
+    def search_tasks_cmd(
+        query: str = typer.Option(..., "--query", help="Words to search for (partial words and typos match)"),
+        plan: Optional[str] = typer.Option(None, "--plan", help="Plan name or ID"),
+        limit: int = typer.Option(SEARCH_DEFAULT_LIMIT, "--limit", help="Maximum number of results"),
+        cached: bool = typer.Option(False, "--cached", "--offline", help="Search the last synced snapshot without contacting Graph")
+    ):
+        """
+        Search tasks by partial title, description or checklist text.
+
+        Results are ranked best first. The plan is synced into the local
+        store first (only changed tasks are refetched) unless --cached.
+        """
+        try:
+            cfg = load_conf()
+            plan_input = plan or os.environ.get("PLANNER_DEFAULT_PLAN") or cfg.get("default_plan")
+
+            if not plan_input:
+                error = {
+                    "code": "ConfigError",
+                    "message": "Plan required (via --plan, env var, or config default)"
+                }
+                print(json.dumps(error))
+                raise typer.Exit(2)
+
+            if cached:
+                plan_obj = get_local_store().resolve_plan(plan_input)
+                results = search_tasks(None, plan_obj["id"], query, limit=limit, cached=True)
+                print(json.dumps(results, indent=2))
+                return
+
+            tenant_id = cfg.get("tenant_id") or os.environ.get("TENANT_ID")
+            client_id = cfg.get("client_id") or os.environ.get("CLIENT_ID")
+
+            if not tenant_id or not client_id:
+                error = {
+                    "code": "ConfigError",
+                    "message": "TENANT_ID and CLIENT_ID required"
+                }
+                print(json.dumps(error))
+                raise typer.Exit(2)
+
+            token = get_tokens(tenant_id, client_id)
+            plan_obj = resolve_plan(token, plan_input)
+            results = search_tasks(token, plan_obj["id"], query, limit=limit)
+            print(json.dumps(results, indent=2))
+
+        except typer.Exit:
+            raise
+        except ValueError as e:
+            print(str(e))
+            raise typer.Exit(2)
+        except Exception as e:
+            error = {
+                "code": "Error",
+                "message": str(e)
+            }
+            print(json.dumps(error))
+            raise typer.Exit(2)
+
+
+def my_tasks_cmd(app: typer.Typer):
+    """List tasks across plans as NDJSON."""
+    @app.command("my-tasks")
+    def my_tasks_cmd(
+        all_plans: bool = typer.Option(False, "--all-plans", help="Read every plan visible to you instead of only your assigned tasks"),
+        plan: Optional[List[str]] = typer.Option(None, "--plan", help="Plan name or ID to read (repeatable; implies a plan fan-out)"),
+        assignee: Optional[str] = typer.Option(None, "--assignee", help="Only tasks assigned to this user (email, UPN, or user ID)"),
+        incomplete: bool = typer.Option(False, "--incomplete", help="Show only incomplete tasks"),
+        due_after: Optional[str] = typer.Option(None, "--due-after", help="Only tasks due on or after this day (YYYY-MM-DD)"),
+        due_before: Optional[str] = typer.Option(None, "--due-before", help="Only tasks due on or before this day (YYYY-MM-DD)"),
+        label: Optional[str] = typer.Option(None, "--label", help="Only tasks carrying all these labels (e.g., Label1,Label3)"),
+        fields: Optional[str] = typer.Option(None, "--fields", help="Comma-separated task fields to output (e.g., id,title,planId)"),
+        no_details: bool = typer.Option(False, "--no-details", help="Skip fetching task descriptions"),
+        max_workers: Optional[int] = typer.Option(None, "--max-workers", help="Plans read concurrently in a fan-out"),
+        output: str = typer.Option("ndjson", "--output", help="Output format: ndjson (one task per line, streamed as pages arrive) or json (array, written once paging completes)")
+    ):
+        """
+        List tasks across plans as NDJSON (one task per line).
+
+        By default reads the tasks assigned to you from /me/planner/tasks.
+        With --all-plans or --plan, reads the plans concurrently and merges
+        their tasks as they arrive. Filters are applied to each page before
+        descriptions are fetched.
+        """
+        try:
+            check_output_format(output)
+            field_list = None
+            if fields:
+                field_list = [f.strip() for f in fields.split(",") if f.strip()]
+
+            cfg = load_conf()
+            tenant_id = cfg.get("tenant_id") or os.environ.get("TENANT_ID")
+            client_id = cfg.get("client_id") or os.environ.get("CLIENT_ID")
+
+            if not tenant_id or not client_id:
+                error = {
+                    "code": "ConfigError",
+                    "message": "TENANT_ID and CLIENT_ID required"
+                }
+                print(json.dumps(error))
+                raise typer.Exit(2)
+
+            token = get_tokens(tenant_id, client_id)
+
+            task_filter = TaskFilter(
+                incomplete_only=incomplete,
+                due_after=due_after,
+                due_before=due_before,
+                assignee_id=resolve_user(token, assignee) if assignee else None,
+                labels=label
+            )
+
+            if all_plans or plan:
+                plan_ids = [resolve_plan(token, p)["id"] for p in plan] if plan else None
+                tasks = iter_plans_tasks(
+                    token,
+                    plan_ids=plan_ids,
+                    task_filter=task_filter,
+                    include_details=not no_details,
+                    fields=field_list,
+                    max_workers=max_workers
+                )
+            else:
+                tasks = iter_my_tasks(
+                    token,
+                    task_filter=task_filter,
+                    include_details=not no_details,
+                    fields=field_list
+                )
+            print_items(tasks, output)
+
+        except typer.Exit:
+            raise
+        except ValueError as e:
+            print(str(e))
+            raise typer.Exit(2)
+        except Exception as e:
+            error = {
+                "code": "Error",
+                "message": str(e)
+            }
+            print(json.dumps(error))
+            raise typer.Exit(2)
@@ -4,8 +4,9 @@ Commands for managing subtasks (checklist items).
 """
 
 import os
+import sys
 import json
-from typing import Optional
+from typing import List, Optional
 import typer
 
 from .constants import GUID_PATTERN
@@ -13,7 +14,19 @@ from .config import load_conf
 from .auth import get_tokens
 from .resolution import resolve_plan
 from .task_operations import resolve_task
-from .task_subtasks import add_subtask, list_subtasks, complete_subtask
+from .task_subtasks import add_subtask, add_subtasks, list_subtasks, complete_subtask
+from .local_store import get_local_store
+
+
+def _read_subtask_titles(subtasks: Optional[List[str]], file: Optional[str]) -> List[str]:
+    """Collect titles from repeated --subtask values (split on newlines) and --file lines."""
+    lines = [line for value in subtasks or [] for line in value.splitlines()]
+    if file == "-":
+        lines.extend(sys.stdin.read().splitlines())
+    elif file:
+        with open(file, "r", encoding="utf-8") as f:
+            lines.extend(f.read().splitlines())
+    return [line.strip() for line in lines if line.strip()]
 
 
 def add_subtask_cmd(app: typer.Typer):
@@ -21,11 +34,26 @@ def add_subtask_cmd(app: typer.Typer):
     @app.command()
     def add_subtask_cmd(
         task: str = typer.Option(..., "--task", help="Task ID or title"),
-        subtask: str = typer.Option(..., "--subtask", help="Subtask title"),
+        subtask: Optional[List[str]] = typer.Option(None, "--subtask", help="Subtask title (repeatable; newline-separated titles add several)"),
+        file: Optional[str] = typer.Option(None, "--file", help="File with one subtask title per line ('-' for stdin)"),
         plan: Optional[str] = typer.Option(None, "--plan", help="Plan name or ID")
     ):
-        """Add a subtask (checklist item) to a task."""
+        """
+        Add a subtask (checklist item) to a task.
+
+        Several titles (repeated --subtask, a newline-separated list or --file)
+        are added together with a single update of the task's checklist.
+        """
         try:
+            titles = _read_subtask_titles(subtask, file)
+            if not titles:
+                error = {
+                    "code": "InvalidInput",
+                    "message": "Provide at least one --subtask or a --file of titles"
+                }
+                print(json.dumps(error))
+                raise typer.Exit(2)
+
             cfg = load_conf()
             tenant_id = cfg.get("tenant_id") or os.environ.get("TENANT_ID")
             client_id = cfg.get("client_id") or os.environ.get("CLIENT_ID")
@@ -59,7 +87,10 @@ def add_subtask_cmd(app: typer.Typer):
                 plan_id = plan_obj["id"]
 
             task_obj = resolve_task(token, task, plan_id)
-            result = add_subtask(task_obj["id"], subtask, token)
+            if len(titles) == 1:
+                result = add_subtask(task_obj["id"], titles[0], token)
+            else:
+                result = add_subtasks(task_obj["id"], titles, token)
             print(json.dumps(result, indent=2))
 
         except ValueError as e:
@@ -79,11 +110,23 @@ def list_subtasks_cmd(app: typer.Typer):
     @app.command()
     def list_subtasks_cmd(
         task: str = typer.Option(..., "--task", help="Task ID or title"),
-        plan: Optional[str] = typer.Option(None, "--plan", help="Plan name or ID")
+        plan: Optional[str] = typer.Option(None, "--plan", help="Plan name or ID"),
+        cached: bool = typer.Option(False, "--cached", "--offline", help="Answer from the local store (see 'sync')")
     ):
         """List subtasks (checklist items) for a task."""
         try:
             cfg = load_conf()
+
+            if cached:
+                store = get_local_store()
+                plan_id = None
+                plan_input = plan or cfg.get("default_plan")
+                if not GUID_PATTERN.match(task) and plan_input:
+                    plan_id = store.resolve_plan(plan_input)["id"]
+                task_obj = store.resolve_task(task, plan_id)
+                print(json.dumps(store.list_subtasks(task_obj["id"]), indent=2))
+                return
+
             tenant_id = cfg.get("tenant_id") or os.environ.get("TENANT_ID")
             client_id = cfg.get("client_id") or os.environ.get("CLIENT_ID")
 
@@ -53,7 +53,7 @@ def complete_task_cmd(app: typer.Typer):
                 plan_id = plan_obj["id"]
 
             task_obj = resolve_task(token, task, plan_id)
-            result = complete_task_op(task_obj["id"], token)
+            result = complete_task_op(task_obj["id"], token, etag=task_obj.get("@odata.etag"))
             print(json.dumps(result, indent=2))
 
         except ValueError as e:
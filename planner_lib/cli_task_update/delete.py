@@ -62,7 +62,7 @@ def delete_task_cmd(app: typer.Typer):
                 plan_id = plan_obj["id"]
 
             task_obj = resolve_task(token, task, plan_id)
-            result = delete_task_op(task_obj["id"], token)
+            result = delete_task_op(task_obj["id"], token, etag=task_obj.get("@odata.etag"))
             print(json.dumps(result, indent=2))
 
         except ValueError as e:
@@ -58,7 +58,7 @@ def move_task_cmd(app: typer.Typer):
 
             task_obj = resolve_task(token, task, plan_id)
             bucket_obj = resolve_bucket(token, plan_id, bucket)
-            result = move_task_op(task_obj["id"], bucket_obj["id"], token)
+            result = move_task_op(task_obj["id"], bucket_obj["id"], token, etag=task_obj.get("@odata.etag"))
             print(json.dumps(result, indent=2))
 
         except ValueError as e:
@@ -54,7 +54,7 @@ def update_task_labels_cmd(app: typer.Typer):
                 plan_id = plan_obj["id"]
 
             task_obj = resolve_task(token, task, plan_id)
-            result = update_task_labels(task_obj["id"], labels, token)
+            result = update_task_labels(task_obj["id"], labels, token, etag=task_obj.get("@odata.etag"))
             print(json.dumps(result, indent=2))
 
         except ValueError as e:
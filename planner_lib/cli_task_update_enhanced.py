@@ -65,7 +65,8 @@ def update_task_cmd(app: typer.Typer):
                 token=token,
                 title=title,
                 description=description,
-                labels=labels
+                labels=labels,
+                etag=task_obj.get("@odata.etag")
             )
             print(json.dumps(result, indent=2))
 
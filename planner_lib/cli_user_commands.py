@@ -8,14 +8,11 @@ import os
 from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from .auth import get_tokens
 from .config import load_conf
 from .resolution_users import search_users_by_name, resolve_user
-
-console = Console()
+from .cli_output import console
 
 
 def search_user_cmd(app: typer.Typer):
@@ -79,6 +76,8 @@ def search_user_cmd(app: typer.Typer):
 
             # Rich table output (verbose mode)
             if verbose:
+                from rich.table import Table
+
                 console.print(f"\n[green]Found {len(users)} user(s) matching '{query}':[/green]\n")
 
                 table = Table(show_header=True, header_style="bold cyan")
@@ -0,0 +1,114 @@
+"""
+CLI Worker Module
+Long-lived JSON-lines RPC mode so callers (the MCP server) can run many
+commands in one Python process instead of spawning one per call.
+
+Protocol (one JSON object per line):
+    request:  {"id": 1, "args": ["list-tasks-cmd", "--plan", "My Plan"]}
+    response: {"id": 1, "code": 0, "stdout": "...", "stderr": "..."}
+"""
+
+import contextlib
+import io
+import json
+import sys
+import traceback
+from typing import Callable, TextIO
+
+import click
+import typer
+
+from .graph_client import close_session
+
+
+def run_command(app: Callable, args: list) -> dict:
+    """
+    Run one CLI command in-process, capturing its output.
+
+    Args:
+        app: The Typer application or root click command
+        args: Command-line arguments (without program name)
+
+    Returns:
+        Dictionary with code, stdout and stderr
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    real_stdin = sys.stdin
+    # Commands must never read protocol lines as interactive input
+    sys.stdin = io.StringIO("")
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                result = app(args=args, prog_name="planner.py", standalone_mode=False)
+                code = result if isinstance(result, int) else 0
+            except click.ClickException as e:
+                e.show(file=stderr)
+                code = e.exit_code
+            except click.exceptions.Abort:
+                stderr.write("Aborted!\n")
+                code = 1
+            except SystemExit as e:
+                code = e.code if isinstance(e.code, int) else 1
+            except Exception:
+                stderr.write(traceback.format_exc())
+                code = 1
+    finally:
+        sys.stdin = real_stdin
+
+    return {"code": code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+def run_worker(app: Callable, stdin: TextIO, stdout: TextIO) -> None:
+    """
+    Serve JSON-lines requests from stdin until EOF.
+
+    Args:
+        app: The Typer application or root click command
+        stdin: Request stream
+        stdout: Response stream
+    """
+    for line in stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            args = request.get("args")
+            if not isinstance(args, list) or not all(isinstance(a, str) for a in args):
+                raise ValueError("'args' must be a list of strings")
+            if args and args[0] == "worker":
+                raise ValueError("Nested worker is not allowed")
+            response = run_command(app, args)
+        except ValueError as e:
+            response = {
+                "code": 2,
+                "stdout": "",
+                "stderr": json.dumps({"code": "WorkerError", "message": str(e)})
+            }
+
+        response["id"] = request_id
+        stdout.write(json.dumps(response) + "\n")
+        stdout.flush()
+
+
+def worker_cmd(app: typer.Typer):
+    """Run as a long-lived JSON-lines worker."""
+    @app.command("worker", hidden=True)
+    def worker():
+        """Serve JSON-lines command requests on stdin/stdout (used by the MCP server)."""
+        real_stdout = sys.stdout
+        # The registry may register this command on a scratch app, so serve
+        # requests through the root command that is actually running
+        root = click.get_current_context().find_root().command
+        try:
+            run_worker(root, sys.stdin, real_stdout)
+        finally:
+            close_session()
+
+
+def register_worker_commands(app: typer.Typer):
+    """Register the worker command with the Typer app."""
+    worker_cmd(app)
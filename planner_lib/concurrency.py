@@ -0,0 +1,50 @@
+"""
+Concurrency Helpers Module
+Bounded worker pools for fanning out independent Graph requests.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+from .constants import DEFAULT_MAX_CONCURRENCY
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def get_max_concurrency() -> int:
+    """Get worker limit from PLANNER_MAX_CONCURRENCY or the default."""
+    try:
+        value = int(os.environ.get("PLANNER_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY))
+    except ValueError:
+        return DEFAULT_MAX_CONCURRENCY
+    return max(1, value)
+
+
+def map_concurrent(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: Optional[int] = None
+) -> List[R]:
+    """
+    Apply func to every item using a bounded thread pool.
+
+    Args:
+        func: Function to call for each item
+        items: Items to process
+        max_workers: Worker limit (default: get_max_concurrency())
+
+    Returns:
+        Results in the same order as items
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    workers = min(max_workers or get_max_concurrency(), len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items))
@@ -21,3 +21,67 @@ REQUIRED_SCOPES = [
 GUID_PATTERN = re.compile(
     r'^([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|[A-Za-z0-9_-]{20,40})$'
 )
+
+# HTTP transport defaults (overridable via PLANNER_HTTP_POOL_SIZE / PLANNER_HTTP_RETRIES)
+DEFAULT_HTTP_POOL_SIZE = 10
+DEFAULT_HTTP_RETRIES = 3
+
+# Connections kept by the shared httpx.AsyncClient of the async API (PLANNER_ASYNC_POOL_SIZE);
+# async fan-out helpers keep at most this many requests in flight
+DEFAULT_ASYNC_POOL_SIZE = 64
+
+# Worker limit for concurrent Graph requests (overridable via PLANNER_MAX_CONCURRENCY).
+# Kept below the HTTP pool size so workers never wait on a free connection.
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Graph JSON batching: max sub-requests per /$batch POST and re-sends of throttled items
+GRAPH_BATCH_MAX_SIZE = 20
+GRAPH_BATCH_MAX_RETRIES = 3
+
+# Persistent name → ID cache (overridable via PLANNER_CACHE_TTL; PLANNER_NO_CACHE=1 disables)
+DEFAULT_CACHE_TTL = 3600
+DEFAULT_CACHE_MAX_ENTRIES = 2000
+# IDs that never change once assigned (plan → owner group, task → conversation thread)
+# are cached for this long instead; 404s still drop them
+STABLE_ID_CACHE_TTL = 30 * 24 * 3600
+
+# In-process access token memoization: treat tokens as expired TOKEN_EXPIRY_SKEW seconds
+# early, and refresh in the background once fewer than TOKEN_REFRESH_WINDOW seconds remain
+TOKEN_EXPIRY_SKEW = 60
+TOKEN_REFRESH_WINDOW = 300
+
+# In-process resource URL → @odata.etag map used to skip pre-write GETs
+ETAG_CACHE_MAX_ENTRIES = 5000
+
+# In-process task details URL → checklist snapshot used to skip pre-reads of subtask writes
+CHECKLIST_CACHE_MAX_ENTRIES = 500
+
+# move-bucket-tasks relists the source after each pass to pick up tasks that were
+# added or skipped while paging; stop after this many passes
+BUCKET_MOVE_MAX_PASSES = 3
+
+# Adaptive request pacing per tenant/resource (PLANNER_MAX_RATE overrides the ceiling).
+# Rates are requests per second; each success adds GOVERNOR_RATE_STEP, each 429/503 halves it
+GOVERNOR_MAX_RATE = 50.0
+GOVERNOR_MIN_RATE = 1.0
+GOVERNOR_BURST = 10.0
+GOVERNOR_RATE_STEP = 0.5
+
+# Retries of 429/503 responses: exponential backoff with jitter unless Retry-After is given,
+# bounded by attempts and by total waiting time (PLANNER_RETRY_MAX_SECONDS)
+RETRY_MAX_ATTEMPTS = 5
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+RETRY_MAX_SECONDS = 60.0
+
+# search-tasks: a task is a candidate when it shares at least this share of the
+# query's trigrams; SEARCH_DEFAULT_LIMIT results are returned unless --limit is given
+SEARCH_MIN_COVERAGE = 0.5
+SEARCH_DEFAULT_LIMIT = 10
+
+# Graph rejects a task details PATCH that would leave more than this many checklist items
+MAX_CHECKLIST_ITEMS = 20
+
+# Client-generated orderHints (order_hint) stay within this length; a list whose next
+# hint would exceed it is re-spread with short hints instead
+ORDER_HINT_MAX_LENGTH = 64
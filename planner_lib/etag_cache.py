@@ -0,0 +1,56 @@
+"""
+ETag Cache Module
+In-process map of Graph resource URL → last seen @odata.etag, so writes can
+skip the GET that only exists to read the current ETag.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+from .constants import ETAG_CACHE_MAX_ENTRIES
+
+_etags: "OrderedDict[str, str]" = OrderedDict()
+_etags_lock = threading.Lock()
+
+
+def _resource_key(url: str) -> str:
+    """Strip the query string so $select variants share one entry."""
+    return url.split("?", 1)[0].rstrip("/")
+
+
+def remember_etag(url: str, etag: Optional[str]) -> None:
+    """Record the current ETag of the resource at url (None is ignored)."""
+    if not etag:
+        return
+    key = _resource_key(url)
+    with _etags_lock:
+        _etags[key] = etag
+        _etags.move_to_end(key)
+        while len(_etags) > ETAG_CACHE_MAX_ENTRIES:
+            _etags.popitem(last=False)
+
+
+def remember_etags(base_url: str, items: Iterable[dict]) -> None:
+    """Record ETags of collection items addressed as {base_url}/{id}."""
+    for item in items:
+        if item.get("id"):
+            remember_etag(f"{base_url}/{item['id']}", item.get("@odata.etag"))
+
+
+def get_known_etag(url: str) -> Optional[str]:
+    """Return the last seen ETag of the resource at url, or None."""
+    with _etags_lock:
+        return _etags.get(_resource_key(url))
+
+
+def forget_etag(url: str) -> None:
+    """Drop the ETag of the resource at url (after a delete or a 412)."""
+    with _etags_lock:
+        _etags.pop(_resource_key(url), None)
+
+
+def clear_etags() -> None:
+    """Forget every known ETag."""
+    with _etags_lock:
+        _etags.clear()
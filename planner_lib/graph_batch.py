@@ -0,0 +1,257 @@
+"""
+Graph JSON Batch Module
+Sends many Graph requests through the /$batch endpoint (20 per POST).
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+from .constants import BASE_GRAPH_URL, GRAPH_BATCH_MAX_SIZE, GRAPH_BATCH_MAX_RETRIES
+from .concurrency import map_concurrent
+from .graph_client import post_json
+from .rate_governor import get_rate_governor
+
+BATCH_URL = f"{BASE_GRAPH_URL}/$batch"
+
+
+def _relative_url(url: str) -> str:
+    """Strip the Graph base URL; batch sub-requests use paths relative to the version root."""
+    if url.startswith(BASE_GRAPH_URL):
+        url = url[len(BASE_GRAPH_URL):]
+    return url if url.startswith("/") else f"/{url}"
+
+
+def _normalize(sub_request: dict) -> dict:
+    """Build the wire format of one sub-request."""
+    item = {
+        "id": str(sub_request["id"]),
+        "method": sub_request.get("method", "GET").upper(),
+        "url": _relative_url(sub_request["url"]),
+    }
+    headers = dict(sub_request.get("headers") or {})
+    if "body" in sub_request and sub_request["body"] is not None:
+        item["body"] = sub_request["body"]
+        headers.setdefault("Content-Type", "application/json")
+    if headers:
+        item["headers"] = headers
+    if sub_request.get("dependsOn"):
+        item["dependsOn"] = [str(d) for d in sub_request["dependsOn"]]
+    return item
+
+
+def _group_dependencies(items: List[dict]) -> List[List[dict]]:
+    """
+    Group sub-requests so that every dependsOn chain stays in one batch.
+
+    Graph only honours dependsOn between requests of the same batch, so
+    connected requests are kept together in their original order.
+    """
+    index = {item["id"]: i for i, item in enumerate(items)}
+    parent = list(range(len(items)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, item in enumerate(items):
+        for dep in item.get("dependsOn", []):
+            if dep not in index:
+                raise ValueError(f"Batch request '{item['id']}' depends on unknown id '{dep}'")
+            parent[find(i)] = find(index[dep])
+
+    groups: Dict[int, List[dict]] = {}
+    for i, item in enumerate(items):
+        groups.setdefault(find(i), []).append(item)
+    return list(groups.values())
+
+
+def chunk_requests(items: List[dict], size: int = GRAPH_BATCH_MAX_SIZE) -> List[List[dict]]:
+    """
+    Split normalized sub-requests into batches of at most `size`.
+
+    Args:
+        items: Normalized sub-requests
+        size: Max requests per batch (Graph allows 20)
+
+    Returns:
+        List of batches
+
+    Raises:
+        ValueError: If a dependsOn chain is larger than one batch
+    """
+    batches: List[List[dict]] = []
+    current: List[dict] = []
+    for group in _group_dependencies(items):
+        if len(group) > size:
+            raise ValueError(f"dependsOn chain of {len(group)} requests exceeds batch size {size}")
+        if len(current) + len(group) > size:
+            batches.append(current)
+            current = []
+        current.extend(group)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _retry_after(response: dict) -> float:
+    """Read Retry-After (seconds) from a sub-response, defaulting to 2."""
+    headers = response.get("headers") or {}
+    for key, value in headers.items():
+        if key.lower() == "retry-after":
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                break
+    return 2.0
+
+
+def _retry_items(pending: List[dict], results: Dict[str, dict], throttled: set) -> List[dict]:
+    """
+    Pick the items to re-send after a throttled round.
+
+    424 Failed Dependency marks requests that never ran because a dependency
+    (directly or further up the chain) was throttled; those are re-sent with
+    it. dependsOn entries naming requests outside the retry set are dropped,
+    since Graph rejects a batch that references unknown ids and those
+    requests have already completed.
+    """
+    retry_ids = set(throttled)
+    changed = True
+    while changed:
+        changed = False
+        for item in pending:
+            if (
+                item["id"] not in retry_ids
+                and results.get(item["id"], {}).get("status") == 424
+                and any(d in retry_ids for d in item.get("dependsOn", []))
+            ):
+                retry_ids.add(item["id"])
+                changed = True
+
+    retry: List[dict] = []
+    for item in pending:
+        if item["id"] not in retry_ids:
+            continue
+        item = dict(item)
+        depends_on = [d for d in item.pop("dependsOn", []) if d in retry_ids]
+        if depends_on:
+            item["dependsOn"] = depends_on
+        retry.append(item)
+    return retry
+
+
+def _send_batch(batch: List[dict], token: str, max_retries: int) -> Dict[str, dict]:
+    """
+    Send one batch, re-sending throttled items (and their dependents) after Retry-After.
+
+    If a re-send fails outright, the responses already collected are returned
+    and the throttled items keep their 429 result.
+    """
+    results: Dict[str, dict] = {}
+    pending = batch
+    attempt = 0
+
+    while pending:
+        try:
+            data = post_json(BATCH_URL, token, {"requests": pending})
+        except Exception:
+            if not results:
+                raise
+            break
+        for response in data.get("responses", []):
+            results[str(response.get("id"))] = {
+                "status": int(response.get("status", 0)),
+                "headers": response.get("headers") or {},
+                "body": response.get("body"),
+            }
+
+        throttled = {i["id"] for i in pending if results.get(i["id"], {}).get("status") == 429}
+        if not throttled or attempt >= max_retries:
+            break
+
+        delay = max(_retry_after(results[i]) for i in throttled)
+        # Slow down direct calls to the throttled resources too
+        governors = {
+            id(g): g for g in (
+                get_rate_governor(f"{BASE_GRAPH_URL}{i['url']}", token)
+                for i in pending if i["id"] in throttled
+            )
+        }
+        for governor in governors.values():
+            governor.on_throttle(delay)
+        time.sleep(delay)
+        pending = _retry_items(pending, results, throttled)
+        attempt += 1
+
+    return results
+
+
+def batch_requests(
+    sub_requests: List[dict],
+    token: str,
+    max_workers: Optional[int] = None,
+    max_retries: int = GRAPH_BATCH_MAX_RETRIES
+) -> Dict[str, dict]:
+    """
+    Execute Graph requests through /$batch.
+
+    Args:
+        sub_requests: Dicts with id, method, url (absolute or relative), and optional
+            headers, body and dependsOn (list of ids)
+        token: Access token
+        max_workers: Batches sent concurrently (default: PLANNER_MAX_CONCURRENCY or 8)
+        max_retries: Re-sends of items throttled with 429
+
+    Returns:
+        Mapping of request id to {"status", "headers", "body"}
+
+    Raises:
+        ValueError: If ids are duplicated or dependsOn is invalid
+        requests.RequestException: If a batch POST itself fails
+    """
+    items = [_normalize(r) for r in sub_requests]
+    ids = [i["id"] for i in items]
+    if len(set(ids)) != len(ids):
+        raise ValueError("Batch request ids must be unique")
+    if not items:
+        return {}
+
+    results: Dict[str, dict] = {}
+    for batch_result in map_concurrent(
+        lambda batch: _send_batch(batch, token, max_retries),
+        chunk_requests(items),
+        max_workers=max_workers
+    ):
+        results.update(batch_result)
+    return results
+
+
+def batch_get_json(
+    urls: List[str],
+    token: str,
+    max_workers: Optional[int] = None
+) -> List[Optional[Any]]:
+    """
+    GET many URLs through /$batch.
+
+    Args:
+        urls: Absolute or version-relative Graph URLs
+        token: Access token
+        max_workers: Batches sent concurrently
+
+    Returns:
+        Response bodies in input order; None for items that did not succeed
+    """
+    results = batch_requests(
+        [{"id": str(i), "method": "GET", "url": url} for i, url in enumerate(urls)],
+        token,
+        max_workers=max_workers
+    )
+    bodies: List[Optional[Any]] = []
+    for i in range(len(urls)):
+        result = results.get(str(i))
+        ok = result is not None and 200 <= result["status"] < 300
+        bodies.append(result["body"] if ok else None)
+    return bodies
@@ -3,8 +3,173 @@ Microsoft Graph API Client Module
 Handles HTTP requests to Microsoft Graph API.
 """
 
+import os
 import time
-import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional
+
+from .constants import DEFAULT_HTTP_POOL_SIZE, DEFAULT_HTTP_RETRIES, RETRY_MAX_ATTEMPTS
+from .etag_cache import remember_etag, forget_etag
+from .rate_governor import get_rate_governor, get_retry_budget, backoff_delay
+
+if TYPE_CHECKING:
+    import requests
+
+_session: Optional["requests.Session"] = None
+_session_lock = threading.Lock()
+
+# Called with the request URL when Graph answers 404 or 412, so caches can drop stale IDs
+_stale_handlers: List[Callable[[str], None]] = [forget_etag]
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read a non-negative integer from the environment, falling back to default."""
+    try:
+        value = int(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+    return value if value >= 0 else default
+
+
+def create_session(pool_size: Optional[int] = None, max_retries: Optional[int] = None) -> "requests.Session":
+    """
+    Create a pooled keep-alive session for Graph API requests.
+
+    Args:
+        pool_size: Max connections kept alive per host (default: PLANNER_HTTP_POOL_SIZE or 10)
+        max_retries: Adapter-level retries for connection errors and 502/504
+            on idempotent methods (default: PLANNER_HTTP_RETRIES or 3)
+
+    Returns:
+        Configured requests.Session
+    """
+    # requests is imported with the first session, keeping cached-only commands fast to start
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    if pool_size is None:
+        pool_size = _env_int("PLANNER_HTTP_POOL_SIZE", DEFAULT_HTTP_POOL_SIZE) or DEFAULT_HTTP_POOL_SIZE
+    if max_retries is None:
+        max_retries = _env_int("PLANNER_HTTP_RETRIES", DEFAULT_HTTP_RETRIES)
+
+    # 429 and 503 are throttling, handled by _send and the rate governor, so
+    # they are not in the status list and Retry-After is never slept on here
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        status_forcelist=(502, 504),
+        backoff_factor=0.5,
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
+def get_session() -> "requests.Session":
+    """Return the shared Graph session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+
+def configure_session(pool_size: Optional[int] = None, max_retries: Optional[int] = None) -> "requests.Session":
+    """
+    Replace the shared session with one using the given pool settings.
+
+    Args:
+        pool_size: Max connections kept alive per host
+        max_retries: Adapter-level retry count
+
+    Returns:
+        The new shared session
+    """
+    global _session
+    with _session_lock:
+        old = _session
+        _session = create_session(pool_size, max_retries)
+    if old is not None:
+        old.close()
+    return _session
+
+
+def close_session() -> None:
+    """Close the shared session and release its pooled connections."""
+    global _session
+    with _session_lock:
+        old, _session = _session, None
+    if old is not None:
+        old.close()
+
+
+def register_stale_handler(handler: Callable[[str], None]) -> None:
+    """Register a callback invoked with the URL of any request answered with 404 or 412."""
+    if handler not in _stale_handlers:
+        _stale_handlers.append(handler)
+
+
+def notify_stale(url: str, status_code: int) -> None:
+    """
+    Invoke the stale handlers if a response status marks url as stale (404 or 412).
+
+    Shared by the sync and async clients so both apply the same policy.
+    """
+    if status_code in (404, 412):
+        for handler in _stale_handlers:
+            try:
+                handler(url)
+            except Exception:
+                pass
+
+
+def _raise_for_status(response: "requests.Response", url: str) -> None:
+    """Notify stale handlers on 404/412, then raise for any HTTP error."""
+    notify_stale(url, response.status_code)
+    response.raise_for_status()
+
+
+def _send(method: str, url: str, token: str, headers: dict, payload: Optional[dict] = None) -> "requests.Response":
+    """
+    Send one request through the shared rate governor, retrying throttled responses.
+
+    429 is retried for every method; 503 only for methods that are safe to
+    repeat (POST is not). Waits honour Retry-After, otherwise use exponential
+    backoff with jitter, and stop after RETRY_MAX_ATTEMPTS or once the total
+    wait would exceed the retry budget; the last response is then returned.
+    """
+    governor = get_rate_governor(url, token)
+    retry_statuses = (429,) if method == "post" else (429, 503)
+    deadline = time.monotonic() + get_retry_budget()
+    kwargs = {"headers": headers}
+    if payload is not None:
+        kwargs["json"] = payload
+
+    attempt = 0
+    while True:
+        governor.acquire()
+        response = getattr(get_session(), method)(url, **kwargs)
+        if response.status_code not in retry_statuses:
+            governor.on_success()
+            return response
+
+        delay = backoff_delay(attempt, response.headers.get("Retry-After"))
+        if attempt >= RETRY_MAX_ATTEMPTS or time.monotonic() + delay > deadline:
+            return response
+        # Pauses every worker sharing this tenant/resource; acquire() waits it out
+        governor.on_throttle(delay)
+        attempt += 1
 
 
 def auth_headers(token: str) -> dict:
@@ -17,7 +182,7 @@ def auth_headers(token: str) -> dict:
 
 def get_json(url: str, token: str) -> dict:
     """
-    Make GET request to Graph API with retry on rate limit.
+    Make GET request to Graph API with retry on rate limit (429/503).
 
     Args:
         url: Full URL to request
@@ -29,22 +194,17 @@ def get_json(url: str, token: str) -> dict:
     Raises:
         requests.RequestException: On network or HTTP errors
     """
-    headers = auth_headers(token)
-    response = requests.get(url, headers=headers)
-
-    # Handle rate limiting
-    if response.status_code == 429:
-        retry_after = int(response.headers.get("Retry-After", "2"))
-        time.sleep(retry_after)
-        response = requests.get(url, headers=headers)
-
-    response.raise_for_status()
-    return response.json()
+    response = _send("get", url, token, auth_headers(token))
+    _raise_for_status(response, url)
+    data = response.json()
+    if isinstance(data, dict):
+        remember_etag(url, data.get("@odata.etag"))
+    return data
 
 
 def post_json(url: str, token: str, payload: dict) -> dict:
     """
-    Make POST request to Graph API with retry on rate limit.
+    Make POST request to Graph API with retry on rate limit (429).
 
     Args:
         url: Full URL to request
@@ -57,28 +217,28 @@ def post_json(url: str, token: str, payload: dict) -> dict:
     Raises:
         requests.RequestException: On network or HTTP errors
     """
-    headers = auth_headers(token)
-    response = requests.post(url, headers=headers, json=payload)
-
-    # Handle rate limiting
-    if response.status_code == 429:
-        retry_after = int(response.headers.get("Retry-After", "2"))
-        time.sleep(retry_after)
-        response = requests.post(url, headers=headers, json=payload)
-
-    response.raise_for_status()
+    response = _send("post", url, token, auth_headers(token), payload)
+    _raise_for_status(response, url)
     return response.json()
 
 
-def patch_json(url: str, token: str, payload: dict, etag: str) -> dict:
+def patch_json(
+    url: str,
+    token: str,
+    payload: dict,
+    etag: str,
+    return_representation: bool = False
+) -> dict:
     """
-    Make PATCH request to Graph API with ETag.
+    Make PATCH request to Graph API with ETag, with retry on rate limit (429/503).
 
     Args:
         url: Full URL to request
         token: Access token
         payload: JSON payload
         etag: ETag for optimistic concurrency
+        return_representation: Send "Prefer: return=representation" so the
+            updated resource (and its new ETag) comes back in the response
 
     Returns:
         Parsed JSON response or empty dict
@@ -88,18 +248,27 @@ def patch_json(url: str, token: str, payload: dict, etag: str) -> dict:
     """
     headers = auth_headers(token)
     headers["If-Match"] = etag
+    if return_representation:
+        headers["Prefer"] = "return=representation"
 
-    response = requests.patch(url, headers=headers, json=payload)
-    response.raise_for_status()
+    response = _send("patch", url, token, headers, payload)
+    _raise_for_status(response, url)
 
     if response.content:
-        return response.json()
+        data = response.json()
+        if isinstance(data, dict) and data.get("@odata.etag"):
+            remember_etag(url, data["@odata.etag"])
+        else:
+            forget_etag(url)
+        return data
+    # 204: the old ETag is no longer valid and the new one is unknown
+    forget_etag(url)
     return {}
 
 
 def delete_json(url: str, token: str, etag: str) -> dict:
     """
-    Make DELETE request to Graph API with ETag.
+    Make DELETE request to Graph API with ETag, with retry on rate limit (429/503).
 
     Args:
         url: Full URL to request
@@ -115,7 +284,56 @@ def delete_json(url: str, token: str, etag: str) -> dict:
     headers = auth_headers(token)
     headers["If-Match"] = etag
 
-    response = requests.delete(url, headers=headers)
-    response.raise_for_status()
+    response = _send("delete", url, token, headers)
+    _raise_for_status(response, url)
+    forget_etag(url)
 
     return {}
+
+
+def iter_pages(url: str, token: str, prefetch: bool = False) -> Iterator[dict]:
+    """
+    Yield response pages of a Graph collection, following @odata.nextLink.
+
+    Args:
+        url: Full URL of the first page
+        token: Access token
+        prefetch: Fetch the next page in the background while the current one is consumed
+
+    Yields:
+        Parsed JSON page
+
+    Raises:
+        requests.RequestException: On network or HTTP errors
+    """
+    if not prefetch:
+        next_url: Optional[str] = url
+        while next_url:
+            page = get_json(next_url, token)
+            yield page
+            next_url = page.get("@odata.nextLink")
+        return
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(get_json, url, token)
+        while future is not None:
+            page = future.result()
+            next_url = page.get("@odata.nextLink")
+            future = executor.submit(get_json, next_url, token) if next_url else None
+            yield page
+
+
+def iter_values(url: str, token: str, prefetch: bool = False) -> Iterator[dict]:
+    """
+    Yield items of a Graph collection lazily across all pages.
+
+    Args:
+        url: Full URL of the first page
+        token: Access token
+        prefetch: Fetch the next page in the background while the current one is consumed
+
+    Yields:
+        Items from each page's "value" array
+    """
+    for page in iter_pages(url, token, prefetch=prefetch):
+        yield from page.get("value", [])
@@ -0,0 +1,505 @@
+"""
+Local Store Module
+SQLite mirror of plans, buckets and tasks under ~/.planner-cli/, filled by
+`planner.py sync` and read by the --cached mode of list/find commands.
+"""
+
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .constants import GUID_PATTERN, SEARCH_MIN_COVERAGE
+from .resolution_utils import case_insensitive_match
+from .search_index import normalize, trigrams, search_fields, score, matched_fields
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS plans (
+    id TEXT PRIMARY KEY,
+    title TEXT,
+    etag TEXT,
+    data TEXT NOT NULL,
+    synced_at REAL
+);
+CREATE TABLE IF NOT EXISTS buckets (
+    id TEXT PRIMARY KEY,
+    plan_id TEXT NOT NULL,
+    name TEXT,
+    position INTEGER,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    plan_id TEXT NOT NULL,
+    bucket_id TEXT,
+    title TEXT,
+    percent_complete INTEGER,
+    etag TEXT,
+    position INTEGER,
+    data TEXT NOT NULL,
+    details TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_buckets_plan ON buckets(plan_id, position);
+CREATE INDEX IF NOT EXISTS idx_tasks_plan ON tasks(plan_id, position);
+CREATE INDEX IF NOT EXISTS idx_tasks_bucket ON tasks(bucket_id, position);
+CREATE TABLE IF NOT EXISTS search_docs (
+    task_id TEXT PRIMARY KEY,
+    plan_id TEXT NOT NULL,
+    etag TEXT,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    checklist TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS search_trigrams (
+    plan_id TEXT NOT NULL,
+    trigram TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    PRIMARY KEY (plan_id, trigram, task_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_search_docs_plan ON search_docs(plan_id);
+CREATE INDEX IF NOT EXISTS idx_search_trigrams_task ON search_trigrams(task_id);
+"""
+
+
+def get_store_path() -> Path:
+    """Get local store path from environment or default."""
+    store_path = os.environ.get("PLANNER_STORE_PATH")
+    if store_path:
+        return Path(store_path).expanduser()
+    return Path.home() / ".planner-cli" / "store.db"
+
+
+def _not_synced(message: str) -> ValueError:
+    return ValueError(json.dumps({
+        "code": "NotSynced",
+        "message": f"{message}; run 'planner.py sync' first"
+    }))
+
+
+class LocalStore:
+    """
+    SQLite-backed mirror of synced plans.
+
+    Each plan is replaced in a single transaction by sync, so readers never
+    see a half-synced plan. Task rows keep the raw Graph object (data) and,
+    when fetched, its /details object (details).
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(SCHEMA)
+        os.chmod(path, 0o600)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # Sync side
+
+    def get_task_states(self, plan_id: str) -> Dict[str, Tuple[Optional[str], bool]]:
+        """Return task ID → (stored @odata.etag, whether /details with an ETag are stored) for a plan."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, etag, json_extract(details, '$.\"@odata.etag\"') IS NOT NULL AS has_details "
+                "FROM tasks WHERE plan_id = ?", (plan_id,)
+            )
+            return {row["id"]: (row["etag"], bool(row["has_details"])) for row in rows}
+
+    def save_plan(
+        self,
+        plan: dict,
+        buckets: List[dict],
+        tasks: List[dict],
+        details: Dict[str, dict]
+    ) -> None:
+        """
+        Replace one plan's buckets and tasks.
+
+        Args:
+            plan: Plan object
+            buckets: All buckets of the plan, in listing order
+            tasks: All tasks of the plan, in listing order
+            details: Task ID → /details object for tasks whose details changed;
+                stored details of other tasks are kept
+        """
+        plan_id = plan["id"]
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO plans (id, title, etag, data, synced_at) VALUES (?, ?, ?, ?, ?)",
+                (plan_id, plan.get("title"), plan.get("@odata.etag"), json.dumps(plan), time.time())
+            )
+            self._conn.execute("DELETE FROM buckets WHERE plan_id = ?", (plan_id,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO buckets (id, plan_id, name, position, data) VALUES (?, ?, ?, ?, ?)",
+                [(b["id"], plan_id, b.get("name"), i, json.dumps(b)) for i, b in enumerate(buckets)]
+            )
+
+            kept = {
+                row["id"]: row["details"]
+                for row in self._conn.execute("SELECT id, details FROM tasks WHERE plan_id = ?", (plan_id,))
+            }
+            rows = [
+                (
+                    t["id"], plan_id, t.get("bucketId"), t.get("title"), t.get("percentComplete", 0),
+                    t.get("@odata.etag"), i, json.dumps(t),
+                    json.dumps(details[t["id"]]) if t["id"] in details else kept.get(t["id"])
+                )
+                for i, t in enumerate(tasks)
+            ]
+            self._conn.execute("DELETE FROM tasks WHERE plan_id = ?", (plan_id,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO tasks "
+                "(id, plan_id, bucket_id, title, percent_complete, etag, position, data, details) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._reindex(plan_id, tasks, rows, set(details))
+
+    def _reindex(self, plan_id: str, tasks: List[dict], rows: List[tuple], refreshed: set) -> None:
+        """
+        Update the search index of one plan inside save_plan's transaction.
+
+        Only tasks whose ETag differs from the indexed one, or whose details
+        were just refetched, are re-tokenized; removed tasks are dropped.
+        """
+        indexed = {
+            row["task_id"]: row["etag"]
+            for row in self._conn.execute("SELECT task_id, etag FROM search_docs WHERE plan_id = ?", (plan_id,))
+        }
+        current = {t["id"] for t in tasks}
+        stale = [
+            (task, row) for task, row in zip(tasks, rows)
+            if task["id"] in refreshed or task["id"] not in indexed or indexed[task["id"]] != task.get("@odata.etag")
+        ]
+        dropped = [(task_id,) for task_id in indexed if task_id not in current]
+        dropped += [(task["id"],) for task, _ in stale]
+        self._conn.executemany("DELETE FROM search_trigrams WHERE task_id = ?", dropped)
+        self._conn.executemany("DELETE FROM search_docs WHERE task_id = ?", dropped)
+
+        docs, grams = [], []
+        for task, row in stale:
+            fields = search_fields(task, json.loads(row[8]) if row[8] else None)
+            docs.append((task["id"], plan_id, task.get("@odata.etag"), fields["title"], fields["description"], fields["checklist"]))
+            grams.extend((plan_id, gram, task["id"]) for gram in trigrams(" ".join(fields.values())))
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO search_docs (task_id, plan_id, etag, title, description, checklist) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            docs
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO search_trigrams (plan_id, trigram, task_id) VALUES (?, ?, ?)", grams
+        )
+
+    def remove_plan(self, plan_id: str) -> None:
+        """Drop a plan and everything stored under it."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM search_trigrams WHERE plan_id = ?", (plan_id,))
+            self._conn.execute("DELETE FROM search_docs WHERE plan_id = ?", (plan_id,))
+            self._conn.execute("DELETE FROM tasks WHERE plan_id = ?", (plan_id,))
+            self._conn.execute("DELETE FROM buckets WHERE plan_id = ?", (plan_id,))
+            self._conn.execute("DELETE FROM plans WHERE id = ?", (plan_id,))
+
+    # Read side
+
+    def list_plans(self) -> List[dict]:
+        """List synced plans, each with a syncedAt timestamp."""
+        with self._lock:
+            rows = self._conn.execute("SELECT data, synced_at FROM plans ORDER BY title")
+            return [dict(json.loads(row["data"]), syncedAt=row["synced_at"]) for row in rows]
+
+    def resolve_plan(self, plan: str) -> dict:
+        """
+        Resolve plan name or ID against synced plans.
+
+        Args:
+            plan: Plan name or ID
+
+        Returns:
+            Stored plan object
+
+        Raises:
+            ValueError: With JSON error object if not synced, not found or ambiguous
+        """
+        plans = self.list_plans()
+        if GUID_PATTERN.match(plan):
+            for p in plans:
+                if p["id"] == plan:
+                    return p
+            raise _not_synced(f"Plan '{plan}' is not in the local store")
+
+        if not plans:
+            raise _not_synced("The local store is empty")
+
+        matches = case_insensitive_match(plans, "title", plan)
+        if len(matches) == 1:
+            return matches[0]
+        elif len(matches) > 1:
+            error = {
+                "code": "Ambiguous",
+                "message": f"Multiple plans match '{plan}'",
+                "candidates": [{"id": p["id"], "title": p["title"]} for p in matches]
+            }
+        else:
+            error = {
+                "code": "NotFound",
+                "message": f"Plan '{plan}' not found in the local store",
+                "candidates": [{"id": p["id"], "title": p["title"]} for p in plans]
+            }
+        raise ValueError(json.dumps(error))
+
+    def list_buckets(self, plan_id: str) -> List[dict]:
+        """List a synced plan's buckets in Graph listing order."""
+        with self._lock:
+            rows = self._conn.execute("SELECT data FROM buckets WHERE plan_id = ? ORDER BY position", (plan_id,))
+            return [json.loads(row["data"]) for row in rows]
+
+    def resolve_bucket(self, plan_id: str, bucket: str) -> dict:
+        """
+        Resolve bucket name or ID against a synced plan's buckets.
+
+        Args:
+            plan_id: Plan ID
+            bucket: Bucket name or ID
+
+        Returns:
+            Stored bucket object (or {"id": bucket} for an ID)
+
+        Raises:
+            ValueError: With JSON error object if not found or ambiguous
+        """
+        if GUID_PATTERN.match(bucket):
+            return {"id": bucket}
+
+        buckets = self.list_buckets(plan_id)
+        matches = case_insensitive_match(buckets, "name", bucket)
+        if len(matches) == 1:
+            return matches[0]
+        elif len(matches) > 1:
+            error = {
+                "code": "Ambiguous",
+                "message": f"Multiple buckets match '{bucket}'",
+                "candidates": [{"id": b["id"], "name": b["name"]} for b in matches]
+            }
+        else:
+            error = {
+                "code": "NotFound",
+                "message": f"Bucket '{bucket}' not found",
+                "candidates": [{"id": b["id"], "name": b["name"]} for b in buckets]
+            }
+        raise ValueError(json.dumps(error))
+
+    def iter_tasks(
+        self,
+        plan_id: Optional[str] = None,
+        bucket_id: Optional[str] = None,
+        incomplete_only: bool = False,
+        include_details: bool = True,
+        fields: Optional[List[str]] = None
+    ) -> Iterator[dict]:
+        """
+        Stream stored tasks with the same shape as task_operations.iter_tasks.
+
+        Args:
+            plan_id: Plan ID (required if bucket_id not provided)
+            bucket_id: Bucket ID (takes precedence over plan_id)
+            incomplete_only: Filter to show only incomplete tasks
+            include_details: Attach the stored description
+            fields: Only keep these task properties
+
+        Yields:
+            Task objects
+
+        Raises:
+            ValueError: If neither plan_id nor bucket_id provided
+        """
+        if bucket_id:
+            query, args = "SELECT data, details FROM tasks WHERE bucket_id = ?", [bucket_id]
+        elif plan_id:
+            query, args = "SELECT data, details FROM tasks WHERE plan_id = ?", [plan_id]
+        else:
+            raise ValueError("plan_id or bucket_id required")
+        if incomplete_only:
+            query += " AND percent_complete < 100"
+        query += " ORDER BY position"
+
+        with self._lock:
+            rows = self._conn.execute(query, args).fetchall()
+
+        attach = include_details and (fields is None or "description" in fields)
+        for row in rows:
+            task = json.loads(row["data"])
+            if attach:
+                task["description"] = json.loads(row["details"]).get("description", "") if row["details"] else ""
+            if fields is not None:
+                task = {f: task[f] for f in fields if f in task}
+            yield task
+
+    def get_task(self, task_id: str, include_details: bool = False) -> Optional[dict]:
+        """Return a stored task by ID (with description if asked), or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT data, details FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        if row is None:
+            return None
+        task = json.loads(row["data"])
+        if include_details:
+            task["description"] = json.loads(row["details"]).get("description", "") if row["details"] else ""
+        return task
+
+    def resolve_task(self, task: str, plan_id: Optional[str] = None, include_details: bool = False) -> dict:
+        """
+        Resolve task ID or title against stored tasks, like task_operations.resolve_task.
+
+        Args:
+            task: Task ID or title
+            plan_id: Plan ID (required for title search)
+            include_details: Attach the stored description
+
+        Returns:
+            Stored task object
+
+        Raises:
+            ValueError: With JSON error if not synced, not found or ambiguous
+        """
+        if GUID_PATTERN.match(task):
+            task_obj = self.get_task(task, include_details=include_details)
+            if task_obj is None:
+                raise _not_synced(f"Task '{task}' is not in the local store")
+            return task_obj
+
+        if not plan_id:
+            raise ValueError(json.dumps({
+                "code": "ConfigError",
+                "message": "plan_id required for title-based task search"
+            }))
+
+        tasks = list(self.iter_tasks(plan_id=plan_id, include_details=include_details))
+        matches = case_insensitive_match(tasks, "title", task)
+        if len(matches) == 1:
+            return matches[0]
+        elif len(matches) > 1:
+            error = {
+                "code": "AmbiguousTask",
+                "message": f"Multiple tasks match '{task}'",
+                "candidates": [{"id": t["id"], "title": t["title"], "bucketId": t.get("bucketId", "")} for t in matches]
+            }
+        else:
+            error = {
+                "code": "TaskNotFound",
+                "message": f"Task '{task}' not found",
+                "candidates": [{"id": t["id"], "title": t["title"]} for t in tasks[:5]]
+            }
+        raise ValueError(json.dumps(error))
+
+    def list_subtasks(self, task_id: str) -> List[dict]:
+        """
+        List a stored task's checklist items, like task_subtasks.list_subtasks.
+
+        Raises:
+            ValueError: With JSON error if the task or its details were not synced
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT details FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        if row is None or row["details"] is None:
+            raise _not_synced(f"Details of task '{task_id}' are not in the local store")
+        checklist = json.loads(row["details"]).get("checklist", {})
+        return [
+            {"id": item_id, "title": item.get("title"), "isChecked": item.get("isChecked", False)}
+            for item_id, item in checklist.items()
+        ]
+
+    def search_tasks(self, plan_id: str, query: str, limit: int = 10) -> List[dict]:
+        """
+        Rank a plan's stored tasks against a free-text query.
+
+        Candidates come from the trigram index (tasks sharing at least
+        SEARCH_MIN_COVERAGE of the query's trigrams), so typos and partial
+        words still match; they are then scored by search_index.score over
+        title, description and checklist titles.
+
+        Args:
+            plan_id: Plan ID
+            query: Free-text query
+            limit: Maximum number of results
+
+        Returns:
+            Results with id, title, bucketId, percentComplete, score and
+            matchedIn, best first
+        """
+        normalized = normalize(query)
+        grams = sorted(trigrams(normalized))
+        if not grams:
+            return []
+        needed = max(1, math.ceil(len(grams) * SEARCH_MIN_COVERAGE))
+
+        placeholders = ",".join("?" * len(grams))
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.row_factory = None
+            candidates = cursor.execute(
+                "SELECT c.task_id, c.hits, d.title, d.description, d.checklist FROM ("
+                "  SELECT task_id, COUNT(*) AS hits FROM search_trigrams"
+                f"  WHERE plan_id = ? AND trigram IN ({placeholders})"
+                "  GROUP BY task_id HAVING hits >= ?"
+                ") c JOIN search_docs d ON d.task_id = c.task_id",
+                [plan_id, *grams, needed]
+            ).fetchall()
+
+            ranked = []
+            for task_id, hits, title, description, checklist in candidates:
+                fields = {"title": title, "description": description, "checklist": checklist}
+                ranked.append((score(normalized, hits / len(grams), fields), task_id, fields))
+            ranked.sort(key=lambda r: (-r[0], r[2]["title"]))
+            ranked = ranked[:limit]
+
+            top_ids = [task_id for _, task_id, _ in ranked]
+            data = dict(cursor.execute(
+                f"SELECT id, data FROM tasks WHERE id IN ({','.join('?' * len(top_ids))})", top_ids
+            ).fetchall()) if top_ids else {}
+
+        query_grams = set(grams)
+        results = []
+        for value, task_id, fields in ranked:
+            task = json.loads(data[task_id])
+            results.append({
+                "id": task_id,
+                "title": task.get("title", ""),
+                "bucketId": task.get("bucketId", ""),
+                "percentComplete": task.get("percentComplete", 0),
+                "score": value,
+                "matchedIn": matched_fields(query_grams, fields)
+            })
+        return results
+
+
+_store: Optional[LocalStore] = None
+_store_lock = threading.Lock()
+
+
+def get_local_store() -> LocalStore:
+    """Return the process-wide local store for the current PLANNER_STORE_PATH."""
+    global _store
+    path = get_store_path()
+    with _store_lock:
+        if _store is None or _store.path != path:
+            if _store is not None:
+                _store.close()
+            _store = LocalStore(path)
+        return _store
+
+
+def reset_local_store() -> None:
+    """Close the process-wide local store (tests, path changes)."""
+    global _store
+    with _store_lock:
+        if _store is not None:
+            _store.close()
+        _store = None
@@ -0,0 +1,167 @@
+"""
+Order Hint Module
+Fractional orderHint strings for Planner checklist items and buckets.
+
+Planner orders items by ordinal comparison of their orderHint. A new hint is
+generated strictly between two neighbors (either may be absent for the start
+or the end of the list), so an insert or a move rewrites one item. Generated
+hints use only 0-9A-Za-z and never end in the lowest digit, which leaves room
+before any of them; neighbors may be service-generated hints with other
+characters.
+"""
+
+import json
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .constants import ORDER_HINT_MAX_LENGTH
+
+_DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+_LOWEST = _DIGITS[0]
+# Code point above every character, used when no upper neighbor constrains a position
+_UNBOUNDED = 0x110000
+
+
+def _invalid(message: str) -> ValueError:
+    return ValueError(json.dumps({"code": "InvalidInput", "message": message}))
+
+
+def _between(before: str, after: Optional[str], pick: Callable[[List[str]], str]) -> str:
+    """Build a hint between before and after, choosing the deciding digit with pick."""
+    if after is not None and not before < after:
+        raise _invalid(f"orderHint '{before}' must sort before '{after}'")
+
+    hint = []
+    bounded = after is not None
+    position = 0
+    while True:
+        low = ord(before[position]) if position < len(before) else -1
+        if bounded and position >= len(after):
+            # hint equals a prefix of after, so nothing shorter fits
+            raise _invalid(f"No orderHint fits between '{before}' and '{after}'")
+        high = ord(after[position]) if bounded else _UNBOUNDED
+
+        free = [d for d in _DIGITS[1:] if low < ord(d) < high]
+        if free:
+            hint.append(pick(free))
+            return "".join(hint)
+
+        # No digit fits here: keep before's character (or the lowest digit once
+        # before is exhausted) and find room at the next position
+        keep = before[position] if position < len(before) else _LOWEST
+        if ord(keep) > high:
+            raise _invalid(f"No orderHint fits between '{before}' and '{after}'")
+        hint.append(keep)
+        bounded = bounded and ord(keep) == high
+        position += 1
+
+
+def hint_between(before: Optional[str], after: Optional[str]) -> str:
+    """
+    Return a hint that sorts strictly after before and strictly before after.
+
+    Between two neighbors the middle free digit is used, so repeated inserts
+    into one gap lengthen hints by a character about every 6 inserts. At the
+    end (or start) the free digit nearest the neighbor is used, so a digit
+    position lasts for about 60 appends (or prepends).
+
+    Args:
+        before: Hint of the preceding item (None or "" at the start)
+        after: Hint of the following item (None at the end)
+
+    Returns:
+        New hint
+
+    Raises:
+        ValueError: If before does not sort before after, or no hint fits
+            between them (only possible next to foreign characters)
+    """
+    if after is None and before:
+        return _between(before, None, lambda free: free[0])
+    if after is not None and not before:
+        return _between("", after, lambda free: free[-1])
+    return _between(before or "", after, lambda free: free[len(free) // 2])
+
+
+def hints_between(before: Optional[str], after: Optional[str], count: int) -> List[str]:
+    """
+    Return count ascending hints between before and after.
+
+    Between two neighbors the hints are chosen by bisection, so their length
+    grows with log(count) rather than count; at the end they are appended
+    one after another.
+
+    Args:
+        before: Hint of the preceding item (None or "" at the start)
+        after: Hint of the following item (None at the end)
+        count: Number of hints
+
+    Returns:
+        Ascending list of count hints
+    """
+    if count <= 0:
+        return []
+    if after is None:
+        hints = []
+        for _ in range(count):
+            before = hint_between(before, None)
+            hints.append(before)
+        return hints
+    middle = _between(before or "", after, lambda free: free[len(free) // 2])
+    left = count // 2
+    return hints_between(before, middle, left) + [middle] + hints_between(middle, after, count - left - 1)
+
+
+def hint_at_start(first: Optional[str]) -> str:
+    """Return a hint that sorts before first (any hint when the list is empty)."""
+    return hint_between(None, first)
+
+
+def hint_at_end(last: Optional[str]) -> str:
+    """Return a hint that sorts after last (any hint when the list is empty)."""
+    return hint_between(last, None)
+
+
+def needs_rebalance(hints: List[str]) -> bool:
+    """Return True when any hint is longer than ORDER_HINT_MAX_LENGTH."""
+    return any(len(hint) > ORDER_HINT_MAX_LENGTH for hint in hints)
+
+
+def spread_hints(count: int) -> List[str]:
+    """Return count short, evenly spaced ascending hints for re-spreading a whole list."""
+    return hints_between(None, _DIGITS[-1], count)
+
+
+def sort_by_hint(items: Dict[str, Optional[str]]) -> List[str]:
+    """Return item IDs ordered as Planner shows them (missing hints first, ties by ID)."""
+    return sorted(items, key=lambda item_id: (items[item_id] or "", item_id))
+
+
+def append_hints(existing: Dict[str, Optional[str]], count: int) -> Tuple[List[str], Dict[str, str]]:
+    """
+    Return hints for count items appended after the existing ones.
+
+    Existing hints are left alone unless the new hints would exceed
+    ORDER_HINT_MAX_LENGTH; then the whole list is re-spread and the existing
+    items needing a new hint are returned as well.
+
+    Args:
+        existing: Item ID → current orderHint
+        count: Number of items to append
+
+    Returns:
+        (hints for the new items in order, item ID → new hint of existing items)
+    """
+    ordered = sort_by_hint(existing)
+    last = existing[ordered[-1]] if ordered else None
+    try:
+        new_hints = hints_between(last, None, count)
+    except ValueError:
+        new_hints = None
+    if new_hints is not None and not needs_rebalance(new_hints):
+        return new_hints, {}
+
+    spread = spread_hints(len(ordered) + count)
+    rewritten = {
+        item_id: hint for item_id, hint in zip(ordered, spread) if existing[item_id] != hint
+    }
+    return spread[len(ordered):], rewritten
@@ -0,0 +1,155 @@
+"""
+Rate Governor Module
+Shared, adaptive request pacing for Graph API calls.
+
+One token bucket per (tenant, resource) is shared by every thread in the
+process. Its rate grows additively on success and halves on 429/503, and a
+throttled response pauses the whole bucket for Retry-After, so concurrent
+workers back off together instead of each tripping throttling in turn.
+"""
+
+import os
+import random
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from .cache_store import token_scope
+from .constants import (
+    GOVERNOR_MAX_RATE,
+    GOVERNOR_MIN_RATE,
+    GOVERNOR_BURST,
+    GOVERNOR_RATE_STEP,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    RETRY_MAX_SECONDS
+)
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a positive float from the environment, falling back to default."""
+    try:
+        value = float(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+    return value if value > 0 else default
+
+
+def get_retry_budget() -> float:
+    """Total seconds a single request may spend waiting on retries (PLANNER_RETRY_MAX_SECONDS)."""
+    return _env_float("PLANNER_RETRY_MAX_SECONDS", RETRY_MAX_SECONDS)
+
+
+def backoff_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    Seconds to wait before retry number `attempt` (0-based).
+
+    A numeric Retry-After header wins; otherwise exponential backoff with
+    jitter: half the capped exponential delay plus a random share of the other half.
+
+    Args:
+        attempt: Retry attempt number, starting at 0
+        retry_after: Raw Retry-After header value, if any
+
+    Returns:
+        Delay in seconds
+    """
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except (TypeError, ValueError):
+            pass
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class RateGovernor:
+    """Thread-safe token bucket with additive-increase / multiplicative-decrease rate."""
+
+    def __init__(
+        self,
+        max_rate: float = GOVERNOR_MAX_RATE,
+        min_rate: float = GOVERNOR_MIN_RATE,
+        burst: float = GOVERNOR_BURST
+    ):
+        self.max_rate = max_rate
+        self.min_rate = min(min_rate, max_rate)
+        self.burst = burst
+        self.rate = max_rate
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token if one is available; otherwise return the seconds to wait before trying again."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            self._refill(now)
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while True:
+            wait = self.reserve()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def on_success(self) -> None:
+        """Additively raise the rate after an unthrottled response."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + GOVERNOR_RATE_STEP)
+
+    def on_throttle(self, delay: float) -> None:
+        """Halve the rate and pause every caller of this bucket for `delay` seconds."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = 0.0
+            self._paused_until = max(self._paused_until, now + delay)
+
+
+_governors: Dict[Tuple[str, str], RateGovernor] = {}
+_governors_lock = threading.Lock()
+
+
+@lru_cache(maxsize=32)
+def _tenant_of(token: str) -> str:
+    return token_scope(token).split(":", 1)[0]
+
+
+def _resource_of(url: str) -> str:
+    """First path segment after the API version, e.g. 'planner', 'groups', '$batch'."""
+    path = url.split("://", 1)[-1].split("?", 1)[0]
+    parts = [p for p in path.split("/") if p]
+    # parts: host, version, resource, ...
+    return parts[2] if len(parts) > 2 else (parts[-1] if parts else "")
+
+
+def get_rate_governor(url: str, token: str) -> RateGovernor:
+    """Return the shared governor for the token's tenant and the URL's resource."""
+    key = (_tenant_of(token), _resource_of(url))
+    with _governors_lock:
+        governor = _governors.get(key)
+        if governor is None:
+            governor = RateGovernor(max_rate=_env_float("PLANNER_MAX_RATE", GOVERNOR_MAX_RATE))
+            _governors[key] = governor
+        return governor
+
+
+def reset_rate_governors() -> None:
+    """Forget all learned rates."""
+    with _governors_lock:
+        _governors.clear()
@@ -4,13 +4,15 @@ Re-exports all resolution operations from modular structure.
 """
 
 from .resolution_utils import case_insensitive_match
-from .resolution_plans import list_user_plans, resolve_plan
-from .resolution_buckets import list_plan_buckets, resolve_bucket
+from .resolution_plans import list_user_plans, iter_user_plans, resolve_plan
+from .resolution_buckets import list_plan_buckets, iter_plan_buckets, resolve_bucket
 
 __all__ = [
     "case_insensitive_match",
     "list_user_plans",
+    "iter_user_plans",
     "resolve_plan",
     "list_plan_buckets",
+    "iter_plan_buckets",
     "resolve_bucket",
 ]
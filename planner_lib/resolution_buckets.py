@@ -4,11 +4,31 @@ Handles listing and resolving bucket names to IDs.
 """
 
 import json
-from typing import List
+from typing import Iterator, List
 
 from .constants import BASE_GRAPH_URL, GUID_PATTERN
-from .graph_client import get_json
+from .etag_cache import remember_etags
+from .graph_client import iter_pages
 from .resolution_utils import case_insensitive_match
+from .resolution_cache import get_cached_bucket, cache_buckets
+
+
+def iter_plan_buckets(plan_id: str, token: str) -> Iterator[dict]:
+    """
+    Stream the buckets of a plan page by page.
+
+    Args:
+        plan_id: Plan ID
+        token: Access token
+
+    Yields:
+        Bucket objects
+    """
+    url = f"{BASE_GRAPH_URL}/planner/plans/{plan_id}/buckets"
+    for page in iter_pages(url, token):
+        buckets = page.get("value", [])
+        remember_etags(f"{BASE_GRAPH_URL}/planner/buckets", buckets)
+        yield from buckets
 
 
 def list_plan_buckets(plan_id: str, token: str) -> List[dict]:
@@ -22,15 +42,16 @@ def list_plan_buckets(plan_id: str, token: str) -> List[dict]:
     Returns:
         List of bucket objects
     """
-    url = f"{BASE_GRAPH_URL}/planner/plans/{plan_id}/buckets"
-    data = get_json(url, token)
-    return data.get("value", [])
+    return list(iter_plan_buckets(plan_id, token))
 
 
 def resolve_bucket(token: str, plan_id: str, bucket: str) -> dict:
     """
     Resolve bucket name or ID to bucket object.
 
+    Bucket names are served from the persistent resolution cache when possible;
+    a miss lists the plan's buckets once and caches every unambiguous name.
+
     Args:
         token: Access token
         plan_id: Plan ID
@@ -46,8 +67,13 @@ def resolve_bucket(token: str, plan_id: str, bucket: str) -> dict:
     if GUID_PATTERN.match(bucket):
         return {"id": bucket}
 
+    cached = get_cached_bucket(token, plan_id, bucket)
+    if cached:
+        return cached
+
     # Fetch all buckets
     buckets = list_plan_buckets(plan_id, token)
+    cache_buckets(token, plan_id, buckets)
 
     # Find case-insensitive matches
     matches = case_insensitive_match(buckets, "name", bucket)
@@ -0,0 +1,215 @@
+"""
+Resolution Cache Module
+Persistent plan/bucket/user name → ID cache, plus plan → group and
+task → conversation thread IDs, scoped per tenant/user.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from .cache_store import get_cache_store, cache_enabled, token_scope
+from .constants import STABLE_ID_CACHE_TTL
+from .graph_client import register_stale_handler
+
+PLAN_NAMESPACE = "plan"
+BUCKET_NAMESPACE = "bucket"
+GROUP_NAMESPACE = "group"
+USER_NAMESPACE = "user"
+PLAN_GROUP_NAMESPACE = "plan-group"
+THREAD_NAMESPACE = "thread"
+
+
+def _unique_by_name(items: List[dict], key: str) -> dict:
+    """Map lowercased names to items, dropping names that are ambiguous."""
+    by_name: dict = {}
+    ambiguous = set()
+    for item in items:
+        name = (item.get(key) or "").lower()
+        if not name:
+            continue
+        if name in by_name:
+            ambiguous.add(name)
+        by_name[name] = item
+    return {name: item for name, item in by_name.items() if name not in ambiguous}
+
+
+def get_cached_plan(token: str, plan_name: str) -> Optional[dict]:
+    """Return cached plan object for a plan title, or None on miss."""
+    if not cache_enabled():
+        return None
+    return get_cache_store().get(PLAN_NAMESPACE, f"{token_scope(token)}:{plan_name.lower()}")
+
+
+def cache_plans(token: str, plans: List[dict]) -> None:
+    """Cache every unambiguous plan title from a full plan listing."""
+    if not cache_enabled():
+        return
+    scope = token_scope(token)
+    get_cache_store().set_many(PLAN_NAMESPACE, {
+        f"{scope}:{name}": {"id": p["id"], "title": p.get("title", ""), "groupName": p.get("groupName", "")}
+        for name, p in _unique_by_name(plans, "title").items()
+    })
+    cache_plan_groups(token, {p["id"]: p["owner"] for p in plans if p.get("owner")})
+
+
+def get_cached_bucket(token: str, plan_id: str, bucket_name: str) -> Optional[dict]:
+    """Return cached bucket object for a bucket name within a plan, or None on miss."""
+    if not cache_enabled():
+        return None
+    return get_cache_store().get(BUCKET_NAMESPACE, f"{token_scope(token)}:{plan_id}:{bucket_name.lower()}")
+
+
+def cache_buckets(token: str, plan_id: str, buckets: List[dict]) -> None:
+    """Cache every unambiguous bucket name from a full bucket listing."""
+    if not cache_enabled():
+        return
+    scope = token_scope(token)
+    get_cache_store().set_many(BUCKET_NAMESPACE, {
+        f"{scope}:{plan_id}:{name}": {"id": b["id"], "name": b.get("name", ""), "planId": plan_id}
+        for name, b in _unique_by_name(buckets, "name").items()
+    })
+
+
+def forget_bucket(token: str, bucket_id: str) -> Optional[str]:
+    """
+    Drop every cached name of a bucket (after it was renamed or deleted).
+
+    Returns:
+        Plan ID of the dropped entries, or None if none were cached
+    """
+    if not cache_enabled():
+        return None
+    prefix = f"{BUCKET_NAMESPACE}|{token_scope(token)}:"
+    plan_ids = []
+
+    def is_bucket(full_key: str, value) -> bool:
+        if full_key.startswith(prefix) and isinstance(value, dict) and value.get("id") == bucket_id:
+            plan_ids.append(value.get("planId"))
+            return True
+        return False
+
+    get_cache_store().invalidate_where(is_bucket)
+    return plan_ids[0] if plan_ids else None
+
+
+def rename_cached_bucket(token: str, bucket_id: str, new_name: str, plan_id: Optional[str] = None) -> None:
+    """
+    Move a renamed bucket's cache entry from its old name to the new one.
+
+    If another bucket of the plan is already cached under the new name, the
+    name is now ambiguous and that entry is dropped instead.
+    """
+    if not cache_enabled():
+        return
+    plan_id = forget_bucket(token, bucket_id) or plan_id
+    if not plan_id or not new_name:
+        return
+    store = get_cache_store()
+    key = f"{token_scope(token)}:{plan_id}:{new_name.lower()}"
+    existing = store.get(BUCKET_NAMESPACE, key)
+    if existing and existing.get("id") != bucket_id:
+        store.invalidate(BUCKET_NAMESPACE, key)
+    else:
+        store.set(BUCKET_NAMESPACE, key, {"id": bucket_id, "name": new_name, "planId": plan_id})
+
+
+def get_cached_group_names(token: str, group_ids: Iterable[str]) -> Dict[str, str]:
+    """Return cached display names for the given group IDs (misses are omitted)."""
+    if not cache_enabled():
+        return {}
+    scope = token_scope(token)
+    store = get_cache_store()
+    names = {}
+    for group_id in group_ids:
+        name = store.get(GROUP_NAMESPACE, f"{scope}:{group_id}")
+        if name is not None:
+            names[group_id] = name
+    return names
+
+
+def cache_group_names(token: str, names: Dict[str, str]) -> None:
+    """Cache group ID → display name pairs."""
+    if not cache_enabled():
+        return
+    scope = token_scope(token)
+    get_cache_store().set_many(GROUP_NAMESPACE, {
+        f"{scope}:{group_id}": name for group_id, name in names.items()
+    })
+
+
+def get_cached_user_ids(token: str, identifiers: Iterable[str]) -> Dict[str, str]:
+    """Return cached user IDs for emails/UPNs/names, keyed by the identifier as given (misses are omitted)."""
+    if not cache_enabled():
+        return {}
+    scope = token_scope(token)
+    store = get_cache_store()
+    user_ids = {}
+    for identifier in identifiers:
+        user_id = store.get(USER_NAMESPACE, f"{scope}:{identifier.lower()}")
+        if user_id is not None:
+            user_ids[identifier] = user_id
+    return user_ids
+
+
+def cache_user_ids(token: str, user_ids: Dict[str, str]) -> None:
+    """Cache identifier → user ID pairs (identifiers are matched case-insensitively)."""
+    if not cache_enabled() or not user_ids:
+        return
+    scope = token_scope(token)
+    get_cache_store().set_many(USER_NAMESPACE, {
+        f"{scope}:{identifier.lower()}": user_id for identifier, user_id in user_ids.items()
+    })
+
+
+def get_cached_plan_group(token: str, plan_id: str) -> Optional[str]:
+    """Return the cached owner group ID of a plan, or None on miss."""
+    if not cache_enabled():
+        return None
+    return get_cache_store().get(PLAN_GROUP_NAMESPACE, f"{token_scope(token)}:{plan_id}")
+
+
+def cache_plan_groups(token: str, groups: Dict[str, str]) -> None:
+    """Cache plan ID → owner group ID pairs (a plan's owner never changes)."""
+    if not cache_enabled() or not groups:
+        return
+    scope = token_scope(token)
+    get_cache_store().set_many(PLAN_GROUP_NAMESPACE, {
+        f"{scope}:{plan_id}": group_id for plan_id, group_id in groups.items()
+    }, ttl=STABLE_ID_CACHE_TTL)
+
+
+def get_cached_thread(token: str, task_id: str) -> Optional[str]:
+    """Return the cached conversationThreadId of a task, or None on miss."""
+    if not cache_enabled():
+        return None
+    return get_cache_store().get(THREAD_NAMESPACE, f"{token_scope(token)}:{task_id}")
+
+
+def cache_thread(token: str, task_id: str, thread_id: str) -> None:
+    """Cache a task's conversationThreadId (it never changes once the thread exists)."""
+    if not cache_enabled() or not thread_id:
+        return
+    get_cache_store().set(THREAD_NAMESPACE, f"{token_scope(token)}:{task_id}", thread_id, ttl=STABLE_ID_CACHE_TTL)
+
+
+def invalidate_for_url(url: str) -> None:
+    """Drop cached entries whose ID appears in a URL that returned 404 or 412."""
+    if not cache_enabled():
+        return
+
+    def is_stale(full_key: str, value) -> bool:
+        if full_key.startswith(f"{GROUP_NAMESPACE}|"):
+            return full_key.rsplit(":", 1)[-1] in url
+        if full_key.startswith(f"{USER_NAMESPACE}|"):
+            return isinstance(value, str) and value in url
+        if full_key.startswith((f"{PLAN_GROUP_NAMESPACE}|", f"{THREAD_NAMESPACE}|")):
+            # Plan/task ID (key) or group/thread ID (value)
+            return full_key.rsplit(":", 1)[-1] in url or (isinstance(value, str) and value in url)
+        if not full_key.startswith((f"{PLAN_NAMESPACE}|", f"{BUCKET_NAMESPACE}|")):
+            return False
+        ids = [value.get("id", ""), value.get("planId", "")] if isinstance(value, dict) else []
+        return any(i and i in url for i in ids)
+
+    get_cache_store().invalidate_where(is_stale)
+
+
+register_stale_handler(invalidate_for_url)
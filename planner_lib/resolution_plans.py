@@ -4,37 +4,90 @@ Handles listing and resolving plan names to IDs.
 """
 
 import json
-from typing import List
+from typing import Iterator, List
 
 from .constants import BASE_GRAPH_URL, GUID_PATTERN
-from .graph_client import get_json
+from .graph_batch import batch_get_json
+from .graph_client import iter_pages, iter_values
 from .resolution_utils import case_insensitive_match
+from .resolution_cache import get_cached_plan, cache_plans, get_cached_group_names, cache_group_names
 
 
-def list_user_plans(token: str) -> List[dict]:
+def _attach_group_names(token: str, plans: List[dict]) -> None:
+    """
+    Set groupName on plans from their owner group, in place.
+
+    Owner IDs are deduplicated and served from the group-name cache; only
+    misses are fetched, one $batch per 20 groups. Plans that already carry
+    a groupName are left alone, and lookup failures leave groupName unset.
+
+    Args:
+        token: Access token
+        plans: Plan objects with optional owner field
+    """
+    plans = [p for p in plans if p.get("owner") and "groupName" not in p]
+    owner_ids = list(dict.fromkeys(p["owner"] for p in plans))
+    names = get_cached_group_names(token, owner_ids)
+
+    missing = [group_id for group_id in owner_ids if group_id not in names]
+    if missing:
+        try:
+            groups = batch_get_json(
+                [f"/groups/{group_id}?$select=displayName" for group_id in missing],
+                token
+            )
+        except Exception:
+            groups = [None] * len(missing)
+        fetched = {
+            group_id: group_data.get("displayName", "")
+            for group_id, group_data in zip(missing, groups)
+            if group_data
+        }
+        cache_group_names(token, fetched)
+        names.update(fetched)
+
+    for plan in plans:
+        if plan.get("owner") in names:
+            plan["groupName"] = names[plan["owner"]]
+
+
+def iter_user_plans(token: str, include_group_names: bool = True) -> Iterator[dict]:
+    """
+    Stream the plans accessible to the user page by page.
+
+    Group names are looked up per page, so the first plans are yielded
+    before later pages are requested.
+
+    Args:
+        token: Access token
+        include_group_names: Look up each owner group's display name
+
+    Yields:
+        Plan objects with optional groupName field
+    """
+    for page in iter_pages(f"{BASE_GRAPH_URL}/me/planner/plans", token, prefetch=True):
+        plans = page.get("value", [])
+        if include_group_names:
+            _attach_group_names(token, plans)
+        yield from plans
+
+
+def list_user_plans(token: str, include_group_names: bool = True) -> List[dict]:
     """
     List all plans accessible to the user with group names.
 
     Args:
         token: Access token
+        include_group_names: Look up each owner group's display name
 
     Returns:
         List of plan objects with optional groupName field
     """
     url = f"{BASE_GRAPH_URL}/me/planner/plans"
-    data = get_json(url, token)
-    plans = data.get("value", [])
+    plans = list(iter_values(url, token))
 
-    # Augment with group names
-    for plan in plans:
-        owner_id = plan.get("owner")
-        if owner_id:
-            try:
-                group_url = f"{BASE_GRAPH_URL}/groups/{owner_id}"
-                group_data = get_json(group_url, token)
-                plan["groupName"] = group_data.get("displayName", "")
-            except Exception:
-                pass
+    if include_group_names:
+        _attach_group_names(token, plans)
 
     return plans
 
@@ -43,6 +96,10 @@ def resolve_plan(token: str, plan: str) -> dict:
     """
     Resolve plan name or ID to plan object.
 
+    Plan titles are served from the persistent resolution cache when possible;
+    a miss lists all plans once and caches every unambiguous title. Group
+    names are only looked up for the candidates of an error.
+
     Args:
         token: Access token
         plan: Plan name or ID
@@ -57,15 +114,22 @@ def resolve_plan(token: str, plan: str) -> dict:
     if GUID_PATTERN.match(plan):
         return {"id": plan}
 
+    cached = get_cached_plan(token, plan)
+    if cached:
+        return cached
+
     # Fetch all plans
-    plans = list_user_plans(token)
+    plans = list_user_plans(token, include_group_names=False)
+    cache_plans(token, plans)
 
     # Find case-insensitive matches
     matches = case_insensitive_match(plans, "title", plan)
 
     if len(matches) == 1:
         return matches[0]
-    elif len(matches) > 1:
+
+    _attach_group_names(token, matches or plans)
+    if len(matches) > 1:
         candidates = [{"id": p["id"], "title": p["title"], "groupName": p.get("groupName", "")}
                      for p in matches]
         error = {
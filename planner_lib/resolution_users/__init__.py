@@ -6,13 +6,15 @@ Supports partial name search for better user experience.
 
 from .search import search_users_by_name
 from .resolver import resolve_user
-from .batch import resolve_users
+from .batch import resolve_users, resolve_user_ids, lookup_users_exact
 from .types import UserInfo, ResolvedUser
 
 __all__ = [
     "search_users_by_name",
     "resolve_user",
     "resolve_users",
+    "resolve_user_ids",
+    "lookup_users_exact",
     "UserInfo",
     "ResolvedUser",
 ]
@@ -3,11 +3,97 @@ Batch user resolution with comprehensive error reporting
 """
 
 import json
-from typing import List
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import quote
 
+from ..concurrency import map_concurrent
+from ..constants import BASE_GRAPH_URL, GUID_PATTERN
+from ..graph_client import iter_values
+from ..resolution_cache import get_cached_user_ids, cache_user_ids
 from .resolver import resolve_user
 from .utils import create_batch_error
 
+# Graph accepts at most 15 values in one `in` filter
+EXACT_LOOKUP_CHUNK = 15
+
+
+def lookup_users_exact(token: str, identifiers: List[str]) -> Dict[str, str]:
+    """
+    Look up emails/UPNs with one `$filter=... in (...)` query per 15 identifiers.
+
+    Args:
+        token: OAuth access token
+        identifiers: Emails or UPNs
+
+    Returns:
+        Lowercased UPN/mail → User ID for every user found; identifiers
+        without a match (or whose query failed) are left out
+    """
+    found: Dict[str, str] = {}
+    for start in range(0, len(identifiers), EXACT_LOOKUP_CHUNK):
+        values = ",".join(
+            "'" + quote(identifier.replace("'", "''")) + "'"
+            for identifier in identifiers[start:start + EXACT_LOOKUP_CHUNK]
+        )
+        url = (
+            f"{BASE_GRAPH_URL}/users?$filter=userPrincipalName in ({values}) or mail in ({values})"
+            "&$select=id,userPrincipalName,mail"
+        )
+        try:
+            users = list(iter_values(url, token))
+        except Exception:
+            # Unmatched identifiers fall back to resolve_user
+            continue
+        for user in users:
+            for key in (user.get("userPrincipalName"), user.get("mail")):
+                if key:
+                    found[key.lower()] = user["id"]
+    return found
+
+
+def _resolve_one(token: str, identifier: str) -> object:
+    """Run resolve_user, returning the user ID or the exception it raised."""
+    try:
+        return resolve_user(token, identifier)
+    except Exception as e:
+        return e
+
+
+def resolve_user_ids(token: str, identifiers: Iterable[str], max_workers: Optional[int] = None) -> Dict[str, object]:
+    """
+    Resolve many user identifiers with as few requests as possible.
+
+    GUIDs need no request and earlier resolutions are served from the
+    persistent cache. Remaining emails/UPNs are matched with one `$filter`
+    query per 15; anything still unresolved (names, guest accounts) goes
+    through resolve_user, concurrently.
+
+    Args:
+        token: OAuth access token
+        identifiers: Emails/UPNs/User IDs/partial names (duplicates allowed)
+        max_workers: Concurrent resolve_user calls (default: PLANNER_MAX_CONCURRENCY or 8)
+
+    Returns:
+        Identifier → User ID, or the exception resolve_user raised for it
+    """
+    identifiers = list(dict.fromkeys(identifiers))
+    resolved: Dict[str, object] = {i: i for i in identifiers if GUID_PATTERN.match(i)}
+    pending = [i for i in identifiers if i not in resolved]
+    resolved.update(get_cached_user_ids(token, pending))
+    pending = [i for i in pending if i not in resolved]
+
+    exact = [i for i in pending if "@" in i]
+    if exact:
+        matches = lookup_users_exact(token, exact)
+        found = {i: matches[i.lower()] for i in exact if i.lower() in matches}
+        cache_user_ids(token, found)
+        resolved.update(found)
+        pending = [i for i in pending if i not in found]
+
+    # resolve_user caches what it resolves
+    resolved.update(zip(pending, map_concurrent(lambda i: _resolve_one(token, i), pending, max_workers=max_workers)))
+    return resolved
+
 
 def resolve_users(token: str, assignee_csv: str) -> List[str]:
     """
@@ -16,6 +102,10 @@ def resolve_users(token: str, assignee_csv: str) -> List[str]:
     Uses batch validation: attempts to resolve all identifiers first,
     then reports all errors together instead of failing on first error.
 
+    Identifiers are resolved through resolve_user_ids: GUIDs and cached
+    identifiers need no request, emails/UPNs share a `$filter` query and
+    the rest go through resolve_user concurrently.
+
     Args:
         token: OAuth access token
         assignee_csv: Comma-separated emails/UPNs/User IDs/partial names
@@ -32,36 +122,40 @@ def resolve_users(token: str, assignee_csv: str) -> List[str]:
     # Split and clean
     identifiers = [user.strip() for user in assignee_csv.split(",") if user.strip()]
 
-    # Batch validation: try to resolve all users and collect results/errors
+    outcomes = resolve_user_ids(token, identifiers)
+
+    # Batch validation: collect results/errors in input order
     user_ids = []
     resolved_info = []  # Successfully resolved users
     not_found = []      # Users not found
     ambiguous = {}      # Users with multiple matches
 
     for identifier in identifiers:
-        try:
-            user_id = resolve_user(token, identifier)
-            user_ids.append(user_id)
+        value = outcomes[identifier]
+
+        if not isinstance(value, Exception):
+            user_ids.append(value)
             resolved_info.append({
                 "input": identifier,
-                "userId": user_id
+                "userId": value
             })
-        except ValueError as e:
-            try:
-                error_data = json.loads(str(e))
-
-                if error_data.get("code") == "AmbiguousUser":
-                    # Collect ambiguous user with suggestions
-                    ambiguous[identifier] = error_data.get("suggestions", [])
-                elif error_data.get("code") == "UserNotFound":
-                    # Collect not found user
-                    not_found.append(identifier)
-                else:
-                    # Unknown error, re-raise
-                    raise
-            except (json.JSONDecodeError, KeyError):
-                # Not a JSON error, re-raise
-                raise
+            continue
+
+        try:
+            error_data = json.loads(str(value))
+        except (json.JSONDecodeError, KeyError):
+            # Not a JSON error, re-raise
+            raise value
+
+        if error_data.get("code") == "AmbiguousUser":
+            # Collect ambiguous user with suggestions
+            ambiguous[identifier] = error_data.get("suggestions", [])
+        elif error_data.get("code") == "UserNotFound":
+            # Collect not found user
+            not_found.append(identifier)
+        else:
+            # Unknown error, re-raise
+            raise value
 
     # If there are any errors, report all of them together
     if not_found or ambiguous:
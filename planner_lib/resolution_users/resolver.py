@@ -7,6 +7,7 @@ from typing import Optional
 
 from ..constants import BASE_GRAPH_URL, GUID_PATTERN
 from ..graph_client import get_json
+from ..resolution_cache import get_cached_user_ids, cache_user_ids
 from .search import search_users_by_name
 from .utils import (
     format_user_suggestion,
@@ -20,7 +21,8 @@ def resolve_user(token: str, user_identifier: str, enable_search: bool = True) -
     Resolve user email/UPN, User ID, or partial name to Azure AD User ID (GUID).
 
     Resolution strategy:
-    1. If input is a GUID, return it directly
+    1. If input is a GUID, return it directly (cached identifiers are
+       likewise answered without a request)
     2. Try exact match (email/UPN lookup)
     3. If enable_search=True and exact match fails, try partial name search
        - If exactly 1 match found, use it
@@ -43,10 +45,15 @@ def resolve_user(token: str, user_identifier: str, enable_search: bool = True) -
     if GUID_PATTERN.match(user_identifier):
         return user_identifier
 
+    cached = get_cached_user_ids(token, [user_identifier])
+    if cached:
+        return cached[user_identifier]
+
     # Step 2: Try exact match (email/UPN)
     try:
         url = f"{BASE_GRAPH_URL}/users/{user_identifier}"
         user = get_json(url, token)
+        cache_user_ids(token, {user_identifier: user["id"]})
         return user["id"]
     except Exception:
         # Exact match failed, try search if enabled
@@ -65,6 +72,7 @@ def resolve_user(token: str, user_identifier: str, enable_search: bool = True) -
 
     if len(search_results) == 1:
         # Single match - use it
+        cache_user_ids(token, {user_identifier: search_results[0]["id"]})
         return search_results[0]["id"]
 
     # Multiple matches - raise ambiguous error with suggestions
@@ -6,7 +6,7 @@ from typing import List, Dict, Any
 from urllib.parse import quote
 
 from ..constants import BASE_GRAPH_URL
-from ..graph_client import get_json
+from ..graph_client import iter_values
 
 
 def search_users_by_name(token: str, search_term: str) -> List[Dict[str, Any]]:
@@ -28,8 +28,7 @@ def search_users_by_name(token: str, search_term: str) -> List[Dict[str, Any]]:
     url = f"{BASE_GRAPH_URL}/users?$filter=startswith(tolower(displayName),tolower('{encoded_term}'))&$select=id,displayName,userPrincipalName,mail"
 
     try:
-        result = get_json(url, token)
-        return result.get("value", [])
+        return list(iter_values(url, token))
     except Exception:
         # Return empty list if search fails
         return []
@@ -0,0 +1,85 @@
+"""
+Search Index Module
+Text normalization, trigram extraction and ranking for fuzzy task search.
+"""
+
+import re
+import unicodedata
+from typing import Dict, List, Optional, Set
+
+_WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def normalize(text: str) -> str:
+    """Case-fold, strip accents and collapse everything but word characters to single spaces."""
+    text = unicodedata.normalize("NFKD", text or "")
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return " ".join(_WORD_PATTERN.findall(text.casefold()))
+
+
+def trigrams(text: str) -> Set[str]:
+    """
+    Trigrams of each word, padded with a space on both sides.
+
+    Padding makes one- and two-letter words searchable and gives word
+    starts and ends their own trigrams ("ship" → " sh", "shi", "hip", "ip ").
+
+    Args:
+        text: Raw or normalized text
+
+    Returns:
+        Set of trigram strings
+    """
+    grams: Set[str] = set()
+    for word in normalize(text).split():
+        padded = f" {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def search_fields(task: dict, details: Optional[dict]) -> Dict[str, str]:
+    """Normalized title, description and checklist text of a task."""
+    details = details or {}
+    checklist = details.get("checklist") or {}
+    return {
+        "title": normalize(task.get("title", "")),
+        "description": normalize(details.get("description", "")),
+        "checklist": normalize(" ".join(
+            item.get("title") or "" for item in checklist.values() if isinstance(item, dict)
+        ))
+    }
+
+
+def score(query: str, coverage: float, fields: Dict[str, str]) -> float:
+    """
+    Rank one task against a query.
+
+    The base score is the share of query trigrams found in the task (0-1).
+    Whole-query substring hits add 1.0 in the title (0.5 more as a title
+    prefix, 1.0 more for an exact title) or 0.5 in the description or
+    checklist, so exact and partial phrase matches outrank scattered ones.
+
+    Args:
+        query: Normalized query
+        coverage: Share of the query's trigrams present in the task
+        fields: Normalized fields from search_fields
+
+    Returns:
+        Score (higher is better)
+    """
+    value = coverage
+    title = fields["title"]
+    if query in title:
+        value += 1.0
+        if title.startswith(query):
+            value += 0.5
+        if title == query:
+            value += 1.0
+    elif query in fields["description"] or query in fields["checklist"]:
+        value += 0.5
+    return round(value, 4)
+
+
+def matched_fields(query_grams: Set[str], fields: Dict[str, str]) -> List[str]:
+    """Names of the fields sharing at least one trigram with the query."""
+    return [name for name, text in fields.items() if text and query_grams & trigrams(text)]
@@ -0,0 +1,92 @@
+"""
+Store Sync Module
+Incremental sync of plans into the local SQLite store.
+"""
+
+from typing import Dict, List, Optional
+
+from .constants import BASE_GRAPH_URL
+from .graph_batch import batch_get_json
+from .graph_client import get_json
+from .local_store import LocalStore, get_local_store
+from .resolution_buckets import list_plan_buckets
+from .task_operations import iter_tasks
+
+
+def sync_plan(
+    token: str,
+    plan_id: str,
+    store: Optional[LocalStore] = None,
+    include_details: bool = True,
+    full: bool = False,
+    max_workers: Optional[int] = None
+) -> dict:
+    """
+    Mirror one plan's buckets and tasks into the local store.
+
+    The plan, its buckets and its tasks are listed without /details (a few
+    paged requests). Each task's @odata.etag is compared with the stored
+    one, and /details are fetched through $batch only for tasks that are
+    new or changed, whose stored details carry no ETag, or for every task
+    with full=True.
+
+    Graph keeps separate ETags for a task and its /details, so an edit that
+    only touches the details (description or checklist text) can leave the
+    task ETag unchanged; such edits are picked up by full=True (sync --full).
+
+    Args:
+        token: Access token
+        plan_id: Plan ID
+        store: Local store (default: the process-wide store)
+        include_details: Mirror descriptions and checklists
+        full: Refetch details of unchanged tasks too
+        max_workers: Concurrent $batch requests (default: PLANNER_MAX_CONCURRENCY or 8)
+
+    Returns:
+        Summary with planId, title, buckets, tasks, added, updated, removed,
+        unchanged and detailsFetched counts
+
+    Raises:
+        requests.RequestException: On API errors
+    """
+    store = store or get_local_store()
+    plan = get_json(f"{BASE_GRAPH_URL}/planner/plans/{plan_id}", token)
+    buckets = list_plan_buckets(plan_id, token)
+    tasks = list(iter_tasks(token, plan_id=plan_id, include_details=False))
+
+    stored = store.get_task_states(plan_id)
+    added = updated = unchanged = 0
+    stale: List[str] = []
+    for task in tasks:
+        etag, has_details = stored.get(task["id"], (None, False))
+        if task["id"] not in stored:
+            added += 1
+        elif etag != task.get("@odata.etag"):
+            updated += 1
+        else:
+            unchanged += 1
+        if include_details and (full or not has_details or etag != task.get("@odata.etag")):
+            stale.append(task["id"])
+
+    details: Dict[str, dict] = {}
+    if stale:
+        bodies = batch_get_json(
+            [f"/planner/tasks/{task_id}/details" for task_id in stale],
+            token,
+            max_workers=max_workers
+        )
+        details = {task_id: body for task_id, body in zip(stale, bodies) if body is not None}
+
+    store.save_plan(plan, buckets, tasks, details)
+
+    return {
+        "planId": plan_id,
+        "title": plan.get("title", ""),
+        "buckets": len(buckets),
+        "tasks": len(tasks),
+        "added": added,
+        "updated": updated,
+        "removed": len(set(stored) - {t["id"] for t in tasks}),
+        "unchanged": unchanged,
+        "detailsFetched": len(details)
+    }
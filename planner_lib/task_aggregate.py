@@ -0,0 +1,215 @@
+"""
+Task Aggregate Module
+Tasks across many plans: the signed-in user's tasks or a concurrent fan-out over plans.
+"""
+
+import json
+import queue
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional
+
+from .concurrency import get_max_concurrency
+from .constants import BASE_GRAPH_URL
+from .etag_cache import remember_etags
+from .graph_client import iter_pages
+from .resolution_plans import list_user_plans
+from .task_creation import parse_labels
+from .task_operations import _attach_descriptions
+
+_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# Pages a fan-out may hold ahead of the consumer before its workers pause
+_FANOUT_QUEUE_PAGES = 16
+
+_DONE = object()
+
+
+class TaskFilter:
+    """
+    Filters applied to every page of tasks before descriptions are fetched.
+
+    All conditions must hold. Due dates compare on the calendar day of
+    dueDateTime; tasks without a due date fail any due-range condition.
+    """
+
+    def __init__(
+        self,
+        incomplete_only: bool = False,
+        due_after: Optional[str] = None,
+        due_before: Optional[str] = None,
+        assignee_id: Optional[str] = None,
+        labels: Optional[str] = None
+    ):
+        """
+        Args:
+            incomplete_only: Keep only tasks below 100% complete
+            due_after: Keep tasks due on or after this YYYY-MM-DD day
+            due_before: Keep tasks due on or before this YYYY-MM-DD day
+            assignee_id: Keep tasks assigned to this user ID
+            labels: Comma-separated labels (e.g., Label1,Label3) a task must all carry
+
+        Raises:
+            ValueError: If a due date is not YYYY-MM-DD
+        """
+        for name, value in (("due_after", due_after), ("due_before", due_before)):
+            if value and not _DATE_PATTERN.match(value):
+                raise ValueError(json.dumps({
+                    "code": "InvalidInput",
+                    "message": f"{name} must be a YYYY-MM-DD date, got '{value}'"
+                }))
+        self.incomplete_only = incomplete_only
+        self.due_after = due_after
+        self.due_before = due_before
+        self.assignee_id = assignee_id
+        self.categories = list(parse_labels(labels))
+
+    def matches(self, task: dict) -> bool:
+        """Return True when the task passes every condition."""
+        if self.incomplete_only and task.get("percentComplete", 0) >= 100:
+            return False
+        if self.due_after or self.due_before:
+            due = (task.get("dueDateTime") or "")[:10]
+            if not due:
+                return False
+            if self.due_after and due < self.due_after:
+                return False
+            if self.due_before and due > self.due_before:
+                return False
+        if self.assignee_id and self.assignee_id not in (task.get("assignments") or {}):
+            return False
+        applied = task.get("appliedCategories") or {}
+        return all(applied.get(category) for category in self.categories)
+
+
+def _process_page(
+    tasks: List[dict],
+    token: str,
+    task_filter: Optional[TaskFilter],
+    fetch_details: bool,
+    fields: Optional[List[str]],
+    max_workers: Optional[int]
+) -> List[dict]:
+    """Filter one page, then enrich and project only the tasks that survived."""
+    remember_etags(f"{BASE_GRAPH_URL}/planner/tasks", tasks)
+    if task_filter is not None:
+        tasks = [t for t in tasks if task_filter.matches(t)]
+    if fetch_details and tasks:
+        _attach_descriptions(tasks, token, max_workers)
+    if fields is not None:
+        tasks = [{f: t[f] for f in fields if f in t} for t in tasks]
+    return tasks
+
+
+def iter_my_tasks(
+    token: str,
+    task_filter: Optional[TaskFilter] = None,
+    include_details: bool = True,
+    fields: Optional[List[str]] = None,
+    max_workers: Optional[int] = None
+) -> Iterator[dict]:
+    """
+    Stream the tasks assigned to the signed-in user across all plans.
+
+    Reads /me/planner/tasks page by page (the next page is fetched while the
+    current one is enriched); descriptions are fetched only for tasks that
+    pass the filter.
+
+    Args:
+        token: Access token
+        task_filter: Conditions applied before enrichment
+        include_details: Fetch /details to attach description
+        fields: Only keep these task properties; details are fetched only if
+            "description" is among them
+        max_workers: Concurrent $batch requests for details
+
+    Yields:
+        Task objects
+    """
+    fetch_details = include_details and (fields is None or "description" in fields)
+    for page in iter_pages(f"{BASE_GRAPH_URL}/me/planner/tasks", token, prefetch=True):
+        yield from _process_page(page.get("value", []), token, task_filter, fetch_details, fields, max_workers)
+
+
+def iter_plans_tasks(
+    token: str,
+    plan_ids: Optional[List[str]] = None,
+    task_filter: Optional[TaskFilter] = None,
+    include_details: bool = True,
+    fields: Optional[List[str]] = None,
+    max_workers: Optional[int] = None
+) -> Iterator[dict]:
+    """
+    Stream tasks from many plans, reading the plans concurrently.
+
+    Each plan is paged by its own worker; filtered, enriched pages are
+    merged in arrival order, so the first tasks are yielded while other
+    plans are still being read. Workers pause when the consumer falls
+    behind and stop when the iterator is closed.
+
+    Args:
+        token: Access token
+        plan_ids: Plans to read (default: every plan visible to the user)
+        task_filter: Conditions applied before enrichment
+        include_details: Fetch /details to attach description
+        fields: Only keep these task properties; details are fetched only if
+            "description" is among them
+        max_workers: Plans read at once (default: PLANNER_MAX_CONCURRENCY or 8)
+
+    Yields:
+        Task objects, merged across plans
+
+    Raises:
+        Exception: The first error raised while reading any plan
+    """
+    if plan_ids is None:
+        plan_ids = [p["id"] for p in list_user_plans(token, include_group_names=False)]
+    plan_ids = list(dict.fromkeys(plan_ids))
+    if not plan_ids:
+        return
+
+    fetch_details = include_details and (fields is None or "description" in fields)
+    pages: queue.Queue = queue.Queue(maxsize=_FANOUT_QUEUE_PAGES)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def read_plan(plan_id: str) -> None:
+        try:
+            for page in iter_pages(f"{BASE_GRAPH_URL}/planner/plans/{plan_id}/tasks", token):
+                if stop.is_set():
+                    break
+                tasks = _process_page(page.get("value", []), token, task_filter, fetch_details, fields, 1)
+                if tasks and not put(tasks):
+                    break
+        except Exception as e:
+            put(e)
+        finally:
+            put(_DONE)
+
+    workers = min(max_workers or get_max_concurrency(), len(plan_ids))
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        for plan_id in plan_ids:
+            executor.submit(read_plan, plan_id)
+
+        remaining = len(plan_ids)
+        while remaining:
+            item = pages.get()
+            if item is _DONE:
+                remaining -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield from item
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
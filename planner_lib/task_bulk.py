@@ -0,0 +1,329 @@
+"""
+Task Bulk Creation Module
+Create many tasks from CSV or JSON Lines rows through Graph $batch.
+"""
+
+import csv
+import json
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from .concurrency import get_max_concurrency
+from .constants import BASE_GRAPH_URL, GRAPH_BATCH_MAX_SIZE
+from .etag_cache import remember_etag
+from .graph_batch import batch_requests
+from .resolution import resolve_plan, resolve_bucket
+from .resolution_users import resolve_user_ids
+from .task_creation import parse_labels, build_assignments
+
+BULK_COLUMNS = ("title", "plan", "bucket", "desc", "due", "assignee", "labels")
+
+
+def _error_of(exc: Exception) -> dict:
+    """Turn a resolution/transport exception into a JSON error object."""
+    try:
+        error = json.loads(str(exc))
+        if isinstance(error, dict) and "code" in error:
+            return error
+    except ValueError:
+        pass
+    return {"code": "Error", "message": str(exc)}
+
+
+def _upstream_error(result: Optional[dict]) -> dict:
+    """Build an UpstreamError from a failed $batch sub-response."""
+    if result is None:
+        return {"code": "UpstreamError", "message": "No response for batched request"}
+    body = result.get("body") or {}
+    message = (body.get("error") or {}).get("message", "") if isinstance(body, dict) else ""
+    return {"code": "UpstreamError", "message": f"{result['status']} {message}".strip()}
+
+
+def _normalize_row(raw: Dict[str, Any], line: int) -> dict:
+    """Lower-case column names, map 'description' to 'desc' and drop blanks."""
+    row = {}
+    for key, value in raw.items():
+        if key is None:
+            continue
+        key = key.strip().lower()
+        if key == "description":
+            key = "desc"
+        if key not in BULK_COLUMNS:
+            continue
+        if value is None:
+            continue
+        value = str(value).strip()
+        if value:
+            row[key] = value
+    if "title" not in row:
+        raise ValueError(json.dumps({
+            "code": "InvalidInput",
+            "message": f"Row {line}: 'title' is required"
+        }))
+    return row
+
+
+def read_bulk_rows(stream: TextIO, fmt: str) -> List[dict]:
+    """
+    Read task rows from CSV (with a header row) or JSON Lines.
+
+    Recognized columns/keys: title (required), plan, bucket, desc or
+    description, due, assignee, labels. Other columns are ignored.
+
+    Args:
+        stream: Text stream to read
+        fmt: "csv" or "jsonl"
+
+    Returns:
+        List of normalized row dicts
+
+    Raises:
+        ValueError: With JSON error object on unknown format or invalid rows
+    """
+    rows = []
+    if fmt == "csv":
+        for line, raw in enumerate(csv.DictReader(stream), start=1):
+            rows.append(_normalize_row(raw, line))
+    elif fmt == "jsonl":
+        line = 0
+        for text in stream:
+            if not text.strip():
+                continue
+            line += 1
+            try:
+                raw = json.loads(text)
+            except ValueError as e:
+                raise ValueError(json.dumps({
+                    "code": "InvalidInput",
+                    "message": f"Row {line}: invalid JSON ({e})"
+                }))
+            if not isinstance(raw, dict):
+                raise ValueError(json.dumps({
+                    "code": "InvalidInput",
+                    "message": f"Row {line}: expected a JSON object"
+                }))
+            rows.append(_normalize_row(raw, line))
+    else:
+        raise ValueError(json.dumps({
+            "code": "ConfigError",
+            "message": f"Unsupported format '{fmt}' (use csv or jsonl)"
+        }))
+    return rows
+
+
+def _resolve_targets(
+    token: str,
+    rows: List[dict],
+    default_plan: Optional[str],
+    default_bucket: Optional[str]
+) -> List[Tuple[Optional[str], Optional[str], Optional[dict]]]:
+    """Resolve each distinct plan and (plan, bucket) once; return (plan_id, bucket_id, error) per row."""
+    plans: Dict[str, Any] = {}
+    buckets: Dict[Tuple[str, str], Any] = {}
+    targets = []
+
+    for row in rows:
+        plan_input = row.get("plan") or default_plan
+        bucket_input = row.get("bucket") or default_bucket
+        if not plan_input or not bucket_input:
+            targets.append((None, None, {
+                "code": "ConfigError",
+                "message": "Plan and bucket required (via row, flags, env vars, or config defaults)"
+            }))
+            continue
+
+        # Plans and buckets are resolved sequentially: the first miss fills
+        # the resolution cache for the names that follow
+        if plan_input not in plans:
+            try:
+                plans[plan_input] = resolve_plan(token, plan_input)
+            except Exception as e:
+                plans[plan_input] = e
+        plan_obj = plans[plan_input]
+        if isinstance(plan_obj, Exception):
+            targets.append((None, None, _error_of(plan_obj)))
+            continue
+
+        key = (plan_obj["id"], bucket_input)
+        if key not in buckets:
+            try:
+                buckets[key] = resolve_bucket(token, plan_obj["id"], bucket_input)
+            except Exception as e:
+                buckets[key] = e
+        bucket_obj = buckets[key]
+        if isinstance(bucket_obj, Exception):
+            targets.append((None, None, _error_of(bucket_obj)))
+            continue
+
+        targets.append((plan_obj["id"], bucket_obj["id"], None))
+
+    return targets
+
+
+def _resolve_assignees(token: str, rows: List[dict], max_workers: Optional[int]) -> Dict[str, Any]:
+    """Resolve every distinct assignee identifier once (see resolve_user_ids)."""
+    identifiers = [
+        part.strip()
+        for row in rows
+        for part in row.get("assignee", "").split(",")
+        if part.strip()
+    ]
+    return resolve_user_ids(token, identifiers, max_workers=max_workers)
+
+
+def _build_payload(row: dict, plan_id: str, bucket_id: str, users: Dict[str, Any]) -> Tuple[Optional[dict], Optional[dict]]:
+    """Build the POST body for one row, or return the assignee error."""
+    payload: Dict[str, Any] = {
+        "planId": plan_id,
+        "bucketId": bucket_id,
+        "title": row["title"]
+    }
+    if row.get("due"):
+        payload["dueDateTime"] = f"{row['due']}T17:00:00Z"
+    if row.get("labels"):
+        payload["appliedCategories"] = parse_labels(row["labels"])
+    if row.get("assignee"):
+        user_ids = []
+        for part in row["assignee"].split(","):
+            part = part.strip()
+            if not part:
+                continue
+            user = users[part]
+            if isinstance(user, Exception):
+                return None, _error_of(user)
+            user_ids.append(user)
+        payload["assignments"] = build_assignments(user_ids)
+    return payload, None
+
+
+def _set_descriptions(token: str, created: List[Tuple[int, str, str]], max_workers: Optional[int]) -> Dict[int, dict]:
+    """
+    PATCH descriptions of newly created tasks: one $batch wave to read the
+    details ETags, one to write. Returns errors by row index.
+    """
+    errors: Dict[int, dict] = {}
+    if not created:
+        return errors
+
+    details = batch_requests(
+        [{"id": str(i), "method": "GET", "url": f"/planner/tasks/{task_id}/details"} for i, task_id, _ in created],
+        token,
+        max_workers=max_workers
+    )
+
+    patches = []
+    for i, task_id, description in created:
+        result = details.get(str(i))
+        if result is None or not 200 <= result["status"] < 300:
+            errors[i] = _upstream_error(result)
+            continue
+        patches.append({
+            "id": str(i),
+            "method": "PATCH",
+            "url": f"/planner/tasks/{task_id}/details",
+            "headers": {"If-Match": result["body"]["@odata.etag"], "Prefer": "return=representation"},
+            "body": {"description": description}
+        })
+
+    written = batch_requests(patches, token, max_workers=max_workers) if patches else {}
+    for patch in patches:
+        i = int(patch["id"])
+        result = written.get(patch["id"])
+        if result is None or not 200 <= result["status"] < 300:
+            errors[i] = _upstream_error(result)
+        elif isinstance(result.get("body"), dict):
+            remember_etag(f"{BASE_GRAPH_URL}{patch['url']}", result["body"].get("@odata.etag"))
+    return errors
+
+
+def create_tasks_bulk(
+    token: str,
+    rows: List[dict],
+    default_plan: Optional[str] = None,
+    default_bucket: Optional[str] = None,
+    max_workers: Optional[int] = None
+) -> Iterator[dict]:
+    """
+    Create tasks for many rows, yielding one result per row in input order.
+
+    Distinct plans, buckets and assignees are resolved once. Rows are then
+    processed in windows of 20 x max_workers: tasks are created through
+    concurrent $batch POSTs, and descriptions are written with one batched
+    details read plus one batched PATCH per window. Results for a window
+    are yielded as soon as it completes.
+
+    Args:
+        token: Access token
+        rows: Rows from read_bulk_rows
+        default_plan: Plan for rows without one
+        default_bucket: Bucket for rows without one
+        max_workers: Concurrent $batch requests (default: PLANNER_MAX_CONCURRENCY or 8)
+
+    Yields:
+        {"row", "ok": True, "taskId", "webUrl", "bucketId", "title"} or
+        {"row", "ok": False, "title", "error"} (with taskId if the task was
+        created but its description could not be set)
+    """
+    targets = _resolve_targets(token, rows, default_plan, default_bucket)
+    users = _resolve_assignees(token, rows, max_workers)
+
+    window = GRAPH_BATCH_MAX_SIZE * (max_workers or get_max_concurrency())
+    for start in range(0, len(rows), window):
+        results: Dict[int, dict] = {}
+        posts = []
+
+        for i in range(start, min(start + window, len(rows))):
+            row = rows[i]
+            plan_id, bucket_id, error = targets[i]
+            payload = None
+            if error is None:
+                payload, error = _build_payload(row, plan_id, bucket_id, users)
+            if error is not None:
+                results[i] = {"row": i + 1, "ok": False, "title": row["title"], "error": error}
+                continue
+            posts.append({"id": str(i), "method": "POST", "url": "/planner/tasks", "body": payload})
+
+        try:
+            created = batch_requests(posts, token, max_workers=max_workers) if posts else {}
+        except Exception as e:
+            created = {}
+            for post in posts:
+                i = int(post["id"])
+                results[i] = {"row": i + 1, "ok": False, "title": rows[i]["title"], "error": _error_of(e)}
+
+        with_description = []
+        for post in posts:
+            i = int(post["id"])
+            if i in results:
+                continue
+            result = created.get(post["id"])
+            if result is None or not 200 <= result["status"] < 300:
+                results[i] = {"row": i + 1, "ok": False, "title": rows[i]["title"], "error": _upstream_error(result)}
+                continue
+            task = result["body"]
+            remember_etag(f"{BASE_GRAPH_URL}/planner/tasks/{task['id']}", task.get("@odata.etag"))
+            results[i] = {
+                "row": i + 1,
+                "ok": True,
+                "taskId": task["id"],
+                "webUrl": task.get("detailsUrl", ""),
+                "bucketId": post["body"]["bucketId"],
+                "title": rows[i]["title"]
+            }
+            if rows[i].get("desc"):
+                with_description.append((i, task["id"], rows[i]["desc"]))
+
+        try:
+            description_errors = _set_descriptions(token, with_description, max_workers)
+        except Exception as e:
+            description_errors = {i: _error_of(e) for i, _, _ in with_description}
+        for i, error in description_errors.items():
+            results[i] = {
+                "row": i + 1,
+                "ok": False,
+                "title": rows[i]["title"],
+                "taskId": results[i]["taskId"],
+                "error": {"code": "DescriptionFailed", "message": error["message"]}
+            }
+
+        for i in sorted(results):
+            yield results[i]
@@ -5,16 +5,42 @@ Handles reading and adding comments to Planner tasks via conversation threads.
 
 import json
 import logging
-from typing import List, Optional
+from typing import Callable, Iterator, List, Optional, Tuple
 
 import requests
 
+from .concurrency import map_concurrent
 from .constants import BASE_GRAPH_URL
-from .graph_client import get_json, post_json
+from .graph_client import get_json, post_json, iter_pages
+from .resolution_cache import (
+    get_cached_plan_group, cache_plan_groups, get_cached_thread, cache_thread, invalidate_for_url
+)
 
 logger = logging.getLogger(__name__)
 
 
+def format_comment(post: dict) -> dict:
+    """
+    Convert a conversation post into a comment object.
+
+    Args:
+        post: Post from /groups/{id}/threads/{id}/posts
+
+    Returns:
+        Comment with id, author (name, email), content and createdDateTime
+    """
+    author = post.get("from", {}).get("emailAddress", {})
+    return {
+        "id": post.get("id"),
+        "author": {
+            "name": author.get("name", ""),
+            "email": author.get("address", "")
+        },
+        "content": post.get("body", {}).get("content", ""),
+        "createdDateTime": post.get("createdDateTime", "")
+    }
+
+
 def _get_validated_plan(plan_id: str, token: str) -> dict:
     """
     Retrieve and validate a plan.
@@ -65,25 +91,16 @@ def _get_validated_plan(plan_id: str, token: str) -> dict:
     return plan
 
 
-def get_task_comments(task_id: str, plan_id: str, token: str) -> List[dict]:
+def _get_task_for_read(task_id: str, token: str) -> dict:
     """
-    Fetch comments from task's conversation thread.
-
-    Args:
-        task_id: Task ID (GUID)
-        plan_id: Plan ID (to get group ID)
-        token: Access token
-
-    Returns:
-        List of comment objects with author, content, and createdDateTime
+    Retrieve a task before reading its comments.
 
     Raises:
-        ValueError: If task or plan not found, or if comments cannot be accessed
+        ValueError: JSON-encoded {error, status} if the task cannot be retrieved
     """
-    # Get task to find conversationThreadId
     task_url = f"{BASE_GRAPH_URL}/planner/tasks/{task_id}"
     try:
-        task = get_json(task_url, token)
+        return get_json(task_url, token)
     except requests.HTTPError as e:
         status_code = e.response.status_code if e.response else None
         error_msg = str(e)
@@ -109,84 +126,15 @@ def get_task_comments(task_id: str, plan_id: str, token: str) -> List[dict]:
             "status": None
         }
         raise ValueError(json.dumps(error_response))
-    conversation_thread_id = task.get("conversationThreadId")
-
-    if not conversation_thread_id:
-        # Task has no comments thread yet
-        return []
-
-    # Get plan to find group ID
-    plan = _get_validated_plan(plan_id, token)
-
-    group_id = plan.get("owner")
-
-    if not group_id:
-        raise ValueError(json.dumps({
-            "code": "NoGroupOwner",
-            "message": f"Plan {plan_id} has no owner group"
-        }))
-
-    # Get conversation thread posts
-    try:
-        posts_url = f"{BASE_GRAPH_URL}/groups/{group_id}/threads/{conversation_thread_id}/posts"
-        posts_data = get_json(posts_url, token)
-        posts = posts_data.get("value", [])
-
-        comments = []
-        for post in posts:
-            # Extract author info
-            from_field = post.get("from", {})
-            author = from_field.get("emailAddress", {})
-
-            # Extract body content
-            body = post.get("body", {})
-            content = body.get("content", "")
-
-            comments.append({
-                "id": post.get("id"),
-                "author": {
-                    "name": author.get("name", ""),
-                    "email": author.get("address", "")
-                },
-                "content": content,
-                "createdDateTime": post.get("createdDateTime", "")
-            })
-
-        return comments
-    except Exception as e:
-        # If thread doesn't exist or access denied, return empty list
-        error_msg = str(e)
-        if "404" in error_msg or "NotFound" in error_msg:
-            return []
-        raise ValueError(json.dumps({
-            "code": "CommentsAccessError",
-            "message": f"Could not access comments: {error_msg}"
-        }))
 
 
-def add_task_comment(task_id: str, plan_id: str, comment: str, token: str) -> dict:
+def _get_validated_task(task_id: str, token: str) -> dict:
     """
-    Add a comment to a task's conversation thread.
-
-    Args:
-        task_id: Task ID (GUID)
-        plan_id: Plan ID (to get group ID)
-        comment: Comment text to add
-        token: Access token
-
-    Returns:
-        Dictionary with success status and comment ID
+    Retrieve and validate a task before adding a comment.
 
     Raises:
-        ValueError: If task or plan not found, or if comment cannot be added
+        ValueError: JSON-encoded error if task cannot be retrieved or is invalid
     """
-    if not comment or not comment.strip():
-        raise ValueError(json.dumps({
-            "code": "InvalidComment",
-            "message": "Comment cannot be empty"
-        }))
-
-    # Get task to find or create conversationThreadId
     task_url = f"{BASE_GRAPH_URL}/planner/tasks/{task_id}"
     try:
         task = get_json(task_url, token)
@@ -218,23 +166,210 @@ def add_task_comment(task_id: str, plan_id: str, comment: str, token: str) -> di
             "code": "TaskAccessError",
             "message": f"Could not access task {task_id}: {error_msg}"
         }))
+    return task
+
+
+def _capture(fetch: Callable[[], dict]) -> Tuple[Optional[dict], Optional[Exception]]:
+    """Run fetch, returning (result, None) or (None, exception)."""
+    try:
+        return fetch(), None
+    except Exception as e:
+        return None, e
+
+
+def _thread_location(
+    task_id: str,
+    plan_id: str,
+    token: str,
+    group_id: Optional[str],
+    thread_id: Optional[str],
+    get_task: Callable[[str, str], dict],
+    thread_first: bool
+) -> Tuple[Optional[str], Optional[str], bool]:
+    """
+    Return (group_id, conversation_thread_id, from_cache) of a task.
 
-    conversation_thread_id = task.get("conversationThreadId")
+    IDs passed in or found in the persistent cache need no request; when
+    both the task and the plan have to be read, they are read concurrently.
+    Errors are raised in the order the sequential lookups used to raise
+    them: task errors first, then (with thread_first) a missing thread ends
+    the lookup before plan errors are considered.
 
-    # Get plan to find group ID
-    plan = _get_validated_plan(plan_id, token)
+    Returns:
+        (group_id, thread_id, from_cache); thread_id is None when the task
+        has no thread yet, and group_id may then be None too. from_cache is
+        True when either ID was taken from the persistent cache
 
-    group_id = plan.get("owner")
+    Raises:
+        ValueError: JSON-encoded error if the task or plan cannot be read or
+            the plan has no owner group
+    """
+    cached_group = None if group_id else get_cached_plan_group(token, plan_id)
+    cached_thread = None if thread_id else get_cached_thread(token, task_id)
+    from_cache = bool(cached_group or cached_thread)
+    group_id = group_id or cached_group
+    thread_id = thread_id or cached_thread
+
+    fetches = []
+    if not thread_id:
+        fetches.append(lambda: get_task(task_id, token))
+    if not group_id:
+        fetches.append(lambda: _get_validated_plan(plan_id, token))
+    outcomes = map_concurrent(_capture, fetches)
+
+    if not thread_id:
+        task, error = outcomes.pop(0)
+        if error:
+            raise error
+        thread_id = task.get("conversationThreadId")
+        if thread_id:
+            cache_thread(token, task_id, thread_id)
+        elif thread_first:
+            return group_id, None, from_cache
 
     if not group_id:
+        plan, error = outcomes.pop(0)
+        if error:
+            raise error
+        group_id = plan.get("owner")
+        if not group_id:
+            raise ValueError(json.dumps({
+                "code": "NoGroupOwner",
+                "message": f"Plan {plan_id} has no owner group"
+            }))
+        cache_plan_groups(token, {plan_id: group_id})
+
+    return group_id, thread_id, from_cache
+
+
+def iter_task_comments(
+    task_id: str,
+    plan_id: str,
+    token: str,
+    group_id: Optional[str] = None,
+    thread_id: Optional[str] = None
+) -> Iterator[dict]:
+    """
+    Stream comments from task's conversation thread, page by page.
+
+    The plan's group and the task's thread ID come from the arguments or the
+    persistent cache when possible, so a cached read is a single request; on
+    a miss the task and plan are read concurrently. A thread that turns out
+    not to exist under cached IDs is looked up again once.
+
+    Args:
+        task_id: Task ID (GUID)
+        plan_id: Plan ID (to get group ID)
+        token: Access token
+        group_id: Owner group ID of the plan, if known
+        thread_id: conversationThreadId of the task, if known
+
+    Yields:
+        Comment objects with author, content, and createdDateTime
+
+    Raises:
+        ValueError: If task or plan not found, or if comments cannot be accessed
+    """
+    group_id, thread_id, cached = _thread_location(
+        task_id, plan_id, token, group_id, thread_id, _get_task_for_read, thread_first=True
+    )
+
+    if not thread_id:
+        # Task has no comments thread yet
+        return
+
+    # Get conversation thread posts
+    yielded = False
+    try:
+        posts_url = f"{BASE_GRAPH_URL}/groups/{group_id}/threads/{thread_id}/posts"
+        for page in iter_pages(posts_url, token):
+            for post in page.get("value", []):
+                yielded = True
+                yield format_comment(post)
+    except Exception as e:
+        # If thread doesn't exist or access denied, return empty list
+        error_msg = str(e)
+        if "404" in error_msg or "NotFound" in error_msg:
+            if cached and not yielded:
+                # Cached IDs were stale; drop them and look them up again
+                invalidate_for_url(posts_url)
+                yield from iter_task_comments(task_id, plan_id, token)
+            return
+        raise ValueError(json.dumps({
+            "code": "CommentsAccessError",
+            "message": f"Could not access comments: {error_msg}"
+        }))
+
+
+def get_task_comments(
+    task_id: str,
+    plan_id: str,
+    token: str,
+    group_id: Optional[str] = None,
+    thread_id: Optional[str] = None
+) -> List[dict]:
+    """
+    Fetch comments from task's conversation thread.
+
+    Args:
+        task_id: Task ID (GUID)
+        plan_id: Plan ID (to get group ID)
+        token: Access token
+        group_id: Owner group ID of the plan, if known
+        thread_id: conversationThreadId of the task, if known
+
+    Returns:
+        List of comment objects with author, content, and createdDateTime
+
+    Raises:
+        ValueError: If task or plan not found, or if comments cannot be accessed
+    """
+    return list(iter_task_comments(task_id, plan_id, token, group_id=group_id, thread_id=thread_id))
+
+
+def add_task_comment(
+    task_id: str,
+    plan_id: str,
+    comment: str,
+    token: str,
+    group_id: Optional[str] = None,
+    thread_id: Optional[str] = None
+) -> dict:
+    """
+    Add a comment to a task's conversation thread.
+
+    With the group and thread IDs passed in or cached, the reply is the only
+    request; otherwise the task and plan are read concurrently first. A
+    reply that fails with 404 under cached IDs is retried once after a
+    fresh lookup.
+
+    Args:
+        task_id: Task ID (GUID)
+        plan_id: Plan ID (to get group ID)
+        comment: Comment text to add
+        token: Access token
+        group_id: Owner group ID of the plan, if known
+        thread_id: conversationThreadId of the task, if known
+
+    Returns:
+        Dictionary with success status and comment ID
+
+    Raises:
+        ValueError: If task or plan not found, or if comment cannot be added
+    """
+    if not comment or not comment.strip():
         raise ValueError(json.dumps({
-            "code": "NoGroupOwner",
-            "message": f"Plan {plan_id} has no owner group"
+            "code": "InvalidComment",
+            "message": "Comment cannot be empty"
         }))
 
+    group_id, thread_id, cached = _thread_location(
+        task_id, plan_id, token, group_id, thread_id, _get_validated_task, thread_first=False
+    )
+
     # If no thread exists, we need to create one
     # For now, we'll try to reply to existing thread or create via task details
-    if not conversation_thread_id:
+    if not thread_id:
         # Try to get/create thread via task details
         # Note: Microsoft Graph API may require creating the thread first
         # This is a limitation - we can only add comments if a thread already exists
@@ -245,7 +380,7 @@ def add_task_comment(task_id: str, plan_id: str, comment: str, token: str) -> di
 
     # Reply to existing thread
     try:
-        reply_url = f"{BASE_GRAPH_URL}/groups/{group_id}/threads/{conversation_thread_id}/reply"
+        reply_url = f"{BASE_GRAPH_URL}/groups/{group_id}/threads/{thread_id}/reply"
         payload = {
             "post": {
                 "body": {
@@ -262,6 +397,10 @@ def add_task_comment(task_id: str, plan_id: str, comment: str, token: str) -> di
         }
     except Exception as e:
         error_msg = str(e)
+        if cached and ("404" in error_msg or "NotFound" in error_msg):
+            # Cached IDs were stale; drop them and look them up again
+            invalidate_for_url(reply_url)
+            return add_task_comment(task_id, plan_id, comment, token)
         raise ValueError(json.dumps({
             "code": "CommentAddError",
             "message": f"Could not add comment: {error_msg}"
@@ -4,18 +4,21 @@ Mark tasks as complete.
 """
 
 import requests
+from typing import Optional
 
 from .constants import BASE_GRAPH_URL
+from .etag_cache import get_known_etag
 from .graph_client import get_json, patch_json
 
 
-def complete_task_op(task_id: str, token: str) -> dict:
+def complete_task_op(task_id: str, token: str, etag: Optional[str] = None) -> dict:
     """
     Mark a task as complete.
 
     Args:
         task_id: Task ID
         token: Access token
+        etag: Known task ETag (skips the pre-read GET; refetched on 412)
 
     Returns:
         Updated task object or success dict
@@ -23,20 +26,19 @@ def complete_task_op(task_id: str, token: str) -> dict:
     Raises:
         requests.RequestException: On API errors
     """
-    # Fetch current task for ETag
+    # Use the known ETag, fetching the task only when none is at hand
     url = f"{BASE_GRAPH_URL}/planner/tasks/{task_id}"
-    task = get_json(url, token)
-    etag = task["@odata.etag"]
+    etag = etag or get_known_etag(url) or get_json(url, token)["@odata.etag"]
 
     # Update with retry on ETag conflict
     try:
-        result = patch_json(url, token, {"percentComplete": 100}, etag)
+        result = patch_json(url, token, {"percentComplete": 100}, etag, return_representation=True)
         return result if result else {"ok": True, "taskId": task_id}
     except requests.HTTPError as e:
         if e.response.status_code == 412:  # Precondition Failed (ETag conflict)
             # Retry once
             task = get_json(url, token)
             etag = task["@odata.etag"]
-            result = patch_json(url, token, {"percentComplete": 100}, etag)
+            result = patch_json(url, token, {"percentComplete": 100}, etag, return_representation=True)
             return result if result else {"ok": True, "taskId": task_id}
         raise
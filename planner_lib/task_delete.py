@@ -4,18 +4,21 @@ Delete tasks from planner.
 """
 
 import requests
+from typing import Optional
 
 from .constants import BASE_GRAPH_URL
-from .graph_client import get_json, auth_headers
+from .etag_cache import get_known_etag
+from .graph_client import get_json, delete_json
 
 
-def delete_task_op(task_id: str, token: str) -> dict:
+def delete_task_op(task_id: str, token: str, etag: Optional[str] = None) -> dict:
     """
     Delete a task.
 
     Args:
         task_id: Task ID
         token: Access token
+        etag: Known task ETag (skips the pre-read GET; refetched on 412)
 
     Returns:
         Success dict
@@ -23,16 +26,17 @@ def delete_task_op(task_id: str, token: str) -> dict:
     Raises:
         requests.RequestException: On API errors
     """
-    # Fetch current task for ETag
+    # Use the known ETag, fetching the task only when none is at hand
     url = f"{BASE_GRAPH_URL}/planner/tasks/{task_id}"
-    task = get_json(url, token)
-    etag = task["@odata.etag"]
-
-    # Delete with ETag
-    headers = auth_headers(token)
-    headers["If-Match"] = etag
-
-    response = requests.delete(url, headers=headers)
-    response.raise_for_status()
+    etag = etag or get_known_etag(url) or get_json(url, token)["@odata.etag"]
+
+    # Delete with retry on ETag conflict
+    try:
+        delete_json(url, token, etag)
+    except requests.HTTPError as e:
+        if e.response.status_code != 412:
+            raise
+        task = get_json(url, token)
+        delete_json(url, token, task["@odata.etag"])
 
     return {"ok": True, "taskId": task_id}
@@ -3,12 +3,13 @@ Task Management Module - Barrel Exports
 Re-exports all task management operations from modular structure.
 """
 
-from .task_operations import list_tasks, resolve_task, get_task_details, find_task_by_title
+from .task_operations import list_tasks, iter_tasks, resolve_task, get_task_details, find_task_by_title
 from .task_updates import complete_task_op, move_task_op, delete_task_op
-from .task_subtasks import add_subtask, list_subtasks, complete_subtask
+from .task_subtasks import add_subtask, add_subtasks, list_subtasks, complete_subtask
 
 __all__ = [
     "list_tasks",
+    "iter_tasks",
     "resolve_task",
     "get_task_details",
     "find_task_by_title",
@@ -16,6 +17,7 @@ __all__ = [
     "move_task_op",
     "delete_task_op",
     "add_subtask",
+    "add_subtasks",
     "list_subtasks",
     "complete_subtask",
 ]
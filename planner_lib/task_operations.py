@@ -4,30 +4,59 @@ Core task operations: list and resolve tasks.
 """
 
 import json
-from typing import Optional, List
+from typing import Iterator, Optional, List
 
 from .constants import BASE_GRAPH_URL, GUID_PATTERN
-from .graph_client import get_json
+from .etag_cache import remember_etag, remember_etags
+from .graph_batch import batch_get_json
+from .graph_client import get_json, iter_pages
 from .resolution_utils import case_insensitive_match
 
 
-def list_tasks(
+def _attach_descriptions(tasks: List[dict], token: str, max_workers: Optional[int]) -> None:
+    """Fetch descriptions for tasks, 20 per $batch, batches sent concurrently."""
+    with_ids = [t for t in tasks if t.get("id")]
+    details_list = batch_get_json(
+        [f"/planner/tasks/{t['id']}/details" for t in with_ids],
+        token,
+        max_workers=max_workers
+    )
+    for task, details in zip(with_ids, details_list):
+        # If details fetch fails, set empty description
+        task["description"] = (details or {}).get("description", "")
+        if details:
+            remember_etag(f"{BASE_GRAPH_URL}/planner/tasks/{task['id']}/details", details.get("@odata.etag"))
+
+
+def iter_tasks(
     token: str,
     plan_id: Optional[str] = None,
     bucket_id: Optional[str] = None,
-    incomplete_only: bool = False
-) -> List[dict]:
+    incomplete_only: bool = False,
+    max_workers: Optional[int] = None,
+    prefetch: bool = False,
+    include_details: bool = True,
+    fields: Optional[List[str]] = None
+) -> Iterator[dict]:
     """
-    List tasks from a plan or bucket.
+    Stream tasks from a plan or bucket page by page, following @odata.nextLink.
+
+    Descriptions are fetched per page, so the first tasks are yielded before
+    later pages are requested.
 
     Args:
         token: Access token
         plan_id: Plan ID (required if bucket_id not provided)
         bucket_id: Bucket ID (takes precedence over plan_id)
         incomplete_only: Filter to show only incomplete tasks
+        max_workers: Concurrent $batch requests for details (default: PLANNER_MAX_CONCURRENCY or 8)
+        prefetch: Fetch the next page while the current one is being enriched
+        include_details: Fetch /details to attach description (skipped when False)
+        fields: Only keep these task properties; details are fetched only if
+            "description" is among them
 
-    Returns:
-        List of task objects with description included
+    Yields:
+        Task objects, with description included unless details are skipped
 
     Raises:
         ValueError: If neither plan_id nor bucket_id provided
@@ -39,38 +68,95 @@ def list_tasks(
     else:
         raise ValueError("plan_id or bucket_id required")
 
-    data = get_json(url, token)
-    tasks = data.get("value", [])
+    fetch_details = include_details and (fields is None or "description" in fields)
+
+    for page in iter_pages(url, token, prefetch=prefetch):
+        tasks = page.get("value", [])
+        # Later writes in this process can skip their pre-read GET
+        remember_etags(f"{BASE_GRAPH_URL}/planner/tasks", tasks)
+
+        if incomplete_only:
+            tasks = [t for t in tasks if t.get("percentComplete", 0) < 100]
 
-    if incomplete_only:
-        tasks = [t for t in tasks if t.get("percentComplete", 0) < 100]
+        # Only tasks that survived filtering are enriched
+        if fetch_details:
+            _attach_descriptions(tasks, token, max_workers)
 
-    # Fetch descriptions for all tasks
-    for task in tasks:
-        task_id = task.get("id")
-        if task_id:
-            try:
-                details_url = f"{BASE_GRAPH_URL}/planner/tasks/{task_id}/details"
-                details = get_json(details_url, token)
-                task["description"] = details.get("description", "")
-            except Exception:
-                # If details fetch fails, set empty description
-                task["description"] = ""
+        if fields is not None:
+            tasks = [{f: t[f] for f in fields if f in t} for t in tasks]
 
-    return tasks
+        yield from tasks
 
 
-def resolve_task(token: str, task: str, plan_id: Optional[str] = None) -> dict:
+def list_tasks(
+    token: str,
+    plan_id: Optional[str] = None,
+    bucket_id: Optional[str] = None,
+    incomplete_only: bool = False,
+    max_workers: Optional[int] = None,
+    include_details: bool = True,
+    fields: Optional[List[str]] = None
+) -> List[dict]:
+    """
+    List tasks from a plan or bucket.
+
+    Args:
+        token: Access token
+        plan_id: Plan ID (required if bucket_id not provided)
+        bucket_id: Bucket ID (takes precedence over plan_id)
+        incomplete_only: Filter to show only incomplete tasks
+        max_workers: Concurrent $batch requests for details (default: PLANNER_MAX_CONCURRENCY or 8)
+        include_details: Fetch /details to attach description (skipped when False)
+        fields: Only keep these task properties; details are fetched only if
+            "description" is among them
+
+    Returns:
+        List of task objects, with description included unless details are skipped
+
+    Raises:
+        ValueError: If neither plan_id nor bucket_id provided
+    """
+    return list(iter_tasks(
+        token,
+        plan_id=plan_id,
+        bucket_id=bucket_id,
+        incomplete_only=incomplete_only,
+        max_workers=max_workers,
+        include_details=include_details,
+        fields=fields
+    ))
+
+
+def _fetch_description(task_id: str, token: str) -> str:
+    """Fetch a single task's description, returning empty string on failure."""
+    try:
+        details_url = f"{BASE_GRAPH_URL}/planner/tasks/{task_id}/details"
+        details = get_json(details_url, token)
+        return details.get("description", "")
+    except Exception:
+        return ""
+
+
+def resolve_task(
+    token: str,
+    task: str,
+    plan_id: Optional[str] = None,
+    include_details: bool = False
+) -> dict:
     """
     Resolve task identifier (ID or title) to task object.
 
+    Title matching lists the plan without /details calls, so resolution costs
+    one request; the description is fetched only for the match when asked for.
+
     Args:
         token: Access token
         task: Task ID (GUID) or task title
         plan_id: Plan ID (required for title search)
+        include_details: Attach the task description (one extra request)
 
     Returns:
-        Task object with full details including description
+        Task object (including description if include_details)
 
     Raises:
         ValueError: With JSON error if task not found or ambiguous
@@ -81,13 +167,8 @@ def resolve_task(token: str, task: str, plan_id: Optional[str] = None) -> dict:
         task_obj = get_json(url, token)
         # Fetch description
         task_id = task_obj.get("id")
-        if task_id:
-            try:
-                details_url = f"{BASE_GRAPH_URL}/planner/tasks/{task_id}/details"
-                details = get_json(details_url, token)
-                task_obj["description"] = details.get("description", "")
-            except Exception:
-                task_obj["description"] = ""
+        if include_details and task_id:
+            task_obj["description"] = _fetch_description(task_id, token)
         return task_obj
 
     # Title → search
@@ -97,11 +178,14 @@ def resolve_task(token: str, task: str, plan_id: Optional[str] = None) -> dict:
             "message": "plan_id required for title-based task search"
         }))
 
-    tasks = list_tasks(token, plan_id=plan_id)
+    tasks = list_tasks(token, plan_id=plan_id, include_details=False)
     matches = case_insensitive_match(tasks, "title", task)
 
     if len(matches) == 1:
-        return matches[0]
+        match = matches[0]
+        if include_details:
+            match["description"] = _fetch_description(match["id"], token)
+        return match
     elif len(matches) > 1:
         candidates = [{"id": t["id"], "title": t["title"], "bucketId": t.get("bucketId", "")}
                      for t in matches]
@@ -145,12 +229,7 @@ def get_task_details(task_id: str, token: str) -> dict:
     task_obj = get_json(url, token)
 
     # Fetch description
-    try:
-        details_url = f"{BASE_GRAPH_URL}/planner/tasks/{task_id}/details"
-        details = get_json(details_url, token)
-        task_obj["description"] = details.get("description", "")
-    except Exception:
-        task_obj["description"] = ""
+    task_obj["description"] = _fetch_description(task_id, token)
 
     return task_obj
 
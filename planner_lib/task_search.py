@@ -0,0 +1,43 @@
+"""
+Task Search Module
+Ranked fuzzy search over a plan's titles, descriptions and checklists.
+"""
+
+from typing import List, Optional
+
+from .constants import SEARCH_DEFAULT_LIMIT
+from .local_store import LocalStore, get_local_store
+from .store_sync import sync_plan
+
+
+def search_tasks(
+    token: Optional[str],
+    plan_id: str,
+    query: str,
+    limit: int = SEARCH_DEFAULT_LIMIT,
+    cached: bool = False,
+    store: Optional[LocalStore] = None
+) -> List[dict]:
+    """
+    Search a plan's tasks by partial, misspelled or out-of-order words.
+
+    The plan is first brought up to date in the local store (sync_plan:
+    details are refetched only for tasks whose ETag changed, and only those
+    tasks are re-indexed), then answered from the store's trigram index.
+    With cached=True the sync is skipped and no Graph request is made.
+
+    Args:
+        token: Access token (unused when cached)
+        plan_id: Plan ID
+        query: Free-text query
+        limit: Maximum number of results
+        cached: Search the last synced snapshot without contacting Graph
+        store: Local store (default: the process-wide store)
+
+    Returns:
+        Ranked results with id, title, bucketId, percentComplete, score and matchedIn
+    """
+    store = store or get_local_store()
+    if not cached:
+        sync_plan(token, plan_id, store=store)
+    return store.search_tasks(plan_id, query, limit=limit)
@@ -3,11 +3,140 @@ Add Subtask Module
 Add checklist items to tasks.
 """
 
+import json
 import uuid
+from typing import Dict, List, Tuple
+
 import requests
 
-from .constants import BASE_GRAPH_URL
+from .checklist_cache import get_checklist, remember_checklist, forget_checklist
+from .constants import BASE_GRAPH_URL, MAX_CHECKLIST_ITEMS
 from .graph_client import get_json, patch_json
+from .order_hint import append_hints
+
+CHECKLIST_ITEM_TYPE = "#microsoft.graph.plannerChecklistItem"
+
+
+def checklist_additions(checklist: dict, new_items: Dict[str, str]) -> dict:
+    """
+    Build the checklist PATCH delta that appends new unchecked items in order.
+
+    Checklist PATCHes merge by item ID, so existing items are not re-sent;
+    they only get a new orderHint in the rare case the list has to be
+    re-spread (see order_hint.append_hints). Items whose ID is already in
+    checklist (e.g. a write that landed before a 412) are left out rather
+    than added twice.
+
+    Args:
+        checklist: Current checklist dict from task details
+        new_items: New item ID → title, in the order they should appear
+
+    Returns:
+        Checklist dict holding the new items (and any re-hinted ones)
+    """
+    added = [(item_id, title) for item_id, title in new_items.items() if item_id not in checklist]
+    if not added:
+        return {}
+
+    hints, rehinted = append_hints(
+        {item_id: item.get("orderHint") for item_id, item in checklist.items()}, len(added)
+    )
+    additions = {
+        item_id: {"@odata.type": CHECKLIST_ITEM_TYPE, "orderHint": hint}
+        for item_id, hint in rehinted.items()
+    }
+    for (item_id, title), hint in zip(added, hints):
+        additions[item_id] = {
+            "@odata.type": CHECKLIST_ITEM_TYPE,
+            "title": title,
+            "isChecked": False,
+            "orderHint": hint
+        }
+    return additions
+
+
+def read_checklist(url: str, token: str) -> Tuple[str, dict]:
+    """
+    Return (etag, checklist) of the task details at url.
+
+    Served from the checklist snapshot when this process has one, otherwise
+    read with a GET (which refreshes the snapshot).
+    """
+    snapshot = get_checklist(url)
+    if snapshot is not None:
+        return snapshot
+    details = get_json(url, token)
+    remember_checklist(url, details)
+    return details["@odata.etag"], details.get("checklist", {})
+
+
+def add_subtasks(task_id: str, subtask_titles: List[str], token: str) -> dict:
+    """
+    Add several subtasks (checklist items) to a task with a single PATCH.
+
+    Only the new items are sent. The current checklist comes from this
+    process's snapshot when there is one, so repeated additions skip the
+    GET of /details. On a 412 the details are re-read and the same new
+    items (same IDs) are sent again against the fresh ETag.
+
+    Args:
+        task_id: Task ID
+        subtask_titles: Subtask titles, in the order they should appear
+        token: Access token
+
+    Returns:
+        Success dict with the new subtask IDs, in input order
+
+    Raises:
+        ValueError: If no title is given or the checklist would exceed
+            MAX_CHECKLIST_ITEMS items
+        requests.RequestException: On API errors
+    """
+    titles = [title.strip() for title in subtask_titles if title and title.strip()]
+    if not titles:
+        raise ValueError(json.dumps({
+            "code": "InvalidInput",
+            "message": "At least one subtask title is required"
+        }))
+
+    url = f"{BASE_GRAPH_URL}/planner/tasks/{task_id}/details"
+    new_items = {str(uuid.uuid4()): title for title in titles}
+
+    for attempt in range(2):
+        etag, checklist = read_checklist(url, token)
+        additions = checklist_additions(checklist, new_items)
+        if len(set(checklist) | set(additions)) > MAX_CHECKLIST_ITEMS:
+            raise ValueError(json.dumps({
+                "code": "ChecklistLimit",
+                "message": f"A task holds at most {MAX_CHECKLIST_ITEMS} checklist items; "
+                           f"it has {len(checklist)} and {len(titles)} were given"
+            }))
+        if not additions:
+            # An earlier attempt landed despite the error
+            return {"ok": True, "subtaskIds": list(new_items)}
+
+        try:
+            details = patch_json(url, token, {"checklist": additions}, etag, return_representation=True)
+            remember_checklist(url, details)
+            return {"ok": True, "subtaskIds": list(new_items)}
+        except requests.HTTPError as e:
+            forget_checklist(url)
+            if e.response.status_code == 412 and not attempt:
+                # Retry once on ETag conflict against the fresh checklist
+                continue
+            if e.response.status_code == 400:
+                # Provide more detailed error information for 400 errors
+                error_detail = "Bad Request"
+                try:
+                    error_json = e.response.json()
+                    error_detail = error_json.get("error", {}).get("message", error_detail)
+                except:
+                    error_detail = e.response.text
+                raise requests.HTTPError(
+                    f"400 Bad Request: {error_detail}",
+                    response=e.response
+                )
+            raise
 
 
 def add_subtask(task_id: str, subtask_title: str, token: str) -> dict:
@@ -25,95 +154,5 @@ def add_subtask(task_id: str, subtask_title: str, token: str) -> dict:
     Raises:
         requests.RequestException: On API errors
     """
-    url = f"{BASE_GRAPH_URL}/planner/tasks/{task_id}/details"
-    details = get_json(url, token)
-    etag = details["@odata.etag"]
-
-    # Get existing checklist or initialize empty dict
-    checklist = details.get("checklist", {})
-
-    # Create a clean copy of existing items with @odata.type annotation
-    # Note: We regenerate orderHints to avoid API-generated formats that may be invalid
-    clean_checklist = {}
-    for key, value in checklist.items():
-        clean_checklist[key] = {
-            "@odata.type": "#microsoft.graph.plannerChecklistItem",
-            "title": value.get("title"),
-            "isChecked": value.get("isChecked", False)
-        }
-        # Do NOT include orderHint from existing items as API may generate invalid formats
-        # We'll generate new hints based on position
-
-    # Generate new item ID
-    item_id = str(uuid.uuid4())
-
-    # Generate a proper orderHint based on existing items
-    # For Planner API, orderHint format rules:
-    # - Must contain at least one space and end with exclamation point
-    # - Number of exclamation points must be >= number of spaces
-    # - Valid: " !", " !!", " !!!", etc.
-    if not clean_checklist:
-        order_hint = " !"
-    else:
-        # Use equal spaces and exclamation points for simplicity
-        num_items = len(clean_checklist)
-        order_hint = " " * (num_items + 1) + "!" * (num_items + 1)
-
-    # Add new item with @odata.type annotation
-    clean_checklist[item_id] = {
-        "@odata.type": "#microsoft.graph.plannerChecklistItem",
-        "title": subtask_title,
-        "isChecked": False,
-        "orderHint": order_hint
-    }
-
-    # Update with retry on ETag conflict
-    try:
-        patch_json(url, token, {"checklist": clean_checklist}, etag)
-        return {"ok": True, "subtaskId": item_id}
-    except requests.HTTPError as e:
-        if e.response.status_code == 412:
-            # Retry once on ETag conflict
-            details = get_json(url, token)
-            etag = details["@odata.etag"]
-            checklist = details.get("checklist", {})
-
-            # Rebuild clean checklist with @odata.type annotation
-            clean_checklist = {}
-            for key, value in checklist.items():
-                clean_checklist[key] = {
-                    "@odata.type": "#microsoft.graph.plannerChecklistItem",
-                    "title": value.get("title"),
-                    "isChecked": value.get("isChecked", False)
-                }
-                # Do NOT include orderHint from existing items
-
-            # Recalculate orderHint
-            if not clean_checklist:
-                order_hint = " !"
-            else:
-                num_items = len(clean_checklist)
-                order_hint = " " * (num_items + 1) + "!" * (num_items + 1)
-
-            # Add new item with @odata.type annotation
-            clean_checklist[item_id] = {
-                "@odata.type": "#microsoft.graph.plannerChecklistItem",
-                "title": subtask_title,
-                "isChecked": False,
-                "orderHint": order_hint
-            }
-            patch_json(url, token, {"checklist": clean_checklist}, etag)
-            return {"ok": True, "subtaskId": item_id}
-        elif e.response.status_code == 400:
-            # Provide more detailed error information for 400 errors
-            error_detail = "Bad Request"
-            try:
-                error_json = e.response.json()
-                error_detail = error_json.get("error", {}).get("message", error_detail)
-            except:
-                error_detail = e.response.text
-            raise requests.HTTPError(
-                f"400 Bad Request: {error_detail}",
-                response=e.response
-            )
-        raise
+    result = add_subtasks(task_id, [subtask_title], token)
+    return {"ok": True, "subtaskId": result["subtaskIds"][0]}
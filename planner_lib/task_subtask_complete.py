@@ -4,16 +4,32 @@ Mark checklist items as complete.
 """
 
 import json
+from typing import Optional
+
 import requests
 
+from .checklist_cache import get_checklist, remember_checklist, forget_checklist
 from .constants import BASE_GRAPH_URL
 from .graph_client import get_json, patch_json
+from .task_subtask_add import CHECKLIST_ITEM_TYPE
+
+
+def _find_item(checklist: dict, subtask_title: str) -> Optional[str]:
+    """Return the ID of the checklist item titled subtask_title (case-insensitive)."""
+    for cid, item in checklist.items():
+        if (item.get("title") or "").lower() == subtask_title.lower():
+            return cid
+    return None
 
 
 def complete_subtask(task_id: str, subtask_title: str, token: str) -> dict:
     """
     Mark a subtask (checklist item) as complete.
 
+    Only `{itemId: {isChecked: true}}` is sent. The item is looked up in
+    this process's checklist snapshot when there is one (falling back to a
+    GET of /details if the title is not in it), and re-read once on a 412.
+
     Args:
         task_id: Task ID
         subtask_title: Subtask title to find and complete
@@ -27,86 +43,45 @@ def complete_subtask(task_id: str, subtask_title: str, token: str) -> dict:
         requests.RequestException: On API errors
     """
     url = f"{BASE_GRAPH_URL}/planner/tasks/{task_id}/details"
-    details = get_json(url, token)
-    etag = details["@odata.etag"]
-    checklist = details.get("checklist", {})
-
-    # Find by title (case-insensitive)
-    item_id = None
-    for cid, item in checklist.items():
-        if item.get("title", "").lower() == subtask_title.lower():
-            item_id = cid
-            break
 
-    if not item_id:
-        raise ValueError(json.dumps({
-            "code": "SubtaskNotFound",
-            "message": f"Subtask '{subtask_title}' not found"
-        }))
-
-    # Create a clean copy of checklist with @odata.type annotation
-    # Note: Do NOT include orderHint from existing items as API may generate invalid formats
-    clean_checklist = {}
-    for key, value in checklist.items():
-        clean_checklist[key] = {
-            "@odata.type": "#microsoft.graph.plannerChecklistItem",
-            "title": value.get("title"),
-            "isChecked": value.get("isChecked", False)
-        }
-        # Do NOT include orderHint from existing items
-
-    # Mark the item as checked
-    clean_checklist[item_id]["isChecked"] = True
-
-    # Update with retry on ETag conflict
-    try:
-        patch_json(url, token, {"checklist": clean_checklist}, etag)
-        return {"ok": True, "subtaskId": item_id}
-    except requests.HTTPError as e:
-        if e.response.status_code == 412:
-            # Retry once on ETag conflict
+    for attempt in range(2):
+        snapshot = get_checklist(url)
+        item_id = _find_item(snapshot[1], subtask_title) if snapshot else None
+        if item_id:
+            etag = snapshot[0]
+        else:
+            # No snapshot, or the item was added elsewhere since it was taken
             details = get_json(url, token)
+            remember_checklist(url, details)
             etag = details["@odata.etag"]
-            checklist = details.get("checklist", {})
-
-            # Find again (in case checklist changed)
-            item_id = None
-            for cid, item in checklist.items():
-                if item.get("title", "").lower() == subtask_title.lower():
-                    item_id = cid
-                    break
-
-            if not item_id:
-                raise ValueError(json.dumps({
-                    "code": "SubtaskNotFound",
-                    "message": f"Subtask '{subtask_title}' not found after retry"
-                }))
-
-            # Rebuild clean checklist with @odata.type annotation
-            # Note: Do NOT include orderHint from existing items as API may generate invalid formats
-            clean_checklist = {}
-            for key, value in checklist.items():
-                clean_checklist[key] = {
-                    "@odata.type": "#microsoft.graph.plannerChecklistItem",
-                    "title": value.get("title"),
-                    "isChecked": value.get("isChecked", False)
-                }
-                # Do NOT include orderHint from existing items
-
-            # Mark as checked
-            clean_checklist[item_id]["isChecked"] = True
-            patch_json(url, token, {"checklist": clean_checklist}, etag)
+            item_id = _find_item(details.get("checklist", {}), subtask_title)
+
+        if not item_id:
+            raise ValueError(json.dumps({
+                "code": "SubtaskNotFound",
+                "message": f"Subtask '{subtask_title}' not found" + (" after retry" if attempt else "")
+            }))
+
+        delta = {item_id: {"@odata.type": CHECKLIST_ITEM_TYPE, "isChecked": True}}
+        try:
+            details = patch_json(url, token, {"checklist": delta}, etag, return_representation=True)
+            remember_checklist(url, details)
             return {"ok": True, "subtaskId": item_id}
-        elif e.response.status_code == 400:
-            # Provide more detailed error information for 400 errors
-            error_detail = "Bad Request"
-            try:
-                error_json = e.response.json()
-                error_detail = error_json.get("error", {}).get("message", error_detail)
-            except:
-                error_detail = e.response.text
-            raise requests.HTTPError(
-                f"400 Bad Request: {error_detail}",
-                response=e.response
-            )
-        raise
+        except requests.HTTPError as e:
+            forget_checklist(url)
+            if e.response.status_code == 412 and not attempt:
+                # Retry once on ETag conflict
+                continue
+            if e.response.status_code == 400:
+                # Provide more detailed error information for 400 errors
+                error_detail = "Bad Request"
+                try:
+                    error_json = e.response.json()
+                    error_detail = error_json.get("error", {}).get("message", error_detail)
+                except:
+                    error_detail = e.response.text
+                raise requests.HTTPError(
+                    f"400 Bad Request: {error_detail}",
+                    response=e.response
+                )
+            raise
@@ -5,6 +5,7 @@ List checklist items from tasks.
 
 from typing import List
 
+from .checklist_cache import remember_checklist
 from .constants import BASE_GRAPH_URL
 from .graph_client import get_json
 
@@ -22,6 +23,7 @@ def list_subtasks(task_id: str, token: str) -> List[dict]:
     """
     url = f"{BASE_GRAPH_URL}/planner/tasks/{task_id}/details"
     details = get_json(url, token)
+    remember_checklist(url, details)
     checklist = details.get("checklist", {})
 
     items = []
@@ -3,12 +3,13 @@ Task Subtasks Module - Barrel Exports
 Re-exports all subtask operations from modular structure.
 """
 
-from .task_subtask_add import add_subtask
+from .task_subtask_add import add_subtask, add_subtasks
 from .task_subtask_list import list_subtasks
 from .task_subtask_complete import complete_subtask
 
 __all__ = [
     "add_subtask",
+    "add_subtasks",
     "list_subtasks",
     "complete_subtask",
 ]
@@ -7,6 +7,7 @@ import requests
 from typing import Optional
 
 from .constants import BASE_GRAPH_URL
+from .etag_cache import get_known_etag
 from .graph_client import get_json, patch_json
 from .task_creation import parse_labels
 
@@ -16,7 +17,8 @@ def update_task_op(
     token: str,
     title: Optional[str] = None,
     description: Optional[str] = None,
-    labels: Optional[str] = None
+    labels: Optional[str] = None,
+    etag: Optional[str] = None
 ) -> dict:
     """
     Update properties on an existing task.
@@ -27,6 +29,7 @@ def update_task_op(
         description: New task description (optional)
         labels: Comma-separated labels like "Label1,Label3" or empty string to clear (optional)
         token: Access token
+        etag: Known task ETag (skips the pre-read GET; refetched on 412)
 
     Returns:
         Updated task object
@@ -34,10 +37,7 @@ def update_task_op(
     Raises:
         requests.RequestException: On API errors
     """
-    # Fetch current task for ETag and details
     task_url = f"{BASE_GRAPH_URL}/planner/tasks/{task_id}"
-    task = get_json(task_url, token)
-    etag = task["@odata.etag"]
 
     # Build payload for task properties (title)
     task_payload = {}
@@ -51,31 +51,32 @@ def update_task_op(
 
     # Update task if there are task-level changes
     if task_payload:
+        # Use the known ETag, fetching the task only when none is at hand
+        etag = etag or get_known_etag(task_url) or get_json(task_url, token)["@odata.etag"]
         try:
-            result = patch_json(task_url, token, task_payload, etag)
+            result = patch_json(task_url, token, task_payload, etag, return_representation=True)
         except requests.HTTPError as e:
             if e.response.status_code == 412:  # Precondition Failed (ETag conflict)
                 # Retry once
                 task = get_json(task_url, token)
                 etag = task["@odata.etag"]
-                result = patch_json(task_url, token, task_payload, etag)
+                result = patch_json(task_url, token, task_payload, etag, return_representation=True)
             else:
                 raise
 
     # Update description if provided (separate endpoint)
     if description is not None:
         details_url = f"{BASE_GRAPH_URL}/planner/tasks/{task_id}/details"
-        details = get_json(details_url, token)
-        details_etag = details["@odata.etag"]
+        details_etag = get_known_etag(details_url) or get_json(details_url, token)["@odata.etag"]
 
         try:
-            patch_json(details_url, token, {"description": description}, details_etag)
+            patch_json(details_url, token, {"description": description}, details_etag, return_representation=True)
         except requests.HTTPError as e:
             if e.response.status_code == 412:
                 # Retry once
                 details = get_json(details_url, token)
                 details_etag = details["@odata.etag"]
-                patch_json(details_url, token, {"description": description}, details_etag)
+                patch_json(details_url, token, {"description": description}, details_etag, return_representation=True)
             else:
                 raise
 
@@ -7,11 +7,17 @@ import requests
 from typing import Optional
 
 from .constants import BASE_GRAPH_URL
+from .etag_cache import get_known_etag
 from .graph_client import get_json, patch_json
 from .task_creation import parse_labels
 
 
-def update_task_labels(task_id: str, labels: Optional[str], token: str) -> dict:
+def update_task_labels(
+    task_id: str,
+    labels: Optional[str],
+    token: str,
+    etag: Optional[str] = None
+) -> dict:
     """
     Update labels on an existing task.
 
@@ -19,6 +25,7 @@ def update_task_labels(task_id: str, labels: Optional[str], token: str) -> dict:
         task_id: Task ID (GUID)
         labels: Comma-separated labels like "Label1,Label3" or empty string to clear
         token: Access token
+        etag: Known task ETag (skips the pre-read GET; refetched on 412)
 
     Returns:
         Updated task object
@@ -29,22 +36,21 @@ def update_task_labels(task_id: str, labels: Optional[str], token: str) -> dict:
     # Parse labels (empty string or None → empty dict)
     parsed_labels = parse_labels(labels) if labels else {}
 
-    # Fetch current task for ETag
+    # Use the known ETag, fetching the task only when none is at hand
     url = f"{BASE_GRAPH_URL}/planner/tasks/{task_id}"
-    task = get_json(url, token)
-    etag = task["@odata.etag"]
+    etag = etag or get_known_etag(url) or get_json(url, token)["@odata.etag"]
 
     # Update with retry on ETag conflict
     payload = {"appliedCategories": parsed_labels}
 
     try:
-        result = patch_json(url, token, payload, etag)
+        result = patch_json(url, token, payload, etag, return_representation=True)
         return result if result else {"ok": True, "taskId": task_id}
     except requests.HTTPError as e:
         if e.response.status_code == 412:  # Precondition Failed (ETag conflict)
             # Retry once
             task = get_json(url, token)
             etag = task["@odata.etag"]
-            result = patch_json(url, token, payload, etag)
+            result = patch_json(url, token, payload, etag, return_representation=True)
             return result if result else {"ok": True, "taskId": task_id}
         raise
@@ -59,12 +59,55 @@ export async function handleMoveBucketTasks(args: {
   source: string;
   target: string;
   plan: string;
+  workers?: number;
 }): Promise<any> {
-  const result = await runCli([
+  // Progress events on stderr are not surfaced through MCP
+  const cliArgs = [
     "move-bucket-tasks",
     "--source", args.source,
     "--target", args.target,
     "--plan", args.plan,
-  ]);
+    "--no-progress",
+  ];
+
+  if (args.workers) {
+    cliArgs.push("--workers", String(args.workers));
+  }
+
+  const result = await runCli(cliArgs);
+  return parseCliOutput(result);
+}
+
+/**
+ * Handle planner_reorderBucket tool
+ */
+export async function handleReorderBucket(args: {
+  bucket: string;
+  plan: string;
+  order?: string[];
+  by?: string;
+  descending?: boolean;
+  dryRun?: boolean;
+}): Promise<any> {
+  const cliArgs = [
+    "reorder-bucket",
+    "--bucket", args.bucket,
+    "--plan", args.plan,
+  ];
+
+  for (const task of args.order ?? []) {
+    cliArgs.push("--order", task);
+  }
+  if (args.by) {
+    cliArgs.push("--by", args.by);
+  }
+  if (args.descending) {
+    cliArgs.push("--descending");
+  }
+  if (args.dryRun) {
+    cliArgs.push("--dry-run");
+  }
+
+  const result = await runCli(cliArgs);
   return parseCliOutput(result);
 }
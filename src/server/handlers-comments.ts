@@ -3,7 +3,7 @@
  * Handlers for reading and adding task comments
  */
 
-import { runCli, parseCliOutput } from "./utils.js";
+import { runCli, parseCliOutput, parseNdjsonOutput } from "./utils.js";
 
 /**
  * Handle planner_listComments tool
@@ -12,10 +12,10 @@ export async function handleListComments(args: {
   task: string;
   plan: string;
 }): Promise<any> {
-  const cliArgs = ["list-comments-cmd", "--task", args.task, "--plan", args.plan];
+  const cliArgs = ["list-comments-cmd", "--task", args.task, "--plan", args.plan, "--output", "ndjson"];
 
   const result = await runCli(cliArgs);
-  return parseCliOutput(result);
+  return parseNdjsonOutput(result);
 }
 
 /**
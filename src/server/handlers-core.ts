@@ -3,7 +3,10 @@
  * Handlers for authentication and configuration tools
  */
 
-import { runCli, parseCliOutput } from "./utils.js";
+import { mkdtempSync, writeFileSync, rmSync } from "fs";
+import { tmpdir } from "os";
+import { join } from "path";
+import { runCli, parseCliOutput, parseNdjsonOutput } from "./utils.js";
 
 /**
  * Handle planner_initAuth tool
@@ -29,15 +32,38 @@ export async function handleSetDefaults(args: { plan: string; bucket: string }):
  * Handle planner_listPlans tool
  */
 export async function handleListPlans(): Promise<any> {
-  const result = await runCli(["list-plans"]);
-  return parseCliOutput(result);
+  const result = await runCli(["list-plans", "--output", "ndjson"]);
+  return parseNdjsonOutput(result);
 }
 
 /**
  * Handle planner_listBuckets tool
  */
-export async function handleListBuckets(args: { plan: string }): Promise<any> {
-  const result = await runCli(["list-buckets", "--plan", args.plan]);
+export async function handleListBuckets(args: { plan: string; cached?: boolean }): Promise<any> {
+  const cliArgs = ["list-buckets", "--plan", args.plan, "--output", "ndjson"];
+
+  if (args.cached) {
+    cliArgs.push("--cached");
+  }
+
+  const result = await runCli(cliArgs);
+  return parseNdjsonOutput(result);
+}
+
+/**
+ * Handle planner_sync tool
+ */
+export async function handleSync(args: { plan?: string; full?: boolean }): Promise<any> {
+  const cliArgs = ["sync"];
+
+  if (args.plan) {
+    cliArgs.push("--plan", args.plan);
+  }
+  if (args.full) {
+    cliArgs.push("--full");
+  }
+
+  const result = await runCli(cliArgs);
   return parseCliOutput(result);
 }
 
@@ -77,3 +103,53 @@ export async function handleCreateTask(args: {
   const result = await runCli(cliArgs);
   return parseCliOutput(result);
 }
+
+/**
+ * Handle planner_createTasksBulk tool
+ */
+export async function handleCreateTasksBulk(args: {
+  tasks: Array<{
+    title: string;
+    plan?: string;
+    bucket?: string;
+    desc?: string;
+    due?: string;
+    labels?: string;
+    assignee?: string;
+  }>;
+  plan?: string;
+  bucket?: string;
+}): Promise<any> {
+  // Rows go through a temporary JSON Lines file (the CLI worker has no stdin for commands)
+  const dir = mkdtempSync(join(tmpdir(), "planner-bulk-"));
+  const file = join(dir, "tasks.jsonl");
+  writeFileSync(file, args.tasks.map((task) => JSON.stringify(task)).join("\n") + "\n", { mode: 0o600 });
+
+  const cliArgs = ["add-bulk", "--file", file, "--format", "jsonl"];
+
+  if (args.plan) {
+    cliArgs.push("--plan", args.plan);
+  }
+  if (args.bucket) {
+    cliArgs.push("--bucket", args.bucket);
+  }
+
+  try {
+    const result = await runCli(cliArgs);
+    const lines = result.stdout.trim().split("\n").filter((line) => line.trim());
+    let results: any[];
+    try {
+      results = lines.map((line) => JSON.parse(line));
+    } catch {
+      return parseCliOutput(result);
+    }
+    // Command-level errors print a single error object without a row number
+    if (results.length === 1 && results[0].row === undefined) {
+      return parseCliOutput(result);
+    }
+    const created = results.filter((r) => r.ok).length;
+    return { ok: created === results.length, created, failed: results.length - created, results };
+  } finally {
+    rmSync(dir, { recursive: true, force: true });
+  }
+}
@@ -10,10 +10,17 @@ import { runCli, parseCliOutput } from "./utils.js";
  */
 export async function handleAddSubtask(args: {
   task: string;
-  subtask: string;
+  subtask?: string;
+  subtasks?: string[];
   plan?: string;
 }): Promise<any> {
-  const cliArgs = ["add-subtask-cmd", "--task", args.task, "--subtask", args.subtask];
+  const cliArgs = ["add-subtask-cmd", "--task", args.task];
+
+  for (const title of [args.subtask, ...(args.subtasks ?? [])]) {
+    if (title) {
+      cliArgs.push("--subtask", title);
+    }
+  }
 
   if (args.plan) {
     cliArgs.push("--plan", args.plan);
@@ -26,12 +33,15 @@ export async function handleAddSubtask(args: {
 /**
  * Handle planner_listSubtasks tool
  */
-export async function handleListSubtasks(args: { task: string; plan?: string }): Promise<any> {
+export async function handleListSubtasks(args: { task: string; plan?: string; cached?: boolean }): Promise<any> {
   const cliArgs = ["list-subtasks-cmd", "--task", args.task];
 
   if (args.plan) {
     cliArgs.push("--plan", args.plan);
   }
+  if (args.cached) {
+    cliArgs.push("--cached");
+  }
 
   const result = await runCli(cliArgs);
   return parseCliOutput(result);
@@ -3,7 +3,7 @@
  * Handlers for task operations (list, find, complete, move, delete)
  */
 
-import { runCli, parseCliOutput } from "./utils.js";
+import { runCli, parseCliOutput, parseNdjsonOutput } from "./utils.js";
 
 /**
  * Handle planner_listTasks tool
@@ -12,8 +12,11 @@ export async function handleListTasks(args: {
   plan: string;
   bucket?: string;
   incompleteOnly?: boolean;
+  fields?: string;
+  noDetails?: boolean;
+  cached?: boolean;
 }): Promise<any> {
-  const cliArgs = ["list-tasks-cmd", "--plan", args.plan];
+  const cliArgs = ["list-tasks-cmd", "--plan", args.plan, "--output", "ndjson"];
 
   if (args.bucket) {
     cliArgs.push("--bucket", args.bucket);
@@ -21,25 +24,110 @@ export async function handleListTasks(args: {
   if (args.incompleteOnly) {
     cliArgs.push("--incomplete");
   }
+  if (args.fields) {
+    cliArgs.push("--fields", args.fields);
+  }
+  if (args.noDetails) {
+    cliArgs.push("--no-details");
+  }
+  if (args.cached) {
+    cliArgs.push("--cached");
+  }
 
   const result = await runCli(cliArgs);
-  return parseCliOutput(result);
+  return parseNdjsonOutput(result);
 }
 
 /**
  * Handle planner_findTask tool
  */
-export async function handleFindTask(args: { task: string; plan?: string }): Promise<any> {
+export async function handleFindTask(args: { task: string; plan?: string; cached?: boolean }): Promise<any> {
   const cliArgs = ["find-task-cmd", "--task", args.task];
 
   if (args.plan) {
     cliArgs.push("--plan", args.plan);
   }
+  if (args.cached) {
+    cliArgs.push("--cached");
+  }
+
+  const result = await runCli(cliArgs);
+  return parseCliOutput(result);
+}
+
+/**
+ * Handle planner_searchTasks tool
+ */
+export async function handleSearchTasks(args: {
+  query: string;
+  plan?: string;
+  limit?: number;
+  cached?: boolean;
+}): Promise<any> {
+  const cliArgs = ["search-tasks", "--query", args.query];
+
+  if (args.plan) {
+    cliArgs.push("--plan", args.plan);
+  }
+  if (args.limit) {
+    cliArgs.push("--limit", String(args.limit));
+  }
+  if (args.cached) {
+    cliArgs.push("--cached");
+  }
 
   const result = await runCli(cliArgs);
   return parseCliOutput(result);
 }
 
+/**
+ * Handle planner_myTasks tool
+ */
+export async function handleMyTasks(args: {
+  allPlans?: boolean;
+  plans?: string[];
+  assignee?: string;
+  incompleteOnly?: boolean;
+  dueAfter?: string;
+  dueBefore?: string;
+  label?: string;
+  fields?: string;
+  noDetails?: boolean;
+}): Promise<any> {
+  const cliArgs = ["my-tasks"];
+
+  if (args.allPlans) {
+    cliArgs.push("--all-plans");
+  }
+  for (const plan of args.plans || []) {
+    cliArgs.push("--plan", plan);
+  }
+  if (args.assignee) {
+    cliArgs.push("--assignee", args.assignee);
+  }
+  if (args.incompleteOnly) {
+    cliArgs.push("--incomplete");
+  }
+  if (args.dueAfter) {
+    cliArgs.push("--due-after", args.dueAfter);
+  }
+  if (args.dueBefore) {
+    cliArgs.push("--due-before", args.dueBefore);
+  }
+  if (args.label) {
+    cliArgs.push("--label", args.label);
+  }
+  if (args.fields) {
+    cliArgs.push("--fields", args.fields);
+  }
+  if (args.noDetails) {
+    cliArgs.push("--no-details");
+  }
+
+  const result = await runCli(cliArgs);
+  return parseNdjsonOutput(result);
+}
+
 /**
  * Handle planner_completeTask tool
  */
@@ -9,11 +9,15 @@ import {
   handleListPlans,
   handleListBuckets,
   handleCreateTask,
+  handleCreateTasksBulk,
+  handleSync,
 } from "./handlers-core.js";
 
 import {
   handleListTasks,
   handleFindTask,
+  handleSearchTasks,
+  handleMyTasks,
   handleCompleteTask,
   handleMoveTask,
   handleDeleteTask,
@@ -36,6 +40,7 @@ import {
   handleDeleteBucket,
   handleRenameBucket,
   handleMoveBucketTasks,
+  handleReorderBucket,
 } from "./handlers-buckets.js";
 
 import {
@@ -64,6 +69,12 @@ export async function handleToolCall(name: string, args: any): Promise<any> {
     case "planner_createTask":
       return handleCreateTask(args);
 
+    case "planner_createTasksBulk":
+      return handleCreateTasksBulk(args);
+
+    case "planner_sync":
+      return handleSync(args);
+
     // Task management tools
     case "planner_listTasks":
       return handleListTasks(args);
@@ -71,6 +82,12 @@ export async function handleToolCall(name: string, args: any): Promise<any> {
     case "planner_findTask":
       return handleFindTask(args);
 
+    case "planner_searchTasks":
+      return handleSearchTasks(args);
+
+    case "planner_myTasks":
+      return handleMyTasks(args);
+
     case "planner_completeTask":
       return handleCompleteTask(args);
 
@@ -113,6 +130,9 @@ export async function handleToolCall(name: string, args: any): Promise<any> {
     case "planner_moveBucketTasks":
       return handleMoveBucketTasks(args);
 
+    case "planner_reorderBucket":
+      return handleReorderBucket(args);
+
     // Comment tools
     case "planner_listComments":
       return handleListComments(args);
@@ -5,4 +5,4 @@
 
 export { TOOLS } from "./tools.js";
 export { handleToolCall } from "./handlers.js";
-export { runCli, parseCliOutput, getCliPath, getPythonPath } from "./utils.js";
+export { runCli, parseCliOutput, parseNdjsonOutput, getCliPath, getPythonPath } from "./utils.js";
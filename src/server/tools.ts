@@ -53,6 +53,41 @@ export const TOOLS: Tool[] = [
       required: ["title"],
     },
   },
+  {
+    name: "planner_createTasksBulk",
+    description: "Create many tasks in one call. Plans, buckets and assignees are resolved once per distinct value and tasks are created through batched requests. Returns a result per task.",
+    inputSchema: {
+      type: "object",
+      properties: {
+        tasks: {
+          type: "array",
+          description: "Tasks to create (required)",
+          items: {
+            type: "object",
+            properties: {
+              title: { type: "string", description: "Task title (required)" },
+              plan: { type: "string", description: "Plan name or ID (optional)" },
+              bucket: { type: "string", description: "Bucket name or ID (optional)" },
+              desc: { type: "string", description: "Task description (optional)" },
+              due: { type: "string", description: "Due date in YYYY-MM-DD format (optional)" },
+              labels: { type: "string", description: "Comma-separated labels like 'Label1,Label3' (optional)" },
+              assignee: { type: "string", description: "Comma-separated user emails or User IDs (optional)" },
+            },
+            required: ["title"],
+          },
+        },
+        plan: {
+          type: "string",
+          description: "Plan name or ID for tasks without one (optional if default is set)",
+        },
+        bucket: {
+          type: "string",
+          description: "Bucket name or ID for tasks without one (optional if default is set)",
+        },
+      },
+      required: ["tasks"],
+    },
+  },
   {
     name: "planner_setDefaults",
     description: "Set default plan and bucket for task creation.",
@@ -90,10 +125,32 @@ export const TOOLS: Tool[] = [
           type: "string",
           description: "Plan name or ID",
         },
+        cached: {
+          type: "boolean",
+          description: "Answer from the local store filled by planner_sync instead of calling Graph (optional, default: false)",
+        },
       },
       required: ["plan"],
     },
   },
+  {
+    name: "planner_sync",
+    description: "Mirror plans, buckets and tasks into the local store so list/find tools can answer with cached: true. Only tasks changed since the last sync have their details refetched.",
+    inputSchema: {
+      type: "object",
+      properties: {
+        plan: {
+          type: "string",
+          description: "Plan name or ID (optional, default: all plans)",
+        },
+        full: {
+          type: "boolean",
+          description: "Refetch details of unchanged tasks too, picking up description/checklist-only edits (optional, default: false)",
+        },
+      },
+      required: [],
+    },
+  },
   {
     name: "planner_listTasks",
     description: "List tasks in a plan or bucket. Can filter to show only incomplete tasks.",
@@ -112,6 +169,18 @@ export const TOOLS: Tool[] = [
           type: "boolean",
           description: "Show only incomplete tasks (optional, default: false)",
         },
+        fields: {
+          type: "string",
+          description: "Comma-separated task fields to return, e.g. 'id,title,bucketId'. Descriptions are only fetched if 'description' is listed (optional)",
+        },
+        noDetails: {
+          type: "boolean",
+          description: "Skip fetching task descriptions for faster listing (optional, default: false)",
+        },
+        cached: {
+          type: "boolean",
+          description: "Answer from the local store filled by planner_sync instead of calling Graph (optional, default: false)",
+        },
       },
       required: ["plan"],
     },
@@ -130,10 +199,87 @@ export const TOOLS: Tool[] = [
           type: "string",
           description: "Plan name or ID (required for title-based search)",
         },
+        cached: {
+          type: "boolean",
+          description: "Answer from the local store filled by planner_sync instead of calling Graph (optional, default: false)",
+        },
       },
       required: ["task"],
     },
   },
+  {
+    name: "planner_searchTasks",
+    description: "Search a plan's tasks by partial or misspelled words in the title, description or checklist. Returns ranked matches with a score.",
+    inputSchema: {
+      type: "object",
+      properties: {
+        query: {
+          type: "string",
+          description: "Words to search for",
+        },
+        plan: {
+          type: "string",
+          description: "Plan name or ID (optional if a default plan is set)",
+        },
+        limit: {
+          type: "number",
+          description: "Maximum number of results (optional, default: 10)",
+        },
+        cached: {
+          type: "boolean",
+          description: "Search the snapshot from the last planner_sync without calling Graph (optional, default: false)",
+        },
+      },
+      required: ["query"],
+    },
+  },
+  {
+    name: "planner_myTasks",
+    description: "List tasks across plans: the tasks assigned to you, or (with allPlans or plans) every task in those plans read concurrently. Filters are applied before descriptions are fetched.",
+    inputSchema: {
+      type: "object",
+      properties: {
+        allPlans: {
+          type: "boolean",
+          description: "Read every plan visible to you instead of only your assigned tasks (optional, default: false)",
+        },
+        plans: {
+          type: "array",
+          items: { type: "string" },
+          description: "Plan names or IDs to read (optional)",
+        },
+        assignee: {
+          type: "string",
+          description: "Only tasks assigned to this user (email, UPN, or user ID) (optional)",
+        },
+        incompleteOnly: {
+          type: "boolean",
+          description: "Show only incomplete tasks (optional, default: false)",
+        },
+        dueAfter: {
+          type: "string",
+          description: "Only tasks due on or after this day, YYYY-MM-DD (optional)",
+        },
+        dueBefore: {
+          type: "string",
+          description: "Only tasks due on or before this day, YYYY-MM-DD (optional)",
+        },
+        label: {
+          type: "string",
+          description: "Only tasks carrying all these labels, e.g. 'Label1,Label3' (optional)",
+        },
+        fields: {
+          type: "string",
+          description: "Comma-separated task fields to return, e.g. 'id,title,planId' (optional)",
+        },
+        noDetails: {
+          type: "boolean",
+          description: "Skip fetching task descriptions (optional, default: false)",
+        },
+      },
+      required: [],
+    },
+  },
   {
     name: "planner_completeTask",
     description: "Mark a task as complete (sets percentComplete to 100).",
@@ -176,7 +322,7 @@ export const TOOLS: Tool[] = [
   },
   {
     name: "planner_addSubtask",
-    description: "Add a subtask (checklist item) to a task.",
+    description: "Add one or more subtasks (checklist items) to a task. Several titles are written in a single checklist update.",
     inputSchema: {
       type: "object",
       properties: {
@@ -186,14 +332,19 @@ export const TOOLS: Tool[] = [
         },
         subtask: {
           type: "string",
-          description: "Subtask title",
+          description: "Subtask title (newline-separated titles add several)",
+        },
+        subtasks: {
+          type: "array",
+          items: { type: "string" },
+          description: "Subtask titles, added in order (at most 20 checklist items per task)",
         },
         plan: {
           type: "string",
           description: "Plan name or ID (required for title-based search)",
         },
       },
-      required: ["task", "subtask"],
+      required: ["task"],
     },
   },
   {
@@ -210,6 +361,10 @@ export const TOOLS: Tool[] = [
           type: "string",
           description: "Plan name or ID (required for title-based search)",
         },
+        cached: {
+          type: "boolean",
+          description: "Answer from the local store filled by planner_sync instead of calling Graph (optional, default: false)",
+        },
       },
       required: ["task"],
     },
@@ -376,7 +531,7 @@ export const TOOLS: Tool[] = [
   },
   {
     name: "planner_moveBucketTasks",
-    description: "Move all tasks from one bucket to another within the same plan.",
+    description: "Move all tasks from one bucket to another within the same plan. Interrupted moves resume where they stopped when called again.",
     inputSchema: {
       type: "object",
       properties: {
@@ -392,10 +547,50 @@ export const TOOLS: Tool[] = [
           type: "string",
           description: "Plan name or ID (required)",
         },
+        workers: {
+          type: "number",
+          description: "Concurrent requests (optional, default 8)",
+        },
       },
       required: ["source", "target", "plan"],
     },
   },
+  {
+    name: "planner_reorderBucket",
+    description: "Reorder the tasks in a bucket, by an explicit task order or a sort key. Only tasks that must move are updated.",
+    inputSchema: {
+      type: "object",
+      properties: {
+        bucket: {
+          type: "string",
+          description: "Bucket name or ID (required)",
+        },
+        plan: {
+          type: "string",
+          description: "Plan name or ID (required)",
+        },
+        order: {
+          type: "array",
+          items: { type: "string" },
+          description: "Task IDs or titles in the wanted order; unlisted tasks follow in their current order",
+        },
+        by: {
+          type: "string",
+          enum: ["due", "title", "priority", "created"],
+          description: "Sort key to use instead of an explicit order (tasks without it go last)",
+        },
+        descending: {
+          type: "boolean",
+          description: "Reverse the sort key order (optional)",
+        },
+        dryRun: {
+          type: "boolean",
+          description: "Report the tasks that would move without updating them (optional)",
+        },
+      },
+      required: ["bucket", "plan"],
+    },
+  },
   {
     name: "planner_listComments",
     description: "List all comments on a task.",
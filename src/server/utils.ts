@@ -3,10 +3,19 @@
  * Helper functions for path resolution and CLI execution
  */
 
-import { spawn } from "child_process";
+import { spawn, ChildProcessWithoutNullStreams } from "child_process";
 import { homedir } from "os";
 import { join } from "path";
 import { existsSync } from "fs";
+import { createInterface } from "readline";
+
+type CliResult = { code: number; stdout: string; stderr: string };
+
+/**
+ * Commands that must not run in the shared worker (interactive device-code login
+ * needs its output to reach the user while the command is still running)
+ */
+const SPAWN_ONLY_COMMANDS = new Set(["init-auth"]);
 
 /**
  * Get the CLI path from environment or default
@@ -41,9 +50,9 @@ export function getPythonPath(): string {
 }
 
 /**
- * Run the Python CLI with the given arguments
+ * Spawn a fresh Python process for a single CLI call
  */
-export async function runCli(args: string[]): Promise<{ code: number; stdout: string; stderr: string }> {
+function spawnCli(args: string[]): Promise<CliResult> {
   return new Promise((resolve) => {
     const cliPath = getCliPath();
     const pythonPath = getPythonPath();
@@ -77,14 +86,140 @@ export async function runCli(args: string[]): Promise<{ code: number; stdout: st
 }
 
 /**
- * Parse CLI output as JSON or throw error
+ * Long-lived `planner.py worker` process speaking JSON lines over stdin/stdout.
+ * Requests are tagged with an id so responses can be matched as they arrive.
+ */
+class CliWorker {
+  private child: ChildProcessWithoutNullStreams;
+  private nextId = 1;
+  private pending = new Map<number, { resolve: (r: CliResult) => void }>();
+  public alive = true;
+
+  constructor() {
+    this.child = spawn(getPythonPath(), [getCliPath(), "worker"], {
+      env: {
+        ...process.env,
+      },
+    });
+
+    createInterface({ input: this.child.stdout }).on("line", (line) => {
+      let message: any;
+      try {
+        message = JSON.parse(line);
+      } catch {
+        console.error(`[MCP Debug] Unparseable worker output: ${line.substring(0, 200)}`);
+        return;
+      }
+      const entry = this.pending.get(message.id);
+      if (!entry) {
+        return;
+      }
+      this.pending.delete(message.id);
+      if (message.code !== 0) {
+        console.error(`[MCP Debug] CLI failed with code ${message.code}`);
+        console.error(`[MCP Debug] stdout: ${String(message.stdout).substring(0, 200)}`);
+        console.error(`[MCP Debug] stderr: ${String(message.stderr).substring(0, 200)}`);
+      }
+      entry.resolve({ code: message.code || 0, stdout: message.stdout || "", stderr: message.stderr || "" });
+    });
+
+    // Write failures are reported through the write callback in run()
+    this.child.stdin.on("error", () => {});
+
+    this.child.stderr.on("data", (data) => {
+      console.error(`[MCP Debug] worker stderr: ${data.toString().substring(0, 200)}`);
+    });
+
+    // Requests already handed to a worker that dies are reported as failures,
+    // never re-run, since the command may have partially executed
+    const fail = (reason: string) => {
+      this.alive = false;
+      for (const entry of this.pending.values()) {
+        entry.resolve({ code: 1, stdout: "", stderr: JSON.stringify({ code: "WorkerError", message: reason }) });
+      }
+      this.pending.clear();
+    };
+    this.child.on("error", (err) => fail(`Worker error: ${err.message}`));
+    this.child.on("close", (code) => fail(`Worker exited with code ${code}`));
+  }
+
+  run(args: string[]): Promise<CliResult> {
+    return new Promise((resolve, reject) => {
+      const id = this.nextId++;
+      if (!this.alive) {
+        reject(new Error("Worker is not running"));
+        return;
+      }
+      this.pending.set(id, { resolve });
+      // A failed write means the request never reached the worker, so it is safe to retry elsewhere
+      this.child.stdin.write(JSON.stringify({ id, args }) + "\n", (err) => {
+        if (err && this.pending.delete(id)) {
+          reject(err);
+        }
+      });
+    });
+  }
+}
+
+let worker: CliWorker | null = null;
+
+/**
+ * Whether calls should go through the persistent worker (disable with PLANNER_MCP_WORKER=0)
+ */
+function workerEnabled(): boolean {
+  return !["0", "false", "no"].includes((process.env.PLANNER_MCP_WORKER || "").toLowerCase());
+}
+
+/**
+ * Run the Python CLI with the given arguments.
+ * Uses the shared worker process when possible and falls back to spawning.
+ */
+export async function runCli(args: string[]): Promise<CliResult> {
+  if (!workerEnabled() || SPAWN_ONLY_COMMANDS.has(args[0])) {
+    return spawnCli(args);
+  }
+
+  if (!worker || !worker.alive) {
+    worker = new CliWorker();
+  }
+
+  try {
+    return await worker.run(args);
+  } catch (error) {
+    console.error(`[MCP Debug] Worker unavailable, spawning CLI: ${(error as Error).message}`);
+    worker = null;
+    return spawnCli(args);
+  }
+}
+
+/**
+ * Parse newline-delimited JSON into an array, or null if any line is not JSON
+ */
+function parseNdjson(text: string): any[] | null {
+  const items: any[] = [];
+  for (const line of text.split("\n")) {
+    if (!line.trim()) {
+      continue;
+    }
+    try {
+      items.push(JSON.parse(line));
+    } catch {
+      return null;
+    }
+  }
+  return items;
+}
+
+/**
+ * Parse CLI output as JSON (or NDJSON, as an array) or throw error
  */
 export function parseCliOutput(result: { code: number; stdout: string; stderr: string }): any {
   if (result.code === 0) {
+    const stdoutTrimmed = result.stdout.trim();
     try {
-      return JSON.parse(result.stdout.trim());
+      return JSON.parse(stdoutTrimmed);
     } catch {
-      return { ok: true, message: result.stdout.trim() };
+      return (stdoutTrimmed && parseNdjson(stdoutTrimmed)) || { ok: true, message: stdoutTrimmed };
     }
   } else {
     // Try to parse error as JSON from stdout first, then stderr
@@ -125,3 +260,17 @@ export function parseCliOutput(result: { code: number; stdout: string; stderr: s
     throw error;
   }
 }
+
+/**
+ * Parse newline-delimited JSON CLI output into an array, or throw error
+ */
+export function parseNdjsonOutput(result: { code: number; stdout: string; stderr: string }): any[] {
+  if (result.code !== 0) {
+    return parseCliOutput(result);
+  }
+  const items = parseNdjson(result.stdout);
+  if (items === null) {
+    throw new Error(`Unparseable CLI output: ${result.stdout.substring(0, 200)}`);
+  }
+  return items;
+}
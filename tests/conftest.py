@@ -14,6 +14,33 @@ from .conftest_fixtures import (
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Point the persistent cache and local store at per-test files and reset in-process caches between tests"""
+    from planner_lib.cache_store import reset_cache_store
+    from planner_lib.auth import reset_token_providers
+    from planner_lib.etag_cache import clear_etags
+    from planner_lib.checklist_cache import clear_checklists
+    from planner_lib.rate_governor import reset_rate_governors
+    from planner_lib.local_store import reset_local_store
+
+    monkeypatch.setenv("PLANNER_CACHE_PATH", str(tmp_path / "cache.json"))
+    monkeypatch.setenv("PLANNER_STORE_PATH", str(tmp_path / "store.db"))
+    reset_cache_store()
+    reset_token_providers()
+    clear_etags()
+    clear_checklists()
+    reset_rate_governors()
+    reset_local_store()
+    yield
+    reset_cache_store()
+    reset_token_providers()
+    clear_etags()
+    clear_checklists()
+    reset_rate_governors()
+    reset_local_store()
+
+
 @pytest.fixture
 def mock_config_dir(tmp_path):
     """Create a temporary config directory"""
@@ -54,6 +81,12 @@ def mock_task():
     return get_mock_task_data()
 
 
+@pytest.fixture
+def no_exact_user_lookup(mocker):
+    """Send every resolve_users identifier through resolve_user (no $filter lookup)"""
+    return mocker.patch("planner_lib.resolution_users.batch.lookup_users_exact", return_value={})
+
+
 @pytest.fixture
 def mock_msal_app(mocker):
     """Mock MSAL PublicClientApplication"""
@@ -68,15 +101,20 @@ def mock_msal_app(mocker):
         "access_token": "mock_access_token"
     }
 
+    mock_cache = MagicMock()
+    mock_cache.serialize.return_value = "{}"
+    mock_cache.has_state_changed = True
+
     mocker.patch("msal.PublicClientApplication", return_value=mock_app)
-    mocker.patch("msal.SerializableTokenCache")
+    mocker.patch("msal.SerializableTokenCache", return_value=mock_cache)
+    mock_app.token_cache = mock_cache
 
     return mock_app
 
 
 @pytest.fixture
 def mock_requests(mocker):
-    """Mock requests library"""
+    """Mock the shared requests session used by graph_client"""
     mock_response = Mock()
     mock_response.status_code = 200
     mock_response.json.return_value = {"value": []}
@@ -84,9 +122,9 @@ def mock_requests(mocker):
     mock_response.content = b"{}"
     mock_response.headers = {}
 
-    mock_get = mocker.patch("requests.get", return_value=mock_response)
-    mock_post = mocker.patch("requests.post", return_value=mock_response)
-    mock_patch = mocker.patch("requests.patch", return_value=mock_response)
+    mock_get = mocker.patch("requests.Session.get", return_value=mock_response)
+    mock_post = mocker.patch("requests.Session.post", return_value=mock_response)
+    mock_patch = mocker.patch("requests.Session.patch", return_value=mock_response)
 
     return {
         "get": mock_get,
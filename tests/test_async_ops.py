@@ -0,0 +1,112 @@
+"""
+Tests for the async client and operations
+"""
+
+import asyncio
+import json
+import pytest
+
+from planner_lib import async_client, async_ops, graph_client
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    """Serve Graph requests from a handler through httpx.MockTransport"""
+    httpx = pytest.importorskip("httpx")
+    requests_seen = []
+    routes = {}
+
+    def handler(request):
+        requests_seen.append(request)
+        status, body = routes[(request.method, request.url.path.replace("/v1.0", ""))]
+        if callable(body):
+            status, body = body(request)
+        return httpx.Response(status, json=body) if body is not None else httpx.Response(status)
+
+    monkeypatch.setattr(
+        async_client, "create_async_client",
+        lambda pool_size=None, max_retries=None: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    return routes, requests_seen
+
+
+def test_amap_concurrent_bounds_in_flight_work():
+    """Test results keep input order and no more than max_concurrency run at once"""
+    in_flight = 0
+    peak = 0
+
+    async def work(n):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return n * 2
+
+    assert run(async_client.amap_concurrent(work, range(50), max_concurrency=5)) == list(range(0, 100, 2))
+    assert peak == 5
+
+
+def test_list_tasks_follows_pages_and_attaches_descriptions(graph, mock_token):
+    """Test pages are followed and descriptions fetched per task"""
+    routes, _ = graph
+    routes[("GET", "/planner/plans/p1/tasks")] = (200, {
+        "value": [{"id": "t1", "title": "One", "percentComplete": 0}],
+        "@odata.nextLink": "https://graph.microsoft.com/v1.0/planner/plans/p1/tasks/page2"
+    })
+    routes[("GET", "/planner/plans/p1/tasks/page2")] = (200, {"value": [{"id": "t2", "title": "Two", "percentComplete": 100}]})
+    routes[("GET", "/planner/tasks/t1/details")] = (200, {"description": "first"})
+    routes[("GET", "/planner/tasks/t2/details")] = (200, {"description": "second"})
+
+    tasks = run(async_ops.list_tasks(mock_token, plan_id="p1"))
+
+    assert [(t["id"], t["description"]) for t in tasks] == [("t1", "first"), ("t2", "second")]
+
+
+def test_move_task_refetches_etag_on_conflict(graph, mock_token):
+    """Test a 412 with a stale ETag is retried once with a fresh one"""
+    routes, seen = graph
+    attempts = []
+
+    def patch(request):
+        attempts.append(request.headers["If-Match"])
+        return (412, {"error": {"code": "PreconditionFailed"}}) if len(attempts) == 1 else (200, {"id": "t1", "@odata.etag": "W/\"3\""})
+
+    routes[("PATCH", "/planner/tasks/t1")] = (0, patch)
+    routes[("GET", "/planner/tasks/t1")] = (200, {"id": "t1", "@odata.etag": "W/\"2\""})
+
+    result = run(async_ops.move_task_op("t1", "b2", mock_token, etag="W/\"1\""))
+
+    assert result["@odata.etag"] == "W/\"3\""
+    assert attempts == ["W/\"1\"", "W/\"2\""]
+    assert json.loads(seen[0].content) == {"bucketId": "b2"}
+
+
+def test_throttled_get_is_retried(graph, mock_token, monkeypatch):
+    """Test 429 responses go through the shared retry policy"""
+    routes, seen = graph
+    routes[("GET", "/planner/tasks/t1/details")] = (0, lambda request: (
+        (429, None) if len(seen) == 1 else (200, {"checklist": {"c1": {"title": "Step", "isChecked": False}}})
+    ))
+    # Retry-After is absent, so skip the backoff wait
+    monkeypatch.setattr(async_client, "backoff_delay", lambda attempt, retry_after=None: 0.0)
+
+    assert run(async_ops.list_subtasks("t1", mock_token)) == [{"id": "c1", "title": "Step", "isChecked": False}]
+    assert len(seen) == 2
+
+
+def test_async_404_notifies_shared_stale_handlers(graph, mock_token, mocker):
+    """Test the async client applies the same 404/412 stale policy as graph_client"""
+    routes, _ = graph
+    routes[("GET", "/planner/tasks/gone")] = (404, {"error": {"code": "NotFound"}})
+    handler = mocker.Mock()
+    mocker.patch.object(graph_client, "_stale_handlers", [handler])
+
+    with pytest.raises(Exception):
+        run(async_client.get_json("https://graph.microsoft.com/v1.0/planner/tasks/gone", mock_token))
+
+    handler.assert_called_once_with("https://graph.microsoft.com/v1.0/planner/tasks/gone")
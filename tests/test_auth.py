@@ -11,7 +11,10 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from planner_lib.auth import get_tokens, get_cache_path
+import threading
+
+from planner_lib import auth
+from planner_lib.auth import get_tokens, get_cache_path, get_token_provider, set_device_code_handler
 
 
 def test_get_tokens_device_flow(mocker, mock_msal_app, tmp_path):
@@ -85,6 +88,136 @@ def test_get_tokens_auth_failure(mocker, mock_msal_app, tmp_path):
         get_tokens("test-tenant", "test-client")
 
 
+def test_get_tokens_memoized_in_process(mocker, mock_msal_app, tmp_path):
+    """Test repeated calls reuse the in-memory app and token"""
+    mock_msal_app.get_accounts.return_value = [{"username": "test@example.com"}]
+    mock_msal_app.acquire_token_silent.return_value = {
+        "access_token": "cached_token",
+        "expires_in": 3600
+    }
+    mocker.patch("planner_lib.auth.get_cache_path", return_value=tmp_path / "cache.bin")
+
+    assert get_tokens("test-tenant", "test-client") == "cached_token"
+    assert get_tokens("test-tenant", "test-client") == "cached_token"
+
+    import msal
+    msal.PublicClientApplication.assert_called_once()
+    mock_msal_app.acquire_token_silent.assert_called_once()
+
+
+def test_get_tokens_skips_unchanged_cache_write(mocker, mock_msal_app, tmp_path):
+    """Test the cache file is only rewritten when MSAL state changed"""
+    mock_msal_app.get_accounts.return_value = [{"username": "test@example.com"}]
+    mock_msal_app.acquire_token_silent.return_value = {
+        "access_token": "cached_token",
+        "expires_in": 3600
+    }
+    mock_msal_app.token_cache.has_state_changed = False
+    cache_file = tmp_path / "cache.bin"
+    mocker.patch("planner_lib.auth.get_cache_path", return_value=cache_file)
+
+    get_tokens("test-tenant", "test-client")
+
+    assert not cache_file.exists()
+
+
+def test_get_tokens_writes_cache_atomically(mocker, mock_msal_app, tmp_path):
+    """Test a changed cache is written with owner-only permissions"""
+    cache_file = tmp_path / "cache.bin"
+    mocker.patch("planner_lib.auth.get_cache_path", return_value=cache_file)
+
+    get_tokens("test-tenant", "test-client")
+
+    assert cache_file.read_text() == "{}"
+    assert oct(cache_file.stat().st_mode & 0o777) == "0o600"
+    assert [p.name for p in tmp_path.iterdir()] == ["cache.bin"]
+
+
+def test_get_tokens_refreshes_near_expiry(mocker, mock_msal_app, tmp_path):
+    """Test a token close to expiry is returned while a refresh runs in the background"""
+    mock_msal_app.get_accounts.return_value = [{"username": "test@example.com"}]
+    mock_msal_app.acquire_token_silent.side_effect = [
+        {"access_token": "old_token", "expires_in": 120},
+        {"access_token": "new_token", "expires_in": 3600}
+    ]
+    mocker.patch("planner_lib.auth.get_cache_path", return_value=tmp_path / "cache.bin")
+    started = []
+    mocker.patch(
+        "planner_lib.auth.threading.Thread",
+        side_effect=lambda target, daemon: MagicMock(start=lambda: started.append(target))
+    )
+
+    assert get_tokens("test-tenant", "test-client") == "old_token"
+    assert get_tokens("test-tenant", "test-client") == "old_token"
+    assert len(started) == 1
+
+    started[0]()
+
+    assert get_tokens("test-tenant", "test-client") == "new_token"
+    assert mock_msal_app.acquire_token_silent.call_args.kwargs["force_refresh"] is True
+
+
+def test_background_refresh_does_not_block_get_token(mocker, mock_msal_app, tmp_path):
+    """Test foreground calls are served while the refresh request is in flight"""
+    mock_msal_app.get_accounts.return_value = [{"username": "test@example.com"}]
+    mocker.patch("planner_lib.auth.get_cache_path", return_value=tmp_path / "cache.bin")
+    served = []
+
+    def silent(scopes, account, force_refresh=False):
+        if not force_refresh:
+            return {"access_token": "old_token", "expires_in": 120}
+        caller = threading.Thread(target=lambda: served.append(get_tokens("test-tenant", "test-client")))
+        caller.start()
+        caller.join(timeout=2)
+        return {"access_token": "new_token", "expires_in": 3600}
+
+    mock_msal_app.acquire_token_silent.side_effect = silent
+    get_tokens("test-tenant", "test-client")
+
+    provider = get_token_provider("test-tenant", "test-client")
+    provider._refreshing = True
+    provider._background_refresh()
+
+    assert served == ["old_token"]
+    assert get_tokens("test-tenant", "test-client") == "new_token"
+
+
+def test_cache_file_rewritten_elsewhere_is_reloaded(mocker, mock_msal_app, tmp_path):
+    """Test a cache file rewritten by another process (e.g. init-auth) is picked up"""
+    mock_msal_app.get_accounts.return_value = [{"username": "test@example.com"}]
+    mock_msal_app.acquire_token_silent.side_effect = [
+        {"access_token": "first_token", "expires_in": 3600},
+        {"access_token": "second_token", "expires_in": 3600}
+    ]
+    cache_file = tmp_path / "cache.bin"
+    mocker.patch("planner_lib.auth.get_cache_path", return_value=cache_file)
+
+    assert get_tokens("test-tenant", "test-client") == "first_token"
+    mtime = cache_file.stat().st_mtime
+    os.utime(cache_file, (mtime + 10, mtime + 10))
+
+    assert get_tokens("test-tenant", "test-client") == "second_token"
+    import msal
+    assert msal.PublicClientApplication.call_count == 2
+
+
+def test_device_code_prompt_goes_to_handler_or_log(mocker, mock_msal_app, tmp_path, monkeypatch, caplog):
+    """Test the library logs sign-in instructions unless a handler (the CLI's) is set"""
+    mocker.patch("planner_lib.auth.get_cache_path", return_value=tmp_path / "cache.bin")
+    monkeypatch.setattr(auth, "_device_code_handler", auth._log_device_code)
+
+    with caplog.at_level("WARNING", logger="planner_lib.auth"):
+        get_tokens("test-tenant", "test-client")
+    assert "TEST1234" in caplog.text
+
+    shown = []
+    set_device_code_handler(shown.append)
+    auth.reset_token_providers()
+    get_tokens("test-tenant", "test-client")
+
+    assert [flow["user_code"] for flow in shown] == ["TEST1234"]
+
+
 def test_cache_path():
     """Test cache path generation"""
     path = get_cache_path()
@@ -6,10 +6,12 @@ from .test_bucket_create import TestBucketCreate
 from .test_bucket_delete import TestBucketDelete
 from .test_bucket_update import TestBucketUpdate
 from .test_bucket_move import TestBucketMove
+from .test_bucket_reorder import TestBucketReorder
 
 __all__ = [
     "TestBucketCreate",
     "TestBucketDelete",
     "TestBucketUpdate",
-    "TestBucketMove"
+    "TestBucketMove",
+    "TestBucketReorder"
 ]
@@ -66,3 +66,17 @@ class TestBucketCreate:
             create_bucket_op("invalid-plan", "Sprint 1", mock_token)
 
         assert "Invalid plan ID" in str(exc_info.value)
+
+    def test_create_bucket_after_existing_buckets(self, mock_token, mock_bucket, mocker):
+        """Test a new bucket is ordered after the plan's last bucket without touching the others"""
+        mock_post = mocker.patch("planner_lib.bucket_create.post_json", return_value=mock_bucket)
+        mock_patch = mocker.patch("planner_lib.bucket_create.patch_json")
+        buckets = [
+            {"id": "b1", "orderHint": "8585269235419217847", "@odata.etag": "W/\"1\""},
+            {"id": "b2", "orderHint": "8585234698740091215P]", "@odata.etag": "W/\"2\""}
+        ]
+
+        create_bucket_op("plan-id-1", "Sprint 1", mock_token, buckets=buckets)
+
+        assert mock_post.call_args[0][2]["orderHint"] > "8585269235419217847"
+        mock_patch.assert_not_called()
@@ -4,6 +4,7 @@ Tests for bucket_delete module
 
 import pytest
 from planner_lib.bucket_delete import delete_bucket_op
+from planner_lib.resolution_cache import cache_buckets, get_cached_bucket
 
 
 @pytest.fixture
@@ -64,3 +65,13 @@ class TestBucketDelete:
         # Verify ETag was extracted and used
         mock_delete.assert_called_once()
         assert mock_delete.call_args[0][2] == mock_bucket["@odata.etag"]
+
+    def test_delete_forgets_cached_bucket(self, mock_token, mock_bucket, mocker):
+        """Test a deleted bucket's name no longer resolves from the cache"""
+        cache_buckets(mock_token, "plan-id-1", [mock_bucket, {"id": "bucket-id-2", "name": "Backlog"}])
+        mocker.patch("planner_lib.bucket_delete.delete_json", return_value={})
+
+        delete_bucket_op("bucket-id-1", mock_token, etag="W/\"abc123\"")
+
+        assert get_cached_bucket(mock_token, "plan-id-1", "Old Sprint") is None
+        assert get_cached_bucket(mock_token, "plan-id-1", "Backlog")["id"] == "bucket-id-2"
@@ -2,8 +2,10 @@
 Tests for bucket_move module
 """
 
+import json
 import pytest
 from planner_lib.bucket_move import move_bucket_tasks_op
+from planner_lib.etag_cache import get_known_etag, remember_etag
 
 
 @pytest.fixture
@@ -21,10 +23,10 @@ class TestBucketMove:
 
     def test_move_tasks_success(self, mock_token, mock_tasks, mocker):
         """Test moving all tasks from source to target bucket"""
-        mock_get = mocker.patch("planner_lib.bucket_move.get_json")
+        mock_get = mocker.patch("planner_lib.bucket_move.iter_values")
         mock_move = mocker.patch("planner_lib.bucket_move.move_task_op")
 
-        mock_get.return_value = {"value": mock_tasks}
+        mock_get.return_value = iter(mock_tasks)
         mock_move.return_value = {"ok": True}
 
         result = move_bucket_tasks_op("source-bucket", "target-bucket", mock_token)
@@ -44,10 +46,10 @@ class TestBucketMove:
 
     def test_move_tasks_empty_bucket(self, mock_token, mocker):
         """Test moving tasks from empty bucket"""
-        mock_get = mocker.patch("planner_lib.bucket_move.get_json")
+        mock_get = mocker.patch("planner_lib.bucket_move.iter_values")
         mock_move = mocker.patch("planner_lib.bucket_move.move_task_op")
 
-        mock_get.return_value = {"value": []}
+        mock_get.return_value = iter([])
 
         result = move_bucket_tasks_op("empty-bucket", "target-bucket", mock_token)
 
@@ -61,10 +63,10 @@ class TestBucketMove:
 
     def test_move_tasks_partial_failure(self, mock_token, mock_tasks, mocker):
         """Test moving tasks with some failures"""
-        mock_get = mocker.patch("planner_lib.bucket_move.get_json")
+        mock_get = mocker.patch("planner_lib.bucket_move.iter_values")
         mock_move = mocker.patch("planner_lib.bucket_move.move_task_op")
 
-        mock_get.return_value = {"value": mock_tasks}
+        mock_get.return_value = iter(mock_tasks)
 
         # Second task fails to move
         mock_move.side_effect = [
@@ -87,7 +89,7 @@ class TestBucketMove:
 
     def test_move_tasks_source_not_found(self, mock_token, mocker):
         """Test moving from non-existent source bucket"""
-        mock_get = mocker.patch("planner_lib.bucket_move.get_json")
+        mock_get = mocker.patch("planner_lib.bucket_move.iter_values")
         mock_get.side_effect = Exception("Bucket not found")
 
         with pytest.raises(Exception) as exc_info:
@@ -97,10 +99,10 @@ class TestBucketMove:
 
     def test_move_tasks_all_fail(self, mock_token, mock_tasks, mocker):
         """Test scenario where all task moves fail"""
-        mock_get = mocker.patch("planner_lib.bucket_move.get_json")
+        mock_get = mocker.patch("planner_lib.bucket_move.iter_values")
         mock_move = mocker.patch("planner_lib.bucket_move.move_task_op")
 
-        mock_get.return_value = {"value": mock_tasks}
+        mock_get.return_value = iter(mock_tasks)
         mock_move.side_effect = Exception("Target bucket not found")
 
         result = move_bucket_tasks_op("source-bucket", "invalid-target", mock_token)
@@ -110,3 +112,94 @@ class TestBucketMove:
         assert result["failed"] == 3
         assert len(result["taskIds"]) == 0
         assert len(result["errors"]) == 3
+
+    def test_move_tasks_with_etags_uses_batch(self, mock_token, mocker):
+        """Test listed ETags are used for batched PATCHes, with 412 falling back"""
+        tasks = [
+            {"id": "task-id-1", "@odata.etag": "W/\"e1\""},
+            {"id": "task-id-2", "@odata.etag": "W/\"e2\""},
+            {"id": "task-id-3", "@odata.etag": "W/\"e3\""}
+        ]
+        mocker.patch("planner_lib.bucket_move.iter_values", return_value=iter(tasks))
+        mock_batch = mocker.patch("planner_lib.bucket_move.batch_requests")
+        mock_batch.return_value = {
+            "task-id-1": {"status": 204, "headers": {}, "body": None},
+            "task-id-2": {"status": 412, "headers": {}, "body": None},
+            "task-id-3": {"status": 403, "headers": {}, "body": {"error": {"message": "Forbidden"}}}
+        }
+        mock_move = mocker.patch("planner_lib.bucket_move.move_task_op", return_value={"ok": True})
+
+        result = move_bucket_tasks_op("source-bucket", "target-bucket", mock_token)
+
+        sent = mock_batch.call_args[0][0]
+        assert sent[0]["headers"] == {"If-Match": "W/\"e1\""}
+        assert sent[0]["body"] == {"bucketId": "target-bucket"}
+        mock_move.assert_called_once_with("task-id-2", "target-bucket", mock_token)
+        assert result["taskIds"] == ["task-id-1", "task-id-2"]
+        assert result["errors"] == [{"taskId": "task-id-3", "error": "403 Forbidden"}]
+
+    def test_batch_412_forgets_stale_etag_before_fallback(self, mock_token, mocker):
+        """Test the per-task fallback after a batched 412 does not reuse the stale ETag"""
+        url = "https://graph.microsoft.com/v1.0/planner/tasks/task-id-1"
+        remember_etag(url, "W/\"stale\"")
+        mocker.patch("planner_lib.bucket_move.iter_values", side_effect=[
+            iter([{"id": "task-id-1", "@odata.etag": "W/\"stale\""}]), iter([])
+        ])
+        mocker.patch("planner_lib.bucket_move.batch_requests", return_value={
+            "task-id-1": {"status": 412, "headers": {}, "body": None}
+        })
+        seen = []
+        mocker.patch("planner_lib.bucket_move.move_task_op", side_effect=lambda *args: seen.append(get_known_etag(url)))
+
+        result = move_bucket_tasks_op("source-bucket", "target-bucket", mock_token)
+
+        assert seen == [None]
+        assert result["taskIds"] == ["task-id-1"]
+
+    def test_move_tasks_resumes_from_checkpoint(self, mock_token, mock_tasks, tmp_path, mocker):
+        """Test tasks recorded in the checkpoint are skipped and totals are cumulative"""
+        checkpoint = tmp_path / "move.json"
+        checkpoint.write_text(json.dumps({
+            "source": "source-bucket", "target": "target-bucket", "movedIds": ["task-id-1"]
+        }))
+        mocker.patch("planner_lib.bucket_move.iter_values", side_effect=[iter(mock_tasks), iter([])])
+        mock_move = mocker.patch("planner_lib.bucket_move.move_task_op", return_value={"ok": True})
+
+        result = move_bucket_tasks_op(
+            "source-bucket", "target-bucket", mock_token, checkpoint_path=checkpoint
+        )
+
+        assert [c[0][0] for c in mock_move.call_args_list] == ["task-id-2", "task-id-3"]
+        assert result["moved"] == 3
+        assert result["resumed"] is True
+        assert not checkpoint.exists()
+
+    def test_move_tasks_keeps_checkpoint_on_failure(self, mock_token, mock_tasks, tmp_path, mocker):
+        """Test a run with failures leaves the moved IDs behind for the next attempt"""
+        checkpoint = tmp_path / "move.json"
+        mocker.patch("planner_lib.bucket_move.iter_values", side_effect=lambda url, token: iter(mock_tasks))
+        mocker.patch("planner_lib.bucket_move.move_task_op", side_effect=[
+            {"ok": True}, Exception("Task locked"), {"ok": True}
+        ])
+
+        move_bucket_tasks_op("source-bucket", "target-bucket", mock_token, checkpoint_path=checkpoint)
+
+        saved = json.loads(checkpoint.read_text())
+        assert saved["movedIds"] == ["task-id-1", "task-id-3"]
+
+    def test_move_tasks_relists_and_reports_progress(self, mock_token, mock_tasks, mocker):
+        """Test tasks that show up on a second listing are moved and progress is emitted"""
+        late_task = {"id": "task-id-4", "title": "Task 4"}
+        mocker.patch("planner_lib.bucket_move.iter_values", side_effect=[
+            iter(mock_tasks), iter([late_task]), iter([])
+        ])
+        mocker.patch("planner_lib.bucket_move.move_task_op", return_value={"ok": True})
+        events = []
+
+        result = move_bucket_tasks_op(
+            "source-bucket", "target-bucket", mock_token, max_workers=1, progress=events.append
+        )
+
+        assert result["moved"] == 4
+        assert [e["event"] for e in events] == ["start", "listed", "progress", "listed", "progress", "done"]
+        assert events[-1] == {"event": "done", "moved": 4, "failed": 0}
@@ -0,0 +1,90 @@
+"""
+Tests for bucket_reorder module
+"""
+
+import json
+import random
+import pytest
+from planner_lib.bucket_reorder import desired_order, longest_increasing_run, plan_reorder, reorder_bucket_op
+from planner_lib.etag_cache import get_known_etag
+from planner_lib.order_hint import hints_between
+
+
+def bucket(count):
+    """Task IDs with ascending hints, as a bucket listed in display order"""
+    ids = [f"task-{n:03d}" for n in range(count)]
+    return ids, dict(zip(ids, hints_between(None, None, count)))
+
+
+def apply(current, new_hints):
+    hints = {**current, **new_hints}
+    return sorted(hints, key=lambda task_id: hints[task_id])
+
+
+class TestBucketReorder:
+    """Tests for reorder planning and reorder_bucket_op"""
+
+    def test_few_moves_touch_few_tasks(self):
+        """Test moving 3 tasks of 200 rewrites exactly those 3 hints"""
+        ids, current = bucket(200)
+        desired = list(ids)
+        for source, target in ((150, 2), (10, 180), (99, 0)):
+            desired.insert(target, desired.pop(source))
+
+        new_hints = plan_reorder(current, desired)
+
+        assert len(new_hints) == 3
+        assert apply(current, new_hints) == desired
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_any_order_is_reached_with_minimal_writes(self, seed):
+        """Test random orders are reached by moving only tasks off the longest increasing run"""
+        rng = random.Random(seed)
+        ids, current = bucket(rng.randint(1, 120))
+        desired = rng.sample(ids, len(ids))
+
+        new_hints = plan_reorder(current, desired)
+
+        assert apply(current, new_hints) == desired
+        assert len(new_hints) == len(ids) - len(longest_increasing_run([current[t] for t in desired]))
+
+    def test_desired_order_by_due_and_by_titles(self):
+        """Test --by sorts with undated tasks last, and named tasks lead the order"""
+        tasks = [
+            {"id": "a", "title": "Alpha", "orderHint": "1", "dueDateTime": "2025-03-01T00:00:00Z"},
+            {"id": "b", "title": "Beta", "orderHint": "2"},
+            {"id": "c", "title": "Gamma", "orderHint": "3", "dueDateTime": "2025-01-01T00:00:00Z"}
+        ]
+
+        assert desired_order(tasks, by="due") == ["c", "a", "b"]
+        assert desired_order(tasks, order=["gamma", "b"]) == ["c", "b", "a"]
+        with pytest.raises(ValueError) as exc_info:
+            desired_order(tasks, order=["Delta"])
+        assert json.loads(str(exc_info.value))["code"] == "TaskNotFound"
+
+    def test_reorder_patches_only_moved_tasks(self, mock_token, mocker):
+        """Test only moved tasks are PATCHed, and a 412 in the batch is retried alone"""
+        tasks = [
+            {"id": "a", "title": "A", "orderHint": "1", "@odata.etag": "W/\"a\"", "priority": 5},
+            {"id": "b", "title": "B", "orderHint": "2", "@odata.etag": "W/\"b\"", "priority": 9},
+            {"id": "c", "title": "C", "orderHint": "3", "@odata.etag": "W/\"c\"", "priority": 3},
+            {"id": "d", "title": "D", "orderHint": "4", "@odata.etag": "W/\"d\"", "priority": 1}
+        ]
+        mocker.patch("planner_lib.bucket_reorder.iter_values", return_value=iter(tasks))
+        mock_batch = mocker.patch("planner_lib.bucket_reorder.batch_requests", return_value={
+            "d": {"status": 412, "body": {}}, "c": {"status": 200, "body": {}}
+        })
+        mocker.patch("planner_lib.bucket_reorder.get_json", return_value={"@odata.etag": "W/\"fresh\""})
+        mock_patch = mocker.patch("planner_lib.bucket_reorder.patch_json")
+
+        result = reorder_bucket_op("bucket-1", mock_token, by="priority")
+
+        # a and b already increase in priority order and keep their hints
+        assert [r["id"] for r in mock_batch.call_args[0][0]] == ["d", "c"]
+        assert mock_patch.call_args[0][0].endswith("/planner/tasks/d")
+        # The listing's stale ETag is not reused after the 412
+        assert mock_patch.call_args[0][3] == "W/\"fresh\""
+        assert get_known_etag("https://graph.microsoft.com/v1.0/planner/tasks/c") is None
+        assert result["moved"] == 2 and result["failed"] == 0
+        batched_hints = {r["id"]: r["body"]["orderHint"] for r in mock_batch.call_args[0][0]}
+        assert batched_hints["d"] < batched_hints["c"] < "1"
@@ -5,6 +5,7 @@ Tests for bucket_update module
 import pytest
 import requests
 from planner_lib.bucket_update import update_bucket_op
+from planner_lib.resolution_cache import cache_buckets, get_cached_bucket
 
 
 @pytest.fixture
@@ -96,3 +97,29 @@ class TestBucketUpdate:
             update_bucket_op("invalid-bucket-id", "New Name", mock_token)
 
         assert "Bucket not found" in str(exc_info.value)
+
+    def test_update_bucket_known_etag_and_name_skip_get(self, mock_token, mocker):
+        """Test a resolved bucket (ETag and name at hand) is renamed without a GET"""
+        mock_get = mocker.patch("planner_lib.bucket_update.get_json")
+        mock_patch = mocker.patch("planner_lib.bucket_update.patch_json", return_value={})
+
+        result = update_bucket_op(
+            "bucket-id-1", "Sprint 2", mock_token, etag="W/\"abc123\"", old_name="Sprint 1"
+        )
+
+        assert result["oldName"] == "Sprint 1"
+        mock_get.assert_not_called()
+        assert mock_patch.call_args[0][3] == "W/\"abc123\""
+
+    def test_rename_moves_resolution_cache_entry(self, mock_token, mock_bucket, mocker):
+        """Test the old name stops resolving and the new name maps to the bucket"""
+        cache_buckets(mock_token, "plan-id-1", [mock_bucket, {"id": "bucket-id-2", "name": "Backlog"}])
+        mocker.patch("planner_lib.bucket_update.patch_json", return_value={
+            "id": "bucket-id-1", "name": "Sprint 2", "planId": "plan-id-1"
+        })
+
+        update_bucket_op("bucket-id-1", "Sprint 2", mock_token, etag="W/\"abc123\"", old_name="Sprint 1")
+
+        assert get_cached_bucket(mock_token, "plan-id-1", "Sprint 1") is None
+        assert get_cached_bucket(mock_token, "plan-id-1", "sprint 2")["id"] == "bucket-id-1"
+        assert get_cached_bucket(mock_token, "plan-id-1", "Backlog")["id"] == "bucket-id-2"
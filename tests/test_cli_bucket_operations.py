@@ -28,6 +28,7 @@ def mock_bucket_env(mocker):
     mock_bucket = {"id": "bucket-123", "name": "Test Bucket"}
     mocker.patch("planner_lib.cli_bucket_commands.resolve_plan", return_value=mock_plan)
     mocker.patch("planner_lib.cli_bucket_commands.resolve_bucket", return_value=mock_bucket)
+    mocker.patch("planner_lib.cli_bucket_commands.list_plan_buckets", return_value=[])
 
     return {
         "plan": mock_plan,
@@ -223,3 +224,28 @@ class TestMoveBucketTasksCLI:
         assert output["moved"] == 3
         assert output["failed"] == 2
         assert len(output["errors"]) == 2
+
+
+class TestReorderBucketCLI:
+    """Tests for reorder-bucket CLI command"""
+
+    def test_reorder_bucket_by_order(self, mock_bucket_env, mocker):
+        """Test repeated and newline-separated --order values reach reorder_bucket_op in order"""
+        mock_reorder = mocker.patch("planner_lib.cli_bucket_commands.reorder_bucket_op")
+        mock_reorder.return_value = {"ok": True, "bucketId": "bucket-123", "tasks": 5, "moved": 2, "failed": 0}
+
+        result = runner.invoke(app, [
+            "reorder-bucket",
+            "--bucket", "Test Bucket",
+            "--plan", "Test Plan",
+            "--order", "Ship release",
+            "--order", "Write notes\nTag build",
+            "--dry-run"
+        ])
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout)["moved"] == 2
+        args, kwargs = mock_reorder.call_args
+        assert args[0] == "bucket-123"
+        assert kwargs["order"] == ["Ship release", "Write notes", "Tag build"]
+        assert kwargs["by"] is None and kwargs["dry_run"] is True
@@ -42,3 +42,100 @@ def test_list_buckets_success(mocker, mock_config_file, mock_buckets):
     assert output[0]["name"] == "To Do"
 
 
+
+
+def test_list_tasks_streams_json_array(mocker):
+    """Test list-tasks-cmd prints tasks as the same JSON array json.dumps would print"""
+    tasks = [{"id": "task-id-1", "title": "One"}, {"id": "task-id-2", "title": "Two"}]
+    mocker.patch("planner_lib.cli_task_list.load_conf", return_value={
+        "tenant_id": "test-tenant", "client_id": "test-client"
+    })
+    mocker.patch("planner_lib.cli_task_list.get_tokens", return_value="mock_token")
+    mocker.patch("planner_lib.cli_task_list.resolve_plan", return_value={"id": "plan-id-1"})
+    mock_iter = mocker.patch("planner_lib.cli_task_list.iter_tasks", return_value=iter(tasks))
+
+    result = runner.invoke(app, ["list-tasks-cmd", "--plan", "My Plan"])
+
+    assert result.exit_code == 0
+    assert result.stdout == json.dumps(tasks, indent=2) + "\n"
+    assert mock_iter.call_args[1]["prefetch"] is True
+
+
+def test_list_tasks_empty_plan(mocker):
+    """Test list-tasks-cmd prints an empty JSON array for a plan without tasks"""
+    mocker.patch("planner_lib.cli_task_list.load_conf", return_value={
+        "tenant_id": "test-tenant", "client_id": "test-client"
+    })
+    mocker.patch("planner_lib.cli_task_list.get_tokens", return_value="mock_token")
+    mocker.patch("planner_lib.cli_task_list.resolve_plan", return_value={"id": "plan-id-1"})
+    mocker.patch("planner_lib.cli_task_list.iter_tasks", return_value=iter([]))
+
+    result = runner.invoke(app, ["list-tasks-cmd", "--plan", "My Plan"])
+
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == []
+
+
+def test_list_tasks_paging_error_prints_only_the_error(mocker):
+    """Test a failure after the first page leaves no partial array on stdout"""
+    def pages():
+        yield {"id": "task-id-1", "title": "One"}
+        raise ValueError(json.dumps({"code": "Error", "message": "page 2 failed"}))
+
+    mocker.patch("planner_lib.cli_task_list.load_conf", return_value={
+        "tenant_id": "test-tenant", "client_id": "test-client"
+    })
+    mocker.patch("planner_lib.cli_task_list.get_tokens", return_value="mock_token")
+    mocker.patch("planner_lib.cli_task_list.resolve_plan", return_value={"id": "plan-id-1"})
+    mocker.patch("planner_lib.cli_task_list.iter_tasks", return_value=pages())
+
+    result = runner.invoke(app, ["list-tasks-cmd", "--plan", "My Plan"])
+
+    assert result.exit_code == 2
+    assert json.loads(result.stdout)["message"] == "page 2 failed"
+
+
+def test_list_tasks_ndjson_output(mocker):
+    """Test --output ndjson writes one compact task per line"""
+    tasks = [{"id": "task-id-1", "title": "One"}, {"id": "task-id-2", "title": "Two"}]
+    mocker.patch("planner_lib.cli_task_list.load_conf", return_value={
+        "tenant_id": "test-tenant", "client_id": "test-client"
+    })
+    mocker.patch("planner_lib.cli_task_list.get_tokens", return_value="mock_token")
+    mocker.patch("planner_lib.cli_task_list.resolve_plan", return_value={"id": "plan-id-1"})
+    mocker.patch("planner_lib.cli_task_list.iter_tasks", return_value=iter(tasks))
+
+    result = runner.invoke(app, ["list-tasks-cmd", "--plan", "My Plan", "--output", "ndjson"])
+
+    assert result.exit_code == 0
+    assert result.stdout == "".join(json.dumps(t) + "\n" for t in tasks)
+
+
+def test_list_plans_ndjson_streams_pages(mocker):
+    """Test list-plans --output ndjson reads plans page by page"""
+    mocker.patch("planner_lib.cli_commands.load_conf", return_value={
+        "tenant_id": "test-tenant", "client_id": "test-client"
+    })
+    mocker.patch("planner_lib.cli_commands.get_tokens", return_value="mock_token")
+    mocker.patch("planner_lib.resolution_plans.iter_pages", return_value=iter([
+        {"value": [{"id": "p1", "title": "One"}]},
+        {"value": [{"id": "p2", "title": "Two"}]}
+    ]))
+    mock_list = mocker.patch("planner_lib.cli_commands.list_user_plans")
+
+    result = runner.invoke(app, ["list-plans", "--output", "ndjson"])
+
+    assert result.exit_code == 0
+    assert [json.loads(line)["id"] for line in result.stdout.splitlines()] == ["p1", "p2"]
+    mock_list.assert_not_called()
+
+
+def test_list_output_rejects_unknown_format(mocker):
+    """Test an unknown --output value fails before authenticating"""
+    mock_tokens = mocker.patch("planner_lib.cli_commands.get_tokens")
+
+    result = runner.invoke(app, ["list-buckets", "--plan", "My Plan", "--output", "yaml"])
+
+    assert result.exit_code == 2
+    assert json.loads(result.stdout)["code"] == "InvalidInput"
+    mock_tokens.assert_not_called()
@@ -0,0 +1,90 @@
+"""
+Tests for lazy command registration and CLI startup cost
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import typer
+import typer.main
+from typer.testing import CliRunner
+
+from planner import app
+from planner_lib.cli_commands import register_all_commands
+from planner_lib.cli_task_commands import register_task_commands
+from planner_lib.cli_bucket_commands import register_bucket_commands
+from planner_lib.cli_cache_commands import register_cache_commands
+from planner_lib.cli_sync_commands import register_sync_commands
+from planner_lib.cli_worker import register_worker_commands
+from planner_lib.cli_registry import COMMANDS, HIDDEN
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Cumulative `import planner` budget; eager registration took ~300 ms
+IMPORT_BUDGET_US = int(os.environ.get("PLANNER_IMPORT_BUDGET_MS", "150")) * 1000
+
+
+def run_python(code, tmp_path, *flags):
+    env = dict(os.environ, PLANNER_STORE_PATH=str(tmp_path / "store.db"), HOME=str(tmp_path))
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True
+    )
+
+
+def test_registry_matches_registered_commands():
+    """Test every registered command is in the registry with its short help and visibility"""
+    eager = typer.Typer()
+    for register in (
+        register_all_commands, register_task_commands, register_bucket_commands,
+        register_cache_commands, register_sync_commands, register_worker_commands
+    ):
+        register(eager)
+    commands = typer.main.get_group(eager).commands
+
+    assert list(COMMANDS) == list(commands)
+    for name, command in commands.items():
+        assert COMMANDS[name][2] == (command.help or "").strip().splitlines()[0], name
+        assert command.hidden == (name in HIDDEN), name
+
+
+def test_root_help_omits_hidden_commands():
+    """Test the lazy --help listing keeps hidden commands out"""
+    result = CliRunner().invoke(app, ["--help"])
+
+    assert result.exit_code == 0
+    assert "list-plans" in result.stdout
+    assert all(f" {name} " not in result.stdout for name in HIDDEN)
+
+
+def test_cached_read_and_help_skip_heavy_imports(tmp_path):
+    """Test --help and a cached read import neither msal, requests nor unrelated commands"""
+    code = (
+        "import sys\n"
+        "from planner import app\n"
+        "for args in (['--help'], ['list-tasks-cmd', '--plan', 'X', '--cached']):\n"
+        "    try:\n"
+        "        app(args=args, prog_name='planner.py')\n"
+        "    except SystemExit:\n"
+        "        pass\n"
+        "print(sorted(m for m in ('msal', 'requests', 'planner_lib.cli_bucket_commands', 'planner_lib.task_updates') if m in sys.modules), file=sys.stderr)\n"
+    )
+    result = run_python(code, tmp_path)
+
+    assert result.stderr.strip().splitlines()[-1] == "[]"
+    assert "NotSynced" in result.stdout
+
+
+@pytest.mark.benchmark
+def test_import_time_budget(tmp_path):
+    """Test `import planner` stays within the cold-start budget (python -X importtime)"""
+    result = run_python("import planner", tmp_path, "-X", "importtime")
+    cumulative = [
+        int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and line.split("|")[2].strip() == "planner"
+    ]
+
+    assert cumulative and cumulative[0] < IMPORT_BUDGET_US, f"import planner took {cumulative} us"
@@ -0,0 +1,84 @@
+"""
+Tests for the JSON-lines CLI worker
+"""
+
+import io
+import json
+
+from typer.testing import CliRunner
+
+from planner import app
+from planner_lib.cli_worker import run_worker, run_command
+
+
+def serve(*requests):
+    """Feed request lines to the worker and return parsed responses"""
+    stdin = io.StringIO("".join(
+        (r if isinstance(r, str) else json.dumps(r)) + "\n" for r in requests
+    ))
+    stdout = io.StringIO()
+    run_worker(app, stdin, stdout)
+    return [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+
+def test_worker_runs_commands_in_process(mocker, mock_plans):
+    """Test several commands are served by one worker with ids echoed back"""
+    mocker.patch("planner_lib.cli_commands.load_conf", return_value={
+        "tenant_id": "test-tenant", "client_id": "test-client"
+    })
+    mock_tokens = mocker.patch("planner_lib.cli_commands.get_tokens", return_value="mock_token")
+    mocker.patch("planner_lib.cli_commands.list_user_plans", return_value=mock_plans)
+
+    responses = serve(
+        {"id": 1, "args": ["list-plans"]},
+        {"id": 2, "args": ["list-plans"]}
+    )
+
+    assert [r["id"] for r in responses] == [1, 2]
+    assert all(r["code"] == 0 for r in responses)
+    assert json.loads(responses[1]["stdout"])[0]["title"] == "My Plan"
+    assert mock_tokens.call_count == 2
+
+
+def test_worker_reports_usage_errors():
+    """Test unknown commands return a non-zero code with the usage error"""
+    responses = serve({"id": "a", "args": ["no-such-command"]})
+
+    assert responses[0]["id"] == "a"
+    assert responses[0]["code"] == 2
+    assert "No such command" in responses[0]["stderr"]
+
+
+def test_worker_rejects_malformed_requests():
+    """Test bad JSON and bad args produce WorkerError responses without stopping"""
+    responses = serve("not json", {"id": 2, "args": "list-plans"}, {"id": 3, "args": ["worker"]})
+
+    assert [r["code"] for r in responses] == [2, 2, 2]
+    assert json.loads(responses[1]["stderr"])["code"] == "WorkerError"
+
+
+def test_run_command_captures_output(mocker):
+    """Test command output and exit code are captured instead of written to stdout"""
+    mocker.patch("planner_lib.cli_commands.load_conf", return_value={})
+
+    result = run_command(app, ["list-plans"])
+
+    assert result["code"] == 2
+    assert "ConfigError" in result["stdout"]
+
+
+def test_worker_command_dispatches_to_root_app(mocker, mock_plans):
+    """Test `planner.py worker` serves every command, not only the worker's own app"""
+    mocker.patch("planner_lib.cli_commands.load_conf", return_value={
+        "tenant_id": "test-tenant", "client_id": "test-client"
+    })
+    mocker.patch("planner_lib.cli_commands.get_tokens", return_value="mock_token")
+    mocker.patch("planner_lib.cli_commands.list_user_plans", return_value=mock_plans)
+    requests = [{"id": 1, "args": ["cache", "stats"]}, {"id": 2, "args": ["list-plans"]}]
+
+    result = CliRunner().invoke(app, ["worker"], input="".join(json.dumps(r) + "\n" for r in requests))
+    responses = [json.loads(line) for line in result.stdout.splitlines()]
+
+    assert result.exit_code == 0
+    assert [(r["id"], r["code"]) for r in responses] == [(1, 0), (2, 0)]
+    assert json.loads(responses[1]["stdout"])[0]["title"] == "My Plan"
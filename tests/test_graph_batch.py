@@ -0,0 +1,170 @@
+"""
+Tests for Graph JSON $batch support
+"""
+
+import pytest
+
+from planner_lib.graph_batch import (
+    BATCH_URL,
+    batch_requests,
+    batch_get_json,
+    chunk_requests,
+)
+
+
+def ok_responses(payload):
+    """Answer every sub-request of a batch with 200 and an echo body"""
+    return {
+        "responses": [
+            {"id": r["id"], "status": 200, "headers": {}, "body": {"url": r["url"]}}
+            for r in payload["requests"]
+        ]
+    }
+
+
+class TestChunkRequests:
+    """Tests for splitting sub-requests into batches"""
+
+    def test_splits_into_batches_of_twenty(self):
+        """Test 45 independent requests become 20 + 20 + 5"""
+        items = [{"id": str(i), "method": "GET", "url": f"/x/{i}"} for i in range(45)]
+
+        batches = chunk_requests(items)
+
+        assert [len(b) for b in batches] == [20, 20, 5]
+
+    def test_keeps_depends_on_chain_together(self):
+        """Test a dependsOn chain is never split across batches"""
+        items = [{"id": str(i), "method": "GET", "url": f"/x/{i}"} for i in range(19)]
+        items.append({"id": "a", "method": "POST", "url": "/a"})
+        items.append({"id": "b", "method": "PATCH", "url": "/b", "dependsOn": ["a"]})
+
+        batches = chunk_requests(items)
+
+        ids_per_batch = [{i["id"] for i in b} for b in batches]
+        assert any({"a", "b"} <= ids for ids in ids_per_batch)
+
+    def test_unknown_dependency_raises(self):
+        """Test dependsOn pointing to a missing id is rejected"""
+        with pytest.raises(ValueError, match="unknown id"):
+            chunk_requests([{"id": "b", "method": "GET", "url": "/b", "dependsOn": ["a"]}])
+
+
+class TestBatchRequests:
+    """Tests for batch_requests"""
+
+    def test_results_keyed_by_id(self, mock_token, mocker):
+        """Test results are returned per sub-request id"""
+        mock_post = mocker.patch("planner_lib.graph_batch.post_json")
+        mock_post.side_effect = lambda url, token, payload: ok_responses(payload)
+
+        results = batch_requests(
+            [{"id": "t1", "url": "https://graph.microsoft.com/v1.0/planner/tasks/1"}],
+            mock_token
+        )
+
+        assert results["t1"]["status"] == 200
+        assert results["t1"]["body"] == {"url": "/planner/tasks/1"}
+        assert mock_post.call_args[0][0] == BATCH_URL
+
+    def test_patch_body_gets_content_type(self, mock_token, mocker):
+        """Test write sub-requests carry JSON content type and If-Match"""
+        mock_post = mocker.patch("planner_lib.graph_batch.post_json")
+        mock_post.side_effect = lambda url, token, payload: ok_responses(payload)
+
+        batch_requests(
+            [{"id": "1", "method": "patch", "url": "/planner/tasks/1",
+              "headers": {"If-Match": "W/\"e\""}, "body": {"bucketId": "b"}}],
+            mock_token
+        )
+
+        sent = mock_post.call_args[0][2]["requests"][0]
+        assert sent["method"] == "PATCH"
+        assert sent["headers"] == {"If-Match": "W/\"e\"", "Content-Type": "application/json"}
+        assert sent["body"] == {"bucketId": "b"}
+
+    def test_throttled_items_are_retried(self, mock_token, mocker):
+        """Test a 429 sub-response is re-sent alone after Retry-After"""
+        mock_sleep = mocker.patch("planner_lib.graph_batch.time.sleep")
+        mock_post = mocker.patch("planner_lib.graph_batch.post_json")
+        mock_post.side_effect = [
+            {"responses": [
+                {"id": "1", "status": 200, "body": {}},
+                {"id": "2", "status": 429, "headers": {"Retry-After": "3"}},
+            ]},
+            {"responses": [{"id": "2", "status": 200, "body": {"ok": True}}]},
+        ]
+
+        results = batch_requests(
+            [{"id": "1", "url": "/a"}, {"id": "2", "url": "/b"}],
+            mock_token
+        )
+
+        assert results["2"]["status"] == 200
+        mock_sleep.assert_called_once_with(3.0)
+        assert [r["id"] for r in mock_post.call_args_list[1][0][2]["requests"]] == ["2"]
+
+    def test_throttled_dependent_retried_without_completed_parent(self, mock_token, mocker):
+        """Test a throttled dependent drops dependsOn on its succeeded parent and 424s follow transitively"""
+        mocker.patch("planner_lib.graph_batch.time.sleep")
+        mock_post = mocker.patch("planner_lib.graph_batch.post_json")
+
+        def post(url, token, payload):
+            ids = {r["id"] for r in payload["requests"]}
+            for r in payload["requests"]:
+                if any(d not in ids for d in r.get("dependsOn", [])):
+                    raise RuntimeError(f"400 dependsOn references unknown id {r['dependsOn'][0]}")
+            if mock_post.call_count == 1:
+                return {"responses": [
+                    {"id": "a", "status": 200, "body": {}},
+                    {"id": "b", "status": 429, "headers": {"Retry-After": "1"}},
+                    {"id": "c", "status": 424},
+                ]}
+            return ok_responses(payload)
+
+        mock_post.side_effect = post
+
+        results = batch_requests([
+            {"id": "a", "url": "/a"},
+            {"id": "b", "url": "/b", "dependsOn": ["a"]},
+            {"id": "c", "url": "/c", "dependsOn": ["b"]},
+        ], mock_token)
+
+        assert {i: r["status"] for i, r in results.items()} == {"a": 200, "b": 200, "c": 200}
+        retried = mock_post.call_args_list[1][0][2]["requests"]
+        assert [(r["id"], r.get("dependsOn")) for r in retried] == [("b", None), ("c", ["b"])]
+
+    def test_failed_retry_keeps_completed_results(self, mock_token, mocker):
+        """Test a failing re-send returns the responses already collected"""
+        mocker.patch("planner_lib.graph_batch.time.sleep")
+        mocker.patch("planner_lib.graph_batch.post_json", side_effect=[
+            {"responses": [
+                {"id": "1", "status": 200, "body": {}},
+                {"id": "2", "status": 429, "headers": {"Retry-After": "1"}},
+            ]},
+            RuntimeError("503 Service Unavailable"),
+        ])
+
+        results = batch_requests([{"id": "1", "url": "/a"}, {"id": "2", "url": "/b"}], mock_token)
+
+        assert {i: r["status"] for i, r in results.items()} == {"1": 200, "2": 429}
+
+    def test_duplicate_ids_rejected(self, mock_token):
+        """Test duplicate sub-request ids raise ValueError"""
+        with pytest.raises(ValueError, match="unique"):
+            batch_requests([{"id": "1", "url": "/a"}, {"id": "1", "url": "/b"}], mock_token)
+
+
+def test_batch_get_json_returns_none_for_failures(mock_token, mocker):
+    """Test failed items come back as None in input order"""
+    mocker.patch(
+        "planner_lib.graph_batch.post_json",
+        return_value={"responses": [
+            {"id": "1", "status": 404, "body": {"error": {}}},
+            {"id": "0", "status": 200, "body": {"description": "d"}},
+        ]}
+    )
+
+    bodies = batch_get_json(["/t/0/details", "/t/1/details"], mock_token)
+
+    assert bodies == [{"description": "d"}, None]
@@ -0,0 +1,155 @@
+"""
+Tests for graph_client transport and request helpers
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from planner_lib import graph_client
+from planner_lib.graph_client import (
+    get_session,
+    configure_session,
+    close_session,
+    get_json,
+    delete_json,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_session():
+    """Ensure each test starts without a shared session"""
+    close_session()
+    yield
+    close_session()
+
+
+def test_get_session_is_shared():
+    """Test that the same pooled session is reused across calls"""
+    assert get_session() is get_session()
+
+
+def test_configure_session_pool_size():
+    """Test that pool size and retries are applied to the HTTPS adapter"""
+    session = configure_session(pool_size=25, max_retries=5)
+
+    adapter = session.get_adapter("https://graph.microsoft.com")
+    assert adapter._pool_maxsize == 25
+    assert adapter.max_retries.total == 5
+    assert get_session() is session
+
+
+def test_adapter_leaves_throttling_to_rate_governor():
+    """Test the transport never retries 429/503 or sleeps on Retry-After itself"""
+    retry = get_session().get_adapter("https://graph.microsoft.com").max_retries
+
+    assert set(retry.status_forcelist) == {502, 504}
+    assert retry.respect_retry_after_header is False
+
+
+def test_pool_size_from_environment(monkeypatch):
+    """Test that PLANNER_HTTP_POOL_SIZE configures the default session"""
+    monkeypatch.setenv("PLANNER_HTTP_POOL_SIZE", "4")
+
+    adapter = get_session().get_adapter("https://graph.microsoft.com")
+
+    assert adapter._pool_maxsize == 4
+
+
+def test_get_json_uses_shared_session(mocker, mock_token):
+    """Test that get_json goes through the pooled session"""
+    response = Mock(status_code=200)
+    response.json.return_value = {"id": "x"}
+    mock_get = mocker.patch.object(get_session(), "get", return_value=response)
+
+    result = get_json("https://graph.microsoft.com/v1.0/me", mock_token)
+
+    assert result == {"id": "x"}
+    mock_get.assert_called_once()
+    assert mock_get.call_args[1]["headers"]["Authorization"] == f"Bearer {mock_token}"
+
+
+def test_delete_json_sends_etag(mocker, mock_token):
+    """Test that delete_json sends If-Match through the pooled session"""
+    response = Mock(status_code=204)
+    mock_delete = mocker.patch.object(get_session(), "delete", return_value=response)
+
+    assert delete_json("https://graph.microsoft.com/v1.0/x", mock_token, "W/\"e\"") == {}
+    assert mock_delete.call_args[1]["headers"]["If-Match"] == "W/\"e\""
+
+
+def make_pages(mocker, pages):
+    """Patch get_json to serve a chain of pages linked by @odata.nextLink"""
+    by_url = {}
+    for i, items in enumerate(pages):
+        page = {"value": items}
+        if i + 1 < len(pages):
+            page["@odata.nextLink"] = f"https://graph.microsoft.com/v1.0/page/{i + 1}"
+        by_url[f"https://graph.microsoft.com/v1.0/page/{i}"] = page
+    return mocker.patch(
+        "planner_lib.graph_client.get_json",
+        side_effect=lambda url, token: by_url[url]
+    )
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_iter_values_follows_next_link(mocker, mock_token, prefetch):
+    """Test items are yielded across all pages, with and without prefetch"""
+    mock_get = make_pages(mocker, [[{"id": 1}, {"id": 2}], [{"id": 3}], []])
+
+    items = list(graph_client.iter_values(
+        "https://graph.microsoft.com/v1.0/page/0", mock_token, prefetch=prefetch
+    ))
+
+    assert [i["id"] for i in items] == [1, 2, 3]
+    assert mock_get.call_count == 3
+
+
+def test_iter_values_is_lazy(mocker, mock_token):
+    """Test later pages are not requested until earlier items are consumed"""
+    mock_get = make_pages(mocker, [[{"id": 1}], [{"id": 2}]])
+
+    items = graph_client.iter_values("https://graph.microsoft.com/v1.0/page/0", mock_token)
+    assert next(items)["id"] == 1
+
+    assert mock_get.call_count == 1
+
+
+def test_stale_handlers_notified_on_404(mocker, mock_token):
+    """Test registered stale handlers receive the URL of a 404 response"""
+    import requests
+
+    response = Mock(status_code=404)
+    response.raise_for_status.side_effect = requests.HTTPError("404")
+    mocker.patch.object(get_session(), "get", return_value=response)
+    handler = Mock()
+    mocker.patch.object(graph_client, "_stale_handlers", [handler])
+
+    with pytest.raises(requests.HTTPError):
+        get_json("https://graph.microsoft.com/v1.0/planner/plans/p1", mock_token)
+
+    handler.assert_called_once_with("https://graph.microsoft.com/v1.0/planner/plans/p1")
+
+
+def test_patch_json_remembers_returned_etag(mocker, mock_token):
+    """Test return=representation is requested and the new ETag is remembered"""
+    import requests
+    from planner_lib.etag_cache import get_known_etag
+
+    url = "https://graph.microsoft.com/v1.0/planner/tasks/t1"
+    response = Mock(status_code=200, content=b"{}")
+    response.json.return_value = {"id": "t1", "@odata.etag": "W/\"new\""}
+    mock_patch = mocker.patch.object(get_session(), "patch", return_value=response)
+
+    graph_client.patch_json(url, mock_token, {"title": "x"}, "W/\"old\"", return_representation=True)
+
+    assert mock_patch.call_args[1]["headers"]["Prefer"] == "return=representation"
+    assert get_known_etag(url) == "W/\"new\""
+
+    conflict = Mock(status_code=412)
+    conflict.raise_for_status.side_effect = requests.HTTPError("412")
+    mock_patch.return_value = conflict
+
+    with pytest.raises(requests.HTTPError):
+        graph_client.patch_json(url, mock_token, {"title": "y"}, "W/\"new\"")
+
+    assert get_known_etag(url) is None
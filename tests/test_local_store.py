@@ -0,0 +1,118 @@
+"""
+Tests for the local SQLite store, sync and --cached reads
+"""
+
+import json
+import pytest
+from typer.testing import CliRunner
+
+from planner import app
+from planner_lib.local_store import get_local_store
+from planner_lib.store_sync import sync_plan
+
+runner = CliRunner()
+
+PLAN_ID = "plan-id-1234567890abcdef"
+
+
+def make_task(task_id, title, etag, bucket="bucket-a", percent=0):
+    return {"id": task_id, "title": title, "bucketId": bucket, "percentComplete": percent, "@odata.etag": etag}
+
+
+@pytest.fixture
+def graph(mocker):
+    """Mock the Graph listings used by sync_plan"""
+    mocker.patch("planner_lib.store_sync.get_json", return_value={"id": PLAN_ID, "title": "My Plan"})
+    mocker.patch("planner_lib.store_sync.list_plan_buckets", return_value=[
+        {"id": "bucket-a", "name": "To Do"},
+        {"id": "bucket-b", "name": "Done"}
+    ])
+    tasks = mocker.patch("planner_lib.store_sync.iter_tasks")
+    details = mocker.patch(
+        "planner_lib.store_sync.batch_get_json",
+        side_effect=lambda urls, token, max_workers=None: [
+            {
+                "description": f"desc of {url.split('/')[-2]}",
+                "checklist": {"c1": {"title": "Step", "isChecked": True}},
+                "@odata.etag": "W/\"d1\""
+            }
+            for url in urls
+        ]
+    )
+    return tasks, details
+
+
+def test_sync_fetches_details_only_for_changed_tasks(graph, mock_token):
+    """Test a second sync compares ETags and refetches only new or changed tasks"""
+    tasks, details = graph
+    tasks.return_value = iter([make_task("t1", "One", "e1"), make_task("t2", "Two", "e1")])
+    first = sync_plan(mock_token, PLAN_ID)
+
+    tasks.return_value = iter([make_task("t1", "One", "e1"), make_task("t3", "Three", "e1", percent=100)])
+    second = sync_plan(mock_token, PLAN_ID)
+
+    assert first["added"] == 2 and first["detailsFetched"] == 2
+    assert second == {
+        "planId": PLAN_ID, "title": "My Plan", "buckets": 2, "tasks": 2,
+        "added": 1, "updated": 0, "removed": 1, "unchanged": 1, "detailsFetched": 1
+    }
+    assert details.call_args[0][0] == ["/planner/tasks/t3/details"]
+
+    store = get_local_store()
+    assert [t["id"] for t in store.iter_tasks(plan_id=PLAN_ID)] == ["t1", "t3"]
+    assert store.get_task("t1", include_details=True)["description"] == "desc of t1"
+
+
+def test_sync_refetches_details_stored_without_etag(graph, mock_token):
+    """Test unchanged tasks whose stored details have no ETag get their details again"""
+    tasks, details = graph
+    details.side_effect = [[{"description": "old"}], [{"description": "new", "@odata.etag": "W/\"d2\""}]]
+    for _ in range(3):
+        tasks.return_value = iter([make_task("t1", "One", "e1")])
+        result = sync_plan(mock_token, PLAN_ID)
+
+    assert details.call_count == 2
+    assert result["detailsFetched"] == 0
+    assert get_local_store().get_task("t1", include_details=True)["description"] == "new"
+
+
+def test_store_reads_match_live_shapes(graph, mock_token):
+    """Test resolution, filters and subtasks are answered from the store"""
+    tasks, _ = graph
+    tasks.return_value = iter([
+        make_task("t1", "Write docs", "e1"),
+        make_task("t2", "Ship", "e1", bucket="bucket-b", percent=100)
+    ])
+    sync_plan(mock_token, PLAN_ID)
+    store = get_local_store()
+
+    plan = store.resolve_plan("my plan")
+    bucket = store.resolve_bucket(plan["id"], "done")
+    assert [t["id"] for t in store.iter_tasks(bucket_id=bucket["id"])] == ["t2"]
+    assert list(store.iter_tasks(plan_id=PLAN_ID, incomplete_only=True, fields=["id", "title"])) == [
+        {"id": "t1", "title": "Write docs"}
+    ]
+    assert store.resolve_task("WRITE DOCS", PLAN_ID)["id"] == "t1"
+    assert store.list_subtasks("t1") == [{"id": "c1", "title": "Step", "isChecked": True}]
+
+    with pytest.raises(ValueError) as exc_info:
+        store.resolve_plan("Other Plan")
+    assert json.loads(str(exc_info.value))["code"] == "NotFound"
+
+
+def test_list_tasks_cached_skips_auth(mocker):
+    """Test --cached answers without authenticating, and reports an unsynced store"""
+    mock_tokens = mocker.patch("planner_lib.cli_task_list.get_tokens")
+
+    result = runner.invoke(app, ["list-tasks-cmd", "--plan", "My Plan", "--cached"])
+
+    assert result.exit_code == 2
+    assert json.loads(result.stdout)["code"] == "NotSynced"
+    mock_tokens.assert_not_called()
+
+    store = get_local_store()
+    store.save_plan({"id": PLAN_ID, "title": "My Plan"}, [], [make_task("t1", "One", "e1")], {})
+    result = runner.invoke(app, ["list-tasks-cmd", "--plan", "My Plan", "--offline", "--fields", "id"])
+
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == [{"id": "t1"}]
@@ -0,0 +1,107 @@
+"""
+Property tests and benchmark for fractional orderHint generation
+"""
+
+import json
+import random
+import string
+import time
+
+import pytest
+
+from planner_lib.constants import ORDER_HINT_MAX_LENGTH
+from planner_lib.order_hint import (
+    append_hints, hint_at_end, hint_at_start, hint_between, hints_between, needs_rebalance, spread_hints
+)
+
+ALPHABET = set(string.digits + string.ascii_letters)
+
+# Service-generated hints seen in Graph responses, plus the " !" request form
+SERVICE_HINTS = [" !", " !!", "8585234698740091215P]", "8585269235419217847", "85855940624;", "zzz~"]
+
+
+def assert_generated(hint):
+    assert hint and set(hint) <= ALPHABET and not hint.endswith("0"), hint
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_inserts_keep_order(seed):
+    """Test hints from random inserts stay unique, sorted and well-formed"""
+    rng = random.Random(seed)
+    hints = []
+    for _ in range(500):
+        index = rng.randint(0, len(hints))
+        before = hints[index - 1] if index else None
+        after = hints[index] if index < len(hints) else None
+        hint = hint_between(before, after)
+        assert_generated(hint)
+        hints.insert(index, hint)
+
+    assert hints == sorted(hints)
+    assert len(set(hints)) == len(hints)
+    assert max(len(h) for h in hints) < 12
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_between_service_hints(seed):
+    """Test hints fit between arbitrary service-generated neighbors"""
+    rng = random.Random(seed)
+    before, after = sorted(rng.sample(SERVICE_HINTS, 2))
+    for _ in range(50):
+        hint = hint_between(before, after)
+        assert before < hint < after
+        before, after = (before, hint) if rng.random() < 0.5 else (hint, after)
+
+
+def test_start_and_end_are_bounded():
+    """Test long runs of appends or prepends grow hints slowly"""
+    last = first = None
+    for _ in range(300):
+        last = hint_at_end(last)
+        first = hint_at_start(first) if first else hint_at_end(None)
+
+    assert len(last) <= 6 and len(first) <= 6
+
+
+def test_hints_between_spreads_evenly():
+    """Test many hints in one gap are ascending with logarithmic length"""
+    hints = hints_between("a", "b", 1000)
+
+    assert hints == sorted(hints) and len(set(hints)) == 1000
+    assert all("a" < h < "b" for h in hints)
+    assert max(len(h) for h in hints) <= 4
+    assert spread_hints(1000) == sorted(spread_hints(1000))
+
+
+def test_invalid_neighbors():
+    """Test neighbors out of order or without room are rejected"""
+    for before, after in (("b", "a"), ("a", "a"), ("a", "a!")):
+        with pytest.raises(ValueError) as exc_info:
+            hint_between(before, after)
+        assert json.loads(str(exc_info.value))["code"] == "InvalidInput"
+
+
+def test_append_rebalances_only_when_needed():
+    """Test existing hints are rewritten only once a new hint would be too long"""
+    hints, rehinted = append_hints({"a": " !", "b": "8585234698740091215P]"}, 3)
+    assert rehinted == {} and "8585234698740091215P]" < hints[0] < hints[1] < hints[2]
+
+    crowded = {"a": "V", "b": "z" * ORDER_HINT_MAX_LENGTH}
+    hints, rehinted = append_hints(crowded, 2)
+    order = [rehinted.get(i, crowded[i]) for i in ("a", "b")] + hints
+    assert set(rehinted) == {"a", "b"}
+    assert order == sorted(order) and not needs_rebalance(order)
+
+
+@pytest.mark.benchmark
+def test_hint_generation_speed():
+    """Test 20,000 random inserts generate hints in well under a second"""
+    rng = random.Random(0)
+    hints = []
+    started = time.perf_counter()
+    for _ in range(20000):
+        index = rng.randint(0, len(hints))
+        hints.insert(index, hint_between(hints[index - 1] if index else None, hints[index] if index < len(hints) else None))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 1.0, f"20,000 inserts took {elapsed:.3f}s"
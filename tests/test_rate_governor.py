@@ -0,0 +1,108 @@
+"""
+Tests for adaptive rate governing and throttling retries
+"""
+
+import pytest
+import requests
+from unittest.mock import Mock
+
+from planner_lib.graph_client import get_session, close_session, get_json, post_json
+from planner_lib.rate_governor import RateGovernor, backoff_delay, get_rate_governor
+
+
+@pytest.fixture(autouse=True)
+def reset_session():
+    """Ensure each test starts without a shared session"""
+    close_session()
+    yield
+    close_session()
+
+
+def make_response(status, retry_after=None, body=None):
+    """Build a fake requests response"""
+    response = Mock(status_code=status)
+    response.headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    response.json.return_value = body or {}
+    if status >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(str(status))
+    return response
+
+
+def test_backoff_delay_prefers_retry_after():
+    """Test Retry-After wins over exponential backoff"""
+    assert backoff_delay(3, "7") == 7.0
+
+
+def test_backoff_delay_grows_with_jitter():
+    """Test backoff doubles per attempt and stays within [d/2, d]"""
+    for attempt, full in [(0, 1.0), (2, 4.0), (10, 30.0)]:
+        delay = backoff_delay(attempt)
+        assert full / 2 <= delay <= full
+
+
+def test_governor_adapts_rate():
+    """Test 429s halve the rate down to the floor and successes raise it back"""
+    governor = RateGovernor(max_rate=8.0, min_rate=1.0, burst=5)
+
+    governor.on_throttle(0)
+    assert governor.rate == 4.0
+    for _ in range(10):
+        governor.on_throttle(0)
+    assert governor.rate == 1.0
+
+    for _ in range(100):
+        governor.on_success()
+    assert governor.rate == 8.0
+
+
+def test_governor_reserve_reports_wait_without_blocking():
+    """Test reserve() hands out burst tokens, then returns the wait instead of sleeping"""
+    governor = RateGovernor(max_rate=2.0, min_rate=1.0, burst=2)
+
+    assert governor.reserve() == 0.0
+    assert governor.reserve() == 0.0
+    assert 0 < governor.reserve() <= 0.5
+
+
+def test_governor_shared_per_tenant_and_resource(mock_token):
+    """Test workers on the same tenant/resource share one budget"""
+    planner_a = get_rate_governor("https://graph.microsoft.com/v1.0/planner/tasks/1", mock_token)
+    planner_b = get_rate_governor("https://graph.microsoft.com/v1.0/planner/plans/2?$select=id", mock_token)
+    groups = get_rate_governor("https://graph.microsoft.com/v1.0/groups/3", mock_token)
+
+    assert planner_a is planner_b
+    assert planner_a is not groups
+
+
+def test_get_json_retries_throttled_requests(mocker, mock_token):
+    """Test 429 and 503 responses are retried until success"""
+    mock_get = mocker.patch.object(get_session(), "get", side_effect=[
+        make_response(429, "0"),
+        make_response(503, "0"),
+        make_response(200, body={"id": "x"})
+    ])
+
+    assert get_json("https://graph.microsoft.com/v1.0/me", mock_token) == {"id": "x"}
+    assert mock_get.call_count == 3
+    assert get_rate_governor("https://graph.microsoft.com/v1.0/me", mock_token).rate < 50.0
+
+
+def test_post_json_not_retried_on_503(mocker, mock_token):
+    """Test POST is only retried on 429, never on 503"""
+    mock_post = mocker.patch.object(get_session(), "post", return_value=make_response(503, "0"))
+
+    with pytest.raises(requests.HTTPError):
+        post_json("https://graph.microsoft.com/v1.0/planner/tasks", mock_token, {"title": "x"})
+
+    mock_post.assert_called_once()
+
+
+def test_retry_budget_caps_waiting(mocker, mock_token, monkeypatch):
+    """Test a Retry-After beyond the retry budget fails fast instead of waiting"""
+    monkeypatch.setenv("PLANNER_RETRY_MAX_SECONDS", "5")
+    mock_get = mocker.patch.object(get_session(), "get", return_value=make_response(429, "120"))
+
+    with pytest.raises(requests.HTTPError):
+        get_json("https://graph.microsoft.com/v1.0/me", mock_token)
+
+    mock_get.assert_called_once()
@@ -0,0 +1,136 @@
+"""
+Tests for the persistent plan/bucket resolution cache
+"""
+
+import base64
+import json
+import time
+from typer.testing import CliRunner
+
+from planner import app
+from planner_lib.cache_store import CacheStore, get_cache_store, token_scope
+from planner_lib.resolution import resolve_plan, resolve_bucket
+from planner_lib.resolution_cache import invalidate_for_url
+
+runner = CliRunner()
+
+
+def make_jwt(claims):
+    """Build an unsigned JWT-shaped token with the given claims"""
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+def test_resolve_plan_served_from_cache(mocker, mock_token, mock_plans):
+    """Test a second resolution of the same title needs no Graph calls"""
+    mock_list = mocker.patch("planner_lib.resolution_plans.list_user_plans", return_value=mock_plans)
+
+    first = resolve_plan(mock_token, "My Plan")
+    second = resolve_plan(mock_token, "my plan")
+    other = resolve_plan(mock_token, "Another Plan")
+
+    assert first["id"] == second["id"] == "plan-id-1"
+    assert other["id"] == "plan-id-2"
+    mock_list.assert_called_once()
+
+
+def test_resolve_bucket_served_from_cache(mocker, mock_token, mock_buckets):
+    """Test bucket names are cached per plan"""
+    mock_list = mocker.patch("planner_lib.resolution_buckets.list_plan_buckets", return_value=mock_buckets)
+
+    resolve_bucket(mock_token, "plan-id-1", "To Do")
+    result = resolve_bucket(mock_token, "plan-id-1", "Done")
+
+    assert result["id"] == "bucket-id-3"
+    mock_list.assert_called_once()
+
+
+def test_ambiguous_titles_are_not_cached(mocker, mock_token):
+    """Test ambiguous plan titles keep raising instead of being cached"""
+    plans = [{"id": "p1", "title": "Dup"}, {"id": "p2", "title": "Dup"}]
+    mock_list = mocker.patch("planner_lib.resolution_plans.list_user_plans", return_value=plans)
+
+    for _ in range(2):
+        try:
+            resolve_plan(mock_token, "Dup")
+        except ValueError:
+            pass
+
+    assert mock_list.call_count == 2
+
+
+def test_cache_scoped_by_user(mocker, mock_plans):
+    """Test entries cached for one user are not served to another"""
+    mock_list = mocker.patch("planner_lib.resolution_plans.list_user_plans", return_value=mock_plans)
+    alice = make_jwt({"tid": "t", "oid": "alice"})
+    bob = make_jwt({"tid": "t", "oid": "bob"})
+
+    resolve_plan(alice, "My Plan")
+    resolve_plan(bob, "My Plan")
+
+    assert token_scope(alice) == "t:alice"
+    assert mock_list.call_count == 2
+
+
+def test_invalidate_for_url_drops_stale_ids(mocker, mock_token, mock_plans):
+    """Test a 404/412 on a cached ID removes the entry"""
+    mock_list = mocker.patch("planner_lib.resolution_plans.list_user_plans", return_value=mock_plans)
+    resolve_plan(mock_token, "My Plan")
+
+    invalidate_for_url("https://graph.microsoft.com/v1.0/planner/plans/plan-id-1/buckets")
+    resolve_plan(mock_token, "My Plan")
+
+    assert mock_list.call_count == 2
+
+
+def test_no_cache_env_disables_cache(mocker, mock_token, mock_plans, monkeypatch):
+    """Test PLANNER_NO_CACHE bypasses the cache"""
+    monkeypatch.setenv("PLANNER_NO_CACHE", "1")
+    mock_list = mocker.patch("planner_lib.resolution_plans.list_user_plans", return_value=mock_plans)
+
+    resolve_plan(mock_token, "My Plan")
+    resolve_plan(mock_token, "My Plan")
+
+    assert mock_list.call_count == 2
+
+
+class TestCacheStore:
+    """Tests for the CacheStore primitive"""
+
+    def test_entries_expire(self, tmp_path, mocker):
+        """Test entries are not returned after their TTL"""
+        store = CacheStore(tmp_path / "c.json", ttl=10)
+        store.set("ns", "k", "v")
+        mocker.patch("planner_lib.cache_store.time.time", return_value=time.time() + 11)
+
+        assert store.get("ns", "k") is None
+
+    def test_lru_eviction(self, tmp_path):
+        """Test least recently used entries are evicted over max_entries"""
+        store = CacheStore(tmp_path / "c.json", max_entries=2)
+        store.set("ns", "a", 1)
+        store.set("ns", "b", 2)
+        store.get("ns", "a")
+        store.set("ns", "c", 3)
+
+        assert store.get("ns", "a") == 1
+        assert store.get("ns", "b") is None
+
+    def test_persisted_across_instances(self, tmp_path):
+        """Test values survive a new process (new store instance)"""
+        CacheStore(tmp_path / "c.json").set("ns", "k", {"id": "x"})
+
+        assert CacheStore(tmp_path / "c.json").get("ns", "k") == {"id": "x"}
+
+
+def test_cache_stats_and_clear_commands():
+    """Test `cache stats` and `cache clear` CLI commands"""
+    get_cache_store().set("plan", "s:my plan", {"id": "plan-id-1"})
+
+    stats = runner.invoke(app, ["cache", "stats"])
+    cleared = runner.invoke(app, ["cache", "clear"])
+
+    assert stats.exit_code == 0
+    assert json.loads(stats.stdout)["namespaces"] == {"plan": 1}
+    assert json.loads(cleared.stdout) == {"ok": True, "removed": 1}
+    assert get_cache_store().stats()["entries"] == 0
@@ -90,3 +90,43 @@ def test_list_user_plans(mocker, mock_token, mock_requests):
     assert plans[0]["id"] == "plan-1"
 
 
+def test_list_user_plans_dedupes_and_caches_groups(mocker, mock_token):
+    """Test shared owner groups are fetched once and then served from cache"""
+    plans = [
+        {"id": "plan-1", "title": "Plan 1", "owner": "group-1"},
+        {"id": "plan-2", "title": "Plan 2", "owner": "group-1"},
+        {"id": "plan-3", "title": "Plan 3", "owner": "group-2"}
+    ]
+    mocker.patch(
+        "planner_lib.resolution_plans.iter_values",
+        side_effect=lambda url, token: iter([dict(p) for p in plans])
+    )
+    mock_batch = mocker.patch(
+        "planner_lib.resolution_plans.batch_get_json",
+        return_value=[{"displayName": "Team A"}, {"displayName": "Team B"}]
+    )
+
+    first = list_user_plans(mock_token)
+    second = list_user_plans(mock_token)
+
+    mock_batch.assert_called_once()
+    assert mock_batch.call_args[0][0] == [
+        "/groups/group-1?$select=displayName",
+        "/groups/group-2?$select=displayName"
+    ]
+    assert [p["groupName"] for p in first] == ["Team A", "Team A", "Team B"]
+    assert [p["groupName"] for p in second] == ["Team A", "Team A", "Team B"]
+
+
+def test_resolve_plan_skips_group_names_on_match(mocker, mock_token):
+    """Test a unique title match needs no group lookups"""
+    mocker.patch(
+        "planner_lib.resolution_plans.iter_values",
+        return_value=iter([{"id": "plan-1", "title": "Plan 1", "owner": "group-1"}])
+    )
+    mock_batch = mocker.patch("planner_lib.resolution_plans.batch_get_json")
+
+    result = resolve_plan(mock_token, "Plan 1")
+
+    assert result["id"] == "plan-1"
+    mock_batch.assert_not_called()
@@ -38,7 +38,7 @@ def test_resolve_user_with_email(mock_get_json):
     )
 
 
-@patch('planner_lib.resolution_users.search.search_users_by_name')
+@patch('planner_lib.resolution_users.resolver.search_users_by_name')
 @patch('planner_lib.resolution_users.resolver.get_json')
 def test_resolve_user_not_found(mock_get_json, mock_search):
     """Test error handling when user not found"""
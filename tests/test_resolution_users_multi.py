@@ -9,6 +9,8 @@ import json
 from planner_lib.resolution_users import resolve_users
 from .test_helpers import get_test_user_id_1, get_test_user_id_2
 
+pytestmark = pytest.mark.usefixtures("no_exact_user_lookup")
+
 
 @patch('planner_lib.resolution_users.batch.resolve_user')
 def test_resolve_users_multiple_emails(mock_resolve_user):
@@ -19,7 +21,7 @@ def test_resolve_users_multiple_emails(mock_resolve_user):
     user_id1 = get_test_user_id_1()
     user_id2 = get_test_user_id_2()
 
-    mock_resolve_user.side_effect = [user_id1, user_id2]
+    mock_resolve_user.side_effect = lambda token, identifier: {email1: user_id1, email2: user_id2}[identifier]
 
     result = resolve_users(token, f"{email1},{email2}")
 
@@ -29,18 +31,18 @@ def test_resolve_users_multiple_emails(mock_resolve_user):
 
 @patch('planner_lib.resolution_users.batch.resolve_user')
 def test_resolve_users_mixed_identifiers(mock_resolve_user):
-    """Test resolving mixed emails and GUIDs"""
+    """Test resolving mixed emails and GUIDs (GUIDs need no lookup)"""
     token = "test_token"
     email = "user1@example.com"
     user_id_input = get_test_user_id_2()
     user_id_resolved = get_test_user_id_1()
 
-    mock_resolve_user.side_effect = [user_id_resolved, user_id_input]
+    mock_resolve_user.side_effect = [user_id_resolved]
 
     result = resolve_users(token, f"{email}, {user_id_input}")
 
     assert result == [user_id_resolved, user_id_input]
-    assert mock_resolve_user.call_count == 2
+    assert mock_resolve_user.call_count == 1
 
 
 @patch('planner_lib.resolution_users.batch.resolve_user')
@@ -51,10 +53,12 @@ def test_resolve_users_first_fails(mock_resolve_user):
     email2 = "user2@example.com"
 
     # First user fails, second would succeed but batch validation collects all errors
-    mock_resolve_user.side_effect = [
-        ValueError(json.dumps({"code": "UserNotFound", "message": "User not found"})),
-        "user-id-2"
-    ]
+    def side_effect(token, identifier):
+        if identifier == email1:
+            raise ValueError(json.dumps({"code": "UserNotFound", "message": "User not found"}))
+        return "user-id-2"
+
+    mock_resolve_user.side_effect = side_effect
 
     with pytest.raises(ValueError) as exc_info:
         resolve_users(token, f"{email1},{email2}")
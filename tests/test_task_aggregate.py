@@ -0,0 +1,108 @@
+"""
+Tests for cross-plan task listing
+"""
+
+import json
+import pytest
+from typer.testing import CliRunner
+
+from planner import app
+from planner_lib.task_aggregate import TaskFilter, iter_my_tasks, iter_plans_tasks
+
+runner = CliRunner()
+
+
+def task(task_id, plan_id="p1", percent=0, due=None, assignees=(), categories=()):
+    data = {
+        "id": task_id,
+        "planId": plan_id,
+        "title": f"Task {task_id}",
+        "percentComplete": percent,
+        "assignments": {user_id: {} for user_id in assignees},
+        "appliedCategories": {category: True for category in categories}
+    }
+    if due:
+        data["dueDateTime"] = f"{due}T17:00:00Z"
+    return data
+
+
+def test_task_filter_conditions():
+    """Test completion, due range, assignee and label conditions all apply"""
+    task_filter = TaskFilter(
+        incomplete_only=True, due_after="2025-01-01", due_before="2025-01-31",
+        assignee_id="u1", labels="Label1,Label3"
+    )
+
+    assert task_filter.matches(task("a", due="2025-01-31", assignees=["u1"], categories=["category1", "category3"]))
+    assert not task_filter.matches(task("b", percent=100, due="2025-01-15", assignees=["u1"], categories=["category1", "category3"]))
+    assert not task_filter.matches(task("c", due="2025-02-01", assignees=["u1"], categories=["category1", "category3"]))
+    assert not task_filter.matches(task("d", assignees=["u1"], categories=["category1", "category3"]))
+    assert not task_filter.matches(task("e", due="2025-01-15", assignees=["u2"], categories=["category1", "category3"]))
+    assert not task_filter.matches(task("f", due="2025-01-15", assignees=["u1"], categories=["category1"]))
+
+    with pytest.raises(ValueError) as exc_info:
+        TaskFilter(due_after="01/02/2025")
+    assert json.loads(str(exc_info.value))["code"] == "InvalidInput"
+
+
+def test_my_tasks_filters_before_fetching_details(mocker, mock_token):
+    """Test only tasks passing the filter have their descriptions fetched"""
+    mocker.patch("planner_lib.task_aggregate.iter_pages", return_value=iter([
+        {"value": [task("t1"), task("t2", percent=100)]},
+        {"value": [task("t3")]}
+    ]))
+    mock_attach = mocker.patch("planner_lib.task_aggregate._attach_descriptions")
+
+    tasks = list(iter_my_tasks(mock_token, task_filter=TaskFilter(incomplete_only=True)))
+
+    assert [t["id"] for t in tasks] == ["t1", "t3"]
+    assert [[t["id"] for t in call.args[0]] for call in mock_attach.call_args_list] == [["t1"], ["t3"]]
+
+
+def test_plan_fanout_merges_every_plan(mocker, mock_token):
+    """Test every plan is read and tasks from all of them are merged"""
+    pages = {
+        "p1": [{"value": [task("a1", "p1"), task("a2", "p1")]}, {"value": [task("a3", "p1")]}],
+        "p2": [{"value": [task("b1", "p2", percent=100)]}],
+        "p3": [{"value": [task("c1", "p3")]}]
+    }
+    mocker.patch(
+        "planner_lib.task_aggregate.iter_pages",
+        side_effect=lambda url, token, prefetch=False: iter(pages[url.split("/plans/")[1].split("/")[0]])
+    )
+    mocker.patch("planner_lib.task_aggregate.list_user_plans", return_value=[{"id": p} for p in pages])
+
+    tasks = list(iter_plans_tasks(
+        mock_token, task_filter=TaskFilter(incomplete_only=True), include_details=False, max_workers=2
+    ))
+
+    assert sorted(t["id"] for t in tasks) == ["a1", "a2", "a3", "c1"]
+
+
+def test_plan_fanout_raises_worker_errors(mocker, mock_token):
+    """Test an error reading one plan is raised to the consumer"""
+    def pages(url, token, prefetch=False):
+        if "/plans/bad/" in url:
+            raise RuntimeError("boom")
+        return iter([{"value": [task("a1")]}])
+
+    mocker.patch("planner_lib.task_aggregate.iter_pages", side_effect=pages)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        list(iter_plans_tasks(mock_token, plan_ids=["good", "bad"], include_details=False))
+
+
+def test_my_tasks_command_streams_ndjson(mocker):
+    """Test my-tasks writes one compact JSON task per line"""
+    mocker.patch("planner_lib.cli_task_list.load_conf", return_value={
+        "tenant_id": "test-tenant", "client_id": "test-client"
+    })
+    mocker.patch("planner_lib.cli_task_list.get_tokens", return_value="mock_token")
+    mocker.patch("planner_lib.task_aggregate.iter_pages", return_value=iter([
+        {"value": [task("t1", due="2025-03-01"), task("t2", due="2025-05-01")]}
+    ]))
+
+    result = runner.invoke(app, ["my-tasks", "--due-before", "2025-04-01", "--no-details", "--fields", "id,planId"])
+
+    assert result.exit_code == 0
+    assert [json.loads(line) for line in result.stdout.splitlines()] == [{"id": "t1", "planId": "p1"}]
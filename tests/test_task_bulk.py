@@ -0,0 +1,139 @@
+"""
+Tests for bulk task creation (add-bulk)
+"""
+
+import io
+import json
+import pytest
+from typer.testing import CliRunner
+
+from planner import app
+from planner_lib.task_bulk import read_bulk_rows, create_tasks_bulk
+
+runner = CliRunner()
+
+
+def fake_batch(status_by_method=None):
+    """Answer batched POSTs with created tasks, details GETs with an ETag and PATCHes with 200"""
+    status_by_method = status_by_method or {}
+    calls = []
+
+    def batch(sub_requests, token, max_workers=None):
+        calls.append(sub_requests)
+        results = {}
+        for r in sub_requests:
+            status = status_by_method.get(r["method"], 200 if r["method"] != "POST" else 201)
+            if r["method"] == "POST":
+                body = {"id": f"task-{r['id']}", "detailsUrl": f"url-{r['id']}", "@odata.etag": "W/\"t\""}
+            elif r["method"] == "GET":
+                body = {"@odata.etag": "W/\"d\""}
+            else:
+                body = {"@odata.etag": "W/\"d2\""}
+            if status >= 400:
+                body = {"error": {"message": "Forbidden"}}
+            results[r["id"]] = {"status": status, "headers": {}, "body": body}
+        return results
+
+    return batch, calls
+
+
+def test_read_bulk_rows_csv_and_jsonl():
+    """Test both formats normalize column names and drop blanks"""
+    csv_rows = read_bulk_rows(io.StringIO("Title,Description,Due,Extra\nA,first,,x\nB,,2024-12-31,\n"), "csv")
+    jsonl_rows = read_bulk_rows(io.StringIO('{"title": "A", "desc": "first"}\n\n{"title": "B"}\n'), "jsonl")
+
+    assert csv_rows == [{"title": "A", "desc": "first"}, {"title": "B", "due": "2024-12-31"}]
+    assert jsonl_rows == [{"title": "A", "desc": "first"}, {"title": "B"}]
+
+
+def test_read_bulk_rows_requires_title():
+    """Test a row without a title is rejected before anything is created"""
+    with pytest.raises(ValueError) as exc_info:
+        read_bulk_rows(io.StringIO('{"title": "A"}\n{"desc": "no title"}\n'), "jsonl")
+
+    error = json.loads(str(exc_info.value))
+    assert error["code"] == "InvalidInput"
+    assert "Row 2" in error["message"]
+
+
+def test_create_tasks_bulk_resolves_once_and_batches(mocker, mock_token):
+    """Test distinct names are resolved once (emails by one $filter query) and writes go through $batch"""
+    mock_plan = mocker.patch("planner_lib.task_bulk.resolve_plan", return_value={"id": "plan-1"})
+    mock_bucket = mocker.patch("planner_lib.task_bulk.resolve_bucket", return_value={"id": "bucket-1"})
+    mock_lookup = mocker.patch("planner_lib.resolution_users.batch.iter_values", return_value=[
+        {"id": "id-a@x.com", "userPrincipalName": "a@x.com"},
+        {"id": "id-b@x.com", "userPrincipalName": "B@x.com"}
+    ])
+    mock_user = mocker.patch("planner_lib.resolution_users.batch.resolve_user")
+    batch, calls = fake_batch()
+    mocker.patch("planner_lib.task_bulk.batch_requests", side_effect=batch)
+    rows = [
+        {"title": "A", "assignee": "a@x.com", "desc": "first"},
+        {"title": "B", "assignee": "a@x.com,b@x.com", "labels": "Label1"},
+        {"title": "C"}
+    ]
+
+    results = list(create_tasks_bulk(mock_token, rows, default_plan="My Plan", default_bucket="To Do"))
+
+    assert [r["row"] for r in results] == [1, 2, 3]
+    assert all(r["ok"] for r in results)
+    assert results[0]["taskId"] == "task-0"
+    mock_plan.assert_called_once()
+    mock_bucket.assert_called_once()
+    assert mock_lookup.call_count == 1
+    mock_user.assert_not_called()
+
+    posts, detail_reads, detail_writes = calls
+    assert [p["method"] for p in posts] == ["POST"] * 3
+    assert posts[1]["body"]["assignments"].keys() == {"id-a@x.com", "id-b@x.com"}
+    assert posts[1]["body"]["appliedCategories"] == {"category1": True}
+    assert [r["url"] for r in detail_reads] == ["/planner/tasks/task-0/details"]
+    assert detail_writes[0]["headers"]["If-Match"] == "W/\"d\""
+    assert detail_writes[0]["body"] == {"description": "first"}
+
+
+def test_create_tasks_bulk_reports_row_errors(mocker, mock_token):
+    """Test failures are reported per row without stopping other rows"""
+    mocker.patch("planner_lib.task_bulk.resolve_plan", return_value={"id": "plan-1"})
+    mocker.patch("planner_lib.task_bulk.resolve_bucket", side_effect=[
+        {"id": "bucket-1"},
+        ValueError(json.dumps({"code": "NotFound", "message": "Bucket 'Nope' not found"}))
+    ])
+    batch, _ = fake_batch({"PATCH": 403})
+    mocker.patch("planner_lib.task_bulk.batch_requests", side_effect=batch)
+    rows = [
+        {"title": "A", "desc": "first"},
+        {"title": "B", "bucket": "Nope"},
+        {"title": "C"}
+    ]
+
+    results = list(create_tasks_bulk(mock_token, rows, default_plan="My Plan", default_bucket="To Do"))
+
+    assert results[0]["ok"] is False
+    assert results[0]["taskId"] == "task-0"
+    assert results[0]["error"]["code"] == "DescriptionFailed"
+    assert results[1] == {"row": 2, "ok": False, "title": "B", "error": {"code": "NotFound", "message": "Bucket 'Nope' not found"}}
+    assert results[2]["ok"] is True
+
+
+def test_add_bulk_command_streams_results(mocker, tmp_path):
+    """Test add-bulk prints one JSON line per row"""
+    tasks_file = tmp_path / "tasks.csv"
+    tasks_file.write_text("title,desc\nA,first\nB,\n")
+    mocker.patch("planner_lib.cli_task_bulk.load_conf", return_value={
+        "tenant_id": "test-tenant", "client_id": "test-client",
+        "default_plan": "My Plan", "default_bucket": "To Do"
+    })
+    mocker.patch("planner_lib.cli_task_bulk.get_tokens", return_value="mock_token")
+    mock_create = mocker.patch("planner_lib.cli_task_bulk.create_tasks_bulk", return_value=iter([
+        {"row": 1, "ok": True, "taskId": "t1"},
+        {"row": 2, "ok": True, "taskId": "t2"}
+    ]))
+
+    result = runner.invoke(app, ["add-bulk", "--file", str(tasks_file)])
+
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.stdout.strip().split("\n")]
+    assert [line["taskId"] for line in lines] == ["t1", "t2"]
+    assert mock_create.call_args[0][1] == [{"title": "A", "desc": "first"}, {"title": "B"}]
+    assert mock_create.call_args[1]["default_plan"] == "My Plan"
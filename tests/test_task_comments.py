@@ -0,0 +1,109 @@
+"""
+Tests for comment operations and the cached plan-group / thread lookups
+"""
+
+import json
+import pytest
+from unittest.mock import Mock
+from typer.testing import CliRunner
+
+from planner import app
+from planner_lib.resolution_cache import cache_plan_groups, cache_thread, get_cached_plan_group, get_cached_thread
+from planner_lib.task_comments import add_task_comment, get_task_comments
+
+POSTS_URL = "https://graph.microsoft.com/v1.0/groups/g1/threads/th1/posts"
+PLAN_ID = "plan-id-0000000000000001"
+TASK_ID = "task-id-0000000000000001"
+
+
+def post(post_id, content):
+    return {"id": post_id, "body": {"content": content}, "createdDateTime": "2025-01-01T00:00:00Z"}
+
+
+def test_cache_miss_reads_task_and_plan_and_caches_ids(mocker, mock_token):
+    """Test a first read fetches task and plan, and a second read is a single request"""
+    responses = {
+        "https://graph.microsoft.com/v1.0/planner/tasks/t1": {"id": "t1", "conversationThreadId": "th1"},
+        "https://graph.microsoft.com/v1.0/planner/plans/p1": {"id": "p1", "owner": "g1"}
+    }
+    mock_get = mocker.patch("planner_lib.task_comments.get_json", side_effect=lambda url, token: responses[url])
+    mock_pages = mocker.patch(
+        "planner_lib.task_comments.iter_pages",
+        side_effect=lambda url, token: iter([{"value": [post("c1", "Hi")]}])
+    )
+
+    first = get_task_comments("t1", "p1", mock_token)
+    second = get_task_comments("t1", "p1", mock_token)
+
+    assert [c["id"] for c in first] == [c["id"] for c in second] == ["c1"]
+    assert sorted(call.args[0] for call in mock_get.call_args_list) == sorted(responses)
+    assert [call.args[0] for call in mock_pages.call_args_list] == [POSTS_URL, POSTS_URL]
+    assert get_cached_plan_group(mock_token, "p1") == "g1"
+    assert get_cached_thread(mock_token, "t1") == "th1"
+
+
+def test_known_ids_add_comment_with_one_request(mocker, mock_token):
+    """Test passing group and thread IDs skips the task and plan lookups"""
+    mock_get = mocker.patch("planner_lib.task_comments.get_json")
+    mock_post = mocker.patch("planner_lib.task_comments.post_json", return_value={"id": "c9"})
+
+    result = add_task_comment("t1", "p1", "Looks good", mock_token, group_id="g1", thread_id="th1")
+
+    assert result == {"ok": True, "taskId": "t1", "commentId": "c9"}
+    mock_get.assert_not_called()
+    assert mock_post.call_args[0][0] == "https://graph.microsoft.com/v1.0/groups/g1/threads/th1/reply"
+
+
+def test_stale_cached_thread_is_looked_up_again(mocker, mock_token):
+    """Test a 404 under cached IDs drops them and retries with a fresh lookup"""
+    cache_plan_groups(mock_token, {"p1": "g1"})
+    cache_thread(mock_token, "t1", "old-thread")
+    mocker.patch("planner_lib.task_comments.get_json", side_effect=lambda url, token: (
+        {"id": "t1", "conversationThreadId": "th1"} if "/tasks/" in url else {"id": "p1", "owner": "g1"}
+    ))
+    mock_post = mocker.patch("planner_lib.task_comments.post_json", side_effect=[
+        Exception("404 Client Error: Not Found"), {"id": "c9"}
+    ])
+
+    result = add_task_comment("t1", "p1", "Looks good", mock_token)
+
+    assert result["commentId"] == "c9"
+    assert "/threads/th1/reply" in mock_post.call_args_list[1][0][0]
+    assert get_cached_thread(mock_token, "t1") == "th1"
+
+
+def test_task_error_precedes_plan_error(mocker, mock_token):
+    """Test the task error is reported when both concurrent lookups fail"""
+    mocker.patch("planner_lib.task_comments.get_json", side_effect=Exception("404 Not Found"))
+
+    with pytest.raises(ValueError) as exc_info:
+        add_task_comment("t1", "p1", "Looks good", mock_token)
+
+    assert json.loads(str(exc_info.value))["code"] == "TaskNotFound"
+
+
+@pytest.mark.parametrize("args, expected", [
+    (["list-comments-cmd"], ("get", POSTS_URL)),
+    (["add-comment-cmd", "--comment", "Looks good"], ("post", POSTS_URL.replace("/posts", "/reply"))),
+])
+def test_warm_comment_commands_make_one_http_call(mocker, args, expected):
+    """Test task and plan IDs with cached group/thread cost a single Graph request"""
+    mocker.patch("planner_lib.cli_task_comments.load_conf", return_value={
+        "tenant_id": "test-tenant", "client_id": "test-client"
+    })
+    mocker.patch("planner_lib.cli_task_comments.get_tokens", return_value="mock_token")
+    cache_plan_groups("mock_token", {PLAN_ID: "g1"})
+    cache_thread("mock_token", TASK_ID, "th1")
+    sent = []
+
+    def send(method, url, token, headers, payload=None):
+        sent.append((method, url))
+        body = {"value": [post("c1", "Hi")]} if method == "get" else {"id": "c2"}
+        return Mock(status_code=200, content=b"{}", json=Mock(return_value=body))
+
+    mocker.patch("planner_lib.graph_client._send", side_effect=send)
+
+    result = CliRunner().invoke(app, [*args, "--task", TASK_ID, "--plan", PLAN_ID])
+
+    assert result.exit_code == 0, result.stdout
+    assert sent == [expected]
@@ -6,6 +6,26 @@ import pytest
 from planner_lib.task_operations import list_tasks
 
 
+def make_batch_get_json(failing_ids=()):
+    """Build a batch_get_json stub that serves per-task details"""
+    def fake_batch_get_json(urls, token, max_workers=None):
+        bodies = []
+        for url in urls:
+            task_id = url.split("/")[-2]
+            bodies.append(None if task_id in failing_ids else {"description": f"Description of {task_id}"})
+        return bodies
+    return fake_batch_get_json
+
+
+@pytest.fixture
+def mock_batch(mocker):
+    """Patch the $batch details fetch used by list_tasks"""
+    return mocker.patch(
+        "planner_lib.task_operations.batch_get_json",
+        side_effect=make_batch_get_json()
+    )
+
+
 @pytest.fixture
 def mock_tasks():
     """Return mock tasks data"""
@@ -37,37 +57,108 @@ def mock_tasks():
 class TestListTasks:
     """Tests for list_tasks function"""
 
-    def test_list_tasks_by_plan(self, mock_token, mock_tasks, mocker):
+    def test_list_tasks_by_plan(self, mock_token, mock_tasks, mock_batch, mocker):
         """Test listing tasks by plan ID"""
-        mock_get = mocker.patch("planner_lib.task_operations.get_json")
-        mock_get.return_value = {"value": mock_tasks}
+        mock_get = mocker.patch("planner_lib.task_operations.iter_pages")
+        mock_get.return_value = iter([{"value": mock_tasks}])
 
         result = list_tasks(mock_token, plan_id="plan-id-1")
 
         assert len(result) == 3
         assert result[0]["title"] == "Task One"
         mock_get.assert_called_once()
+        # Details for all tasks go through a single batch call
+        mock_batch.assert_called_once()
+        assert len(mock_batch.call_args[0][0]) == 3
 
-    def test_list_tasks_by_bucket(self, mock_token, mock_tasks, mocker):
+    def test_list_tasks_by_bucket(self, mock_token, mock_tasks, mock_batch, mocker):
         """Test listing tasks by bucket ID"""
-        mock_get = mocker.patch("planner_lib.task_operations.get_json")
-        mock_get.return_value = {"value": mock_tasks}
+        mock_get = mocker.patch("planner_lib.task_operations.iter_pages")
+        mock_get.return_value = iter([{"value": mock_tasks}])
 
         result = list_tasks(mock_token, bucket_id="bucket-id-1")
 
         assert len(result) == 3
         mock_get.assert_called_once()
+        assert mock_get.call_args[0][0].endswith("/planner/buckets/bucket-id-1/tasks")
+
+    def test_list_tasks_follows_all_pages(self, mock_token, mock_tasks, mock_batch, mocker):
+        """Test tasks from every page are returned and enriched page by page"""
+        mock_pages = mocker.patch("planner_lib.task_operations.iter_pages")
+        mock_pages.return_value = iter([{"value": mock_tasks[:2]}, {"value": mock_tasks[2:]}])
 
-    def test_list_tasks_incomplete_only(self, mock_token, mock_tasks, mocker):
+        result = list_tasks(mock_token, plan_id="plan-id-1")
+
+        assert [t["id"] for t in result] == ["task-id-1", "task-id-2", "task-id-3"]
+        assert mock_batch.call_count == 2
+
+    def test_list_tasks_incomplete_only(self, mock_token, mock_tasks, mock_batch, mocker):
         """Test filtering incomplete tasks"""
-        mock_get = mocker.patch("planner_lib.task_operations.get_json")
-        mock_get.return_value = {"value": mock_tasks}
+        mock_get = mocker.patch("planner_lib.task_operations.iter_pages")
+        mock_get.return_value = iter([{"value": mock_tasks}])
 
         result = list_tasks(mock_token, plan_id="plan-id-1", incomplete_only=True)
 
         assert len(result) == 2
         assert all(t["percentComplete"] < 100 for t in result)
 
+    def test_list_tasks_descriptions_attached_in_order(self, mock_token, mock_tasks, mock_batch, mocker):
+        """Test batched descriptions are attached to the matching tasks"""
+        mock_get = mocker.patch("planner_lib.task_operations.iter_pages")
+        mock_get.return_value = iter([{"value": mock_tasks}])
+
+        result = list_tasks(mock_token, plan_id="plan-id-1", max_workers=3)
+
+        assert [t["description"] for t in result] == [
+            "Description of task-id-1",
+            "Description of task-id-2",
+            "Description of task-id-3",
+        ]
+        assert mock_batch.call_args[1]["max_workers"] == 3
+
+    def test_list_tasks_details_failure_sets_empty_description(self, mock_token, mock_tasks, mocker):
+        """Test a failing details call does not fail the whole listing"""
+        mock_get = mocker.patch("planner_lib.task_operations.iter_pages")
+        mock_get.return_value = iter([{"value": mock_tasks}])
+        mocker.patch(
+            "planner_lib.task_operations.batch_get_json",
+            side_effect=make_batch_get_json(failing_ids={"task-id-2"})
+        )
+
+        result = list_tasks(mock_token, plan_id="plan-id-1")
+
+        assert result[1]["description"] == ""
+        assert result[2]["description"] == "Description of task-id-3"
+
+    def test_list_tasks_without_details_skips_batch(self, mock_token, mock_tasks, mock_batch, mocker):
+        """Test include_details=False lists tasks with a single call"""
+        mocker.patch("planner_lib.task_operations.iter_pages", return_value=iter([{"value": mock_tasks}]))
+
+        result = list_tasks(mock_token, plan_id="plan-id-1", include_details=False)
+
+        assert len(result) == 3
+        assert "description" not in result[0]
+        mock_batch.assert_not_called()
+
+    def test_list_tasks_field_projection(self, mock_token, mock_tasks, mock_batch, mocker):
+        """Test fields projection keeps only requested keys and skips details"""
+        mocker.patch("planner_lib.task_operations.iter_pages", return_value=iter([{"value": mock_tasks}]))
+
+        result = list_tasks(mock_token, plan_id="plan-id-1", fields=["id", "title"])
+
+        assert result[0] == {"id": "task-id-1", "title": "Task One"}
+        mock_batch.assert_not_called()
+
+    def test_list_tasks_field_projection_with_description(self, mock_token, mock_tasks, mock_batch, mocker):
+        """Test details are fetched when description is a requested field"""
+        mocker.patch("planner_lib.task_operations.iter_pages", return_value=iter([{"value": mock_tasks}]))
+
+        result = list_tasks(mock_token, plan_id="plan-id-1", incomplete_only=True, fields=["id", "description"])
+
+        assert result[0] == {"id": "task-id-1", "description": "Description of task-id-1"}
+        # Only the two incomplete tasks are enriched
+        assert len(mock_batch.call_args[0][0]) == 2
+
     def test_list_tasks_no_params_raises_error(self, mock_token):
         """Test that missing plan_id and bucket_id raises error"""
         with pytest.raises(ValueError, match="plan_id or bucket_id required"):
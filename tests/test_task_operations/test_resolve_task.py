@@ -54,6 +54,27 @@ class TestResolveTask:
         assert result["title"] == "Task One"
         assert result["id"] == "task-id-1"
 
+    def test_resolve_task_by_title_skips_details(self, mock_token, mock_tasks, mocker):
+        """Test title resolution lists the plan without fetching details"""
+        mock_list = mocker.patch("planner_lib.task_operations.list_tasks")
+        mock_list.return_value = mock_tasks
+
+        resolve_task(mock_token, "Task One", plan_id="plan-id-1")
+
+        mock_list.assert_called_once_with(mock_token, plan_id="plan-id-1", include_details=False)
+
+    def test_resolve_task_by_title_with_details(self, mock_token, mock_tasks, mocker):
+        """Test include_details fetches the description for the match only"""
+        mocker.patch("planner_lib.task_operations.list_tasks", return_value=mock_tasks)
+        mock_get = mocker.patch("planner_lib.task_operations.get_json")
+        mock_get.return_value = {"description": "Details"}
+
+        result = resolve_task(mock_token, "Task One", plan_id="plan-id-1", include_details=True)
+
+        assert result["description"] == "Details"
+        mock_get.assert_called_once()
+        assert mock_get.call_args[0][0].endswith(f"/planner/tasks/{result['id']}/details")
+
     def test_resolve_task_by_title_case_insensitive(self, mock_token, mock_tasks, mocker):
         """Test case-insensitive title matching"""
         mock_list = mocker.patch("planner_lib.task_operations.list_tasks")
@@ -0,0 +1,96 @@
+"""
+Tests for trigram task search
+"""
+
+import json
+from typer.testing import CliRunner
+
+from planner import app
+from planner_lib.local_store import get_local_store
+from planner_lib.search_index import normalize, trigrams
+from planner_lib.task_search import search_tasks
+
+runner = CliRunner()
+
+PLAN_ID = "plan-id-1234567890abcdef"
+
+
+def task(task_id, title, etag="e1"):
+    return {"id": task_id, "title": title, "bucketId": "b1", "percentComplete": 0, "@odata.etag": etag}
+
+
+def seed_store():
+    store = get_local_store()
+    store.save_plan(
+        {"id": PLAN_ID, "title": "My Plan"},
+        [],
+        [
+            task("t1", "Quarterly report"),
+            task("t2", "Write quarterly report draft"),
+            task("t3", "Deploy server"),
+            task("t4", "Team offsite")
+        ],
+        {
+            "t3": {"description": "Roll out after the report is signed off", "checklist": {}},
+            "t4": {"description": "", "checklist": {"c1": {"title": "Book venue", "isChecked": False}}}
+        }
+    )
+    return store
+
+
+def test_normalize_and_trigrams():
+    """Test accents, case and punctuation are folded and short words are padded"""
+    assert normalize("  Café-Déploy  ") == "cafe deploy"
+    assert trigrams("Go") == {" go", "go "}
+
+
+def test_search_ranks_titles_and_tolerates_typos():
+    """Test exact titles rank first and misspelled words still match"""
+    store = seed_store()
+
+    results = store.search_tasks(PLAN_ID, "quarterly report")
+    assert [r["id"] for r in results][:2] == ["t1", "t2"]
+    assert results[0]["score"] > results[1]["score"]
+
+    assert store.search_tasks(PLAN_ID, "quartrly")[0]["id"] in ("t1", "t2")
+    assert store.search_tasks(PLAN_ID, "venue") == [{
+        "id": "t4", "title": "Team offsite", "bucketId": "b1", "percentComplete": 0,
+        "score": 1.5, "matchedIn": ["checklist"]
+    }]
+    assert "description" in next(r for r in store.search_tasks(PLAN_ID, "report") if r["id"] == "t3")["matchedIn"]
+    assert store.search_tasks(PLAN_ID, "zzzz") == []
+
+
+def test_index_follows_etags_and_removals():
+    """Test changed tasks are re-indexed and removed tasks leave the index"""
+    store = seed_store()
+    store.save_plan({"id": PLAN_ID, "title": "My Plan"}, [], [task("t1", "Annual summary", etag="e2")], {})
+
+    assert store.search_tasks(PLAN_ID, "annual")[0]["id"] == "t1"
+    assert store.search_tasks(PLAN_ID, "quarterly") == []
+    assert store.search_tasks(PLAN_ID, "deploy") == []
+
+
+def test_search_tasks_syncs_unless_cached(mocker, mock_token):
+    """Test the live path syncs the plan first and the cached path does not"""
+    seed_store()
+    mock_sync = mocker.patch("planner_lib.task_search.sync_plan")
+
+    assert search_tasks(mock_token, PLAN_ID, "deploy")[0]["id"] == "t3"
+    mock_sync.assert_called_once()
+
+    mock_sync.reset_mock()
+    search_tasks(None, PLAN_ID, "deploy", cached=True)
+    mock_sync.assert_not_called()
+
+
+def test_search_tasks_command_cached(mocker):
+    """Test search-tasks --cached answers from the store without authenticating"""
+    seed_store()
+    mock_tokens = mocker.patch("planner_lib.cli_task_list.get_tokens")
+
+    result = runner.invoke(app, ["search-tasks", "--query", "draft", "--plan", "My Plan", "--cached", "--limit", "1"])
+
+    assert result.exit_code == 0
+    assert [r["id"] for r in json.loads(result.stdout)] == ["t2"]
+    mock_tokens.assert_not_called()
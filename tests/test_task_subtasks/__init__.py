@@ -3,7 +3,9 @@ Task subtasks tests module
 """
 
 from .test_add_subtask import TestAddSubtask
+from .test_add_subtasks import TestAddSubtasks
 from .test_list_subtasks import TestListSubtasks
 from .test_complete_subtask import TestCompleteSubtask
+from .test_checklist_snapshot import TestChecklistSnapshot
 
-__all__ = ["TestAddSubtask", "TestListSubtasks", "TestCompleteSubtask"]
+__all__ = ["TestAddSubtask", "TestAddSubtasks", "TestListSubtasks", "TestCompleteSubtask", "TestChecklistSnapshot"]
@@ -0,0 +1,84 @@
+"""
+Tests for adding several subtasks in one checklist update
+"""
+
+import json
+import pytest
+import requests
+from unittest.mock import Mock
+from typer.testing import CliRunner
+
+from planner import app
+from planner_lib.task_subtasks import add_subtasks
+from .fixtures import mock_task_details
+
+runner = CliRunner()
+
+
+class TestAddSubtasks:
+    """Tests for add_subtasks function and multi-title add-subtask-cmd"""
+
+    def test_add_subtasks_single_patch(self, mock_token, mock_task_details, mocker):
+        """Test all titles are written with one GET and one PATCH, in order"""
+        mock_get = mocker.patch("planner_lib.task_subtask_add.get_json", return_value=mock_task_details)
+        mock_patch = mocker.patch("planner_lib.task_subtask_add.patch_json", return_value={})
+        mocker.patch("uuid.uuid4", side_effect=["id-a", "id-b", "id-c"])
+
+        result = add_subtasks("task-id-123", ["One", "Two", "Three"], mock_token)
+
+        assert result == {"ok": True, "subtaskIds": ["id-a", "id-b", "id-c"]}
+        assert mock_get.call_count == 1
+        checklist = mock_patch.call_args[0][2]["checklist"]
+        assert [checklist[i]["title"] for i in ("id-a", "id-b", "id-c")] == ["One", "Two", "Three"]
+        assert set(checklist) == {"id-a", "id-b", "id-c"}
+
+    def test_add_subtasks_conflict_merges_fresh_checklist(self, mock_token, mock_task_details, mocker):
+        """Test a 412 re-reads the checklist and resends the same new items against it"""
+        fresh = {**mock_task_details, "@odata.etag": "W/\"new_etag\"", "checklist": {
+            **mock_task_details["checklist"],
+            "concurrent-id": {"title": "Added elsewhere", "isChecked": False}
+        }}
+        mocker.patch("planner_lib.task_subtask_add.get_json", side_effect=[mock_task_details, fresh])
+        http_error = requests.HTTPError()
+        http_error.response = Mock(status_code=412)
+        mock_patch = mocker.patch("planner_lib.task_subtask_add.patch_json", side_effect=[http_error, {}])
+        mocker.patch("uuid.uuid4", side_effect=["id-a", "id-b"])
+
+        result = add_subtasks("task-id-123", ["One", "Two"], mock_token)
+
+        assert result["subtaskIds"] == ["id-a", "id-b"]
+        retry_payload = mock_patch.call_args_list[1][0]
+        assert retry_payload[3] == "W/\"new_etag\""
+        assert set(retry_payload[2]["checklist"]) == {"id-a", "id-b"}
+        hints = [retry_payload[2]["checklist"][i]["orderHint"] for i in ("id-a", "id-b")]
+        assert max(item.get("orderHint") or "" for item in fresh["checklist"].values()) < hints[0] < hints[1]
+
+    def test_add_subtasks_rejects_checklist_over_limit(self, mock_token, mock_task_details, mocker):
+        """Test no PATCH is sent when the checklist would exceed 20 items"""
+        mocker.patch("planner_lib.task_subtask_add.get_json", return_value=mock_task_details)
+        mock_patch = mocker.patch("planner_lib.task_subtask_add.patch_json")
+
+        with pytest.raises(ValueError) as exc_info:
+            add_subtasks("task-id-123", [f"Step {n}" for n in range(19)], mock_token)
+
+        assert json.loads(str(exc_info.value))["code"] == "ChecklistLimit"
+        mock_patch.assert_not_called()
+
+    def test_cli_collects_repeated_newline_and_file_titles(self, tmp_path, mocker):
+        """Test add-subtask-cmd gathers every title source into one add_subtasks call"""
+        mocker.patch("planner_lib.cli_task_subtask.load_conf", return_value={
+            "tenant_id": "test-tenant", "client_id": "test-client"
+        })
+        mocker.patch("planner_lib.cli_task_subtask.get_tokens", return_value="mock_token")
+        mocker.patch("planner_lib.cli_task_subtask.resolve_task", return_value={"id": "task-id-123"})
+        mock_add = mocker.patch("planner_lib.cli_task_subtask.add_subtasks", return_value={"ok": True, "subtaskIds": []})
+        titles_file = tmp_path / "titles.txt"
+        titles_file.write_text("Four\n\nFive\n")
+
+        result = runner.invoke(app, [
+            "add-subtask-cmd", "--task", "12345678-1234-1234-1234-123456789012",
+            "--subtask", "One", "--subtask", "Two\nThree", "--file", str(titles_file)
+        ])
+
+        assert result.exit_code == 0
+        assert mock_add.call_args[0][1] == ["One", "Two", "Three", "Four", "Five"]
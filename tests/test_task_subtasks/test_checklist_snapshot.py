@@ -0,0 +1,65 @@
+"""
+Tests for delta checklist writes and the in-process checklist snapshot
+"""
+
+from planner_lib.checklist_cache import get_checklist, remember_checklist
+from planner_lib.etag_cache import remember_etag
+from planner_lib.task_subtasks import add_subtask, complete_subtask
+from .fixtures import mock_task_details
+
+URL = "https://graph.microsoft.com/v1.0/planner/tasks/task-id-123/details"
+
+
+def patched_details(details, etag, **items):
+    """Details as returned by a PATCH with Prefer: return=representation"""
+    return {**details, "@odata.etag": etag, "checklist": {**details["checklist"], **items}}
+
+
+class TestChecklistSnapshot:
+    """Tests for subtask writes served from the checklist snapshot"""
+
+    def test_repeat_operations_skip_pre_read(self, mock_token, mock_task_details, mocker):
+        """Test add then complete reads details once and sends only the changed item"""
+        new_item = {"title": "Ship", "isChecked": False, "orderHint": "8585"}
+        mock_get = mocker.patch("planner_lib.task_subtask_add.get_json", return_value=mock_task_details)
+        mocker.patch("planner_lib.task_subtask_add.patch_json",
+                     return_value=patched_details(mock_task_details, "W/\"e2\"", **{"new-id": new_item}))
+        mock_complete_get = mocker.patch("planner_lib.task_subtask_complete.get_json")
+        mock_complete_patch = mocker.patch("planner_lib.task_subtask_complete.patch_json",
+                                           return_value=patched_details(mock_task_details, "W/\"e3\""))
+        mocker.patch("uuid.uuid4", return_value="new-id")
+
+        add_subtask("task-id-123", "Ship", mock_token)
+        result = complete_subtask("task-id-123", "ship", mock_token)
+
+        assert result == {"ok": True, "subtaskId": "new-id"}
+        assert mock_get.call_count == 1
+        mock_complete_get.assert_not_called()
+        args = mock_complete_patch.call_args[0]
+        assert args[2] == {"checklist": {"new-id": {"@odata.type": "#microsoft.graph.plannerChecklistItem", "isChecked": True}}}
+        assert args[3] == "W/\"e2\""
+        assert get_checklist(URL)[0] == "W/\"e3\""
+
+    def test_snapshot_dropped_when_details_etag_changes(self, mock_task_details):
+        """Test a snapshot is not served once another write changed the details ETag"""
+        remember_checklist(URL, mock_task_details)
+        assert get_checklist(URL)[0] == mock_task_details["@odata.etag"]
+
+        remember_etag(URL, "W/\"changed\"")
+
+        assert get_checklist(URL) is None
+
+    def test_complete_rereads_when_title_missing_from_snapshot(self, mock_token, mock_task_details, mocker):
+        """Test an item added elsewhere since the snapshot is found with a fresh read"""
+        remember_checklist(URL, mock_task_details)
+        fresh = patched_details(mock_task_details, "W/\"e2\"", **{"other-id": {"title": "Added elsewhere"}})
+        mock_get = mocker.patch("planner_lib.task_subtask_complete.get_json", return_value=fresh)
+        mock_patch = mocker.patch("planner_lib.task_subtask_complete.patch_json", return_value={})
+
+        result = complete_subtask("task-id-123", "Added elsewhere", mock_token)
+
+        assert result["subtaskId"] == "other-id"
+        assert mock_get.call_count == 1
+        assert mock_patch.call_args[0][3] == "W/\"e2\""
+        # 204 response: the new ETag is unknown, so the snapshot is dropped
+        assert get_checklist(URL) is None
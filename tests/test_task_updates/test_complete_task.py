@@ -54,3 +54,31 @@ class TestCompleteTask:
         assert result["percentComplete"] == 100
         assert mock_get.call_count == 2
         assert mock_patch.call_count == 2
+
+    def test_complete_task_known_etag_skips_get(self, mock_token, mocker):
+        """Test a caller-supplied ETag avoids the pre-read GET"""
+        mock_get = mocker.patch("planner_lib.task_complete.get_json")
+        mock_patch = mocker.patch("planner_lib.task_complete.patch_json")
+        mock_patch.return_value = {"percentComplete": 100, "@odata.etag": "W/\"def456\""}
+
+        result = complete_task_op("task-id-123", mock_token, etag="W/\"abc123\"")
+
+        assert result["percentComplete"] == 100
+        mock_get.assert_not_called()
+        assert mock_patch.call_args[0][3] == "W/\"abc123\""
+        assert mock_patch.call_args[1]["return_representation"] is True
+
+    def test_complete_task_uses_etag_from_listing(self, mock_token, mocker):
+        """Test an ETag seen while listing tasks is reused"""
+        from planner_lib.etag_cache import remember_etags
+
+        remember_etags("https://graph.microsoft.com/v1.0/planner/tasks", [
+            {"id": "task-id-123", "@odata.etag": "W/\"listed\""}
+        ])
+        mock_get = mocker.patch("planner_lib.task_complete.get_json")
+        mock_patch = mocker.patch("planner_lib.task_complete.patch_json", return_value={})
+
+        complete_task_op("task-id-123", mock_token)
+
+        mock_get.assert_not_called()
+        assert mock_patch.call_args[0][3] == "W/\"listed\""
@@ -29,7 +29,7 @@ class TestDeleteTask:
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
 
-        mock_delete = mocker.patch("requests.delete")
+        mock_delete = mocker.patch("requests.Session.delete")
         mock_delete.return_value = mock_response
 
         result = delete_task_op("task-id-123", mock_token)
@@ -46,7 +46,7 @@ class TestDeleteTask:
         mock_response = Mock()
         mock_response.raise_for_status.return_value = None
 
-        mock_delete = mocker.patch("requests.delete")
+        mock_delete = mocker.patch("requests.Session.delete")
         mock_delete.return_value = mock_response
 
         delete_task_op("task-id-123", mock_token)
@@ -56,3 +56,18 @@ class TestDeleteTask:
         headers = call_args[1]["headers"]
         assert "If-Match" in headers
         assert headers["If-Match"] == "W/\"abc123\""
+
+    def test_delete_task_stale_etag_refetches(self, mock_token, mock_task_with_etag, mocker):
+        """Test a 412 on a known ETag triggers one GET and a retried DELETE"""
+        import requests
+
+        mock_get = mocker.patch("planner_lib.task_delete.get_json", return_value=mock_task_with_etag)
+        conflict = requests.HTTPError()
+        conflict.response = Mock(status_code=412)
+        mock_delete = mocker.patch("planner_lib.task_delete.delete_json", side_effect=[conflict, {}])
+
+        result = delete_task_op("task-id-123", mock_token, etag="W/\"stale\"")
+
+        assert result["ok"] is True
+        mock_get.assert_called_once()
+        assert mock_delete.call_args_list[1][0][2] == "W/\"abc123\""
@@ -8,6 +8,8 @@ from unittest.mock import patch
 from planner_lib.resolution_users import resolve_users
 from .test_user_search_helpers import parse_error, assert_batch_error
 
+pytestmark = pytest.mark.usefixtures("no_exact_user_lookup")
+
 
 class TestResolveUsers:
     """Test batch user resolution"""
@@ -15,7 +17,7 @@ class TestResolveUsers:
     @patch('planner_lib.resolution_users.batch.resolve_user')
     def test_resolve_multiple_users(self, mock_resolve):
         """Test resolving comma-separated users"""
-        mock_resolve.side_effect = ["user-id-1", "user-id-2", "user-id-3"]
+        mock_resolve.side_effect = lambda token, identifier: identifier.replace("user", "user-id-").split("@")[0]
 
         result = resolve_users("fake-token", "user1@company.com,user2@company.com,user3@company.com")
 
@@ -26,17 +28,16 @@ class TestResolveUsers:
     @patch('planner_lib.resolution_users.batch.resolve_user')
     def test_resolve_mixed_identifiers(self, mock_resolve):
         """Test resolving mix of emails and names"""
-        mock_resolve.side_effect = ["user-id-1", "user-id-2"]
+        mock_resolve.side_effect = lambda token, identifier: {"user1@company.com": "user-id-1", "Iman": "user-id-2"}[identifier]
 
         result = resolve_users("fake-token", "user1@company.com,Iman")
 
-        assert len(result) == 2
+        assert result == ["user-id-1", "user-id-2"]
         assert mock_resolve.call_count == 2
 
-        # Check that both identifiers were passed
+        # Check that both identifiers were passed (resolved concurrently, in any order)
         calls = mock_resolve.call_args_list
-        assert calls[0][0][1] == "user1@company.com"
-        assert calls[1][0][1] == "Iman"
+        assert sorted(call[0][1] for call in calls) == ["Iman", "user1@company.com"]
 
     def test_resolve_empty_string(self):
         """Test empty string returns empty list"""
@@ -53,7 +54,7 @@ class TestResolveUsers:
     @patch('planner_lib.resolution_users.batch.resolve_user')
     def test_resolve_strips_whitespace(self, mock_resolve):
         """Test that whitespace is properly stripped"""
-        mock_resolve.side_effect = ["user-id-1", "user-id-2"]
+        mock_resolve.side_effect = lambda token, identifier: f"id-{identifier}"
 
         result = resolve_users("fake-token", " user1@company.com , user2@company.com ")
 
@@ -61,8 +62,7 @@ class TestResolveUsers:
 
         # Verify identifiers were stripped
         calls = mock_resolve.call_args_list
-        assert calls[0][0][1] == "user1@company.com"
-        assert calls[1][0][1] == "user2@company.com"
+        assert sorted(call[0][1] for call in calls) == ["user1@company.com", "user2@company.com"]
 
     @patch('planner_lib.resolution_users.batch.resolve_user')
     def test_resolve_single_error_reported(self, mock_resolve):
@@ -80,3 +80,4 @@ class TestResolveUsers:
         assert "nonexistent@company.com" in error["notFound"]
 
 
+
@@ -8,6 +8,8 @@ from unittest.mock import patch
 from planner_lib.resolution_users import resolve_users
 from .test_user_search_helpers import parse_error, assert_batch_error
 
+pytestmark = pytest.mark.usefixtures("no_exact_user_lookup")
+
 
 class TestBatchUserResolution:
     """Test batch validation for multiple users"""
@@ -54,11 +56,12 @@ class TestBatchUserResolution:
     @patch('planner_lib.resolution_users.batch.resolve_user')
     def test_batch_partial_success_still_fails(self, mock_resolve):
         """Test that even with some successes, any error fails the batch"""
-        mock_resolve.side_effect = [
-            "user-id-1",  # Success
-            "user-id-2",  # Success
-            ValueError(json.dumps({"code": "UserNotFound", "message": "Not found"})),  # Fail
-        ]
+        def side_effect(token, identifier):
+            if identifier == "invalid@test.com":
+                raise ValueError(json.dumps({"code": "UserNotFound", "message": "Not found"}))  # Fail
+            return f"id-{identifier}"  # Success
+
+        mock_resolve.side_effect = side_effect
 
         with pytest.raises(ValueError) as exc_info:
             resolve_users("fake-token", "user1@test.com,user2@test.com,invalid@test.com")
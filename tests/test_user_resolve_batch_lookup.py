@@ -0,0 +1,43 @@
+"""
+Batch user resolution: single-query email lookup and the user cache
+"""
+
+from unittest.mock import patch
+from planner_lib.resolution_users import resolve_users
+
+
+class TestResolveUsersLookup:
+    """Test the single-query email lookup and the persistent user cache"""
+
+    @patch('planner_lib.resolution_users.batch.resolve_user')
+    @patch('planner_lib.resolution_users.batch.iter_values')
+    def test_emails_resolved_with_one_filter_query(self, mock_values, mock_resolve):
+        """Test emails are matched by one $filter query without per-user lookups"""
+        mock_values.return_value = [
+            {"id": "id-1", "userPrincipalName": "User1@company.com", "mail": "user1@company.com"},
+            {"id": "id-2", "userPrincipalName": "ext_user2#EXT#@company.com", "mail": "user2@partner.com"}
+        ]
+
+        result = resolve_users("fake-token", "user1@company.com,USER2@partner.com")
+
+        assert result == ["id-1", "id-2"]
+        assert mock_values.call_count == 1
+        assert "$filter=userPrincipalName in (" in mock_values.call_args[0][0]
+        mock_resolve.assert_not_called()
+
+    @patch('planner_lib.resolution_users.resolver.search_users_by_name')
+    @patch('planner_lib.resolution_users.resolver.get_json')
+    @patch('planner_lib.resolution_users.batch.iter_values')
+    def test_repeat_resolution_served_from_cache(self, mock_values, mock_get, mock_search):
+        """Test a second call resolves previously seen users without any request"""
+        mock_values.return_value = [{"id": "id-1", "userPrincipalName": "user1@company.com"}]
+        mock_get.side_effect = Exception("404")
+        mock_search.return_value = [{"id": "id-iman", "displayName": "Iman"}]
+
+        first = resolve_users("fake-token", "user1@company.com,Iman")
+        second = resolve_users("fake-token", "Iman,user1@company.com")
+
+        assert first == ["id-1", "id-iman"]
+        assert second == ["id-iman", "id-1"]
+        assert mock_values.call_count == 1
+        assert mock_search.call_count == 1
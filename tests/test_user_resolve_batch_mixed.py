@@ -8,6 +8,8 @@ from unittest.mock import patch
 from planner_lib.resolution_users import resolve_users
 from .test_user_search_helpers import parse_error, assert_batch_error
 
+pytestmark = pytest.mark.usefixtures("no_exact_user_lookup")
+
 
 class TestBatchMixedScenarios:
     """Test batch error with mix of successful, ambiguous, and not found"""
@@ -14,10 +14,10 @@ from .test_user_search_fixtures import (
 class TestSearchUsersByName:
     """Test user search functionality"""
 
-    @patch('planner_lib.resolution_users.search.get_json')
+    @patch('planner_lib.resolution_users.search.iter_values')
     def test_search_single_result(self, mock_get_json):
         """Test search with single matching user"""
-        mock_get_json.return_value = mock_user_search_response([get_single_user()])
+        mock_get_json.return_value = iter(mock_user_search_response([get_single_user()])["value"])
 
         results = search_users_by_name("fake-token", "Iman")
 
@@ -25,10 +25,10 @@ class TestSearchUsersByName:
         assert results[0]["displayName"] == "Iman Karimi"
         assert results[0]["id"] == "user-id-1"
 
-    @patch('planner_lib.resolution_users.search.get_json')
+    @patch('planner_lib.resolution_users.search.iter_values')
     def test_search_multiple_results(self, mock_get_json):
         """Test search with multiple matching users"""
-        mock_get_json.return_value = mock_user_search_response(get_multiple_users())
+        mock_get_json.return_value = iter(mock_user_search_response(get_multiple_users())["value"])
 
         results = search_users_by_name("fake-token", "John")
 
@@ -36,16 +36,16 @@ class TestSearchUsersByName:
         assert results[0]["displayName"] == "John Smith"
         assert results[1]["displayName"] == "John Doe"
 
-    @patch('planner_lib.resolution_users.search.get_json')
+    @patch('planner_lib.resolution_users.search.iter_values')
     def test_search_no_results(self, mock_get_json):
         """Test search with no matching users"""
-        mock_get_json.return_value = {"value": []}
+        mock_get_json.return_value = iter([])
 
         results = search_users_by_name("fake-token", "NonExistentUser")
 
         assert len(results) == 0
 
-    @patch('planner_lib.resolution_users.search.get_json')
+    @patch('planner_lib.resolution_users.search.iter_values')
     def test_search_api_error(self, mock_get_json):
         """Test search handles API errors gracefully"""
         mock_get_json.side_effect = Exception("API Error")